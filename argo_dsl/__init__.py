@@ -3,3 +3,9 @@ __url__ = "https://github.com/zen-xu/argo-dsl"
 __author__ = "ZhengYu, Xu"
 __author_email__ = "zen-xu@outlook.com"
 __license__ = "Apache 2.0"
+
+
+from .loader import install_from_env as _install_from_env
+
+
+_install_from_env()
@@ -0,0 +1,343 @@
+"""
+Columnar analytics over workflow nodes.
+
+`NodeTable` loads the nodes of any number of workflows into numpy arrays, one
+per attribute:
+
+* `startedAt` and `finishedAt` as int64 seconds since the epoch,
+* `resourcesDuration` as one float64 column per resource,
+* workflows, template names, phases, node types and host nodes as integer codes
+  into a tuple of labels.
+
+Aggregations group a column by one of these codes with sorted `numpy` reductions
+instead of python loops over the nodes. numpy is an optional dependency, install
+`argo-dsl[analytics]`.
+"""
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from pydantic.datetime_parse import parse_datetime
+
+from .nodes import status_nodes
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("argo_dsl.analytics needs numpy, install argo-dsl[analytics]") from None
+
+
+CATEGORIES = ("workflow", "template", "phase", "type", "host")
+NO_TIME = np.iinfo(np.int64).min
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class Categories:
+    """
+    Integer codes of a categorical column, `labels[codes[i]]` is the label of row `i`
+    """
+
+    __slots__ = ("codes", "labels")
+
+    def __init__(self, codes: "np.ndarray", labels: Tuple[Optional[str], ...]):
+        self.codes = codes
+        self.labels = labels
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def code(self, label: Optional[str]) -> int:
+        return self.labels.index(label)
+
+    def mask(self, label: Optional[str]) -> "np.ndarray":
+        """
+        Rows with `label`
+        """
+        try:
+            return self.codes == self.code(label)
+        except ValueError:
+            return np.zeros(len(self.codes), dtype=bool)
+
+
+class _CategoriesBuilder:
+    def __init__(self):
+        self.index: Dict[Optional[str], int] = {}
+        self.chunks: List[np.ndarray] = []
+
+    def extend(self, labels: List[Optional[str]]):
+        index = self.index
+        for label in dict.fromkeys(labels):
+            if label not in index:
+                index[label] = len(index)
+        self.chunks.append(np.fromiter(map(index.__getitem__, labels), dtype=np.int32, count=len(labels)))
+
+    def build(self) -> Categories:
+        return Categories(_concatenate(self.chunks, np.int32), tuple(self.index))
+
+
+class Aggregate:
+    """
+    Statistics of a column per label of a categorical column, every statistic is an
+    array aligned with `labels`. Labels without values have a count of 0 and nan
+    statistics.
+    """
+
+    STATISTICS = ("count", "total", "mean", "min", "max")
+
+    def __init__(
+        self,
+        labels: Tuple[Optional[str], ...],
+        count: "np.ndarray",
+        total: "np.ndarray",
+        minimum: "np.ndarray",
+        maximum: "np.ndarray",
+    ):
+        self.labels = labels
+        self.count = count
+        self.total = total
+        self.min = minimum
+        self.max = maximum
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = np.where(count > 0, total / count, np.nan)
+
+    def __getitem__(self, label: Optional[str]) -> Dict[str, float]:
+        i = self.labels.index(label)
+        return {statistic: getattr(self, statistic)[i].item() for statistic in self.STATISTICS}
+
+    def to_dict(self) -> Dict[Optional[str], Dict[str, float]]:
+        """
+        Statistics by label, labels without values are left out
+        """
+        return {label: self[label] for label, count in zip(self.labels, self.count) if count}
+
+
+def _concatenate(chunks: List["np.ndarray"], dtype: Any) -> "np.ndarray":
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+
+
+def _seconds(value: Any) -> int:
+    parsed = value if isinstance(value, datetime) else parse_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int((parsed - _EPOCH).total_seconds())
+
+
+def _times(values: List[Any], cache: Dict[Any, int]) -> "np.ndarray":
+    try:
+        unique = dict.fromkeys(values)
+    except TypeError:
+        # `meta.v1.Time` wrappers of pydantic nodes are not hashable
+        values = [getattr(value, "__root__", value) for value in values]
+        unique = dict.fromkeys(values)
+
+    for value in unique:
+        if value not in cache:
+            cache[value] = _seconds(value)
+    return np.fromiter(map(cache.__getitem__, values), dtype=np.int64, count=len(values))
+
+
+class NodeTableBuilder:
+    """
+    Collects nodes of several workflows into a `NodeTable`
+    """
+
+    def __init__(self):
+        self._rows = 0
+        self._ids: List[str] = []
+        self._categories = {name: _CategoriesBuilder() for name in CATEGORIES}
+        self._started: List[np.ndarray] = []
+        self._finished: List[np.ndarray] = []
+        # chunks of every resource column by the row they start at
+        self._resources: Dict[str, List[Tuple[int, np.ndarray]]] = {}
+        self._edge_parents: List[int] = []
+        self._edge_children: List[int] = []
+        self._times: Dict[Any, int] = {None: NO_TIME}
+
+    def add_nodes(self, nodes: Mapping[str, Any], workflow: Optional[str] = None) -> "NodeTableBuilder":
+        """
+        Add a node map, nodes are any objects with the `v1alpha1.NodeStatus` attributes
+        """
+        offset = self._rows
+        rows = {node_id: offset + i for i, node_id in enumerate(nodes)}
+        values = list(nodes.values())
+
+        # one pass per column, each a comprehension rather than a method call per node
+        categories = self._categories
+        categories["workflow"].extend([workflow] * len(values))
+        categories["template"].extend([node.templateName for node in values])
+        categories["phase"].extend([node.phase for node in values])
+        categories["type"].extend([node.type for node in values])
+        categories["host"].extend([node.hostNodeName for node in values])
+        self._started.append(_times([node.startedAt for node in values], self._times))
+        self._finished.append(_times([node.finishedAt for node in values], self._times))
+        self._ids.extend(rows)
+
+        durations = [node.resourcesDuration for node in values]
+        for resource in dict.fromkeys(name for amounts in durations if amounts for name in amounts):
+            column = [amounts.get(resource, np.nan) if amounts else np.nan for amounts in durations]
+            self._resources.setdefault(resource, []).append((offset, np.array(column, dtype=np.float64)))
+
+        for row, children in enumerate([node.children for node in values], offset):
+            if children:
+                for child in children:
+                    child_row = rows.get(child)
+                    if child_row is not None:
+                        self._edge_parents.append(row)
+                        self._edge_children.append(child_row)
+
+        self._rows += len(rows)
+        return self
+
+    def add_status(self, status: Any, workflow: Optional[str] = None) -> "NodeTableBuilder":
+        """
+        Add the nodes of a workflow status, see `argo_dsl.nodes.status_nodes`
+        """
+        return self.add_nodes(status_nodes(status), workflow)
+
+    def build(self) -> "NodeTable":
+        resources: Dict[str, np.ndarray] = {}
+        for resource, chunks in self._resources.items():
+            column = resources[resource] = np.full(self._rows, np.nan)
+            for offset, chunk in chunks:
+                column[offset : offset + len(chunk)] = chunk
+
+        return NodeTable(
+            ids=self._ids,
+            categories={name: builder.build() for name, builder in self._categories.items()},
+            started=_concatenate(self._started, np.int64),
+            finished=_concatenate(self._finished, np.int64),
+            resources=resources,
+            edges=(np.array(self._edge_parents, dtype=np.int64), np.array(self._edge_children, dtype=np.int64)),
+        )
+
+
+class NodeTable:
+    """
+    Columns of workflow nodes, see the module docstring. Rows are in the order the
+    nodes were added.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        categories: Dict[str, Categories],
+        started: "np.ndarray",
+        finished: "np.ndarray",
+        resources: Dict[str, "np.ndarray"],
+        edges: Tuple["np.ndarray", "np.ndarray"],
+    ):
+        self.ids = ids
+        self.categories = categories
+        self.started = started
+        self.finished = finished
+        self.resources = resources
+        # parent and child rows of every `children` link
+        self.edges = edges
+
+    @classmethod
+    def from_nodes(cls, nodes: Mapping[str, Any], workflow: Optional[str] = None) -> "NodeTable":
+        return NodeTableBuilder().add_nodes(nodes, workflow).build()
+
+    @classmethod
+    def from_statuses(cls, statuses: Iterable[Tuple[str, Any]]) -> "NodeTable":
+        """
+        Table of the nodes of `(workflow name, workflow status)` pairs
+        """
+        builder = NodeTableBuilder()
+        for workflow, status in statuses:
+            builder.add_status(status, workflow)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getattr__(self, item: str) -> Categories:
+        try:
+            return self.__dict__["categories"][item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+    def duration(self) -> "np.ndarray":
+        """
+        Wall time of every node in seconds, nan unless it has started and finished
+        """
+        valid = (self.started != NO_TIME) & (self.finished != NO_TIME)
+        return np.where(valid, self.finished - self.started, np.nan)
+
+    def queue_delay(self) -> "np.ndarray":
+        """
+        Seconds between the time a node could start and its start, nan for nodes
+        without parents or times.
+
+        A node could start once its parents let it: a parent which finished before
+        the node started, a DAG dependency or the previous step group, at its
+        finish, any other parent, such as the step group or DAG containing the
+        node, at its start.
+        """
+        parents, children = self.edges
+        child_started = self.started[children]
+        parent_started = self.started[parents]
+        parent_finished = self.finished[parents]
+
+        finished_before = (parent_finished != NO_TIME) & (parent_finished <= child_started)
+        ready_at = np.where(finished_before, parent_finished, parent_started)
+
+        ready = np.full(len(self), NO_TIME, dtype=np.int64)
+        np.maximum.at(ready, children, ready_at)
+
+        valid = (ready != NO_TIME) & (self.started != NO_TIME)
+        return np.where(valid, self.started - ready, np.nan)
+
+    def resource(self, name: str) -> "np.ndarray":
+        """
+        `resourcesDuration` of a resource, e.g. cpu or memory, nan for nodes without it
+        """
+        column = self.resources.get(name)
+        return np.full(len(self), np.nan) if column is None else column
+
+    def aggregate(self, by: str, values: "np.ndarray", where: Optional["np.ndarray"] = None) -> Aggregate:
+        """
+        Statistics of `values` grouped by the categorical column `by`, nan values and
+        rows outside of the `where` mask are ignored
+        """
+        if by not in CATEGORIES:
+            raise ValueError(f"can not group by {by!r}, expected one of {', '.join(CATEGORIES)}")
+        categories = self.categories[by]
+
+        valid = ~np.isnan(values)
+        if where is not None:
+            valid &= where
+        codes = categories.codes[valid]
+        values = values[valid]
+        size = len(categories.labels)
+
+        count = np.bincount(codes, minlength=size)
+        total = np.bincount(codes, weights=values, minlength=size)
+        minimum = np.full(size, np.nan)
+        maximum = np.full(size, np.nan)
+        if len(codes):
+            order = np.argsort(codes, kind="stable")
+            codes = codes[order]
+            values = values[order]
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            minimum[codes[starts]] = np.minimum.reduceat(values, starts)
+            maximum[codes[starts]] = np.maximum.reduceat(values, starts)
+
+        return Aggregate(categories.labels, count, total, minimum, maximum)
+
+    def durations_by(self, by: str, where: Optional["np.ndarray"] = None) -> Aggregate:
+        return self.aggregate(by, self.duration(), where)
+
+    def queue_delays_by(self, by: str, where: Optional["np.ndarray"] = None) -> Aggregate:
+        return self.aggregate(by, self.queue_delay(), where)
+
+    def resources_by(self, by: str, resource: str, where: Optional["np.ndarray"] = None) -> Aggregate:
+        return self.aggregate(by, self.resource(resource), where)
@@ -0,0 +1,6637 @@
+# generated by argo_dsl.manifest, do not edit
+
+from typing import Any
+from typing import Dict
+
+from argo_dsl.manifest import dump_model as _model
+from argo_dsl.manifest import dump_value as _value
+
+
+def dump_argo_dsl_api_Model(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return _value(v)
+
+
+def dump_eventsource_EventSourceDeletedResponse(m):
+    return {}
+
+
+def dump_eventsource_LogEntry(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventName")
+    if v is not None:
+        d["eventName"] = v
+    v = get("eventSourceName")
+    if v is not None:
+        d["eventSourceName"] = v
+    v = get("eventSourceType")
+    if v is not None:
+        d["eventSourceType"] = v
+    v = get("level")
+    if v is not None:
+        d["level"] = v
+    v = get("msg")
+    if v is not None:
+        d["msg"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("time")
+    if v is not None:
+        d["time"] = _model(v)
+    return d
+
+
+def dump_eventsource_CreateEventSourceRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventSource")
+    if v is not None:
+        d["eventSource"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_eventsource_EventSourceWatchEvent(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("object")
+    if v is not None:
+        d["object"] = _model(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_eventsource_UpdateEventSourceRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventSource")
+    if v is not None:
+        d["eventSource"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_sensor_DeleteSensorResponse(m):
+    return {}
+
+
+def dump_sensor_LogEntry(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("dependencyName")
+    if v is not None:
+        d["dependencyName"] = v
+    v = get("eventContext")
+    if v is not None:
+        d["eventContext"] = v
+    v = get("level")
+    if v is not None:
+        d["level"] = v
+    v = get("msg")
+    if v is not None:
+        d["msg"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("sensorName")
+    if v is not None:
+        d["sensorName"] = v
+    v = get("time")
+    if v is not None:
+        d["time"] = _model(v)
+    v = get("triggerName")
+    if v is not None:
+        d["triggerName"] = v
+    return d
+
+
+def dump_sensor_CreateSensorRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("sensor")
+    if v is not None:
+        d["sensor"] = _model(v)
+    return d
+
+
+def dump_sensor_SensorWatchEvent(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("object")
+    if v is not None:
+        d["object"] = _model(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_sensor_UpdateSensorRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("sensor")
+    if v is not None:
+        d["sensor"] = _model(v)
+    return d
+
+
+def dump_google_protobuf_Any(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("type_url")
+    if v is not None:
+        d["type_url"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_grpc_gateway_runtime_Error(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("code")
+    if v is not None:
+        d["code"] = v
+    v = get("details")
+    if v is not None:
+        d["details"] = [_model(x) for x in v]
+    v = get("error")
+    if v is not None:
+        d["error"] = v
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    return d
+
+
+def dump_grpc_gateway_runtime_StreamError(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("details")
+    if v is not None:
+        d["details"] = [_model(x) for x in v]
+    v = get("grpc_code")
+    if v is not None:
+        d["grpc_code"] = v
+    v = get("http_code")
+    if v is not None:
+        d["http_code"] = v
+    v = get("http_status")
+    if v is not None:
+        d["http_status"] = v
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Amount(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Backoff(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("duration")
+    if v is not None:
+        d["duration"] = v
+    v = get("factor")
+    if v is not None:
+        d["factor"] = _model(v)
+    v = get("jitter")
+    if v is not None:
+        d["jitter"] = _model(v)
+    v = get("steps")
+    if v is not None:
+        d["steps"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_CatchupConfiguration(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("enabled")
+    if v is not None:
+        d["enabled"] = v
+    v = get("maxDuration")
+    if v is not None:
+        d["maxDuration"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_ConfigMapPersistence(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createIfNotExist")
+    if v is not None:
+        d["createIfNotExist"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_DataFilter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("comparator")
+    if v is not None:
+        d["comparator"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = list(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_DependencyGroup(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("dependencies")
+    if v is not None:
+        d["dependencies"] = list(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventPersistence(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("catchup")
+    if v is not None:
+        d["catchup"] = _model(v)
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_FileArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GitRemoteConfig(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("urls")
+    if v is not None:
+        d["urls"] = list(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_K8SResourcePolicy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("backoff")
+    if v is not None:
+        d["backoff"] = _model(v)
+    v = get("errorOnBackoffTimeout")
+    if v is not None:
+        d["errorOnBackoffTimeout"] = v
+    v = get("labels")
+    if v is not None:
+        d["labels"] = dict(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_KafkaConsumerGroup(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("groupName")
+    if v is not None:
+        d["groupName"] = v
+    v = get("oldest")
+    if v is not None:
+        d["oldest"] = v
+    v = get("rebalanceStrategy")
+    if v is not None:
+        d["rebalanceStrategy"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_LogTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("intervalSeconds")
+    if v is not None:
+        d["intervalSeconds"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Metadata(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("annotations")
+    if v is not None:
+        d["annotations"] = dict(v)
+    v = get("labels")
+    if v is not None:
+        d["labels"] = dict(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Resource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_S3Bucket(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_S3Filter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("prefix")
+    if v is not None:
+        d["prefix"] = v
+    v = get("suffix")
+    if v is not None:
+        d["suffix"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Selector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("operation")
+    if v is not None:
+        d["operation"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_StatusPolicy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("allow")
+    if v is not None:
+        d["allow"] = list(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_StorageGridFilter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("prefix")
+    if v is not None:
+        d["prefix"] = v
+    v = get("suffix")
+    if v is not None:
+        d["suffix"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TimeFilter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("start")
+    if v is not None:
+        d["start"] = v
+    v = get("stop")
+    if v is not None:
+        d["stop"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TriggerParameterSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("contextKey")
+    if v is not None:
+        d["contextKey"] = v
+    v = get("contextTemplate")
+    if v is not None:
+        d["contextTemplate"] = v
+    v = get("dataKey")
+    if v is not None:
+        d["dataKey"] = v
+    v = get("dataTemplate")
+    if v is not None:
+        d["dataTemplate"] = v
+    v = get("dependencyName")
+    if v is not None:
+        d["dependencyName"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TriggerPolicy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("k8s")
+    if v is not None:
+        d["k8s"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TriggerSwitch(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("all")
+    if v is not None:
+        d["all"] = list(v)
+    v = get("any")
+    if v is not None:
+        d["any"] = list(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_URLArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("verifyCert")
+    if v is not None:
+        d["verifyCert"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_WatchPathConfig(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("directory")
+    if v is not None:
+        d["directory"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("pathRegexp")
+    if v is not None:
+        d["pathRegexp"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_AzureEventsHubEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fqdn")
+    if v is not None:
+        d["fqdn"] = v
+    v = get("hubName")
+    if v is not None:
+        d["hubName"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("sharedAccessKey")
+    if v is not None:
+        d["sharedAccessKey"] = _model(v)
+    v = get("sharedAccessKeyName")
+    if v is not None:
+        d["sharedAccessKeyName"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_BasicAuth(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("password")
+    if v is not None:
+        d["password"] = _model(v)
+    v = get("username")
+    if v is not None:
+        d["username"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_CalendarEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("exclusionDates")
+    if v is not None:
+        d["exclusionDates"] = list(v)
+    v = get("interval")
+    if v is not None:
+        d["interval"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("persistence")
+    if v is not None:
+        d["persistence"] = _model(v)
+    v = get("schedule")
+    if v is not None:
+        d["schedule"] = v
+    v = get("timezone")
+    if v is not None:
+        d["timezone"] = v
+    v = get("userPayload")
+    if v is not None:
+        d["userPayload"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Condition(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("lastTransitionTime")
+    if v is not None:
+        d["lastTransitionTime"] = _model(v)
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("reason")
+    if v is not None:
+        d["reason"] = v
+    v = get("status")
+    if v is not None:
+        d["status"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventContext(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("datacontenttype")
+    if v is not None:
+        d["datacontenttype"] = v
+    v = get("id")
+    if v is not None:
+        d["id"] = v
+    v = get("source")
+    if v is not None:
+        d["source"] = v
+    v = get("specversion")
+    if v is not None:
+        d["specversion"] = v
+    v = get("subject")
+    if v is not None:
+        d["subject"] = v
+    v = get("time")
+    if v is not None:
+        d["time"] = _model(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventDependencyFilter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("context")
+    if v is not None:
+        d["context"] = _model(v)
+    v = get("data")
+    if v is not None:
+        d["data"] = [_model(x) for x in v]
+    v = get("time")
+    if v is not None:
+        d["time"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_FileEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventType")
+    if v is not None:
+        d["eventType"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("polling")
+    if v is not None:
+        d["polling"] = v
+    v = get("watchPathConfig")
+    if v is not None:
+        d["watchPathConfig"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GenericEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("authSecret")
+    if v is not None:
+        d["authSecret"] = _model(v)
+    v = get("config")
+    if v is not None:
+        d["config"] = v
+    v = get("insecure")
+    if v is not None:
+        d["insecure"] = v
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GitCreds(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("password")
+    if v is not None:
+        d["password"] = _model(v)
+    v = get("username")
+    if v is not None:
+        d["username"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_HDFSEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("addresses")
+    if v is not None:
+        d["addresses"] = list(v)
+    v = get("checkInterval")
+    if v is not None:
+        d["checkInterval"] = v
+    v = get("hdfsUser")
+    if v is not None:
+        d["hdfsUser"] = v
+    v = get("krbCCacheSecret")
+    if v is not None:
+        d["krbCCacheSecret"] = _model(v)
+    v = get("krbConfigConfigMap")
+    if v is not None:
+        d["krbConfigConfigMap"] = _model(v)
+    v = get("krbKeytabSecret")
+    if v is not None:
+        d["krbKeytabSecret"] = _model(v)
+    v = get("krbRealm")
+    if v is not None:
+        d["krbRealm"] = v
+    v = get("krbServicePrincipalName")
+    if v is not None:
+        d["krbServicePrincipalName"] = v
+    v = get("krbUsername")
+    if v is not None:
+        d["krbUsername"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    v = get("watchPathConfig")
+    if v is not None:
+        d["watchPathConfig"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_PubSubEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("credentialSecret")
+    if v is not None:
+        d["credentialSecret"] = _model(v)
+    v = get("credentialsFile")
+    if v is not None:
+        d["credentialsFile"] = v
+    v = get("deleteSubscriptionOnFinish")
+    if v is not None:
+        d["deleteSubscriptionOnFinish"] = v
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("projectID")
+    if v is not None:
+        d["projectID"] = v
+    v = get("subscriptionID")
+    if v is not None:
+        d["subscriptionID"] = v
+    v = get("topic")
+    if v is not None:
+        d["topic"] = v
+    v = get("topicProjectID")
+    if v is not None:
+        d["topicProjectID"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_ResourceFilter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("afterStart")
+    if v is not None:
+        d["afterStart"] = v
+    v = get("createdBy")
+    if v is not None:
+        d["createdBy"] = _model(v)
+    v = get("fields")
+    if v is not None:
+        d["fields"] = [_model(x) for x in v]
+    v = get("labels")
+    if v is not None:
+        d["labels"] = [_model(x) for x in v]
+    v = get("prefix")
+    if v is not None:
+        d["prefix"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_S3Artifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKey")
+    if v is not None:
+        d["accessKey"] = _model(v)
+    v = get("bucket")
+    if v is not None:
+        d["bucket"] = _model(v)
+    v = get("endpoint")
+    if v is not None:
+        d["endpoint"] = v
+    v = get("events")
+    if v is not None:
+        d["events"] = list(v)
+    v = get("filter")
+    if v is not None:
+        d["filter"] = _model(v)
+    v = get("insecure")
+    if v is not None:
+        d["insecure"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("secretKey")
+    if v is not None:
+        d["secretKey"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SQSEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKey")
+    if v is not None:
+        d["accessKey"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("queue")
+    if v is not None:
+        d["queue"] = v
+    v = get("queueAccountId")
+    if v is not None:
+        d["queueAccountId"] = v
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("roleARN")
+    if v is not None:
+        d["roleARN"] = v
+    v = get("secretKey")
+    if v is not None:
+        d["secretKey"] = _model(v)
+    v = get("waitTimeSeconds")
+    if v is not None:
+        d["waitTimeSeconds"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Status(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("conditions")
+    if v is not None:
+        d["conditions"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TLSConfig(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("caCertPath")
+    if v is not None:
+        d["caCertPath"] = v
+    v = get("caCertSecret")
+    if v is not None:
+        d["caCertSecret"] = _model(v)
+    v = get("clientCertPath")
+    if v is not None:
+        d["clientCertPath"] = v
+    v = get("clientCertSecret")
+    if v is not None:
+        d["clientCertSecret"] = _model(v)
+    v = get("clientKeyPath")
+    if v is not None:
+        d["clientKeyPath"] = v
+    v = get("clientKeySecret")
+    if v is not None:
+        d["clientKeySecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TriggerParameter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("dest")
+    if v is not None:
+        d["dest"] = v
+    v = get("operation")
+    if v is not None:
+        d["operation"] = v
+    v = get("src")
+    if v is not None:
+        d["src"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_WebhookContext(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("authSecret")
+    if v is not None:
+        d["authSecret"] = _model(v)
+    v = get("endpoint")
+    if v is not None:
+        d["endpoint"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("method")
+    if v is not None:
+        d["method"] = v
+    v = get("port")
+    if v is not None:
+        d["port"] = v
+    v = get("serverCertPath")
+    if v is not None:
+        d["serverCertPath"] = v
+    v = get("serverCertSecret")
+    if v is not None:
+        d["serverCertSecret"] = _model(v)
+    v = get("serverKeyPath")
+    if v is not None:
+        d["serverKeyPath"] = v
+    v = get("serverKeySecret")
+    if v is not None:
+        d["serverKeySecret"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_AMQPEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("exchangeName")
+    if v is not None:
+        d["exchangeName"] = v
+    v = get("exchangeType")
+    if v is not None:
+        d["exchangeType"] = v
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("routingKey")
+    if v is not None:
+        d["routingKey"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_AWSLambdaTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKey")
+    if v is not None:
+        d["accessKey"] = _model(v)
+    v = get("functionName")
+    if v is not None:
+        d["functionName"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("secretKey")
+    if v is not None:
+        d["secretKey"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_CustomTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("certFilePath")
+    if v is not None:
+        d["certFilePath"] = v
+    v = get("certSecret")
+    if v is not None:
+        d["certSecret"] = _model(v)
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("secure")
+    if v is not None:
+        d["secure"] = v
+    v = get("serverNameOverride")
+    if v is not None:
+        d["serverNameOverride"] = v
+    v = get("serverURL")
+    if v is not None:
+        d["serverURL"] = v
+    v = get("spec")
+    if v is not None:
+        d["spec"] = dict(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EmitterEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("broker")
+    if v is not None:
+        d["broker"] = v
+    v = get("channelKey")
+    if v is not None:
+        d["channelKey"] = v
+    v = get("channelName")
+    if v is not None:
+        d["channelName"] = v
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("password")
+    if v is not None:
+        d["password"] = _model(v)
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("username")
+    if v is not None:
+        d["username"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventDependency(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventName")
+    if v is not None:
+        d["eventName"] = v
+    v = get("eventSourceName")
+    if v is not None:
+        d["eventSourceName"] = v
+    v = get("filters")
+    if v is not None:
+        d["filters"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventSourceStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GitArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("branch")
+    if v is not None:
+        d["branch"] = v
+    v = get("cloneDirectory")
+    if v is not None:
+        d["cloneDirectory"] = v
+    v = get("creds")
+    if v is not None:
+        d["creds"] = _model(v)
+    v = get("filePath")
+    if v is not None:
+        d["filePath"] = v
+    v = get("ref")
+    if v is not None:
+        d["ref"] = v
+    v = get("remote")
+    if v is not None:
+        d["remote"] = _model(v)
+    v = get("sshKeyPath")
+    if v is not None:
+        d["sshKeyPath"] = v
+    v = get("sshKeySecret")
+    if v is not None:
+        d["sshKeySecret"] = _model(v)
+    v = get("tag")
+    if v is not None:
+        d["tag"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GithubEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("active")
+    if v is not None:
+        d["active"] = v
+    v = get("apiToken")
+    if v is not None:
+        d["apiToken"] = _model(v)
+    v = get("contentType")
+    if v is not None:
+        d["contentType"] = v
+    v = get("deleteHookOnFinish")
+    if v is not None:
+        d["deleteHookOnFinish"] = v
+    v = get("events")
+    if v is not None:
+        d["events"] = list(v)
+    v = get("githubBaseURL")
+    if v is not None:
+        d["githubBaseURL"] = v
+    v = get("githubUploadURL")
+    if v is not None:
+        d["githubUploadURL"] = v
+    v = get("id")
+    if v is not None:
+        d["id"] = v
+    v = get("insecure")
+    if v is not None:
+        d["insecure"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("owner")
+    if v is not None:
+        d["owner"] = v
+    v = get("repository")
+    if v is not None:
+        d["repository"] = v
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    v = get("webhookSecret")
+    if v is not None:
+        d["webhookSecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_GitlabEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessToken")
+    if v is not None:
+        d["accessToken"] = _model(v)
+    v = get("deleteHookOnFinish")
+    if v is not None:
+        d["deleteHookOnFinish"] = v
+    v = get("enableSSLVerification")
+    if v is not None:
+        d["enableSSLVerification"] = v
+    v = get("events")
+    if v is not None:
+        d["events"] = list(v)
+    v = get("gitlabBaseURL")
+    if v is not None:
+        d["gitlabBaseURL"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("projectID")
+    if v is not None:
+        d["projectID"] = v
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_HTTPTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("basicAuth")
+    if v is not None:
+        d["basicAuth"] = _model(v)
+    v = get("headers")
+    if v is not None:
+        d["headers"] = dict(v)
+    v = get("method")
+    if v is not None:
+        d["method"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("timeout")
+    if v is not None:
+        d["timeout"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_KafkaEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("consumerGroup")
+    if v is not None:
+        d["consumerGroup"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("limitEventsPerSecond")
+    if v is not None:
+        d["limitEventsPerSecond"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("partition")
+    if v is not None:
+        d["partition"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("topic")
+    if v is not None:
+        d["topic"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    v = get("version")
+    if v is not None:
+        d["version"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_KafkaTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("compress")
+    if v is not None:
+        d["compress"] = v
+    v = get("flushFrequency")
+    if v is not None:
+        d["flushFrequency"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("partition")
+    if v is not None:
+        d["partition"] = v
+    v = get("partitioningKey")
+    if v is not None:
+        d["partitioningKey"] = v
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("requiredAcks")
+    if v is not None:
+        d["requiredAcks"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("topic")
+    if v is not None:
+        d["topic"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    v = get("version")
+    if v is not None:
+        d["version"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_MQTTEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("clientId")
+    if v is not None:
+        d["clientId"] = v
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("topic")
+    if v is not None:
+        d["topic"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_NATSEventsSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("subject")
+    if v is not None:
+        d["subject"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_NATSTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("subject")
+    if v is not None:
+        d["subject"] = v
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_NSQEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("channel")
+    if v is not None:
+        d["channel"] = v
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("hostAddress")
+    if v is not None:
+        d["hostAddress"] = v
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("topic")
+    if v is not None:
+        d["topic"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_OpenWhiskTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("actionName")
+    if v is not None:
+        d["actionName"] = v
+    v = get("authToken")
+    if v is not None:
+        d["authToken"] = _model(v)
+    v = get("host")
+    if v is not None:
+        d["host"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("payload")
+    if v is not None:
+        d["payload"] = [_model(x) for x in v]
+    v = get("version")
+    if v is not None:
+        d["version"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_PulsarEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("connectionBackoff")
+    if v is not None:
+        d["connectionBackoff"] = _model(v)
+    v = get("jsonBody")
+    if v is not None:
+        d["jsonBody"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    v = get("tlsAllowInsecureConnection")
+    if v is not None:
+        d["tlsAllowInsecureConnection"] = v
+    v = get("tlsTrustCertsSecret")
+    if v is not None:
+        d["tlsTrustCertsSecret"] = _model(v)
+    v = get("tlsValidateHostname")
+    if v is not None:
+        d["tlsValidateHostname"] = v
+    v = get("topics")
+    if v is not None:
+        d["topics"] = list(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_RedisEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("channels")
+    if v is not None:
+        d["channels"] = list(v)
+    v = get("db")
+    if v is not None:
+        d["db"] = v
+    v = get("hostAddress")
+    if v is not None:
+        d["hostAddress"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("password")
+    if v is not None:
+        d["password"] = _model(v)
+    v = get("tls")
+    if v is not None:
+        d["tls"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_ResourceEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("eventTypes")
+    if v is not None:
+        d["eventTypes"] = list(v)
+    v = get("filter")
+    if v is not None:
+        d["filter"] = _model(v)
+    v = get("groupVersionResource")
+    if v is not None:
+        d["groupVersionResource"] = _model(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SNSEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKey")
+    if v is not None:
+        d["accessKey"] = _model(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("roleARN")
+    if v is not None:
+        d["roleARN"] = v
+    v = get("secretKey")
+    if v is not None:
+        d["secretKey"] = _model(v)
+    v = get("topicArn")
+    if v is not None:
+        d["topicArn"] = v
+    v = get("validateSignature")
+    if v is not None:
+        d["validateSignature"] = v
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SensorStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Service(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("clusterIP")
+    if v is not None:
+        d["clusterIP"] = v
+    v = get("ports")
+    if v is not None:
+        d["ports"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SlackEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("signingSecret")
+    if v is not None:
+        d["signingSecret"] = _model(v)
+    v = get("token")
+    if v is not None:
+        d["token"] = _model(v)
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SlackTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("channel")
+    if v is not None:
+        d["channel"] = v
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("slackToken")
+    if v is not None:
+        d["slackToken"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_StorageGridEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiURL")
+    if v is not None:
+        d["apiURL"] = v
+    v = get("authToken")
+    if v is not None:
+        d["authToken"] = _model(v)
+    v = get("bucket")
+    if v is not None:
+        d["bucket"] = v
+    v = get("events")
+    if v is not None:
+        d["events"] = list(v)
+    v = get("filter")
+    if v is not None:
+        d["filter"] = _model(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("topicArn")
+    if v is not None:
+        d["topicArn"] = v
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_StripeEventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiKey")
+    if v is not None:
+        d["apiKey"] = _model(v)
+    v = get("createWebhook")
+    if v is not None:
+        d["createWebhook"] = v
+    v = get("eventFilter")
+    if v is not None:
+        d["eventFilter"] = list(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = dict(v)
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_ArtifactLocation(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configmap")
+    if v is not None:
+        d["configmap"] = _model(v)
+    v = get("file")
+    if v is not None:
+        d["file"] = _model(v)
+    v = get("git")
+    if v is not None:
+        d["git"] = _model(v)
+    v = get("inline")
+    if v is not None:
+        d["inline"] = v
+    v = get("resource")
+    if v is not None:
+        d["resource"] = _model(v)
+    v = get("s3")
+    if v is not None:
+        d["s3"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_StandardK8STrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("groupVersionResource")
+    if v is not None:
+        d["groupVersionResource"] = _model(v)
+    v = get("liveObject")
+    if v is not None:
+        d["liveObject"] = v
+    v = get("operation")
+    if v is not None:
+        d["operation"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("patchStrategy")
+    if v is not None:
+        d["patchStrategy"] = v
+    v = get("source")
+    if v is not None:
+        d["source"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_ArgoWorkflowTrigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("groupVersionResource")
+    if v is not None:
+        d["groupVersionResource"] = _model(v)
+    v = get("operation")
+    if v is not None:
+        d["operation"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("source")
+    if v is not None:
+        d["source"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_TriggerTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("argoWorkflow")
+    if v is not None:
+        d["argoWorkflow"] = _model(v)
+    v = get("awsLambda")
+    if v is not None:
+        d["awsLambda"] = _model(v)
+    v = get("conditions")
+    if v is not None:
+        d["conditions"] = v
+    v = get("custom")
+    if v is not None:
+        d["custom"] = _model(v)
+    v = get("http")
+    if v is not None:
+        d["http"] = _model(v)
+    v = get("k8s")
+    if v is not None:
+        d["k8s"] = _model(v)
+    v = get("kafka")
+    if v is not None:
+        d["kafka"] = _model(v)
+    v = get("log")
+    if v is not None:
+        d["log"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("nats")
+    if v is not None:
+        d["nats"] = _model(v)
+    v = get("openWhisk")
+    if v is not None:
+        d["openWhisk"] = _model(v)
+    v = get("slack")
+    if v is not None:
+        d["slack"] = _model(v)
+    v = get("switch")
+    if v is not None:
+        d["switch"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Template(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("container")
+    if v is not None:
+        d["container"] = _model(v)
+    v = get("imagePullSecrets")
+    if v is not None:
+        d["imagePullSecrets"] = [_model(x) for x in v]
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("nodeSelector")
+    if v is not None:
+        d["nodeSelector"] = dict(v)
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    v = get("tolerations")
+    if v is not None:
+        d["tolerations"] = [_model(x) for x in v]
+    v = get("volumes")
+    if v is not None:
+        d["volumes"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Trigger(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("policy")
+    if v is not None:
+        d["policy"] = _model(v)
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventSourceSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("amqp")
+    if v is not None:
+        d["amqp"] = {k: _model(x) for k, x in v.items()}
+    v = get("azureEventsHub")
+    if v is not None:
+        d["azureEventsHub"] = {k: _model(x) for k, x in v.items()}
+    v = get("calendar")
+    if v is not None:
+        d["calendar"] = {k: _model(x) for k, x in v.items()}
+    v = get("emitter")
+    if v is not None:
+        d["emitter"] = {k: _model(x) for k, x in v.items()}
+    v = get("eventBusName")
+    if v is not None:
+        d["eventBusName"] = v
+    v = get("file")
+    if v is not None:
+        d["file"] = {k: _model(x) for k, x in v.items()}
+    v = get("generic")
+    if v is not None:
+        d["generic"] = {k: _model(x) for k, x in v.items()}
+    v = get("github")
+    if v is not None:
+        d["github"] = {k: _model(x) for k, x in v.items()}
+    v = get("gitlab")
+    if v is not None:
+        d["gitlab"] = {k: _model(x) for k, x in v.items()}
+    v = get("hdfs")
+    if v is not None:
+        d["hdfs"] = {k: _model(x) for k, x in v.items()}
+    v = get("kafka")
+    if v is not None:
+        d["kafka"] = {k: _model(x) for k, x in v.items()}
+    v = get("minio")
+    if v is not None:
+        d["minio"] = {k: _model(x) for k, x in v.items()}
+    v = get("mqtt")
+    if v is not None:
+        d["mqtt"] = {k: _model(x) for k, x in v.items()}
+    v = get("nats")
+    if v is not None:
+        d["nats"] = {k: _model(x) for k, x in v.items()}
+    v = get("nsq")
+    if v is not None:
+        d["nsq"] = {k: _model(x) for k, x in v.items()}
+    v = get("pubSub")
+    if v is not None:
+        d["pubSub"] = {k: _model(x) for k, x in v.items()}
+    v = get("pulsar")
+    if v is not None:
+        d["pulsar"] = {k: _model(x) for k, x in v.items()}
+    v = get("redis")
+    if v is not None:
+        d["redis"] = {k: _model(x) for k, x in v.items()}
+    v = get("replica")
+    if v is not None:
+        d["replica"] = v
+    v = get("resource")
+    if v is not None:
+        d["resource"] = {k: _model(x) for k, x in v.items()}
+    v = get("service")
+    if v is not None:
+        d["service"] = _model(v)
+    v = get("slack")
+    if v is not None:
+        d["slack"] = {k: _model(x) for k, x in v.items()}
+    v = get("sns")
+    if v is not None:
+        d["sns"] = {k: _model(x) for k, x in v.items()}
+    v = get("sqs")
+    if v is not None:
+        d["sqs"] = {k: _model(x) for k, x in v.items()}
+    v = get("storageGrid")
+    if v is not None:
+        d["storageGrid"] = {k: _model(x) for k, x in v.items()}
+    v = get("stripe")
+    if v is not None:
+        d["stripe"] = {k: _model(x) for k, x in v.items()}
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    v = get("webhook")
+    if v is not None:
+        d["webhook"] = {k: _model(x) for k, x in v.items()}
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SensorSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("circuit")
+    if v is not None:
+        d["circuit"] = v
+    v = get("dependencies")
+    if v is not None:
+        d["dependencies"] = [_model(x) for x in v]
+    v = get("dependencyGroups")
+    if v is not None:
+        d["dependencyGroups"] = [_model(x) for x in v]
+    v = get("errorOnFailedRound")
+    if v is not None:
+        d["errorOnFailedRound"] = v
+    v = get("eventBusName")
+    if v is not None:
+        d["eventBusName"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    v = get("triggers")
+    if v is not None:
+        d["triggers"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_EventSourceList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_Sensor(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_events_v1alpha1_SensorList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Amount(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return v
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArchivedWorkflowDeletedResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArtifactRepositoryRef(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArtifactRepositoryRefStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = v
+    v = get("default")
+    if v is not None:
+        d["default"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateDeleteResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_Condition(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("status")
+    if v is not None:
+        d["status"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ContinueOn(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("error")
+    if v is not None:
+        d["error"] = v
+    v = get("failed")
+    if v is not None:
+        d["failed"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Counter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CreateS3BucketOptions(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("objectLocking")
+    if v is not None:
+        d["objectLocking"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowDeletedResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowResumeRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowSuspendRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Event(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("selector")
+    if v is not None:
+        d["selector"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_EventResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_ExecutorConfig(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Gauge(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("realtime")
+    if v is not None:
+        d["realtime"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_GetUserInfoResponse(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("email")
+    if v is not None:
+        d["email"] = v
+    v = get("emailVerified")
+    if v is not None:
+        d["emailVerified"] = v
+    v = get("groups")
+    if v is not None:
+        d["groups"] = list(v)
+    v = get("issuer")
+    if v is not None:
+        d["issuer"] = v
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    v = get("subject")
+    if v is not None:
+        d["subject"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Header(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Histogram(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("buckets")
+    if v is not None:
+        d["buckets"] = [_model(x) for x in v]
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Item(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return _value(v)
+
+
+def dump_io_argoproj_workflow_v1alpha1_Link(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("scope")
+    if v is not None:
+        d["scope"] = v
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_LogEntry(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("content")
+    if v is not None:
+        d["content"] = v
+    v = get("podName")
+    if v is not None:
+        d["podName"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_MemoizationStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("cacheName")
+    if v is not None:
+        d["cacheName"] = v
+    v = get("hit")
+    if v is not None:
+        d["hit"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Metadata(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("annotations")
+    if v is not None:
+        d["annotations"] = dict(v)
+    v = get("labels")
+    if v is not None:
+        d["labels"] = dict(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_MetricLabel(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Mutex(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_MutexHolding(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("holder")
+    if v is not None:
+        d["holder"] = v
+    v = get("mutex")
+    if v is not None:
+        d["mutex"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_MutexStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("holding")
+    if v is not None:
+        d["holding"] = [_model(x) for x in v]
+    v = get("waiting")
+    if v is not None:
+        d["waiting"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_NodeSynchronizationStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("waiting")
+    if v is not None:
+        d["waiting"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_NoneStrategy(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_Prometheus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("counter")
+    if v is not None:
+        d["counter"] = _model(v)
+    v = get("gauge")
+    if v is not None:
+        d["gauge"] = _model(v)
+    v = get("help")
+    if v is not None:
+        d["help"] = v
+    v = get("histogram")
+    if v is not None:
+        d["histogram"] = _model(v)
+    v = get("labels")
+    if v is not None:
+        d["labels"] = [_model(x) for x in v]
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("when")
+    if v is not None:
+        d["when"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_RawArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("data")
+    if v is not None:
+        d["data"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ResourceTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("action")
+    if v is not None:
+        d["action"] = v
+    v = get("failureCondition")
+    if v is not None:
+        d["failureCondition"] = v
+    v = get("flags")
+    if v is not None:
+        d["flags"] = list(v)
+    v = get("manifest")
+    if v is not None:
+        d["manifest"] = v
+    v = get("mergeStrategy")
+    if v is not None:
+        d["mergeStrategy"] = v
+    v = get("setOwnerReference")
+    if v is not None:
+        d["setOwnerReference"] = v
+    v = get("successCondition")
+    if v is not None:
+        d["successCondition"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_RetryNodeAntiAffinity(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_SemaphoreHolding(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("holders")
+    if v is not None:
+        d["holders"] = list(v)
+    v = get("semaphore")
+    if v is not None:
+        d["semaphore"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_SemaphoreStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("holding")
+    if v is not None:
+        d["holding"] = [_model(x) for x in v]
+    v = get("waiting")
+    if v is not None:
+        d["waiting"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_SuppliedValueFrom(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_SuspendTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("duration")
+    if v is not None:
+        d["duration"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_SynchronizationStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("mutex")
+    if v is not None:
+        d["mutex"] = _model(v)
+    v = get("semaphore")
+    if v is not None:
+        d["semaphore"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_TTLStrategy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("secondsAfterCompletion")
+    if v is not None:
+        d["secondsAfterCompletion"] = v
+    v = get("secondsAfterFailure")
+    if v is not None:
+        d["secondsAfterFailure"] = v
+    v = get("secondsAfterSuccess")
+    if v is not None:
+        d["secondsAfterSuccess"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_TarStrategy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("compressionLevel")
+    if v is not None:
+        d["compressionLevel"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_TemplateRef(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("clusterScope")
+    if v is not None:
+        d["clusterScope"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ValueFrom(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("default")
+    if v is not None:
+        d["default"] = v
+    v = get("event")
+    if v is not None:
+        d["event"] = v
+    v = get("jqFilter")
+    if v is not None:
+        d["jqFilter"] = v
+    v = get("jsonPath")
+    if v is not None:
+        d["jsonPath"] = v
+    v = get("parameter")
+    if v is not None:
+        d["parameter"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("supplied")
+    if v is not None:
+        d["supplied"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Version(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("buildDate")
+    if v is not None:
+        d["buildDate"] = v
+    v = get("compiler")
+    if v is not None:
+        d["compiler"] = v
+    v = get("gitCommit")
+    if v is not None:
+        d["gitCommit"] = v
+    v = get("gitTag")
+    if v is not None:
+        d["gitTag"] = v
+    v = get("gitTreeState")
+    if v is not None:
+        d["gitTreeState"] = v
+    v = get("goVersion")
+    if v is not None:
+        d["goVersion"] = v
+    v = get("platform")
+    if v is not None:
+        d["platform"] = v
+    v = get("version")
+    if v is not None:
+        d["version"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_VolumeClaimGC(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("strategy")
+    if v is not None:
+        d["strategy"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowDeleteResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowResubmitRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("memoized")
+    if v is not None:
+        d["memoized"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowResumeRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("nodeFieldSelector")
+    if v is not None:
+        d["nodeFieldSelector"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowRetryRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("nodeFieldSelector")
+    if v is not None:
+        d["nodeFieldSelector"] = v
+    v = get("restartSuccessful")
+    if v is not None:
+        d["restartSuccessful"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowSetRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("nodeFieldSelector")
+    if v is not None:
+        d["nodeFieldSelector"] = v
+    v = get("outputParameters")
+    if v is not None:
+        d["outputParameters"] = v
+    v = get("phase")
+    if v is not None:
+        d["phase"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowStopRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("nodeFieldSelector")
+    if v is not None:
+        d["nodeFieldSelector"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowSuspendRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateDeleteResponse(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateRef(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("clusterScope")
+    if v is not None:
+        d["clusterScope"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTerminateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ZipStrategy(m):
+    return {}
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArchiveStrategy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("none")
+    if v is not None:
+        d["none"] = _model(v)
+    v = get("tar")
+    if v is not None:
+        d["tar"] = _model(v)
+    v = get("zip")
+    if v is not None:
+        d["zip"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArtifactoryArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("passwordSecret")
+    if v is not None:
+        d["passwordSecret"] = _model(v)
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    v = get("usernameSecret")
+    if v is not None:
+        d["usernameSecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Backoff(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("duration")
+    if v is not None:
+        d["duration"] = v
+    v = get("factor")
+    if v is not None:
+        d["factor"] = _model(v)
+    v = get("maxDuration")
+    if v is not None:
+        d["maxDuration"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Cache(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("active")
+    if v is not None:
+        d["active"] = [_model(x) for x in v]
+    v = get("conditions")
+    if v is not None:
+        d["conditions"] = [_model(x) for x in v]
+    v = get("lastScheduledTime")
+    if v is not None:
+        d["lastScheduledTime"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_GCSArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("bucket")
+    if v is not None:
+        d["bucket"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("serviceAccountKeySecret")
+    if v is not None:
+        d["serviceAccountKeySecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_GitArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("depth")
+    if v is not None:
+        d["depth"] = v
+    v = get("fetch")
+    if v is not None:
+        d["fetch"] = list(v)
+    v = get("insecureIgnoreHostKey")
+    if v is not None:
+        d["insecureIgnoreHostKey"] = v
+    v = get("passwordSecret")
+    if v is not None:
+        d["passwordSecret"] = _model(v)
+    v = get("repo")
+    if v is not None:
+        d["repo"] = v
+    v = get("revision")
+    if v is not None:
+        d["revision"] = v
+    v = get("sshPrivateKeySecret")
+    if v is not None:
+        d["sshPrivateKeySecret"] = _model(v)
+    v = get("usernameSecret")
+    if v is not None:
+        d["usernameSecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_HDFSArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("addresses")
+    if v is not None:
+        d["addresses"] = list(v)
+    v = get("force")
+    if v is not None:
+        d["force"] = v
+    v = get("hdfsUser")
+    if v is not None:
+        d["hdfsUser"] = v
+    v = get("krbCCacheSecret")
+    if v is not None:
+        d["krbCCacheSecret"] = _model(v)
+    v = get("krbConfigConfigMap")
+    if v is not None:
+        d["krbConfigConfigMap"] = _model(v)
+    v = get("krbKeytabSecret")
+    if v is not None:
+        d["krbKeytabSecret"] = _model(v)
+    v = get("krbRealm")
+    if v is not None:
+        d["krbRealm"] = v
+    v = get("krbServicePrincipalName")
+    if v is not None:
+        d["krbServicePrincipalName"] = v
+    v = get("krbUsername")
+    if v is not None:
+        d["krbUsername"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_HTTPArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("headers")
+    if v is not None:
+        d["headers"] = [_model(x) for x in v]
+    v = get("url")
+    if v is not None:
+        d["url"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_InfoResponse(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("links")
+    if v is not None:
+        d["links"] = [_model(x) for x in v]
+    v = get("managedNamespace")
+    if v is not None:
+        d["managedNamespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Memoize(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("cache")
+    if v is not None:
+        d["cache"] = _model(v)
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("maxAge")
+    if v is not None:
+        d["maxAge"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Metrics(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("prometheus")
+    if v is not None:
+        d["prometheus"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_OSSArtifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKeySecret")
+    if v is not None:
+        d["accessKeySecret"] = _model(v)
+    v = get("bucket")
+    if v is not None:
+        d["bucket"] = v
+    v = get("createBucketIfNotPresent")
+    if v is not None:
+        d["createBucketIfNotPresent"] = v
+    v = get("endpoint")
+    if v is not None:
+        d["endpoint"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("secretKeySecret")
+    if v is not None:
+        d["secretKeySecret"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Parameter(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("default")
+    if v is not None:
+        d["default"] = v
+    v = get("enum")
+    if v is not None:
+        d["enum"] = list(v)
+    v = get("globalName")
+    if v is not None:
+        d["globalName"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    v = get("valueFrom")
+    if v is not None:
+        d["valueFrom"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_RetryAffinity(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("nodeAntiAffinity")
+    if v is not None:
+        d["nodeAntiAffinity"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_RetryStrategy(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("affinity")
+    if v is not None:
+        d["affinity"] = _model(v)
+    v = get("backoff")
+    if v is not None:
+        d["backoff"] = _model(v)
+    v = get("limit")
+    if v is not None:
+        d["limit"] = _model(v)
+    v = get("retryPolicy")
+    if v is not None:
+        d["retryPolicy"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_S3Artifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessKeySecret")
+    if v is not None:
+        d["accessKeySecret"] = _model(v)
+    v = get("bucket")
+    if v is not None:
+        d["bucket"] = v
+    v = get("createBucketIfNotPresent")
+    if v is not None:
+        d["createBucketIfNotPresent"] = _model(v)
+    v = get("endpoint")
+    if v is not None:
+        d["endpoint"] = v
+    v = get("insecure")
+    if v is not None:
+        d["insecure"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("region")
+    if v is not None:
+        d["region"] = v
+    v = get("roleARN")
+    if v is not None:
+        d["roleARN"] = v
+    v = get("secretKeySecret")
+    if v is not None:
+        d["secretKeySecret"] = _model(v)
+    v = get("useSDKCreds")
+    if v is not None:
+        d["useSDKCreds"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_SemaphoreRef(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMapKeyRef")
+    if v is not None:
+        d["configMapKeyRef"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Sequence(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("count")
+    if v is not None:
+        d["count"] = _model(v)
+    v = get("end")
+    if v is not None:
+        d["end"] = _model(v)
+    v = get("format")
+    if v is not None:
+        d["format"] = v
+    v = get("start")
+    if v is not None:
+        d["start"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_SubmitOpts(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("annotations")
+    if v is not None:
+        d["annotations"] = v
+    v = get("dryRun")
+    if v is not None:
+        d["dryRun"] = v
+    v = get("entryPoint")
+    if v is not None:
+        d["entryPoint"] = v
+    v = get("generateName")
+    if v is not None:
+        d["generateName"] = v
+    v = get("labels")
+    if v is not None:
+        d["labels"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("ownerReference")
+    if v is not None:
+        d["ownerReference"] = _model(v)
+    v = get("parameterFile")
+    if v is not None:
+        d["parameterFile"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = list(v)
+    v = get("serverDryRun")
+    if v is not None:
+        d["serverDryRun"] = v
+    v = get("serviceAccount")
+    if v is not None:
+        d["serviceAccount"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Synchronization(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("mutex")
+    if v is not None:
+        d["mutex"] = _model(v)
+    v = get("semaphore")
+    if v is not None:
+        d["semaphore"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowSubmitRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("resourceKind")
+    if v is not None:
+        d["resourceKind"] = v
+    v = get("resourceName")
+    if v is not None:
+        d["resourceName"] = v
+    v = get("submitOptions")
+    if v is not None:
+        d["submitOptions"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Artifact(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("archive")
+    if v is not None:
+        d["archive"] = _model(v)
+    v = get("archiveLogs")
+    if v is not None:
+        d["archiveLogs"] = v
+    v = get("artifactory")
+    if v is not None:
+        d["artifactory"] = _model(v)
+    v = get("from_")
+    if v is not None:
+        d["from"] = v
+    v = get("gcs")
+    if v is not None:
+        d["gcs"] = _model(v)
+    v = get("git")
+    if v is not None:
+        d["git"] = _model(v)
+    v = get("globalName")
+    if v is not None:
+        d["globalName"] = v
+    v = get("hdfs")
+    if v is not None:
+        d["hdfs"] = _model(v)
+    v = get("http")
+    if v is not None:
+        d["http"] = _model(v)
+    v = get("mode")
+    if v is not None:
+        d["mode"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    v = get("oss")
+    if v is not None:
+        d["oss"] = _model(v)
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("raw")
+    if v is not None:
+        d["raw"] = _model(v)
+    v = get("recurseMode")
+    if v is not None:
+        d["recurseMode"] = v
+    v = get("s3")
+    if v is not None:
+        d["s3"] = _model(v)
+    v = get("subPath")
+    if v is not None:
+        d["subPath"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ArtifactLocation(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("archiveLogs")
+    if v is not None:
+        d["archiveLogs"] = v
+    v = get("artifactory")
+    if v is not None:
+        d["artifactory"] = _model(v)
+    v = get("gcs")
+    if v is not None:
+        d["gcs"] = _model(v)
+    v = get("git")
+    if v is not None:
+        d["git"] = _model(v)
+    v = get("hdfs")
+    if v is not None:
+        d["hdfs"] = _model(v)
+    v = get("http")
+    if v is not None:
+        d["http"] = _model(v)
+    v = get("oss")
+    if v is not None:
+        d["oss"] = _model(v)
+    v = get("raw")
+    if v is not None:
+        d["raw"] = _model(v)
+    v = get("s3")
+    if v is not None:
+        d["s3"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Inputs(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("artifacts")
+    if v is not None:
+        d["artifacts"] = [_model(x) for x in v]
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Outputs(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("artifacts")
+    if v is not None:
+        d["artifacts"] = [_model(x) for x in v]
+    v = get("exitCode")
+    if v is not None:
+        d["exitCode"] = v
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    v = get("result")
+    if v is not None:
+        d["result"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_PodGC(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("labelSelector")
+    if v is not None:
+        d["labelSelector"] = _model(v)
+    v = get("strategy")
+    if v is not None:
+        d["strategy"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Arguments(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("artifacts")
+    if v is not None:
+        d["artifacts"] = [_model(x) for x in v]
+    v = get("parameters")
+    if v is not None:
+        d["parameters"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_DAGTask(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("arguments")
+    if v is not None:
+        d["arguments"] = _model(v)
+    v = get("continueOn")
+    if v is not None:
+        d["continueOn"] = _model(v)
+    v = get("dependencies")
+    if v is not None:
+        d["dependencies"] = list(v)
+    v = get("depends")
+    if v is not None:
+        d["depends"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("onExit")
+    if v is not None:
+        d["onExit"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = v
+    v = get("templateRef")
+    if v is not None:
+        d["templateRef"] = _model(v)
+    v = get("when")
+    if v is not None:
+        d["when"] = v
+    v = get("withItems")
+    if v is not None:
+        d["withItems"] = [_model(x) for x in v]
+    v = get("withParam")
+    if v is not None:
+        d["withParam"] = v
+    v = get("withSequence")
+    if v is not None:
+        d["withSequence"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_DAGTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("failFast")
+    if v is not None:
+        d["failFast"] = v
+    v = get("target")
+    if v is not None:
+        d["target"] = v
+    v = get("tasks")
+    if v is not None:
+        d["tasks"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_NodeStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("boundaryID")
+    if v is not None:
+        d["boundaryID"] = v
+    v = get("children")
+    if v is not None:
+        d["children"] = list(v)
+    v = get("daemoned")
+    if v is not None:
+        d["daemoned"] = v
+    v = get("displayName")
+    if v is not None:
+        d["displayName"] = v
+    v = get("estimatedDuration")
+    if v is not None:
+        d["estimatedDuration"] = v
+    v = get("finishedAt")
+    if v is not None:
+        d["finishedAt"] = _model(v)
+    v = get("hostNodeName")
+    if v is not None:
+        d["hostNodeName"] = v
+    v = get("id")
+    if v is not None:
+        d["id"] = v
+    v = get("inputs")
+    if v is not None:
+        d["inputs"] = _model(v)
+    v = get("memoizationStatus")
+    if v is not None:
+        d["memoizationStatus"] = _model(v)
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("outboundNodes")
+    if v is not None:
+        d["outboundNodes"] = list(v)
+    v = get("outputs")
+    if v is not None:
+        d["outputs"] = _model(v)
+    v = get("phase")
+    if v is not None:
+        d["phase"] = v
+    v = get("podIP")
+    if v is not None:
+        d["podIP"] = v
+    v = get("progress")
+    if v is not None:
+        d["progress"] = v
+    v = get("resourcesDuration")
+    if v is not None:
+        d["resourcesDuration"] = dict(v)
+    v = get("startedAt")
+    if v is not None:
+        d["startedAt"] = _model(v)
+    v = get("synchronizationStatus")
+    if v is not None:
+        d["synchronizationStatus"] = _model(v)
+    v = get("templateName")
+    if v is not None:
+        d["templateName"] = v
+    v = get("templateRef")
+    if v is not None:
+        d["templateRef"] = _model(v)
+    v = get("templateScope")
+    if v is not None:
+        d["templateScope"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Submit(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("arguments")
+    if v is not None:
+        d["arguments"] = _model(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("workflowTemplateRef")
+    if v is not None:
+        d["workflowTemplateRef"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowEventBindingSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("event")
+    if v is not None:
+        d["event"] = _model(v)
+    v = get("submit")
+    if v is not None:
+        d["submit"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowStep(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("arguments")
+    if v is not None:
+        d["arguments"] = _model(v)
+    v = get("continueOn")
+    if v is not None:
+        d["continueOn"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("onExit")
+    if v is not None:
+        d["onExit"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = v
+    v = get("templateRef")
+    if v is not None:
+        d["templateRef"] = _model(v)
+    v = get("when")
+    if v is not None:
+        d["when"] = v
+    v = get("withItems")
+    if v is not None:
+        d["withItems"] = [_model(x) for x in v]
+    v = get("withParam")
+    if v is not None:
+        d["withParam"] = v
+    v = get("withSequence")
+    if v is not None:
+        d["withSequence"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ParallelSteps(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return [_model(x) for x in v]
+
+
+def dump_io_argoproj_workflow_v1alpha1_ScriptTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("args")
+    if v is not None:
+        d["args"] = list(v)
+    v = get("command")
+    if v is not None:
+        d["command"] = list(v)
+    v = get("env")
+    if v is not None:
+        d["env"] = [_model(x) for x in v]
+    v = get("envFrom")
+    if v is not None:
+        d["envFrom"] = [_model(x) for x in v]
+    v = get("image")
+    if v is not None:
+        d["image"] = v
+    v = get("imagePullPolicy")
+    if v is not None:
+        d["imagePullPolicy"] = v
+    v = get("lifecycle")
+    if v is not None:
+        d["lifecycle"] = _model(v)
+    v = get("livenessProbe")
+    if v is not None:
+        d["livenessProbe"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("ports")
+    if v is not None:
+        d["ports"] = [_model(x) for x in v]
+    v = get("readinessProbe")
+    if v is not None:
+        d["readinessProbe"] = _model(v)
+    v = get("resources")
+    if v is not None:
+        d["resources"] = _model(v)
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("source")
+    if v is not None:
+        d["source"] = v
+    v = get("startupProbe")
+    if v is not None:
+        d["startupProbe"] = _model(v)
+    v = get("stdin")
+    if v is not None:
+        d["stdin"] = v
+    v = get("stdinOnce")
+    if v is not None:
+        d["stdinOnce"] = v
+    v = get("terminationMessagePath")
+    if v is not None:
+        d["terminationMessagePath"] = v
+    v = get("terminationMessagePolicy")
+    if v is not None:
+        d["terminationMessagePolicy"] = v
+    v = get("tty")
+    if v is not None:
+        d["tty"] = v
+    v = get("volumeDevices")
+    if v is not None:
+        d["volumeDevices"] = [_model(x) for x in v]
+    v = get("volumeMounts")
+    if v is not None:
+        d["volumeMounts"] = [_model(x) for x in v]
+    v = get("workingDir")
+    if v is not None:
+        d["workingDir"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_UserContainer(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("args")
+    if v is not None:
+        d["args"] = list(v)
+    v = get("command")
+    if v is not None:
+        d["command"] = list(v)
+    v = get("env")
+    if v is not None:
+        d["env"] = [_model(x) for x in v]
+    v = get("envFrom")
+    if v is not None:
+        d["envFrom"] = [_model(x) for x in v]
+    v = get("image")
+    if v is not None:
+        d["image"] = v
+    v = get("imagePullPolicy")
+    if v is not None:
+        d["imagePullPolicy"] = v
+    v = get("lifecycle")
+    if v is not None:
+        d["lifecycle"] = _model(v)
+    v = get("livenessProbe")
+    if v is not None:
+        d["livenessProbe"] = _model(v)
+    v = get("mirrorVolumeMounts")
+    if v is not None:
+        d["mirrorVolumeMounts"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("ports")
+    if v is not None:
+        d["ports"] = [_model(x) for x in v]
+    v = get("readinessProbe")
+    if v is not None:
+        d["readinessProbe"] = _model(v)
+    v = get("resources")
+    if v is not None:
+        d["resources"] = _model(v)
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("startupProbe")
+    if v is not None:
+        d["startupProbe"] = _model(v)
+    v = get("stdin")
+    if v is not None:
+        d["stdin"] = v
+    v = get("stdinOnce")
+    if v is not None:
+        d["stdinOnce"] = v
+    v = get("terminationMessagePath")
+    if v is not None:
+        d["terminationMessagePath"] = v
+    v = get("terminationMessagePolicy")
+    if v is not None:
+        d["terminationMessagePolicy"] = v
+    v = get("tty")
+    if v is not None:
+        d["tty"] = v
+    v = get("volumeDevices")
+    if v is not None:
+        d["volumeDevices"] = [_model(x) for x in v]
+    v = get("volumeMounts")
+    if v is not None:
+        d["volumeMounts"] = [_model(x) for x in v]
+    v = get("workingDir")
+    if v is not None:
+        d["workingDir"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowEventBinding(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowEventBindingList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Template(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("activeDeadlineSeconds")
+    if v is not None:
+        d["activeDeadlineSeconds"] = _model(v)
+    v = get("affinity")
+    if v is not None:
+        d["affinity"] = _model(v)
+    v = get("archiveLocation")
+    if v is not None:
+        d["archiveLocation"] = _model(v)
+    v = get("automountServiceAccountToken")
+    if v is not None:
+        d["automountServiceAccountToken"] = v
+    v = get("container")
+    if v is not None:
+        d["container"] = _model(v)
+    v = get("daemon")
+    if v is not None:
+        d["daemon"] = v
+    v = get("dag")
+    if v is not None:
+        d["dag"] = _model(v)
+    v = get("executor")
+    if v is not None:
+        d["executor"] = _model(v)
+    v = get("hostAliases")
+    if v is not None:
+        d["hostAliases"] = [_model(x) for x in v]
+    v = get("initContainers")
+    if v is not None:
+        d["initContainers"] = [_model(x) for x in v]
+    v = get("inputs")
+    if v is not None:
+        d["inputs"] = _model(v)
+    v = get("memoize")
+    if v is not None:
+        d["memoize"] = _model(v)
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("metrics")
+    if v is not None:
+        d["metrics"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("nodeSelector")
+    if v is not None:
+        d["nodeSelector"] = dict(v)
+    v = get("outputs")
+    if v is not None:
+        d["outputs"] = _model(v)
+    v = get("parallelism")
+    if v is not None:
+        d["parallelism"] = v
+    v = get("podSpecPatch")
+    if v is not None:
+        d["podSpecPatch"] = v
+    v = get("priority")
+    if v is not None:
+        d["priority"] = v
+    v = get("priorityClassName")
+    if v is not None:
+        d["priorityClassName"] = v
+    v = get("resource")
+    if v is not None:
+        d["resource"] = _model(v)
+    v = get("retryStrategy")
+    if v is not None:
+        d["retryStrategy"] = _model(v)
+    v = get("schedulerName")
+    if v is not None:
+        d["schedulerName"] = v
+    v = get("script")
+    if v is not None:
+        d["script"] = _model(v)
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    v = get("sidecars")
+    if v is not None:
+        d["sidecars"] = [_model(x) for x in v]
+    v = get("steps")
+    if v is not None:
+        d["steps"] = [_model(x) for x in v]
+    v = get("suspend")
+    if v is not None:
+        d["suspend"] = _model(v)
+    v = get("synchronization")
+    if v is not None:
+        d["synchronization"] = _model(v)
+    v = get("timeout")
+    if v is not None:
+        d["timeout"] = v
+    v = get("tolerations")
+    if v is not None:
+        d["tolerations"] = [_model(x) for x in v]
+    v = get("volumes")
+    if v is not None:
+        d["volumes"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("activeDeadlineSeconds")
+    if v is not None:
+        d["activeDeadlineSeconds"] = v
+    v = get("affinity")
+    if v is not None:
+        d["affinity"] = _model(v)
+    v = get("arguments")
+    if v is not None:
+        d["arguments"] = _model(v)
+    v = get("artifactRepositoryRef")
+    if v is not None:
+        d["artifactRepositoryRef"] = _model(v)
+    v = get("automountServiceAccountToken")
+    if v is not None:
+        d["automountServiceAccountToken"] = v
+    v = get("dnsConfig")
+    if v is not None:
+        d["dnsConfig"] = _model(v)
+    v = get("dnsPolicy")
+    if v is not None:
+        d["dnsPolicy"] = v
+    v = get("entrypoint")
+    if v is not None:
+        d["entrypoint"] = v
+    v = get("executor")
+    if v is not None:
+        d["executor"] = _model(v)
+    v = get("hostAliases")
+    if v is not None:
+        d["hostAliases"] = [_model(x) for x in v]
+    v = get("hostNetwork")
+    if v is not None:
+        d["hostNetwork"] = v
+    v = get("imagePullSecrets")
+    if v is not None:
+        d["imagePullSecrets"] = [_model(x) for x in v]
+    v = get("metrics")
+    if v is not None:
+        d["metrics"] = _model(v)
+    v = get("nodeSelector")
+    if v is not None:
+        d["nodeSelector"] = dict(v)
+    v = get("onExit")
+    if v is not None:
+        d["onExit"] = v
+    v = get("parallelism")
+    if v is not None:
+        d["parallelism"] = v
+    v = get("podDisruptionBudget")
+    if v is not None:
+        d["podDisruptionBudget"] = _model(v)
+    v = get("podGC")
+    if v is not None:
+        d["podGC"] = _model(v)
+    v = get("podMetadata")
+    if v is not None:
+        d["podMetadata"] = _model(v)
+    v = get("podPriority")
+    if v is not None:
+        d["podPriority"] = v
+    v = get("podPriorityClassName")
+    if v is not None:
+        d["podPriorityClassName"] = v
+    v = get("podSpecPatch")
+    if v is not None:
+        d["podSpecPatch"] = v
+    v = get("priority")
+    if v is not None:
+        d["priority"] = v
+    v = get("retryStrategy")
+    if v is not None:
+        d["retryStrategy"] = _model(v)
+    v = get("schedulerName")
+    if v is not None:
+        d["schedulerName"] = v
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    v = get("shutdown")
+    if v is not None:
+        d["shutdown"] = v
+    v = get("suspend")
+    if v is not None:
+        d["suspend"] = v
+    v = get("synchronization")
+    if v is not None:
+        d["synchronization"] = _model(v)
+    v = get("templates")
+    if v is not None:
+        d["templates"] = [_model(x) for x in v]
+    v = get("tolerations")
+    if v is not None:
+        d["tolerations"] = [_model(x) for x in v]
+    v = get("ttlStrategy")
+    if v is not None:
+        d["ttlStrategy"] = _model(v)
+    v = get("volumeClaimGC")
+    if v is not None:
+        d["volumeClaimGC"] = _model(v)
+    v = get("volumeClaimTemplates")
+    if v is not None:
+        d["volumeClaimTemplates"] = [_model(x) for x in v]
+    v = get("volumes")
+    if v is not None:
+        d["volumes"] = [_model(x) for x in v]
+    v = get("workflowTemplateRef")
+    if v is not None:
+        d["workflowTemplateRef"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("artifactRepositoryRef")
+    if v is not None:
+        d["artifactRepositoryRef"] = _model(v)
+    v = get("compressedNodes")
+    if v is not None:
+        d["compressedNodes"] = v
+    v = get("conditions")
+    if v is not None:
+        d["conditions"] = [_model(x) for x in v]
+    v = get("estimatedDuration")
+    if v is not None:
+        d["estimatedDuration"] = v
+    v = get("finishedAt")
+    if v is not None:
+        d["finishedAt"] = _model(v)
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("nodes")
+    if v is not None:
+        d["nodes"] = {k: _model(x) for k, x in v.items()}
+    v = get("offloadNodeStatusVersion")
+    if v is not None:
+        d["offloadNodeStatusVersion"] = v
+    v = get("outputs")
+    if v is not None:
+        d["outputs"] = _model(v)
+    v = get("persistentVolumeClaims")
+    if v is not None:
+        d["persistentVolumeClaims"] = [_model(x) for x in v]
+    v = get("phase")
+    if v is not None:
+        d["phase"] = v
+    v = get("progress")
+    if v is not None:
+        d["progress"] = v
+    v = get("resourcesDuration")
+    if v is not None:
+        d["resourcesDuration"] = dict(v)
+    v = get("startedAt")
+    if v is not None:
+        d["startedAt"] = _model(v)
+    v = get("storedTemplates")
+    if v is not None:
+        d["storedTemplates"] = {k: _model(x) for k, x in v.items()}
+    v = get("storedWorkflowTemplateSpec")
+    if v is not None:
+        d["storedWorkflowTemplateSpec"] = _model(v)
+    v = get("synchronization")
+    if v is not None:
+        d["synchronization"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("activeDeadlineSeconds")
+    if v is not None:
+        d["activeDeadlineSeconds"] = v
+    v = get("affinity")
+    if v is not None:
+        d["affinity"] = _model(v)
+    v = get("arguments")
+    if v is not None:
+        d["arguments"] = _model(v)
+    v = get("artifactRepositoryRef")
+    if v is not None:
+        d["artifactRepositoryRef"] = _model(v)
+    v = get("automountServiceAccountToken")
+    if v is not None:
+        d["automountServiceAccountToken"] = v
+    v = get("dnsConfig")
+    if v is not None:
+        d["dnsConfig"] = _model(v)
+    v = get("dnsPolicy")
+    if v is not None:
+        d["dnsPolicy"] = v
+    v = get("entrypoint")
+    if v is not None:
+        d["entrypoint"] = v
+    v = get("executor")
+    if v is not None:
+        d["executor"] = _model(v)
+    v = get("hostAliases")
+    if v is not None:
+        d["hostAliases"] = [_model(x) for x in v]
+    v = get("hostNetwork")
+    if v is not None:
+        d["hostNetwork"] = v
+    v = get("imagePullSecrets")
+    if v is not None:
+        d["imagePullSecrets"] = [_model(x) for x in v]
+    v = get("metrics")
+    if v is not None:
+        d["metrics"] = _model(v)
+    v = get("nodeSelector")
+    if v is not None:
+        d["nodeSelector"] = dict(v)
+    v = get("onExit")
+    if v is not None:
+        d["onExit"] = v
+    v = get("parallelism")
+    if v is not None:
+        d["parallelism"] = v
+    v = get("podDisruptionBudget")
+    if v is not None:
+        d["podDisruptionBudget"] = _model(v)
+    v = get("podGC")
+    if v is not None:
+        d["podGC"] = _model(v)
+    v = get("podMetadata")
+    if v is not None:
+        d["podMetadata"] = _model(v)
+    v = get("podPriority")
+    if v is not None:
+        d["podPriority"] = v
+    v = get("podPriorityClassName")
+    if v is not None:
+        d["podPriorityClassName"] = v
+    v = get("podSpecPatch")
+    if v is not None:
+        d["podSpecPatch"] = v
+    v = get("priority")
+    if v is not None:
+        d["priority"] = v
+    v = get("retryStrategy")
+    if v is not None:
+        d["retryStrategy"] = _model(v)
+    v = get("schedulerName")
+    if v is not None:
+        d["schedulerName"] = v
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("serviceAccountName")
+    if v is not None:
+        d["serviceAccountName"] = v
+    v = get("shutdown")
+    if v is not None:
+        d["shutdown"] = v
+    v = get("suspend")
+    if v is not None:
+        d["suspend"] = v
+    v = get("synchronization")
+    if v is not None:
+        d["synchronization"] = _model(v)
+    v = get("templates")
+    if v is not None:
+        d["templates"] = [_model(x) for x in v]
+    v = get("tolerations")
+    if v is not None:
+        d["tolerations"] = [_model(x) for x in v]
+    v = get("ttlStrategy")
+    if v is not None:
+        d["ttlStrategy"] = _model(v)
+    v = get("volumeClaimGC")
+    if v is not None:
+        d["volumeClaimGC"] = _model(v)
+    v = get("volumeClaimTemplates")
+    if v is not None:
+        d["volumeClaimTemplates"] = [_model(x) for x in v]
+    v = get("volumes")
+    if v is not None:
+        d["volumes"] = [_model(x) for x in v]
+    v = get("workflowMetadata")
+    if v is not None:
+        d["workflowMetadata"] = _model(v)
+    v = get("workflowTemplateRef")
+    if v is not None:
+        d["workflowTemplateRef"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateCreateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateLintRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateUpdateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("concurrencyPolicy")
+    if v is not None:
+        d["concurrencyPolicy"] = v
+    v = get("failedJobsHistoryLimit")
+    if v is not None:
+        d["failedJobsHistoryLimit"] = v
+    v = get("schedule")
+    if v is not None:
+        d["schedule"] = v
+    v = get("startingDeadlineSeconds")
+    if v is not None:
+        d["startingDeadlineSeconds"] = v
+    v = get("successfulJobsHistoryLimit")
+    if v is not None:
+        d["successfulJobsHistoryLimit"] = v
+    v = get("suspend")
+    if v is not None:
+        d["suspend"] = v
+    v = get("timezone")
+    if v is not None:
+        d["timezone"] = v
+    v = get("workflowMetadata")
+    if v is not None:
+        d["workflowMetadata"] = _model(v)
+    v = get("workflowSpec")
+    if v is not None:
+        d["workflowSpec"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_Workflow(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowCreateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("instanceID")
+    if v is not None:
+        d["instanceID"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("serverDryRun")
+    if v is not None:
+        d["serverDryRun"] = v
+    v = get("workflow")
+    if v is not None:
+        d["workflow"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowLintRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("workflow")
+    if v is not None:
+        d["workflow"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateCreateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateLintRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateUpdateRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("template")
+    if v is not None:
+        d["template"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_WorkflowWatchEvent(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("object")
+    if v is not None:
+        d["object"] = _model(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflow(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CronWorkflowList(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_LintCronWorkflowRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("cronWorkflow")
+    if v is not None:
+        d["cronWorkflow"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_UpdateCronWorkflowRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("cronWorkflow")
+    if v is not None:
+        d["cronWorkflow"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_argoproj_workflow_v1alpha1_CreateCronWorkflowRequest(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("createOptions")
+    if v is not None:
+        d["createOptions"] = _model(v)
+    v = get("cronWorkflow")
+    if v is not None:
+        d["cronWorkflow"] = _model(v)
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_AWSElasticBlockStoreVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("partition")
+    if v is not None:
+        d["partition"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("volumeID")
+    if v is not None:
+        d["volumeID"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_AzureDiskVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("cachingMode")
+    if v is not None:
+        d["cachingMode"] = v
+    v = get("diskName")
+    if v is not None:
+        d["diskName"] = v
+    v = get("diskURI")
+    if v is not None:
+        d["diskURI"] = v
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_AzureFileVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretName")
+    if v is not None:
+        d["secretName"] = v
+    v = get("shareName")
+    if v is not None:
+        d["shareName"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_Capabilities(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("add")
+    if v is not None:
+        d["add"] = list(v)
+    v = get("drop")
+    if v is not None:
+        d["drop"] = list(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_ConfigMapEnvSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ConfigMapKeySelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ContainerPort(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("containerPort")
+    if v is not None:
+        d["containerPort"] = v
+    v = get("hostIP")
+    if v is not None:
+        d["hostIP"] = v
+    v = get("hostPort")
+    if v is not None:
+        d["hostPort"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("protocol")
+    if v is not None:
+        d["protocol"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_EventSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("component")
+    if v is not None:
+        d["component"] = v
+    v = get("host")
+    if v is not None:
+        d["host"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ExecAction(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("command")
+    if v is not None:
+        d["command"] = list(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_FCVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("lun")
+    if v is not None:
+        d["lun"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("targetWWNs")
+    if v is not None:
+        d["targetWWNs"] = list(v)
+    v = get("wwids")
+    if v is not None:
+        d["wwids"] = list(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_FlockerVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("datasetName")
+    if v is not None:
+        d["datasetName"] = v
+    v = get("datasetUUID")
+    if v is not None:
+        d["datasetUUID"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_GCEPersistentDiskVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("partition")
+    if v is not None:
+        d["partition"] = v
+    v = get("pdName")
+    if v is not None:
+        d["pdName"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_GitRepoVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("directory")
+    if v is not None:
+        d["directory"] = v
+    v = get("repository")
+    if v is not None:
+        d["repository"] = v
+    v = get("revision")
+    if v is not None:
+        d["revision"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_GlusterfsVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("endpoints")
+    if v is not None:
+        d["endpoints"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_HTTPHeader(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_HostAlias(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("hostnames")
+    if v is not None:
+        d["hostnames"] = list(v)
+    v = get("ip")
+    if v is not None:
+        d["ip"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_HostPathVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_KeyToPath(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("mode")
+    if v is not None:
+        d["mode"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_LocalObjectReference(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_NFSVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("server")
+    if v is not None:
+        d["server"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_NodeSelectorRequirement(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("operator")
+    if v is not None:
+        d["operator"] = v
+    v = get("values")
+    if v is not None:
+        d["values"] = list(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_NodeSelectorTerm(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("matchExpressions")
+    if v is not None:
+        d["matchExpressions"] = [_model(x) for x in v]
+    v = get("matchFields")
+    if v is not None:
+        d["matchFields"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_ObjectFieldSelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("fieldPath")
+    if v is not None:
+        d["fieldPath"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ObjectReference(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("fieldPath")
+    if v is not None:
+        d["fieldPath"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("resourceVersion")
+    if v is not None:
+        d["resourceVersion"] = v
+    v = get("uid")
+    if v is not None:
+        d["uid"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaimVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("claimName")
+    if v is not None:
+        d["claimName"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PhotonPersistentDiskVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("pdID")
+    if v is not None:
+        d["pdID"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodDNSConfigOption(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PortworxVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("volumeID")
+    if v is not None:
+        d["volumeID"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PreferredSchedulingTerm(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("preference")
+    if v is not None:
+        d["preference"] = _model(v)
+    v = get("weight")
+    if v is not None:
+        d["weight"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_QuobyteVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("group")
+    if v is not None:
+        d["group"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("registry")
+    if v is not None:
+        d["registry"] = v
+    v = get("tenant")
+    if v is not None:
+        d["tenant"] = v
+    v = get("user")
+    if v is not None:
+        d["user"] = v
+    v = get("volume")
+    if v is not None:
+        d["volume"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_RBDVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("image")
+    if v is not None:
+        d["image"] = v
+    v = get("keyring")
+    if v is not None:
+        d["keyring"] = v
+    v = get("monitors")
+    if v is not None:
+        d["monitors"] = list(v)
+    v = get("pool")
+    if v is not None:
+        d["pool"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("user")
+    if v is not None:
+        d["user"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_SELinuxOptions(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("level")
+    if v is not None:
+        d["level"] = v
+    v = get("role")
+    if v is not None:
+        d["role"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    v = get("user")
+    if v is not None:
+        d["user"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ScaleIOVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("gateway")
+    if v is not None:
+        d["gateway"] = v
+    v = get("protectionDomain")
+    if v is not None:
+        d["protectionDomain"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("sslEnabled")
+    if v is not None:
+        d["sslEnabled"] = v
+    v = get("storageMode")
+    if v is not None:
+        d["storageMode"] = v
+    v = get("storagePool")
+    if v is not None:
+        d["storagePool"] = v
+    v = get("system")
+    if v is not None:
+        d["system"] = v
+    v = get("volumeName")
+    if v is not None:
+        d["volumeName"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_SecretEnvSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_SecretKeySelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_SecretProjection(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_SecretVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("defaultMode")
+    if v is not None:
+        d["defaultMode"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    v = get("secretName")
+    if v is not None:
+        d["secretName"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ServiceAccountTokenProjection(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("audience")
+    if v is not None:
+        d["audience"] = v
+    v = get("expirationSeconds")
+    if v is not None:
+        d["expirationSeconds"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_StorageOSVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("volumeName")
+    if v is not None:
+        d["volumeName"] = v
+    v = get("volumeNamespace")
+    if v is not None:
+        d["volumeNamespace"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_Sysctl(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_Toleration(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("effect")
+    if v is not None:
+        d["effect"] = v
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("operator")
+    if v is not None:
+        d["operator"] = v
+    v = get("tolerationSeconds")
+    if v is not None:
+        d["tolerationSeconds"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_TypedLocalObjectReference(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiGroup")
+    if v is not None:
+        d["apiGroup"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_VolumeDevice(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("devicePath")
+    if v is not None:
+        d["devicePath"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_VolumeMount(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("mountPath")
+    if v is not None:
+        d["mountPath"] = v
+    v = get("mountPropagation")
+    if v is not None:
+        d["mountPropagation"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("subPath")
+    if v is not None:
+        d["subPath"] = v
+    v = get("subPathExpr")
+    if v is not None:
+        d["subPathExpr"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_VsphereVirtualDiskVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("storagePolicyID")
+    if v is not None:
+        d["storagePolicyID"] = v
+    v = get("storagePolicyName")
+    if v is not None:
+        d["storagePolicyName"] = v
+    v = get("volumePath")
+    if v is not None:
+        d["volumePath"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_WindowsSecurityContextOptions(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("gmsaCredentialSpec")
+    if v is not None:
+        d["gmsaCredentialSpec"] = v
+    v = get("gmsaCredentialSpecName")
+    if v is not None:
+        d["gmsaCredentialSpecName"] = v
+    v = get("runAsUserName")
+    if v is not None:
+        d["runAsUserName"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_CSIVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("driver")
+    if v is not None:
+        d["driver"] = v
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("nodePublishSecretRef")
+    if v is not None:
+        d["nodePublishSecretRef"] = _model(v)
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("volumeAttributes")
+    if v is not None:
+        d["volumeAttributes"] = dict(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_CephFSVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("monitors")
+    if v is not None:
+        d["monitors"] = list(v)
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretFile")
+    if v is not None:
+        d["secretFile"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("user")
+    if v is not None:
+        d["user"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_CinderVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("volumeID")
+    if v is not None:
+        d["volumeID"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ConfigMapProjection(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ConfigMapVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("defaultMode")
+    if v is not None:
+        d["defaultMode"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("optional")
+    if v is not None:
+        d["optional"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_EmptyDirVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("medium")
+    if v is not None:
+        d["medium"] = v
+    v = get("sizeLimit")
+    if v is not None:
+        d["sizeLimit"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_EnvFromSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMapRef")
+    if v is not None:
+        d["configMapRef"] = _model(v)
+    v = get("prefix")
+    if v is not None:
+        d["prefix"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_EventSeries(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("count")
+    if v is not None:
+        d["count"] = v
+    v = get("lastObservedTime")
+    if v is not None:
+        d["lastObservedTime"] = _model(v)
+    v = get("state")
+    if v is not None:
+        d["state"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_FlexVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("driver")
+    if v is not None:
+        d["driver"] = v
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("options")
+    if v is not None:
+        d["options"] = dict(v)
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_HTTPGetAction(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("host")
+    if v is not None:
+        d["host"] = v
+    v = get("httpHeaders")
+    if v is not None:
+        d["httpHeaders"] = [_model(x) for x in v]
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("port")
+    if v is not None:
+        d["port"] = _model(v)
+    v = get("scheme")
+    if v is not None:
+        d["scheme"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ISCSIVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("chapAuthDiscovery")
+    if v is not None:
+        d["chapAuthDiscovery"] = v
+    v = get("chapAuthSession")
+    if v is not None:
+        d["chapAuthSession"] = v
+    v = get("fsType")
+    if v is not None:
+        d["fsType"] = v
+    v = get("initiatorName")
+    if v is not None:
+        d["initiatorName"] = v
+    v = get("iqn")
+    if v is not None:
+        d["iqn"] = v
+    v = get("iscsiInterface")
+    if v is not None:
+        d["iscsiInterface"] = v
+    v = get("lun")
+    if v is not None:
+        d["lun"] = v
+    v = get("portals")
+    if v is not None:
+        d["portals"] = list(v)
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("secretRef")
+    if v is not None:
+        d["secretRef"] = _model(v)
+    v = get("targetPortal")
+    if v is not None:
+        d["targetPortal"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_NodeSelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("nodeSelectorTerms")
+    if v is not None:
+        d["nodeSelectorTerms"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaimCondition(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("lastProbeTime")
+    if v is not None:
+        d["lastProbeTime"] = _model(v)
+    v = get("lastTransitionTime")
+    if v is not None:
+        d["lastTransitionTime"] = _model(v)
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("reason")
+    if v is not None:
+        d["reason"] = v
+    v = get("status")
+    if v is not None:
+        d["status"] = v
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaimStatus(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessModes")
+    if v is not None:
+        d["accessModes"] = list(v)
+    v = get("capacity")
+    if v is not None:
+        d["capacity"] = {k: _model(x) for k, x in v.items()}
+    v = get("conditions")
+    if v is not None:
+        d["conditions"] = [_model(x) for x in v]
+    v = get("phase")
+    if v is not None:
+        d["phase"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodDNSConfig(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("nameservers")
+    if v is not None:
+        d["nameservers"] = list(v)
+    v = get("options")
+    if v is not None:
+        d["options"] = [_model(x) for x in v]
+    v = get("searches")
+    if v is not None:
+        d["searches"] = list(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodSecurityContext(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fsGroup")
+    if v is not None:
+        d["fsGroup"] = v
+    v = get("runAsGroup")
+    if v is not None:
+        d["runAsGroup"] = v
+    v = get("runAsNonRoot")
+    if v is not None:
+        d["runAsNonRoot"] = v
+    v = get("runAsUser")
+    if v is not None:
+        d["runAsUser"] = v
+    v = get("seLinuxOptions")
+    if v is not None:
+        d["seLinuxOptions"] = _model(v)
+    v = get("supplementalGroups")
+    if v is not None:
+        d["supplementalGroups"] = list(v)
+    v = get("sysctls")
+    if v is not None:
+        d["sysctls"] = [_model(x) for x in v]
+    v = get("windowsOptions")
+    if v is not None:
+        d["windowsOptions"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_ResourceFieldSelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("containerName")
+    if v is not None:
+        d["containerName"] = v
+    v = get("divisor")
+    if v is not None:
+        d["divisor"] = _model(v)
+    v = get("resource")
+    if v is not None:
+        d["resource"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ResourceRequirements(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("limits")
+    if v is not None:
+        d["limits"] = {k: _model(x) for k, x in v.items()}
+    v = get("requests")
+    if v is not None:
+        d["requests"] = {k: _model(x) for k, x in v.items()}
+    return d
+
+
+def dump_io_k8s_api_core_v1_SecurityContext(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("allowPrivilegeEscalation")
+    if v is not None:
+        d["allowPrivilegeEscalation"] = v
+    v = get("capabilities")
+    if v is not None:
+        d["capabilities"] = _model(v)
+    v = get("privileged")
+    if v is not None:
+        d["privileged"] = v
+    v = get("procMount")
+    if v is not None:
+        d["procMount"] = v
+    v = get("readOnlyRootFilesystem")
+    if v is not None:
+        d["readOnlyRootFilesystem"] = v
+    v = get("runAsGroup")
+    if v is not None:
+        d["runAsGroup"] = v
+    v = get("runAsNonRoot")
+    if v is not None:
+        d["runAsNonRoot"] = v
+    v = get("runAsUser")
+    if v is not None:
+        d["runAsUser"] = v
+    v = get("seLinuxOptions")
+    if v is not None:
+        d["seLinuxOptions"] = _model(v)
+    v = get("windowsOptions")
+    if v is not None:
+        d["windowsOptions"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_ServicePort(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("nodePort")
+    if v is not None:
+        d["nodePort"] = v
+    v = get("port")
+    if v is not None:
+        d["port"] = v
+    v = get("protocol")
+    if v is not None:
+        d["protocol"] = v
+    v = get("targetPort")
+    if v is not None:
+        d["targetPort"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_TCPSocketAction(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("host")
+    if v is not None:
+        d["host"] = v
+    v = get("port")
+    if v is not None:
+        d["port"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_DownwardAPIVolumeFile(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("fieldRef")
+    if v is not None:
+        d["fieldRef"] = _model(v)
+    v = get("mode")
+    if v is not None:
+        d["mode"] = v
+    v = get("path")
+    if v is not None:
+        d["path"] = v
+    v = get("resourceFieldRef")
+    if v is not None:
+        d["resourceFieldRef"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_DownwardAPIVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("defaultMode")
+    if v is not None:
+        d["defaultMode"] = v
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_EnvVarSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMapKeyRef")
+    if v is not None:
+        d["configMapKeyRef"] = _model(v)
+    v = get("fieldRef")
+    if v is not None:
+        d["fieldRef"] = _model(v)
+    v = get("resourceFieldRef")
+    if v is not None:
+        d["resourceFieldRef"] = _model(v)
+    v = get("secretKeyRef")
+    if v is not None:
+        d["secretKeyRef"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_Event(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("action")
+    if v is not None:
+        d["action"] = v
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("count")
+    if v is not None:
+        d["count"] = v
+    v = get("eventTime")
+    if v is not None:
+        d["eventTime"] = _model(v)
+    v = get("firstTimestamp")
+    if v is not None:
+        d["firstTimestamp"] = _model(v)
+    v = get("involvedObject")
+    if v is not None:
+        d["involvedObject"] = _model(v)
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("lastTimestamp")
+    if v is not None:
+        d["lastTimestamp"] = _model(v)
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("reason")
+    if v is not None:
+        d["reason"] = v
+    v = get("related")
+    if v is not None:
+        d["related"] = _model(v)
+    v = get("reportingComponent")
+    if v is not None:
+        d["reportingComponent"] = v
+    v = get("reportingInstance")
+    if v is not None:
+        d["reportingInstance"] = v
+    v = get("series")
+    if v is not None:
+        d["series"] = _model(v)
+    v = get("source")
+    if v is not None:
+        d["source"] = _model(v)
+    v = get("type")
+    if v is not None:
+        d["type"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_Handler(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("exec")
+    if v is not None:
+        d["exec"] = _model(v)
+    v = get("httpGet")
+    if v is not None:
+        d["httpGet"] = _model(v)
+    v = get("tcpSocket")
+    if v is not None:
+        d["tcpSocket"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_Lifecycle(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("postStart")
+    if v is not None:
+        d["postStart"] = _model(v)
+    v = get("preStop")
+    if v is not None:
+        d["preStop"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_NodeAffinity(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("preferredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["preferredDuringSchedulingIgnoredDuringExecution"] = [_model(x) for x in v]
+    v = get("requiredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["requiredDuringSchedulingIgnoredDuringExecution"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaimSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("accessModes")
+    if v is not None:
+        d["accessModes"] = list(v)
+    v = get("dataSource")
+    if v is not None:
+        d["dataSource"] = _model(v)
+    v = get("resources")
+    if v is not None:
+        d["resources"] = _model(v)
+    v = get("selector")
+    if v is not None:
+        d["selector"] = _model(v)
+    v = get("storageClassName")
+    if v is not None:
+        d["storageClassName"] = v
+    v = get("volumeMode")
+    if v is not None:
+        d["volumeMode"] = v
+    v = get("volumeName")
+    if v is not None:
+        d["volumeName"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaimTemplate(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodAffinityTerm(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("labelSelector")
+    if v is not None:
+        d["labelSelector"] = _model(v)
+    v = get("namespaces")
+    if v is not None:
+        d["namespaces"] = list(v)
+    v = get("topologyKey")
+    if v is not None:
+        d["topologyKey"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_Probe(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("exec")
+    if v is not None:
+        d["exec"] = _model(v)
+    v = get("failureThreshold")
+    if v is not None:
+        d["failureThreshold"] = v
+    v = get("httpGet")
+    if v is not None:
+        d["httpGet"] = _model(v)
+    v = get("initialDelaySeconds")
+    if v is not None:
+        d["initialDelaySeconds"] = v
+    v = get("periodSeconds")
+    if v is not None:
+        d["periodSeconds"] = v
+    v = get("successThreshold")
+    if v is not None:
+        d["successThreshold"] = v
+    v = get("tcpSocket")
+    if v is not None:
+        d["tcpSocket"] = _model(v)
+    v = get("timeoutSeconds")
+    if v is not None:
+        d["timeoutSeconds"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_WeightedPodAffinityTerm(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("podAffinityTerm")
+    if v is not None:
+        d["podAffinityTerm"] = _model(v)
+    v = get("weight")
+    if v is not None:
+        d["weight"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_DownwardAPIProjection(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("items")
+    if v is not None:
+        d["items"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_EnvVar(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("value")
+    if v is not None:
+        d["value"] = v
+    v = get("valueFrom")
+    if v is not None:
+        d["valueFrom"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_EphemeralVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("readOnly")
+    if v is not None:
+        d["readOnly"] = v
+    v = get("volumeClaimTemplate")
+    if v is not None:
+        d["volumeClaimTemplate"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_PersistentVolumeClaim(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("metadata")
+    if v is not None:
+        d["metadata"] = _model(v)
+    v = get("spec")
+    if v is not None:
+        d["spec"] = _model(v)
+    v = get("status")
+    if v is not None:
+        d["status"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodAffinity(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("preferredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["preferredDuringSchedulingIgnoredDuringExecution"] = [_model(x) for x in v]
+    v = get("requiredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["requiredDuringSchedulingIgnoredDuringExecution"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_PodAntiAffinity(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("preferredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["preferredDuringSchedulingIgnoredDuringExecution"] = [_model(x) for x in v]
+    v = get("requiredDuringSchedulingIgnoredDuringExecution")
+    if v is not None:
+        d["requiredDuringSchedulingIgnoredDuringExecution"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_VolumeProjection(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = _model(v)
+    v = get("downwardAPI")
+    if v is not None:
+        d["downwardAPI"] = _model(v)
+    v = get("secret")
+    if v is not None:
+        d["secret"] = _model(v)
+    v = get("serviceAccountToken")
+    if v is not None:
+        d["serviceAccountToken"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_Affinity(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("nodeAffinity")
+    if v is not None:
+        d["nodeAffinity"] = _model(v)
+    v = get("podAffinity")
+    if v is not None:
+        d["podAffinity"] = _model(v)
+    v = get("podAntiAffinity")
+    if v is not None:
+        d["podAntiAffinity"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_core_v1_Container(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("args")
+    if v is not None:
+        d["args"] = list(v)
+    v = get("command")
+    if v is not None:
+        d["command"] = list(v)
+    v = get("env")
+    if v is not None:
+        d["env"] = [_model(x) for x in v]
+    v = get("envFrom")
+    if v is not None:
+        d["envFrom"] = [_model(x) for x in v]
+    v = get("image")
+    if v is not None:
+        d["image"] = v
+    v = get("imagePullPolicy")
+    if v is not None:
+        d["imagePullPolicy"] = v
+    v = get("lifecycle")
+    if v is not None:
+        d["lifecycle"] = _model(v)
+    v = get("livenessProbe")
+    if v is not None:
+        d["livenessProbe"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("ports")
+    if v is not None:
+        d["ports"] = [_model(x) for x in v]
+    v = get("readinessProbe")
+    if v is not None:
+        d["readinessProbe"] = _model(v)
+    v = get("resources")
+    if v is not None:
+        d["resources"] = _model(v)
+    v = get("securityContext")
+    if v is not None:
+        d["securityContext"] = _model(v)
+    v = get("startupProbe")
+    if v is not None:
+        d["startupProbe"] = _model(v)
+    v = get("stdin")
+    if v is not None:
+        d["stdin"] = v
+    v = get("stdinOnce")
+    if v is not None:
+        d["stdinOnce"] = v
+    v = get("terminationMessagePath")
+    if v is not None:
+        d["terminationMessagePath"] = v
+    v = get("terminationMessagePolicy")
+    if v is not None:
+        d["terminationMessagePolicy"] = v
+    v = get("tty")
+    if v is not None:
+        d["tty"] = v
+    v = get("volumeDevices")
+    if v is not None:
+        d["volumeDevices"] = [_model(x) for x in v]
+    v = get("volumeMounts")
+    if v is not None:
+        d["volumeMounts"] = [_model(x) for x in v]
+    v = get("workingDir")
+    if v is not None:
+        d["workingDir"] = v
+    return d
+
+
+def dump_io_k8s_api_core_v1_ProjectedVolumeSource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("defaultMode")
+    if v is not None:
+        d["defaultMode"] = v
+    v = get("sources")
+    if v is not None:
+        d["sources"] = [_model(x) for x in v]
+    return d
+
+
+def dump_io_k8s_api_core_v1_Volume(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("awsElasticBlockStore")
+    if v is not None:
+        d["awsElasticBlockStore"] = _model(v)
+    v = get("azureDisk")
+    if v is not None:
+        d["azureDisk"] = _model(v)
+    v = get("azureFile")
+    if v is not None:
+        d["azureFile"] = _model(v)
+    v = get("cephfs")
+    if v is not None:
+        d["cephfs"] = _model(v)
+    v = get("cinder")
+    if v is not None:
+        d["cinder"] = _model(v)
+    v = get("configMap")
+    if v is not None:
+        d["configMap"] = _model(v)
+    v = get("csi")
+    if v is not None:
+        d["csi"] = _model(v)
+    v = get("downwardAPI")
+    if v is not None:
+        d["downwardAPI"] = _model(v)
+    v = get("emptyDir")
+    if v is not None:
+        d["emptyDir"] = _model(v)
+    v = get("fc")
+    if v is not None:
+        d["fc"] = _model(v)
+    v = get("flexVolume")
+    if v is not None:
+        d["flexVolume"] = _model(v)
+    v = get("flocker")
+    if v is not None:
+        d["flocker"] = _model(v)
+    v = get("gcePersistentDisk")
+    if v is not None:
+        d["gcePersistentDisk"] = _model(v)
+    v = get("gitRepo")
+    if v is not None:
+        d["gitRepo"] = _model(v)
+    v = get("glusterfs")
+    if v is not None:
+        d["glusterfs"] = _model(v)
+    v = get("hostPath")
+    if v is not None:
+        d["hostPath"] = _model(v)
+    v = get("iscsi")
+    if v is not None:
+        d["iscsi"] = _model(v)
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("nfs")
+    if v is not None:
+        d["nfs"] = _model(v)
+    v = get("persistentVolumeClaim")
+    if v is not None:
+        d["persistentVolumeClaim"] = _model(v)
+    v = get("photonPersistentDisk")
+    if v is not None:
+        d["photonPersistentDisk"] = _model(v)
+    v = get("portworxVolume")
+    if v is not None:
+        d["portworxVolume"] = _model(v)
+    v = get("projected")
+    if v is not None:
+        d["projected"] = _model(v)
+    v = get("quobyte")
+    if v is not None:
+        d["quobyte"] = _model(v)
+    v = get("rbd")
+    if v is not None:
+        d["rbd"] = _model(v)
+    v = get("scaleIO")
+    if v is not None:
+        d["scaleIO"] = _model(v)
+    v = get("secret")
+    if v is not None:
+        d["secret"] = _model(v)
+    v = get("storageos")
+    if v is not None:
+        d["storageos"] = _model(v)
+    v = get("vsphereVolume")
+    if v is not None:
+        d["vsphereVolume"] = _model(v)
+    return d
+
+
+def dump_io_k8s_api_policy_v1beta1_PodDisruptionBudgetSpec(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("maxUnavailable")
+    if v is not None:
+        d["maxUnavailable"] = _model(v)
+    v = get("minAvailable")
+    if v is not None:
+        d["minAvailable"] = _model(v)
+    v = get("selector")
+    if v is not None:
+        d["selector"] = _model(v)
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_api_resource_Quantity(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return v
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_CreateOptions(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("dryRun")
+    if v is not None:
+        d["dryRun"] = list(v)
+    v = get("fieldManager")
+    if v is not None:
+        d["fieldManager"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_FieldsV1(m):
+    return {}
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_GroupVersionResource(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("group")
+    if v is not None:
+        d["group"] = v
+    v = get("resource")
+    if v is not None:
+        d["resource"] = v
+    v = get("version")
+    if v is not None:
+        d["version"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_LabelSelectorRequirement(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("key")
+    if v is not None:
+        d["key"] = v
+    v = get("operator")
+    if v is not None:
+        d["operator"] = v
+    v = get("values")
+    if v is not None:
+        d["values"] = list(v)
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_ListMeta(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("continue_")
+    if v is not None:
+        d["continue"] = v
+    v = get("remainingItemCount")
+    if v is not None:
+        d["remainingItemCount"] = v
+    v = get("resourceVersion")
+    if v is not None:
+        d["resourceVersion"] = v
+    v = get("selfLink")
+    if v is not None:
+        d["selfLink"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_MicroTime(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return v
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_OwnerReference(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("blockOwnerDeletion")
+    if v is not None:
+        d["blockOwnerDeletion"] = v
+    v = get("controller")
+    if v is not None:
+        d["controller"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("uid")
+    if v is not None:
+        d["uid"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_StatusCause(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("field")
+    if v is not None:
+        d["field"] = v
+    v = get("message")
+    if v is not None:
+        d["message"] = v
+    v = get("reason")
+    if v is not None:
+        d["reason"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_StatusDetails(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("causes")
+    if v is not None:
+        d["causes"] = [_model(x) for x in v]
+    v = get("group")
+    if v is not None:
+        d["group"] = v
+    v = get("kind")
+    if v is not None:
+        d["kind"] = v
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("retryAfterSeconds")
+    if v is not None:
+        d["retryAfterSeconds"] = v
+    v = get("uid")
+    if v is not None:
+        d["uid"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_Time(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return v
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_LabelSelector(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("matchExpressions")
+    if v is not None:
+        d["matchExpressions"] = [_model(x) for x in v]
+    v = get("matchLabels")
+    if v is not None:
+        d["matchLabels"] = dict(v)
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_ManagedFieldsEntry(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("apiVersion")
+    if v is not None:
+        d["apiVersion"] = v
+    v = get("fieldsType")
+    if v is not None:
+        d["fieldsType"] = v
+    v = get("fieldsV1")
+    if v is not None:
+        d["fieldsV1"] = _model(v)
+    v = get("manager")
+    if v is not None:
+        d["manager"] = v
+    v = get("operation")
+    if v is not None:
+        d["operation"] = v
+    v = get("time")
+    if v is not None:
+        d["time"] = _model(v)
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_apis_meta_v1_ObjectMeta(m):
+    get = m.__dict__.get
+    d: Dict[str, Any] = {}
+    v = get("annotations")
+    if v is not None:
+        d["annotations"] = dict(v)
+    v = get("clusterName")
+    if v is not None:
+        d["clusterName"] = v
+    v = get("creationTimestamp")
+    if v is not None:
+        d["creationTimestamp"] = _model(v)
+    v = get("deletionGracePeriodSeconds")
+    if v is not None:
+        d["deletionGracePeriodSeconds"] = v
+    v = get("deletionTimestamp")
+    if v is not None:
+        d["deletionTimestamp"] = _model(v)
+    v = get("finalizers")
+    if v is not None:
+        d["finalizers"] = list(v)
+    v = get("generateName")
+    if v is not None:
+        d["generateName"] = v
+    v = get("generation")
+    if v is not None:
+        d["generation"] = v
+    v = get("labels")
+    if v is not None:
+        d["labels"] = dict(v)
+    v = get("managedFields")
+    if v is not None:
+        d["managedFields"] = [_model(x) for x in v]
+    v = get("name")
+    if v is not None:
+        d["name"] = v
+    v = get("namespace")
+    if v is not None:
+        d["namespace"] = v
+    v = get("ownerReferences")
+    if v is not None:
+        d["ownerReferences"] = [_model(x) for x in v]
+    v = get("resourceVersion")
+    if v is not None:
+        d["resourceVersion"] = v
+    v = get("selfLink")
+    if v is not None:
+        d["selfLink"] = v
+    v = get("uid")
+    if v is not None:
+        d["uid"] = v
+    return d
+
+
+def dump_io_k8s_apimachinery_pkg_util_intstr_IntOrString(m):
+    get = m.__dict__.get
+    v = get("__root__")
+    return v
+
+
+SERIALIZERS = {
+    "argo_dsl.api.Model": dump_argo_dsl_api_Model,
+    "argo_dsl.api.eventsource.EventSourceDeletedResponse": dump_eventsource_EventSourceDeletedResponse,
+    "argo_dsl.api.eventsource.LogEntry": dump_eventsource_LogEntry,
+    "argo_dsl.api.eventsource.CreateEventSourceRequest": dump_eventsource_CreateEventSourceRequest,
+    "argo_dsl.api.eventsource.EventSourceWatchEvent": dump_eventsource_EventSourceWatchEvent,
+    "argo_dsl.api.eventsource.UpdateEventSourceRequest": dump_eventsource_UpdateEventSourceRequest,
+    "argo_dsl.api.sensor.DeleteSensorResponse": dump_sensor_DeleteSensorResponse,
+    "argo_dsl.api.sensor.LogEntry": dump_sensor_LogEntry,
+    "argo_dsl.api.sensor.CreateSensorRequest": dump_sensor_CreateSensorRequest,
+    "argo_dsl.api.sensor.SensorWatchEvent": dump_sensor_SensorWatchEvent,
+    "argo_dsl.api.sensor.UpdateSensorRequest": dump_sensor_UpdateSensorRequest,
+    "argo_dsl.api.google.protobuf.Any": dump_google_protobuf_Any,
+    "argo_dsl.api.grpc.gateway.runtime.Error": dump_grpc_gateway_runtime_Error,
+    "argo_dsl.api.grpc.gateway.runtime.StreamError": dump_grpc_gateway_runtime_StreamError,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Amount": dump_io_argoproj_events_v1alpha1_Amount,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Backoff": dump_io_argoproj_events_v1alpha1_Backoff,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.CatchupConfiguration": dump_io_argoproj_events_v1alpha1_CatchupConfiguration,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.ConfigMapPersistence": dump_io_argoproj_events_v1alpha1_ConfigMapPersistence,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.DataFilter": dump_io_argoproj_events_v1alpha1_DataFilter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.DependencyGroup": dump_io_argoproj_events_v1alpha1_DependencyGroup,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventPersistence": dump_io_argoproj_events_v1alpha1_EventPersistence,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.FileArtifact": dump_io_argoproj_events_v1alpha1_FileArtifact,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GitRemoteConfig": dump_io_argoproj_events_v1alpha1_GitRemoteConfig,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.K8SResourcePolicy": dump_io_argoproj_events_v1alpha1_K8SResourcePolicy,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.KafkaConsumerGroup": dump_io_argoproj_events_v1alpha1_KafkaConsumerGroup,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.LogTrigger": dump_io_argoproj_events_v1alpha1_LogTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Metadata": dump_io_argoproj_events_v1alpha1_Metadata,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Resource": dump_io_argoproj_events_v1alpha1_Resource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.S3Bucket": dump_io_argoproj_events_v1alpha1_S3Bucket,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.S3Filter": dump_io_argoproj_events_v1alpha1_S3Filter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Selector": dump_io_argoproj_events_v1alpha1_Selector,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.StatusPolicy": dump_io_argoproj_events_v1alpha1_StatusPolicy,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.StorageGridFilter": dump_io_argoproj_events_v1alpha1_StorageGridFilter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TimeFilter": dump_io_argoproj_events_v1alpha1_TimeFilter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TriggerParameterSource": dump_io_argoproj_events_v1alpha1_TriggerParameterSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TriggerPolicy": dump_io_argoproj_events_v1alpha1_TriggerPolicy,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TriggerSwitch": dump_io_argoproj_events_v1alpha1_TriggerSwitch,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.URLArtifact": dump_io_argoproj_events_v1alpha1_URLArtifact,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.WatchPathConfig": dump_io_argoproj_events_v1alpha1_WatchPathConfig,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.AzureEventsHubEventSource": dump_io_argoproj_events_v1alpha1_AzureEventsHubEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.BasicAuth": dump_io_argoproj_events_v1alpha1_BasicAuth,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.CalendarEventSource": dump_io_argoproj_events_v1alpha1_CalendarEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Condition": dump_io_argoproj_events_v1alpha1_Condition,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventContext": dump_io_argoproj_events_v1alpha1_EventContext,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventDependencyFilter": dump_io_argoproj_events_v1alpha1_EventDependencyFilter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.FileEventSource": dump_io_argoproj_events_v1alpha1_FileEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GenericEventSource": dump_io_argoproj_events_v1alpha1_GenericEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GitCreds": dump_io_argoproj_events_v1alpha1_GitCreds,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.HDFSEventSource": dump_io_argoproj_events_v1alpha1_HDFSEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.PubSubEventSource": dump_io_argoproj_events_v1alpha1_PubSubEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.ResourceFilter": dump_io_argoproj_events_v1alpha1_ResourceFilter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.S3Artifact": dump_io_argoproj_events_v1alpha1_S3Artifact,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SQSEventSource": dump_io_argoproj_events_v1alpha1_SQSEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Status": dump_io_argoproj_events_v1alpha1_Status,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TLSConfig": dump_io_argoproj_events_v1alpha1_TLSConfig,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TriggerParameter": dump_io_argoproj_events_v1alpha1_TriggerParameter,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.WebhookContext": dump_io_argoproj_events_v1alpha1_WebhookContext,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.AMQPEventSource": dump_io_argoproj_events_v1alpha1_AMQPEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.AWSLambdaTrigger": dump_io_argoproj_events_v1alpha1_AWSLambdaTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.CustomTrigger": dump_io_argoproj_events_v1alpha1_CustomTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EmitterEventSource": dump_io_argoproj_events_v1alpha1_EmitterEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventDependency": dump_io_argoproj_events_v1alpha1_EventDependency,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventSourceStatus": dump_io_argoproj_events_v1alpha1_EventSourceStatus,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GitArtifact": dump_io_argoproj_events_v1alpha1_GitArtifact,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GithubEventSource": dump_io_argoproj_events_v1alpha1_GithubEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.GitlabEventSource": dump_io_argoproj_events_v1alpha1_GitlabEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.HTTPTrigger": dump_io_argoproj_events_v1alpha1_HTTPTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.KafkaEventSource": dump_io_argoproj_events_v1alpha1_KafkaEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.KafkaTrigger": dump_io_argoproj_events_v1alpha1_KafkaTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.MQTTEventSource": dump_io_argoproj_events_v1alpha1_MQTTEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.NATSEventsSource": dump_io_argoproj_events_v1alpha1_NATSEventsSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.NATSTrigger": dump_io_argoproj_events_v1alpha1_NATSTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.NSQEventSource": dump_io_argoproj_events_v1alpha1_NSQEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.OpenWhiskTrigger": dump_io_argoproj_events_v1alpha1_OpenWhiskTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.PulsarEventSource": dump_io_argoproj_events_v1alpha1_PulsarEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.RedisEventSource": dump_io_argoproj_events_v1alpha1_RedisEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.ResourceEventSource": dump_io_argoproj_events_v1alpha1_ResourceEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SNSEventSource": dump_io_argoproj_events_v1alpha1_SNSEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SensorStatus": dump_io_argoproj_events_v1alpha1_SensorStatus,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Service": dump_io_argoproj_events_v1alpha1_Service,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SlackEventSource": dump_io_argoproj_events_v1alpha1_SlackEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SlackTrigger": dump_io_argoproj_events_v1alpha1_SlackTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.StorageGridEventSource": dump_io_argoproj_events_v1alpha1_StorageGridEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.StripeEventSource": dump_io_argoproj_events_v1alpha1_StripeEventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.ArtifactLocation": dump_io_argoproj_events_v1alpha1_ArtifactLocation,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.StandardK8STrigger": dump_io_argoproj_events_v1alpha1_StandardK8STrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.ArgoWorkflowTrigger": dump_io_argoproj_events_v1alpha1_ArgoWorkflowTrigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.TriggerTemplate": dump_io_argoproj_events_v1alpha1_TriggerTemplate,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Template": dump_io_argoproj_events_v1alpha1_Template,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Trigger": dump_io_argoproj_events_v1alpha1_Trigger,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventSourceSpec": dump_io_argoproj_events_v1alpha1_EventSourceSpec,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SensorSpec": dump_io_argoproj_events_v1alpha1_SensorSpec,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventSource": dump_io_argoproj_events_v1alpha1_EventSource,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.EventSourceList": dump_io_argoproj_events_v1alpha1_EventSourceList,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.Sensor": dump_io_argoproj_events_v1alpha1_Sensor,
+    "argo_dsl.api.io.argoproj.events.v1alpha1.SensorList": dump_io_argoproj_events_v1alpha1_SensorList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Amount": dump_io_argoproj_workflow_v1alpha1_Amount,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArchivedWorkflowDeletedResponse": dump_io_argoproj_workflow_v1alpha1_ArchivedWorkflowDeletedResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArtifactRepositoryRef": dump_io_argoproj_workflow_v1alpha1_ArtifactRepositoryRef,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArtifactRepositoryRefStatus": dump_io_argoproj_workflow_v1alpha1_ArtifactRepositoryRefStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplateDeleteResponse": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateDeleteResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Condition": dump_io_argoproj_workflow_v1alpha1_Condition,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ContinueOn": dump_io_argoproj_workflow_v1alpha1_ContinueOn,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Counter": dump_io_argoproj_workflow_v1alpha1_Counter,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CreateS3BucketOptions": dump_io_argoproj_workflow_v1alpha1_CreateS3BucketOptions,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowDeletedResponse": dump_io_argoproj_workflow_v1alpha1_CronWorkflowDeletedResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowResumeRequest": dump_io_argoproj_workflow_v1alpha1_CronWorkflowResumeRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowSuspendRequest": dump_io_argoproj_workflow_v1alpha1_CronWorkflowSuspendRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Event": dump_io_argoproj_workflow_v1alpha1_Event,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.EventResponse": dump_io_argoproj_workflow_v1alpha1_EventResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ExecutorConfig": dump_io_argoproj_workflow_v1alpha1_ExecutorConfig,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Gauge": dump_io_argoproj_workflow_v1alpha1_Gauge,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.GetUserInfoResponse": dump_io_argoproj_workflow_v1alpha1_GetUserInfoResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Header": dump_io_argoproj_workflow_v1alpha1_Header,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Histogram": dump_io_argoproj_workflow_v1alpha1_Histogram,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Item": dump_io_argoproj_workflow_v1alpha1_Item,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Link": dump_io_argoproj_workflow_v1alpha1_Link,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.LogEntry": dump_io_argoproj_workflow_v1alpha1_LogEntry,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.MemoizationStatus": dump_io_argoproj_workflow_v1alpha1_MemoizationStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Metadata": dump_io_argoproj_workflow_v1alpha1_Metadata,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.MetricLabel": dump_io_argoproj_workflow_v1alpha1_MetricLabel,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Mutex": dump_io_argoproj_workflow_v1alpha1_Mutex,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.MutexHolding": dump_io_argoproj_workflow_v1alpha1_MutexHolding,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.MutexStatus": dump_io_argoproj_workflow_v1alpha1_MutexStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.NodeSynchronizationStatus": dump_io_argoproj_workflow_v1alpha1_NodeSynchronizationStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.NoneStrategy": dump_io_argoproj_workflow_v1alpha1_NoneStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Prometheus": dump_io_argoproj_workflow_v1alpha1_Prometheus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.RawArtifact": dump_io_argoproj_workflow_v1alpha1_RawArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ResourceTemplate": dump_io_argoproj_workflow_v1alpha1_ResourceTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.RetryNodeAntiAffinity": dump_io_argoproj_workflow_v1alpha1_RetryNodeAntiAffinity,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SemaphoreHolding": dump_io_argoproj_workflow_v1alpha1_SemaphoreHolding,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SemaphoreStatus": dump_io_argoproj_workflow_v1alpha1_SemaphoreStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SuppliedValueFrom": dump_io_argoproj_workflow_v1alpha1_SuppliedValueFrom,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SuspendTemplate": dump_io_argoproj_workflow_v1alpha1_SuspendTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SynchronizationStatus": dump_io_argoproj_workflow_v1alpha1_SynchronizationStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.TTLStrategy": dump_io_argoproj_workflow_v1alpha1_TTLStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.TarStrategy": dump_io_argoproj_workflow_v1alpha1_TarStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.TemplateRef": dump_io_argoproj_workflow_v1alpha1_TemplateRef,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ValueFrom": dump_io_argoproj_workflow_v1alpha1_ValueFrom,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Version": dump_io_argoproj_workflow_v1alpha1_Version,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.VolumeClaimGC": dump_io_argoproj_workflow_v1alpha1_VolumeClaimGC,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowDeleteResponse": dump_io_argoproj_workflow_v1alpha1_WorkflowDeleteResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowResubmitRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowResubmitRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowResumeRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowResumeRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowRetryRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowRetryRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowSetRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowSetRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowStopRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowStopRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowSuspendRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowSuspendRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateDeleteResponse": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateDeleteResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateRef": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateRef,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTerminateRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowTerminateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ZipStrategy": dump_io_argoproj_workflow_v1alpha1_ZipStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArchiveStrategy": dump_io_argoproj_workflow_v1alpha1_ArchiveStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArtifactoryArtifact": dump_io_argoproj_workflow_v1alpha1_ArtifactoryArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Backoff": dump_io_argoproj_workflow_v1alpha1_Backoff,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Cache": dump_io_argoproj_workflow_v1alpha1_Cache,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowStatus": dump_io_argoproj_workflow_v1alpha1_CronWorkflowStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.GCSArtifact": dump_io_argoproj_workflow_v1alpha1_GCSArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.GitArtifact": dump_io_argoproj_workflow_v1alpha1_GitArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.HDFSArtifact": dump_io_argoproj_workflow_v1alpha1_HDFSArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.HTTPArtifact": dump_io_argoproj_workflow_v1alpha1_HTTPArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.InfoResponse": dump_io_argoproj_workflow_v1alpha1_InfoResponse,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Memoize": dump_io_argoproj_workflow_v1alpha1_Memoize,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Metrics": dump_io_argoproj_workflow_v1alpha1_Metrics,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.OSSArtifact": dump_io_argoproj_workflow_v1alpha1_OSSArtifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Parameter": dump_io_argoproj_workflow_v1alpha1_Parameter,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.RetryAffinity": dump_io_argoproj_workflow_v1alpha1_RetryAffinity,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.RetryStrategy": dump_io_argoproj_workflow_v1alpha1_RetryStrategy,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.S3Artifact": dump_io_argoproj_workflow_v1alpha1_S3Artifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SemaphoreRef": dump_io_argoproj_workflow_v1alpha1_SemaphoreRef,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Sequence": dump_io_argoproj_workflow_v1alpha1_Sequence,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.SubmitOpts": dump_io_argoproj_workflow_v1alpha1_SubmitOpts,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Synchronization": dump_io_argoproj_workflow_v1alpha1_Synchronization,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowSubmitRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowSubmitRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Artifact": dump_io_argoproj_workflow_v1alpha1_Artifact,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ArtifactLocation": dump_io_argoproj_workflow_v1alpha1_ArtifactLocation,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Inputs": dump_io_argoproj_workflow_v1alpha1_Inputs,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Outputs": dump_io_argoproj_workflow_v1alpha1_Outputs,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.PodGC": dump_io_argoproj_workflow_v1alpha1_PodGC,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Arguments": dump_io_argoproj_workflow_v1alpha1_Arguments,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.DAGTask": dump_io_argoproj_workflow_v1alpha1_DAGTask,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.DAGTemplate": dump_io_argoproj_workflow_v1alpha1_DAGTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.NodeStatus": dump_io_argoproj_workflow_v1alpha1_NodeStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Submit": dump_io_argoproj_workflow_v1alpha1_Submit,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowEventBindingSpec": dump_io_argoproj_workflow_v1alpha1_WorkflowEventBindingSpec,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowStep": dump_io_argoproj_workflow_v1alpha1_WorkflowStep,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ParallelSteps": dump_io_argoproj_workflow_v1alpha1_ParallelSteps,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ScriptTemplate": dump_io_argoproj_workflow_v1alpha1_ScriptTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.UserContainer": dump_io_argoproj_workflow_v1alpha1_UserContainer,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowEventBinding": dump_io_argoproj_workflow_v1alpha1_WorkflowEventBinding,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowEventBindingList": dump_io_argoproj_workflow_v1alpha1_WorkflowEventBindingList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Template": dump_io_argoproj_workflow_v1alpha1_Template,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowSpec": dump_io_argoproj_workflow_v1alpha1_WorkflowSpec,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowStatus": dump_io_argoproj_workflow_v1alpha1_WorkflowStatus,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateSpec": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateSpec,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplate": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplateCreateRequest": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateCreateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplateLintRequest": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateLintRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplateList": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.ClusterWorkflowTemplateUpdateRequest": dump_io_argoproj_workflow_v1alpha1_ClusterWorkflowTemplateUpdateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowSpec": dump_io_argoproj_workflow_v1alpha1_CronWorkflowSpec,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.Workflow": dump_io_argoproj_workflow_v1alpha1_Workflow,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowCreateRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowCreateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowLintRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowLintRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowList": dump_io_argoproj_workflow_v1alpha1_WorkflowList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplate": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplate,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateCreateRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateCreateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateLintRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateLintRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateList": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowTemplateUpdateRequest": dump_io_argoproj_workflow_v1alpha1_WorkflowTemplateUpdateRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.WorkflowWatchEvent": dump_io_argoproj_workflow_v1alpha1_WorkflowWatchEvent,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflow": dump_io_argoproj_workflow_v1alpha1_CronWorkflow,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CronWorkflowList": dump_io_argoproj_workflow_v1alpha1_CronWorkflowList,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.LintCronWorkflowRequest": dump_io_argoproj_workflow_v1alpha1_LintCronWorkflowRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.UpdateCronWorkflowRequest": dump_io_argoproj_workflow_v1alpha1_UpdateCronWorkflowRequest,
+    "argo_dsl.api.io.argoproj.workflow.v1alpha1.CreateCronWorkflowRequest": dump_io_argoproj_workflow_v1alpha1_CreateCronWorkflowRequest,
+    "argo_dsl.api.io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource": dump_io_k8s_api_core_v1_AWSElasticBlockStoreVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.AzureDiskVolumeSource": dump_io_k8s_api_core_v1_AzureDiskVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.AzureFileVolumeSource": dump_io_k8s_api_core_v1_AzureFileVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.Capabilities": dump_io_k8s_api_core_v1_Capabilities,
+    "argo_dsl.api.io.k8s.api.core.v1.ConfigMapEnvSource": dump_io_k8s_api_core_v1_ConfigMapEnvSource,
+    "argo_dsl.api.io.k8s.api.core.v1.ConfigMapKeySelector": dump_io_k8s_api_core_v1_ConfigMapKeySelector,
+    "argo_dsl.api.io.k8s.api.core.v1.ContainerPort": dump_io_k8s_api_core_v1_ContainerPort,
+    "argo_dsl.api.io.k8s.api.core.v1.EventSource": dump_io_k8s_api_core_v1_EventSource,
+    "argo_dsl.api.io.k8s.api.core.v1.ExecAction": dump_io_k8s_api_core_v1_ExecAction,
+    "argo_dsl.api.io.k8s.api.core.v1.FCVolumeSource": dump_io_k8s_api_core_v1_FCVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.FlockerVolumeSource": dump_io_k8s_api_core_v1_FlockerVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.GCEPersistentDiskVolumeSource": dump_io_k8s_api_core_v1_GCEPersistentDiskVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.GitRepoVolumeSource": dump_io_k8s_api_core_v1_GitRepoVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.GlusterfsVolumeSource": dump_io_k8s_api_core_v1_GlusterfsVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.HTTPHeader": dump_io_k8s_api_core_v1_HTTPHeader,
+    "argo_dsl.api.io.k8s.api.core.v1.HostAlias": dump_io_k8s_api_core_v1_HostAlias,
+    "argo_dsl.api.io.k8s.api.core.v1.HostPathVolumeSource": dump_io_k8s_api_core_v1_HostPathVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.KeyToPath": dump_io_k8s_api_core_v1_KeyToPath,
+    "argo_dsl.api.io.k8s.api.core.v1.LocalObjectReference": dump_io_k8s_api_core_v1_LocalObjectReference,
+    "argo_dsl.api.io.k8s.api.core.v1.NFSVolumeSource": dump_io_k8s_api_core_v1_NFSVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.NodeSelectorRequirement": dump_io_k8s_api_core_v1_NodeSelectorRequirement,
+    "argo_dsl.api.io.k8s.api.core.v1.NodeSelectorTerm": dump_io_k8s_api_core_v1_NodeSelectorTerm,
+    "argo_dsl.api.io.k8s.api.core.v1.ObjectFieldSelector": dump_io_k8s_api_core_v1_ObjectFieldSelector,
+    "argo_dsl.api.io.k8s.api.core.v1.ObjectReference": dump_io_k8s_api_core_v1_ObjectReference,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaimVolumeSource": dump_io_k8s_api_core_v1_PersistentVolumeClaimVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.PhotonPersistentDiskVolumeSource": dump_io_k8s_api_core_v1_PhotonPersistentDiskVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.PodDNSConfigOption": dump_io_k8s_api_core_v1_PodDNSConfigOption,
+    "argo_dsl.api.io.k8s.api.core.v1.PortworxVolumeSource": dump_io_k8s_api_core_v1_PortworxVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.PreferredSchedulingTerm": dump_io_k8s_api_core_v1_PreferredSchedulingTerm,
+    "argo_dsl.api.io.k8s.api.core.v1.QuobyteVolumeSource": dump_io_k8s_api_core_v1_QuobyteVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.RBDVolumeSource": dump_io_k8s_api_core_v1_RBDVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.SELinuxOptions": dump_io_k8s_api_core_v1_SELinuxOptions,
+    "argo_dsl.api.io.k8s.api.core.v1.ScaleIOVolumeSource": dump_io_k8s_api_core_v1_ScaleIOVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.SecretEnvSource": dump_io_k8s_api_core_v1_SecretEnvSource,
+    "argo_dsl.api.io.k8s.api.core.v1.SecretKeySelector": dump_io_k8s_api_core_v1_SecretKeySelector,
+    "argo_dsl.api.io.k8s.api.core.v1.SecretProjection": dump_io_k8s_api_core_v1_SecretProjection,
+    "argo_dsl.api.io.k8s.api.core.v1.SecretVolumeSource": dump_io_k8s_api_core_v1_SecretVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.ServiceAccountTokenProjection": dump_io_k8s_api_core_v1_ServiceAccountTokenProjection,
+    "argo_dsl.api.io.k8s.api.core.v1.StorageOSVolumeSource": dump_io_k8s_api_core_v1_StorageOSVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.Sysctl": dump_io_k8s_api_core_v1_Sysctl,
+    "argo_dsl.api.io.k8s.api.core.v1.Toleration": dump_io_k8s_api_core_v1_Toleration,
+    "argo_dsl.api.io.k8s.api.core.v1.TypedLocalObjectReference": dump_io_k8s_api_core_v1_TypedLocalObjectReference,
+    "argo_dsl.api.io.k8s.api.core.v1.VolumeDevice": dump_io_k8s_api_core_v1_VolumeDevice,
+    "argo_dsl.api.io.k8s.api.core.v1.VolumeMount": dump_io_k8s_api_core_v1_VolumeMount,
+    "argo_dsl.api.io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource": dump_io_k8s_api_core_v1_VsphereVirtualDiskVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.WindowsSecurityContextOptions": dump_io_k8s_api_core_v1_WindowsSecurityContextOptions,
+    "argo_dsl.api.io.k8s.api.core.v1.CSIVolumeSource": dump_io_k8s_api_core_v1_CSIVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.CephFSVolumeSource": dump_io_k8s_api_core_v1_CephFSVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.CinderVolumeSource": dump_io_k8s_api_core_v1_CinderVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.ConfigMapProjection": dump_io_k8s_api_core_v1_ConfigMapProjection,
+    "argo_dsl.api.io.k8s.api.core.v1.ConfigMapVolumeSource": dump_io_k8s_api_core_v1_ConfigMapVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.EmptyDirVolumeSource": dump_io_k8s_api_core_v1_EmptyDirVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.EnvFromSource": dump_io_k8s_api_core_v1_EnvFromSource,
+    "argo_dsl.api.io.k8s.api.core.v1.EventSeries": dump_io_k8s_api_core_v1_EventSeries,
+    "argo_dsl.api.io.k8s.api.core.v1.FlexVolumeSource": dump_io_k8s_api_core_v1_FlexVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.HTTPGetAction": dump_io_k8s_api_core_v1_HTTPGetAction,
+    "argo_dsl.api.io.k8s.api.core.v1.ISCSIVolumeSource": dump_io_k8s_api_core_v1_ISCSIVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.NodeSelector": dump_io_k8s_api_core_v1_NodeSelector,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaimCondition": dump_io_k8s_api_core_v1_PersistentVolumeClaimCondition,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaimStatus": dump_io_k8s_api_core_v1_PersistentVolumeClaimStatus,
+    "argo_dsl.api.io.k8s.api.core.v1.PodDNSConfig": dump_io_k8s_api_core_v1_PodDNSConfig,
+    "argo_dsl.api.io.k8s.api.core.v1.PodSecurityContext": dump_io_k8s_api_core_v1_PodSecurityContext,
+    "argo_dsl.api.io.k8s.api.core.v1.ResourceFieldSelector": dump_io_k8s_api_core_v1_ResourceFieldSelector,
+    "argo_dsl.api.io.k8s.api.core.v1.ResourceRequirements": dump_io_k8s_api_core_v1_ResourceRequirements,
+    "argo_dsl.api.io.k8s.api.core.v1.SecurityContext": dump_io_k8s_api_core_v1_SecurityContext,
+    "argo_dsl.api.io.k8s.api.core.v1.ServicePort": dump_io_k8s_api_core_v1_ServicePort,
+    "argo_dsl.api.io.k8s.api.core.v1.TCPSocketAction": dump_io_k8s_api_core_v1_TCPSocketAction,
+    "argo_dsl.api.io.k8s.api.core.v1.DownwardAPIVolumeFile": dump_io_k8s_api_core_v1_DownwardAPIVolumeFile,
+    "argo_dsl.api.io.k8s.api.core.v1.DownwardAPIVolumeSource": dump_io_k8s_api_core_v1_DownwardAPIVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.EnvVarSource": dump_io_k8s_api_core_v1_EnvVarSource,
+    "argo_dsl.api.io.k8s.api.core.v1.Event": dump_io_k8s_api_core_v1_Event,
+    "argo_dsl.api.io.k8s.api.core.v1.Handler": dump_io_k8s_api_core_v1_Handler,
+    "argo_dsl.api.io.k8s.api.core.v1.Lifecycle": dump_io_k8s_api_core_v1_Lifecycle,
+    "argo_dsl.api.io.k8s.api.core.v1.NodeAffinity": dump_io_k8s_api_core_v1_NodeAffinity,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaimSpec": dump_io_k8s_api_core_v1_PersistentVolumeClaimSpec,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaimTemplate": dump_io_k8s_api_core_v1_PersistentVolumeClaimTemplate,
+    "argo_dsl.api.io.k8s.api.core.v1.PodAffinityTerm": dump_io_k8s_api_core_v1_PodAffinityTerm,
+    "argo_dsl.api.io.k8s.api.core.v1.Probe": dump_io_k8s_api_core_v1_Probe,
+    "argo_dsl.api.io.k8s.api.core.v1.WeightedPodAffinityTerm": dump_io_k8s_api_core_v1_WeightedPodAffinityTerm,
+    "argo_dsl.api.io.k8s.api.core.v1.DownwardAPIProjection": dump_io_k8s_api_core_v1_DownwardAPIProjection,
+    "argo_dsl.api.io.k8s.api.core.v1.EnvVar": dump_io_k8s_api_core_v1_EnvVar,
+    "argo_dsl.api.io.k8s.api.core.v1.EphemeralVolumeSource": dump_io_k8s_api_core_v1_EphemeralVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.PersistentVolumeClaim": dump_io_k8s_api_core_v1_PersistentVolumeClaim,
+    "argo_dsl.api.io.k8s.api.core.v1.PodAffinity": dump_io_k8s_api_core_v1_PodAffinity,
+    "argo_dsl.api.io.k8s.api.core.v1.PodAntiAffinity": dump_io_k8s_api_core_v1_PodAntiAffinity,
+    "argo_dsl.api.io.k8s.api.core.v1.VolumeProjection": dump_io_k8s_api_core_v1_VolumeProjection,
+    "argo_dsl.api.io.k8s.api.core.v1.Affinity": dump_io_k8s_api_core_v1_Affinity,
+    "argo_dsl.api.io.k8s.api.core.v1.Container": dump_io_k8s_api_core_v1_Container,
+    "argo_dsl.api.io.k8s.api.core.v1.ProjectedVolumeSource": dump_io_k8s_api_core_v1_ProjectedVolumeSource,
+    "argo_dsl.api.io.k8s.api.core.v1.Volume": dump_io_k8s_api_core_v1_Volume,
+    "argo_dsl.api.io.k8s.api.policy.v1beta1.PodDisruptionBudgetSpec": dump_io_k8s_api_policy_v1beta1_PodDisruptionBudgetSpec,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.api.resource.Quantity": dump_io_k8s_apimachinery_pkg_api_resource_Quantity,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.CreateOptions": dump_io_k8s_apimachinery_pkg_apis_meta_v1_CreateOptions,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.FieldsV1": dump_io_k8s_apimachinery_pkg_apis_meta_v1_FieldsV1,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.GroupVersionResource": dump_io_k8s_apimachinery_pkg_apis_meta_v1_GroupVersionResource,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelectorRequirement": dump_io_k8s_apimachinery_pkg_apis_meta_v1_LabelSelectorRequirement,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta": dump_io_k8s_apimachinery_pkg_apis_meta_v1_ListMeta,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.MicroTime": dump_io_k8s_apimachinery_pkg_apis_meta_v1_MicroTime,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference": dump_io_k8s_apimachinery_pkg_apis_meta_v1_OwnerReference,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause": dump_io_k8s_apimachinery_pkg_apis_meta_v1_StatusCause,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails": dump_io_k8s_apimachinery_pkg_apis_meta_v1_StatusDetails,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.Time": dump_io_k8s_apimachinery_pkg_apis_meta_v1_Time,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelector": dump_io_k8s_apimachinery_pkg_apis_meta_v1_LabelSelector,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry": dump_io_k8s_apimachinery_pkg_apis_meta_v1_ManagedFieldsEntry,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta": dump_io_k8s_apimachinery_pkg_apis_meta_v1_ObjectMeta,
+    "argo_dsl.api.io.k8s.apimachinery.pkg.util.intstr.IntOrString": dump_io_k8s_apimachinery_pkg_util_intstr_IntOrString,
+}
@@ -0,0 +1,346 @@
+"""
+Text encodings of the arguments of python templates.
+
+`python_template` passes the arguments which aren't `str`, `int`, `float`, `bool`
+or `complex` as text. Parameters are stored in the Workflow object, size limited
+by etcd, and in the inputs of every node status, so the text is kept short:
+
+* an argument whose type has a `TypeCodec` in `TYPE_CODECS` is encoded by it:
+  dicts and lists of JSON values as JSON, numpy arrays as npy, bytes as they are,
+  and pickled too. The shorter text is kept, pickles are often shorter than JSON.
+  Other arguments, and the ones their codec can't encode exactly, are pickled.
+* the bytes are encoded in base85 by default, 25% longer than the bytes where hex
+  is 100%
+* bytes of `compress_over` or more are compressed with zlib when it makes them
+  shorter
+
+The first character of the text tells how the argument was encoded: the `header`
+of its type codec, `p` for a pickle, upper case when compressed. The script
+decodes with `_decode_argument`, which imports what a header needs only when it
+meets one: numpy for arrays, pickle for pickles. Its branches are the ones of the
+codecs of the annotations of the parameters, and the arguments are only encoded
+by those codecs: a parameter annotated `np.ndarray` is decoded by numpy, or
+unpickled, and a script without one doesn't know numpy.
+
+The text lands in the script, inside a shell here-document and a python string,
+and in parameters Argo looks for `{{...}}` in, so the base85 characters `$`,
+`` ` ``, `{` and `}` are swapped for `.`, `,`, `[` and `]`.
+
+An `ArgumentCodec` encodes the arguments, `decoder_source` is the prelude of the
+script which decodes them. Codecs are picked by name from `ARGUMENT_CODECS`.
+Types are given codecs with `register_type_codec`, before the templates which
+decode them are decorated.
+"""
+import base64
+import io
+import json
+import pickle
+import zlib
+
+from typing import AbstractSet
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+
+DEFAULT_COMPRESS_OVER = 256
+
+PICKLE = "p"
+
+# base85 characters the shell or Argo would expand, and their stand-ins
+_BASE85_UNSAFE = "$`{}"
+_BASE85_SAFE = ".,[]"
+_TO_SAFE = str.maketrans(_BASE85_UNSAFE, _BASE85_SAFE)
+_FROM_SAFE = str.maketrans(_BASE85_SAFE, _BASE85_UNSAFE)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+class TypeCodec:
+    """
+    Encoder of the arguments of a type to bytes. `loads_source` is the source of
+    `loads` in the script, an expression of the bytes `data` which may use the
+    modules of `imports`. `dumps` raises `ValueError` or `TypeError` for arguments
+    it can't encode exactly, they are pickled instead.
+    """
+
+    header = ""
+    imports: Tuple[str, ...] = ()
+
+    def dumps(self, argument: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+    def loads_source(self) -> str:
+        raise NotImplementedError
+
+
+def _is_json(value: Any) -> bool:
+    cls = type(value)
+    if cls in _JSON_SCALARS:
+        return True
+    elif cls is list:
+        return all(map(_is_json, value))
+    elif cls is dict:
+        return all(type(key) is str for key in value) and all(map(_is_json, value.values()))
+    return False
+
+
+class JsonCodec(TypeCodec):
+    """
+    Dicts and lists which hold only dicts with string keys, lists, strings,
+    numbers, booleans and None, which JSON gives back as they were
+    """
+
+    header = "j"
+    imports = ("json",)
+
+    def dumps(self, argument: Any) -> bytes:
+        if not _is_json(argument):
+            raise ValueError("not a JSON value")
+        return json.dumps(argument, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def loads_source(self) -> str:
+        return "json.loads(data)"
+
+
+class NumpyCodec(TypeCodec):
+    """
+    numpy arrays in the npy format, arrays of objects left out
+    """
+
+    header = "n"
+    imports = ("io", "numpy")
+
+    def dumps(self, argument: Any) -> bytes:
+        import numpy
+
+        buffer = io.BytesIO()
+        numpy.save(buffer, argument, allow_pickle=False)
+        return buffer.getvalue()
+
+    def loads(self, data: bytes) -> Any:
+        import numpy
+
+        return numpy.load(io.BytesIO(data), allow_pickle=False)
+
+    def loads_source(self) -> str:
+        return "numpy.load(io.BytesIO(data), allow_pickle=False)"
+
+
+class BytesCodec(TypeCodec):
+    header = "b"
+
+    def dumps(self, argument: Any) -> bytes:
+        return argument
+
+    def loads(self, data: bytes) -> Any:
+        return data
+
+    def loads_source(self) -> str:
+        return "data"
+
+
+# codecs by the exact type of the arguments, or its "module.qualname" for types of
+# optional dependencies
+TYPE_CODECS: Dict[Union[type, str], TypeCodec] = {
+    dict: JsonCodec(),
+    list: JsonCodec(),
+    bytes: BytesCodec(),
+    "numpy.ndarray": NumpyCodec(),
+}
+
+
+def register_type_codec(cls: Union[type, str], codec: TypeCodec):
+    """
+    Encode the arguments of type `cls`, a type or its "module.qualname", with
+    `codec`. Its `header` is a lower case letter no codec of another class has.
+    """
+    header = codec.header
+    if len(header) != 1 or not ("a" <= header <= "z") or header == PICKLE:
+        raise ValueError(f"the header of a type codec is a lower case letter other than {PICKLE!r}, got {header!r}")
+    for other in _codecs_by_header(TYPE_CODECS).get(header, []):
+        if type(other) is not type(codec):
+            raise ValueError(f"header {header!r} is already used by {type(other).__name__}")
+    TYPE_CODECS[cls] = codec
+
+
+def get_type_codec(cls: Any) -> Optional[TypeCodec]:
+    """
+    Codec of the arguments of type `cls`, or of the arguments of an annotation
+    like `List[int]`
+    """
+    cls = getattr(cls, "__origin__", None) or cls
+    if not isinstance(cls, type):
+        return None
+    codec = TYPE_CODECS.get(cls)
+    if codec is None:
+        codec = TYPE_CODECS.get(f"{cls.__module__}.{cls.__qualname__}")
+    return codec
+
+
+def type_codec_headers(annotations: Iterable[Any]) -> Set[str]:
+    """
+    Headers of the codecs of `annotations`, the ones the decoder of parameters of
+    these annotations needs
+    """
+    codecs = (get_type_codec(annotation) for annotation in annotations)
+    return {codec.header for codec in codecs if codec is not None}
+
+
+def _codecs_by_header(codecs: Dict[Union[type, str], TypeCodec]) -> Dict[str, List[TypeCodec]]:
+    headers: Dict[str, List[TypeCodec]] = {}
+    for codec in codecs.values():
+        headers.setdefault(codec.header, []).append(codec)
+    return headers
+
+
+class ArgumentCodec:
+    """
+    Encoder of arguments to text. A codec implements `to_text` and `from_text` and
+    the source of the same `from_text` in the script, which sees its text as `text`
+    and evaluates to the bytes.
+    """
+
+    name = ""
+    # imports of the decoding expression in the script
+    imports: Tuple[str, ...] = ()
+
+    def __init__(self, compress_over: Optional[int] = DEFAULT_COMPRESS_OVER):
+        self.compress_over = compress_over
+
+    def to_text(self, data: bytes) -> str:
+        raise NotImplementedError
+
+    def from_text(self, text: str) -> bytes:
+        raise NotImplementedError
+
+    def from_text_source(self) -> str:
+        raise NotImplementedError
+
+    def encode(
+        self, argument: Any, pickle_protocol: Optional[int] = None, headers: Optional[AbstractSet[str]] = None
+    ) -> str:
+        """
+        Text of `argument`, encoded by its type codec when its header is one of
+        `headers`, all of them by default, or pickled, whichever is shorter
+        """
+        typed = None
+        codec = get_type_codec(type(argument))
+        if codec is not None and (headers is None or codec.header in headers):
+            try:
+                typed = self._encode(codec.header, codec.dumps(argument))
+            except (TypeError, ValueError):
+                pass
+        try:
+            pickled = self._encode(PICKLE, pickle.dumps(argument, protocol=pickle_protocol))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            if typed is None:
+                raise
+            return typed
+        return typed if typed is not None and len(typed) <= len(pickled) else pickled
+
+    def _encode(self, header: str, data: bytes) -> str:
+        if self.compress_over is not None and len(data) >= self.compress_over:
+            compressed = zlib.compress(data)
+            if len(compressed) < len(data):
+                return header.upper() + self.to_text(compressed)
+        return header + self.to_text(data)
+
+    def decode(self, text: str) -> Any:
+        header, data = text[:1], self.from_text(text[1:])
+        if header.isupper():
+            header = header.lower()
+            data = zlib.decompress(data)
+        if header == PICKLE:
+            return pickle.loads(data)
+        return _codecs_by_header(TYPE_CODECS)[header][0].loads(data)
+
+    def decoder_source(self, headers: Optional[AbstractSet[str]] = None) -> str:
+        """
+        Source of `_decode_argument(text)`, the `decode` of the script, for the
+        codecs of `TYPE_CODECS` of `headers`, all of them by default, and pickles
+        """
+        lines = [f"import {module}" for module in sorted(set(self.imports))]
+        lines.extend(
+            [
+                "",
+                "",
+                "def _decode_argument(text):",
+                "    header, text = text[:1], text[1:]",
+                f"    data = {self.from_text_source()}",
+                "    if header.isupper():",
+                "        import zlib",
+                "",
+                "        header = header.lower()",
+                "        data = zlib.decompress(data)",
+            ]
+        )
+        for header, codecs in _codecs_by_header(TYPE_CODECS).items():
+            if headers is not None and header not in headers:
+                continue
+            codec = codecs[0]
+            lines.append(f'    if header == "{header}":')
+            lines.extend(f"        import {module}" for module in codec.imports)
+            if codec.imports:
+                lines.append("")
+            lines.append(f"        return {codec.loads_source()}")
+        lines.extend(["    import pickle", "", "    return pickle.loads(data)", "", ""])
+        return "\n".join(lines).lstrip("\n")
+
+
+class HexCodec(ArgumentCodec):
+    name = "hex"
+
+    def to_text(self, data: bytes) -> str:
+        return data.hex()
+
+    def from_text(self, text: str) -> bytes:
+        return bytes.fromhex(text)
+
+    def from_text_source(self) -> str:
+        return "bytes.fromhex(text)"
+
+
+class Base64Codec(ArgumentCodec):
+    name = "base64"
+    imports = ("base64",)
+
+    def to_text(self, data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
+    def from_text(self, text: str) -> bytes:
+        return base64.b64decode(text)
+
+    def from_text_source(self) -> str:
+        return "base64.b64decode(text)"
+
+
+class Base85Codec(ArgumentCodec):
+    name = "base85"
+    imports = ("base64",)
+
+    def to_text(self, data: bytes) -> str:
+        return base64.b85encode(data).decode().translate(_TO_SAFE)
+
+    def from_text(self, text: str) -> bytes:
+        return base64.b85decode(text.translate(_FROM_SAFE))
+
+    def from_text_source(self) -> str:
+        # by code points, the characters themselves would be expanded in the script
+        table = {ord(safe): ord(unsafe) for safe, unsafe in zip(_BASE85_SAFE, _BASE85_UNSAFE)}
+        return f"base64.b85decode(text.translate({table}))"
+
+
+ARGUMENT_CODECS: Dict[str, Type[ArgumentCodec]] = {"hex": HexCodec, "base64": Base64Codec, "base85": Base85Codec}
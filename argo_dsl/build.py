@@ -0,0 +1,140 @@
+"""
+Compiling template libraries.
+
+`compile_all` instantiates every `Template` class of a set of modules and classes
+and returns the manifests of their templates, spread over a pool of processes:
+
+    manifests = compile_all([my_project.templates, ExtraStep], processes=4)
+
+Modules contribute the template classes among their attributes in the order they
+were defined, the classes of argo_dsl itself, such as star-imported base
+classes, left out. A class given twice, or found in two modules, is compiled
+once, where it is first met. The manifests are in that order whatever the number
+of processes.
+
+A worker finds a class by the module it was found in and its name there, and
+sends back its manifest marshalled. Classes a worker can't import, like the ones
+defined in a function, are compiled in this process.
+"""
+import importlib
+import inspect
+import marshal
+
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from .template import Template
+
+
+DEFAULT_CHUNK_SIZE = 16
+
+# the module and the attribute path of a template class
+Reference = Tuple[str, str]
+
+
+def _template_classes(
+    items: Iterable[Union[ModuleType, str, type]]
+) -> List[Tuple[Type[Template], Optional[Reference]]]:
+    seen = set()
+    classes: List[Tuple[Type[Template], Optional[Reference]]] = []
+
+    def add(cls: Type[Template], reference: Optional[Reference]):
+        if cls not in seen:
+            seen.add(cls)
+            classes.append((cls, reference))
+
+    for item in items:
+        if isinstance(item, str):
+            item = importlib.import_module(item)
+
+        if isinstance(item, ModuleType):
+            for name, value in list(vars(item).items()):
+                if (
+                    isinstance(value, type)
+                    and issubclass(value, Template)
+                    and not _is_argo_dsl_class(value)
+                    and not inspect.isabstract(value)
+                ):
+                    add(value, (item.__name__, name))
+        elif isinstance(item, type) and issubclass(item, Template):
+            add(item, _reference(item))
+        else:
+            raise TypeError(f"expected a module, a module name or a Template class, got {item!r}")
+
+    return classes
+
+
+def _is_argo_dsl_class(cls: type) -> bool:
+    """
+    Whether `cls` is a class of argo_dsl itself, rather than a template argo_dsl
+    generated in a function, as the decorators do
+    """
+    module = cls.__module__
+    return (module == "argo_dsl" or module.startswith("argo_dsl.")) and "<locals>" not in cls.__qualname__
+
+
+def _reference(cls: type) -> Optional[Reference]:
+    if "<locals>" in cls.__qualname__:
+        return None
+    try:
+        if _resolve((cls.__module__, cls.__qualname__)) is cls:
+            return cls.__module__, cls.__qualname__
+    except (ImportError, AttributeError):
+        pass
+    return None
+
+
+def _resolve(reference: Reference) -> Any:
+    module, path = reference
+    value: Any = importlib.import_module(module)
+    for name in path.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def _compile(cls: Type[Template]) -> Dict[str, Any]:
+    return cls().to_manifest()
+
+
+def _worker_compile(reference: Reference) -> Union[bytes, Dict[str, Any]]:
+    manifest = _compile(_resolve(reference))
+    try:
+        return marshal.dumps(manifest)
+    except ValueError:
+        # values marshal doesn't know, the pool pickles the manifest instead
+        return manifest
+
+
+def compile_all(
+    modules_or_classes: Iterable[Union[ModuleType, str, type]],
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """
+    Manifests of the templates of every template class of `modules_or_classes`,
+    modules, module names or classes, compiled by `processes` processes, as many as
+    there are cores by default. Fewer than `chunk_size` classes, or a single
+    process, are compiled in this process.
+    """
+    classes = _template_classes(modules_or_classes)
+    if processes == 1 or len(classes) <= chunk_size:
+        return [_compile(cls) for cls, _ in classes]
+
+    manifests: List[Any] = [None] * len(classes)
+    remote = [(i, reference) for i, (_, reference) in enumerate(classes) if reference is not None]
+    with ProcessPoolExecutor(processes) as executor:
+        results = executor.map(_worker_compile, [reference for _, reference in remote], chunksize=chunk_size)
+        for i, (cls, reference) in enumerate(classes):
+            if reference is None:
+                manifests[i] = _compile(cls)
+        for (i, _), result in zip(remote, results):
+            manifests[i] = marshal.loads(result) if isinstance(result, bytes) else result
+    return manifests
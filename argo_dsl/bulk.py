@@ -0,0 +1,484 @@
+"""
+Bulk workflow submission.
+
+`BulkSubmitter` streams an iterable of workflows, or of `v1alpha1.Arguments` for a
+template workflow, to the Argo Server through an `argo_dsl.client.ArgoClient`:
+
+* items are pulled from the iterable only as fast as they are submitted, at most
+  `max_in_flight` submissions are pending at any time,
+* an optional `TokenBucket` caps the request rate,
+* requests answered with 429, or which fail to connect, are retried after a
+  jittered exponential `Backoff`, or after the `Retry-After` the server asked for.
+  The workflow of a request answered with a 5xx status, or whose connection was
+  lost, may have been created. These are retried for workflows with a fixed
+  `metadata.name`, a 409 of a later attempt meaning the workflow was created,
+  and fail for a `generateName` rather than submit it twice, unless
+  `retry_generate_name` is set,
+* requests are serialized in an executor so the event loop keeps sending while
+  big workflows are dumped.
+
+The `BulkReport` counts the submissions, keeps the failed ones and has latency
+histograms of the requests and of the submissions including their retries.
+
+    async with ArgoClient(url, token=token, namespace="argo") as client:
+        report = await bulk_submit(client, arguments, workflow=template, rate=50)
+"""
+import asyncio
+import bisect
+import math
+import random
+import time
+
+from concurrent.futures import Executor
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .api.io.argoproj.workflow import v1alpha1
+from .client import ArgoClient
+from .client import ArgoServerError
+from .client import ConnectError
+from .client import _path
+from .client import dump_body
+from .manifest import to_manifest
+
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# statuses of create requests the server rejected without creating the workflow
+NOT_CREATED_STATUSES = frozenset([429])
+ALREADY_EXISTS_STATUS = 409
+
+Submission = Union[v1alpha1.Workflow, v1alpha1.Arguments]
+Manifest = Dict[str, Any]
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies in seconds with logarithmic buckets, `BUCKETS_PER_DOUBLING`
+    per doubling from `MINIMUM` seconds, so quantiles are within 19% of the truth
+    """
+
+    MINIMUM = 0.0001
+    BUCKETS_PER_DOUBLING = 4
+
+    def __init__(self):
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MINIMUM:
+            return 0
+        return math.ceil(math.log2(seconds / self.MINIMUM) * self.BUCKETS_PER_DOUBLING)
+
+    def upper_bound(self, bucket: int) -> float:
+        return self.MINIMUM * 2 ** (bucket / self.BUCKETS_PER_DOUBLING)
+
+    def record(self, seconds: float):
+        bucket = self._bucket(seconds)
+        if bucket >= len(self.counts):
+            self.counts.extend([0] * (bucket + 1 - len(self.counts)))
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for bucket, count in enumerate(other.counts):
+            self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket of the `q` quantile, clamped to the observed range
+        """
+        if not self.count:
+            return math.nan
+        cumulative = list(self.counts)
+        for i in range(1, len(cumulative)):
+            cumulative[i] += cumulative[i - 1]
+        bucket = bisect.bisect_left(cumulative, max(1, math.ceil(q * self.count)))
+        return min(max(self.upper_bound(bucket), self.min), self.max)
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Upper bound and count of every non-empty bucket
+        """
+        return [(self.upper_bound(bucket), count) for bucket, count in enumerate(self.counts) if count]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else math.nan,
+        }
+
+    def __repr__(self) -> str:
+        summary = ", ".join(f"{name}={value:.4g}" for name, value in self.summary().items())
+        return f"LatencyHistogram({summary})"
+
+
+class TokenBucket:
+    """
+    Allows `rate` acquisitions per second on average and up to `burst` at once
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated: Optional[float] = None
+        # created on first use, it binds to the running event loop on python < 3.10
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self, now: float):
+        if self._updated is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        loop = asyncio.get_event_loop()
+        # waiters take their turn in order, the first one sleeps for all of them
+        async with self._lock:
+            self._refill(loop.time())
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill(loop.time())
+            self._tokens -= 1
+
+
+class Backoff:
+    """
+    Retries of failed requests: up to `retries` times after "full jitter"
+    exponential delays, a random delay up to `base * 2 ** attempt` and at most `cap`
+    seconds. A `Retry-After` of the server is used instead, up to `cap`.
+    """
+
+    def __init__(
+        self,
+        retries: int = 5,
+        base: float = 0.1,
+        cap: float = 30.0,
+        statuses: FrozenSet[int] = RETRY_STATUSES,
+        seed: Optional[int] = None,
+    ):
+        self.retries = retries
+        self.base = base
+        self.cap = cap
+        self.statuses = statuses
+        self._random = random.Random(seed)
+
+    def retryable(self, error: BaseException) -> bool:
+        if isinstance(error, ArgoServerError):
+            return error.status in self.statuses
+        return isinstance(error, (OSError, asyncio.TimeoutError))
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """
+        Seconds to wait before retry number `attempt`, counted from 1
+        """
+        if isinstance(error, ArgoServerError) and "retry-after" in error.headers:
+            try:
+                return min(max(float(error.headers["retry-after"]), 0.0), self.cap)
+            except ValueError:
+                pass
+        return self._random.uniform(0, min(self.cap, self.base * 2**attempt))
+
+
+class SubmitResult:
+    """
+    Outcome of the item at `index` of the submitted iterable. `name` is the name of
+    the created workflow, `error` the last error of a failed submission.
+    """
+
+    __slots__ = ("index", "name", "attempts", "latency", "error")
+
+    def __init__(
+        self,
+        index: int,
+        name: Optional[str],
+        attempts: int,
+        latency: float,
+        error: Optional[BaseException] = None,
+    ):
+        self.index = index
+        self.name = name
+        self.attempts = attempts
+        self.latency = latency
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"name={self.name!r}" if self.ok else f"error={self.error!r}"
+        return f"SubmitResult(index={self.index}, {outcome}, attempts={self.attempts})"
+
+
+class BulkReport:
+    """
+    Result of a bulk submission, see the module docstring
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.failed: List[SubmitResult] = []
+        self.retries = 0
+        self.elapsed = 0.0
+        # latency of every request answered, and of the submissions from their first
+        # request to their success
+        self.request_latency = LatencyHistogram()
+        self.submit_latency = LatencyHistogram()
+
+    @property
+    def rate(self) -> float:
+        """
+        Successful submissions per second
+        """
+        return self.submitted / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkReport(submitted={self.submitted}, failed={len(self.failed)}, retries={self.retries}, "
+            f"rate={self.rate:.1f}/s, p50={self.submit_latency.quantile(0.5):.4g}s, "
+            f"p99={self.submit_latency.quantile(0.99):.4g}s)"
+        )
+
+
+def _not_created(error: BaseException) -> bool:
+    """
+    Whether the create request which failed with `error` provably created nothing
+    """
+    if isinstance(error, ArgoServerError):
+        return error.status in NOT_CREATED_STATUSES
+    return isinstance(error, ConnectError)
+
+
+def _fixed_name(item: Submission) -> Optional[str]:
+    """
+    The `metadata.name` `item` is created with, None for a `generateName`
+    """
+    if isinstance(item, v1alpha1.Workflow) and item.metadata is not None:
+        return item.metadata.name
+    return None
+
+
+def _template_manifest(workflow: Optional[v1alpha1.Workflow]) -> Optional[Manifest]:
+    if workflow is None:
+        return None
+    manifest = to_manifest(workflow)
+    metadata = manifest.get("metadata") or {}
+    if metadata.get("name") and not metadata.get("generateName"):
+        raise ValueError("the template workflow of a bulk submission needs metadata.generateName, not a name")
+    return manifest
+
+
+def serialize_submission(template: Optional[Manifest], namespace: str, item: Submission) -> Tuple[str, bytes]:
+    """
+    Namespace and body of the create request of `item`: a workflow as it is, or
+    arguments replacing those of the `template` workflow manifest. Runs in the
+    executor of `BulkSubmitter`.
+    """
+    if isinstance(item, v1alpha1.Arguments):
+        if template is None:
+            raise ValueError("submitting arguments needs a template workflow")
+        manifest = dict(template)
+        manifest["spec"] = dict(manifest.get("spec") or {}, arguments=to_manifest(item))
+    else:
+        manifest = to_manifest(item)
+
+    namespace = (manifest.get("metadata") or {}).get("namespace") or namespace
+    return namespace, dump_body({"namespace": namespace, "workflow": manifest})
+
+
+class _Items:
+    """
+    Shares a sync or async iterable between the workers
+    """
+
+    def __init__(self, items: Union[Iterable[Submission], AsyncIterable[Submission]]):
+        self._index = 0
+        self._iterator: Optional[Iterator[Submission]] = None
+        self._async_iterator: Optional[AsyncIterator[Submission]] = None
+        # an async generator can not be advanced by two workers at once
+        self._lock: Optional[asyncio.Lock] = None
+        if hasattr(items, "__aiter__"):
+            self._async_iterator = items.__aiter__()
+            self._lock = asyncio.Lock()
+        else:
+            self._iterator = iter(items)
+
+    async def next(self) -> Optional[Tuple[int, Submission]]:
+        try:
+            if self._iterator is not None:
+                item = next(self._iterator)
+            else:
+                assert self._async_iterator is not None and self._lock is not None
+                async with self._lock:
+                    item = await self._async_iterator.__anext__()
+        except (StopIteration, StopAsyncIteration):
+            return None
+        index = self._index
+        self._index += 1
+        return index, item
+
+
+class BulkSubmitter:
+    """
+    Submits workflows with `client`, see the module docstring.
+
+    `workflow` is the template workflow `v1alpha1.Arguments` items are submitted
+    with, usually with a `workflowTemplateRef` or a compiled spec and a
+    `generateName`. Workflows are created in their own namespace, else in
+    `namespace` or that of the client. `rate` caps the requests per second, with
+    bursts of `burst` requests. `executor` serializes the requests, the default
+    executor of the event loop if None. `retry_generate_name` retries the
+    requests of workflows with a `generateName` which may have created them,
+    accepting duplicates.
+    """
+
+    def __init__(
+        self,
+        client: ArgoClient,
+        workflow: Optional[v1alpha1.Workflow] = None,
+        namespace: Optional[str] = None,
+        max_in_flight: int = 64,
+        rate: Optional[float] = None,
+        burst: float = 1.0,
+        backoff: Optional[Backoff] = None,
+        executor: Optional[Executor] = None,
+        retry_generate_name: bool = False,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.client = client
+        self.template = _template_manifest(workflow)
+        self.namespace = namespace or client.namespace
+        self.max_in_flight = max_in_flight
+        self.rate_limit = None if rate is None else TokenBucket(rate, burst)
+        self.backoff = backoff or Backoff()
+        self.executor = executor
+        self.retry_generate_name = retry_generate_name
+
+    async def submit(
+        self,
+        items: Union[Iterable[Submission], AsyncIterable[Submission]],
+        on_result: Optional[Callable[[SubmitResult], Any]] = None,
+    ) -> BulkReport:
+        """
+        Submit every item, `on_result` is called with the `SubmitResult` of each as
+        soon as it is known
+        """
+        report = BulkReport()
+        shared = _Items(items)
+        start = time.perf_counter()
+
+        async def worker():
+            while True:
+                entry = await shared.next()
+                if entry is None:
+                    return
+                result = await self._submit_one(*entry, report)
+                if result.ok:
+                    report.submitted += 1
+                    report.submit_latency.record(result.latency)
+                else:
+                    report.failed.append(result)
+                if on_result is not None:
+                    on_result(result)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_in_flight)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        finally:
+            report.elapsed = time.perf_counter() - start
+        return report
+
+    async def _submit_one(self, index: int, item: Submission, report: BulkReport) -> SubmitResult:
+        loop = asyncio.get_event_loop()
+        try:
+            namespace, body = await loop.run_in_executor(
+                self.executor, serialize_submission, self.template, self.namespace, item
+            )
+        except Exception as e:
+            return SubmitResult(index, None, 0, 0.0, e)
+
+        path = _path("workflows", namespace)
+        name = _fixed_name(item)
+        backoff = self.backoff
+        start = time.perf_counter()
+        attempt = 0
+        maybe_created = False
+        while True:
+            attempt += 1
+            if self.rate_limit is not None:
+                await self.rate_limit.acquire()
+
+            sent = time.perf_counter()
+            try:
+                response = await self.client.send("POST", path, body)
+            except (ArgoServerError, OSError, asyncio.TimeoutError) as e:
+                if isinstance(e, ArgoServerError):
+                    report.request_latency.record(time.perf_counter() - sent)
+                if maybe_created and isinstance(e, ArgoServerError) and e.status == ALREADY_EXISTS_STATUS:
+                    # created by an earlier attempt which failed after all
+                    return SubmitResult(index, name, attempt, time.perf_counter() - start)
+                if attempt > backoff.retries or not backoff.retryable(e):
+                    return SubmitResult(index, None, attempt, time.perf_counter() - start, e)
+                if not _not_created(e):
+                    if name is None and not self.retry_generate_name:
+                        return SubmitResult(index, None, attempt, time.perf_counter() - start, e)
+                    maybe_created = name is not None
+                report.retries += 1
+                await asyncio.sleep(backoff.delay(attempt, e))
+                continue
+
+            finished = time.perf_counter()
+            report.request_latency.record(finished - sent)
+            metadata = (response.json() or {}).get("metadata") or {}
+            return SubmitResult(index, metadata.get("name"), attempt, finished - start)
+
+
+async def bulk_submit(
+    client: ArgoClient,
+    items: Union[Iterable[Submission], AsyncIterable[Submission]],
+    on_result: Optional[Callable[[SubmitResult], Any]] = None,
+    **kwargs: Any,
+) -> BulkReport:
+    """
+    Submit `items` with a `BulkSubmitter(client, **kwargs)`
+    """
+    return await BulkSubmitter(client, **kwargs).submit(items, on_result)
@@ -0,0 +1,760 @@
+"""
+Asynchronous client of the Argo Server REST API.
+
+`ArgoClient` sends the generated request models, e.g. `v1alpha1.WorkflowCreateRequest`,
+and parses the responses into their models, e.g. `v1alpha1.Workflow`. Requests go
+through a `ConnectionPool` of persistent HTTP/1.1 connections: every response is
+read to its end so the connection can take the next request right away, at most
+`concurrency` requests are in flight and idle connections are reused most
+recently used first, so a steady load keeps a few warm connections rather than
+opening new ones.
+
+The HTTP/1.1 client is built on `asyncio` streams and has no dependencies, it
+speaks just the subset of HTTP the Argo Server uses.
+
+    async with ArgoClient("https://localhost:2746", token=token, namespace="argo") as client:
+        workflow = await client.create_workflow(workflow)
+"""
+import asyncio
+import json
+import ssl
+
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+from urllib.parse import quote
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from .api.io.argoproj.workflow import v1alpha1
+from .manifest import StdlibJsonBackend
+from .manifest import _json_default
+from .manifest import get_json_backend
+from .manifest import to_json_bytes
+from .manifest import to_manifest
+
+
+DEFAULT_CONCURRENCY = 16
+CHUNK_SIZE = 64 * 1024
+DEFAULT_PORT = {"http": 80, "https": 443}
+
+_M = TypeVar("_M", bound=BaseModel)
+
+Body = Union[BaseModel, Mapping[str, Any], bytes, None]
+Query = Mapping[str, Any]
+
+_NO_BODY_STATUS = frozenset([204, 304])
+
+
+class ArgoServerError(Exception):
+    """
+    The server answered with an error status. `code` and `message` are those of the
+    gRPC error in the body, if any.
+    """
+
+    def __init__(self, status: int, reason: str, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.reason = reason
+        self.body = body
+        self.headers = headers or {}
+        self.code: Optional[int] = None
+        self.message = reason
+        try:
+            error = json.loads(body)
+        except ValueError:
+            error = None
+        if isinstance(error, dict):
+            self.code = error.get("code")
+            self.message = error.get("message") or error.get("error") or reason
+        super().__init__(f"{status} {reason}: {self.message}")
+
+
+class ConnectError(ConnectionError):
+    """
+    The connection to the server could not be opened, the request was not sent
+    """
+
+
+class Response:
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.reason = reason
+        # lower case names
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+    def __repr__(self) -> str:
+        return f"Response(status={self.status}, reason={self.reason!r}, body={len(self.body)} bytes)"
+
+
+def dump_body(body: Body) -> bytes:
+    """
+    JSON body of a request, models are serialized by `argo_dsl.manifest.to_json_bytes`,
+    or through `to_manifest` with the stdlib backend, for which it is faster
+    """
+    if body is None or isinstance(body, bytes):
+        return body or b""
+    if not isinstance(get_json_backend(), StdlibJsonBackend):
+        return to_json_bytes(body)
+    data = to_manifest(body) if isinstance(body, BaseModel) else body
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class _StaleConnection(Exception):
+    """
+    The connection was closed before any byte of the response
+    """
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            return headers
+        elif not line:
+            raise ConnectionResetError("connection closed in the response headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    body = bytearray()
+    while True:
+        line = await reader.readline()
+        if not line.endswith(b"\n"):
+            raise ConnectionResetError("connection closed in the response body")
+        size = int(line.split(b";", 1)[0], 16)
+        if size == 0:
+            # trailers end with an empty line
+            await _read_headers(reader)
+            return bytes(body)
+        body += await reader.readexactly(size)
+        await reader.readexactly(2)
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[str, int, str, Dict[str, str]]:
+    """
+    HTTP version, status, reason and headers of a response
+    """
+    line = await reader.readline()
+    if not line:
+        raise _StaleConnection()
+
+    version, status, reason = (line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+    return version, int(status), reason, await _read_headers(reader)
+
+
+async def _read_response(reader: asyncio.StreamReader, method: str) -> Tuple[Response, bool]:
+    """
+    Read a whole response, returns it and whether the connection can be reused
+    """
+    version, status, reason, headers = await _read_head(reader)
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+    if method == "HEAD" or status in _NO_BODY_STATUS or 100 <= status < 200:
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        body = await _read_chunked(reader)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        # delimited by the end of the connection
+        body = await reader.read()
+        keep_alive = False
+
+    return Response(status, reason, headers, body), keep_alive
+
+
+class StreamResponse:
+    """
+    A response whose body is read as it arrives, on a connection of its own which
+    is closed with the response
+    """
+
+    def __init__(self, connection: _Connection, status: int, reason: str, headers: Dict[str, str]):
+        self._connection = connection
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        reader = self._connection.reader
+        if self.headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                line = await reader.readline()
+                if not line.endswith(b"\n"):
+                    raise ConnectionResetError("connection closed in the response body")
+                size = int(line.split(b";", 1)[0], 16)
+                if size == 0:
+                    return
+                yield await reader.readexactly(size)
+                await reader.readexactly(2)
+        elif "content-length" in self.headers:
+            yield await reader.readexactly(int(self.headers["content-length"]))
+        else:
+            while True:
+                chunk = await reader.read(CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def lines(self) -> AsyncIterator[bytes]:
+        """
+        The lines of the body without their line break, e.g. the events of a watch
+        """
+        buf = bytearray()
+        async for chunk in self.chunks():
+            buf += chunk
+            start = 0
+            while True:
+                end = buf.find(b"\n", start)
+                if end < 0:
+                    break
+                yield bytes(buf[start:end])
+                start = end + 1
+            del buf[:start]
+        if buf:
+            yield bytes(buf)
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.chunks()])
+
+    def close(self):
+        self._connection.close()
+
+    async def __aenter__(self) -> "StreamResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Persistent HTTP/1.1 connections to one server, see the module docstring
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        ssl: Optional[Union[bool, ssl.SSLContext]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.host_header = host if port in DEFAULT_PORT.values() else f"{host}:{port}"
+        # most recently used last
+        self._idle: List[_Connection] = []
+        # created on first use, it binds to the running event loop on python < 3.10
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.connections_opened = 0
+
+    async def _connect(self) -> _Connection:
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+        except OSError as e:
+            raise ConnectError(f"can not connect to {self.host}:{self.port}: {e}") from e
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _acquire_idle(self) -> Optional[_Connection]:
+        while self._idle:
+            connection = self._idle.pop()
+            # the server closed it meanwhile
+            if not connection.reader.at_eof():
+                return connection
+            connection.close()
+        return None
+
+    async def request(
+        self,
+        method: str,
+        target: str,
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """
+        Send a request and read its whole response, `target` is the path and query
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        message = self._message(method, target, body, headers)
+        async with self._semaphore:
+            if self.timeout is None:
+                return await self._send(method, message)
+            return await asyncio.wait_for(self._send(method, message), self.timeout)
+
+    def _message(self, method: str, target: str, body: bytes, headers: Optional[Mapping[str, str]]) -> bytes:
+        head = [f"{method} {target} HTTP/1.1", f"Host: {self.host_header}"]
+        if body or method in ("POST", "PUT", "PATCH"):
+            head.append(f"Content-Length: {len(body)}")
+        if headers:
+            head.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+    async def stream(
+        self,
+        method: str,
+        target: str,
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> StreamResponse:
+        """
+        Send a request on a new connection and return once the response headers
+        arrived. Long lived streams such as watches neither hold a pooled connection
+        nor count against `concurrency`, and `timeout` only applies to the headers.
+        """
+        connection = await self._connect()
+        try:
+            connection.writer.write(self._message(method, target, body, headers))
+            await connection.writer.drain()
+            head = _read_head(connection.reader)
+            _, status, reason, response_headers = await (
+                head if self.timeout is None else asyncio.wait_for(head, self.timeout)
+            )
+        except _StaleConnection:
+            connection.close()
+            raise ConnectionResetError("connection closed before the response") from None
+        except BaseException:
+            connection.close()
+            raise
+        return StreamResponse(connection, status, reason, response_headers)
+
+    async def _send(self, method: str, message: bytes) -> Response:
+        connection = self._acquire_idle()
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection = await self._connect()
+            try:
+                try:
+                    connection.writer.write(message)
+                    await connection.writer.drain()
+                except ConnectionError:
+                    raise _StaleConnection() from None
+                response, keep_alive = await _read_response(connection.reader, method)
+            except _StaleConnection:
+                connection.close()
+                if reused:
+                    # the server closed the idle connection before it got the request,
+                    # so sending it again on a new connection is safe
+                    connection = None
+                    continue
+                raise ConnectionResetError("connection closed before the response") from None
+            except BaseException:
+                # a failed or cancelled request leaves the connection in an unknown state
+                connection.close()
+                raise
+
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            return response
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        for connection in idle:
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):  # pragma: no cover
+                pass
+
+
+def _path(*segments: str) -> str:
+    return "/".join(quote(segment, safe="") for segment in segments)
+
+
+class ArgoClient:
+    """
+    Client of the Argo Server at `url`, see the module docstring.
+
+    `token` is sent as the bearer token, `namespace` is the namespace of requests
+    which give none. Use the client as an async context manager or `close` it.
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:2746",
+        token: Optional[str] = None,
+        namespace: str = "default",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = None,
+        ssl: Optional[Union[bool, ssl.SSLContext]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        parts = urlsplit(url)
+        if parts.scheme not in DEFAULT_PORT or not parts.hostname:
+            raise ValueError(f"invalid Argo Server url {url!r}")
+
+        self.url = url
+        self.namespace = namespace
+        self.base_path = parts.path.rstrip("/")
+        self.pool = ConnectionPool(
+            parts.hostname,
+            parts.port or DEFAULT_PORT[parts.scheme],
+            ssl=(ssl if ssl is not None else True) if parts.scheme == "https" else None,
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
+        self.headers: Dict[str, str] = {"Accept": "application/json", "Content-Type": "application/json"}
+        if token:
+            # `argo auth token` prints the whole header value
+            self.headers["Authorization"] = token if token.startswith("Bearer ") else f"Bearer {token}"
+        if headers:
+            self.headers.update(headers)
+
+    async def __aenter__(self) -> "ArgoClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+
+    async def close(self):
+        await self.pool.close()
+
+    async def send(self, method: str, path: str, body: Body = None, query: Optional[Query] = None) -> Response:
+        """
+        Send a request to `path` below `/api/v1`, raises `ArgoServerError` for error
+        responses. None query values are left out.
+        """
+        response = await self.pool.request(method, self._target(path, query), dump_body(body), self.headers)
+        if response.status >= 400:
+            raise ArgoServerError(response.status, response.reason, response.body, response.headers)
+        return response
+
+    async def stream(self, method: str, path: str, query: Optional[Query] = None) -> StreamResponse:
+        """
+        Send a request to `path` below `/api/v1` and return the response as it
+        arrives, see `ConnectionPool.stream`. Raises `ArgoServerError` for error
+        responses.
+        """
+        response = await self.pool.stream(method, self._target(path, query), b"", self.headers)
+        if response.status >= 400:
+            async with response:
+                raise ArgoServerError(response.status, response.reason, await response.read(), response.headers)
+        return response
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        response_model: Type[_M],
+        body: Body = None,
+        query: Optional[Query] = None,
+    ) -> _M:
+        """
+        Send a request and parse the response into `response_model`
+        """
+        response = await self.send(method, path, body, query)
+        return response_model.parse_raw(response.body)
+
+    def _target(self, path: str, query: Optional[Query]) -> str:
+        target = f"{self.base_path}/api/v1/{path}"
+        if query:
+            query = {name: value for name, value in query.items() if value is not None}
+            if query:
+                target += "?" + urlencode(query, doseq=True)
+        return target
+
+    def resolve_namespace(self, namespace: Optional[str] = None, resource: Any = None) -> str:
+        """
+        `namespace` if given, else the namespace of `resource`, else the namespace of
+        the client
+        """
+        if namespace is not None:
+            return namespace
+        metadata = getattr(resource, "metadata", None)
+        return getattr(metadata, "namespace", None) or self.namespace
+
+    # workflows
+
+    async def create_workflow(
+        self,
+        workflow: Union[v1alpha1.Workflow, v1alpha1.WorkflowCreateRequest],
+        namespace: Optional[str] = None,
+        server_dry_run: bool = False,
+    ) -> v1alpha1.Workflow:
+        """
+        Create a workflow, in its own namespace unless `namespace` is given
+        """
+        if isinstance(workflow, v1alpha1.WorkflowCreateRequest):
+            request = workflow
+            namespace = namespace or request.namespace or self.resolve_namespace(None, request.workflow)
+        else:
+            namespace = self.resolve_namespace(namespace, workflow)
+            request = v1alpha1.WorkflowCreateRequest(
+                namespace=namespace, workflow=workflow, serverDryRun=server_dry_run or None
+            )
+        return await self.request("POST", _path("workflows", namespace), v1alpha1.Workflow, request)
+
+    async def lint_workflow(self, workflow: v1alpha1.Workflow, namespace: Optional[str] = None) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace, workflow)
+        request = v1alpha1.WorkflowLintRequest(namespace=namespace, workflow=workflow)
+        return await self.request("POST", _path("workflows", namespace, "lint"), v1alpha1.Workflow, request)
+
+    async def submit_workflow(
+        self,
+        resource_kind: str,
+        resource_name: str,
+        submit_options: Optional[v1alpha1.SubmitOpts] = None,
+        namespace: Optional[str] = None,
+    ) -> v1alpha1.Workflow:
+        """
+        Submit a workflow from a `WorkflowTemplate`, `ClusterWorkflowTemplate` or `CronWorkflow`
+        """
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowSubmitRequest(
+            namespace=namespace,
+            resourceKind=resource_kind,
+            resourceName=resource_name,
+            submitOptions=submit_options,
+        )
+        return await self.request("POST", _path("workflows", namespace, "submit"), v1alpha1.Workflow, request)
+
+    async def get_workflow(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> v1alpha1.Workflow:
+        """
+        Get a workflow, `fields` selects the returned fields, e.g. `metadata,status.phase`
+        """
+        path = _path("workflows", self.resolve_namespace(namespace), name)
+        return await self.request("GET", path, v1alpha1.Workflow, query={"fields": fields})
+
+    async def list_workflows(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> v1alpha1.WorkflowList:
+        query = {
+            "listOptions.labelSelector": label_selector,
+            "listOptions.fieldSelector": field_selector,
+            "listOptions.limit": limit,
+            "listOptions.continue": continue_,
+            "fields": fields,
+        }
+        path = _path("workflows", self.resolve_namespace(namespace))
+        return await self.request("GET", path, v1alpha1.WorkflowList, query=query)
+
+    async def watch_workflows(
+        self,
+        namespace: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> StreamResponse:
+        """
+        Stream the watch events of the workflows of `namespace`, all namespaces if it
+        is "", one json line per event. See `argo_dsl.watch` to consume them.
+        """
+        query = {
+            "listOptions.resourceVersion": resource_version,
+            "listOptions.labelSelector": label_selector,
+            "listOptions.fieldSelector": field_selector,
+            "fields": fields,
+        }
+        return await self.stream("GET", _path("workflow-events", self.resolve_namespace(namespace)), query)
+
+    async def delete_workflow(self, name: str, namespace: Optional[str] = None):
+        await self.send("DELETE", _path("workflows", self.resolve_namespace(namespace), name))
+
+    async def _workflow_action(self, action: str, request: BaseModel, name: str, namespace: str) -> v1alpha1.Workflow:
+        return await self.request("PUT", _path("workflows", namespace, name, action), v1alpha1.Workflow, request)
+
+    async def terminate_workflow(self, name: str, namespace: Optional[str] = None) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowTerminateRequest(name=name, namespace=namespace)
+        return await self._workflow_action("terminate", request, name, namespace)
+
+    async def stop_workflow(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        message: Optional[str] = None,
+    ) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowStopRequest(name=name, namespace=namespace, message=message)
+        return await self._workflow_action("stop", request, name, namespace)
+
+    async def suspend_workflow(self, name: str, namespace: Optional[str] = None) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowSuspendRequest(name=name, namespace=namespace)
+        return await self._workflow_action("suspend", request, name, namespace)
+
+    async def resume_workflow(self, name: str, namespace: Optional[str] = None) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowResumeRequest(name=name, namespace=namespace)
+        return await self._workflow_action("resume", request, name, namespace)
+
+    async def retry_workflow(self, name: str, namespace: Optional[str] = None) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowRetryRequest(name=name, namespace=namespace)
+        return await self._workflow_action("retry", request, name, namespace)
+
+    async def resubmit_workflow(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        memoized: Optional[bool] = None,
+    ) -> v1alpha1.Workflow:
+        namespace = self.resolve_namespace(namespace)
+        request = v1alpha1.WorkflowResubmitRequest(name=name, namespace=namespace, memoized=memoized)
+        return await self._workflow_action("resubmit", request, name, namespace)
+
+    async def workflow_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        pod_name: Optional[str] = None,
+        container: str = "main",
+        follow: bool = False,
+        grep: Optional[str] = None,
+        selector: Optional[str] = None,
+    ) -> StreamResponse:
+        """
+        Stream the logs of the pods of a workflow, one json `v1alpha1.LogEntry` per
+        line. See `argo_dsl.logs` to read them.
+        """
+        query = {
+            "podName": pod_name,
+            "logOptions.container": container,
+            "logOptions.follow": "true" if follow else None,
+            "grep": grep,
+            "selector": selector,
+        }
+        return await self.stream("GET", _path("workflows", self.resolve_namespace(namespace), name, "log"), query)
+
+    # templates
+
+    async def create_workflow_template(
+        self,
+        template: v1alpha1.WorkflowTemplate,
+        namespace: Optional[str] = None,
+    ) -> v1alpha1.WorkflowTemplate:
+        namespace = self.resolve_namespace(namespace, template)
+        request = v1alpha1.WorkflowTemplateCreateRequest(namespace=namespace, template=template)
+        return await self.request("POST", _path("workflow-templates", namespace), v1alpha1.WorkflowTemplate, request)
+
+    async def lint_workflow_template(
+        self,
+        template: v1alpha1.WorkflowTemplate,
+        namespace: Optional[str] = None,
+    ) -> v1alpha1.WorkflowTemplate:
+        namespace = self.resolve_namespace(namespace, template)
+        request = v1alpha1.WorkflowTemplateLintRequest(namespace=namespace, template=template)
+        path = _path("workflow-templates", namespace, "lint")
+        return await self.request("POST", path, v1alpha1.WorkflowTemplate, request)
+
+    async def get_workflow_template(self, name: str, namespace: Optional[str] = None) -> v1alpha1.WorkflowTemplate:
+        path = _path("workflow-templates", self.resolve_namespace(namespace), name)
+        return await self.request("GET", path, v1alpha1.WorkflowTemplate)
+
+    async def delete_workflow_template(self, name: str, namespace: Optional[str] = None):
+        await self.send("DELETE", _path("workflow-templates", self.resolve_namespace(namespace), name))
+
+    async def create_cluster_workflow_template(
+        self,
+        template: v1alpha1.ClusterWorkflowTemplate,
+    ) -> v1alpha1.ClusterWorkflowTemplate:
+        request = v1alpha1.ClusterWorkflowTemplateCreateRequest(template=template)
+        return await self.request("POST", "cluster-workflow-templates", v1alpha1.ClusterWorkflowTemplate, request)
+
+    async def create_cron_workflow(
+        self,
+        cron_workflow: v1alpha1.CronWorkflow,
+        namespace: Optional[str] = None,
+    ) -> v1alpha1.CronWorkflow:
+        namespace = self.resolve_namespace(namespace, cron_workflow)
+        request = v1alpha1.CreateCronWorkflowRequest(namespace=namespace, cronWorkflow=cron_workflow)
+        return await self.request("POST", _path("cron-workflows", namespace), v1alpha1.CronWorkflow, request)
+
+    # events
+
+    async def sensor_logs(
+        self,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+        trigger_name: Optional[str] = None,
+        follow: bool = False,
+        grep: Optional[str] = None,
+    ) -> StreamResponse:
+        """
+        Stream the logs of the sensors of `namespace`, or of sensor `name`, one json
+        `sensor.LogEntry` per line. See `argo_dsl.logs` to read them.
+        """
+        query = {
+            "name": name,
+            "triggerName": trigger_name,
+            "podLogOptions.follow": "true" if follow else None,
+            "grep": grep,
+        }
+        return await self.stream("GET", _path("stream", "sensors", self.resolve_namespace(namespace), "logs"), query)
+
+    async def event_source_logs(
+        self,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+        event_source_type: Optional[str] = None,
+        event_name: Optional[str] = None,
+        follow: bool = False,
+        grep: Optional[str] = None,
+    ) -> StreamResponse:
+        """
+        Stream the logs of the event sources of `namespace`, or of event source `name`,
+        one json `eventsource.LogEntry` per line. See `argo_dsl.logs` to read them.
+        """
+        query = {
+            "name": name,
+            "eventSourceType": event_source_type,
+            "eventName": event_name,
+            "podLogOptions.follow": "true" if follow else None,
+            "grep": grep,
+        }
+        return await self.stream(
+            "GET", _path("stream", "event-sources", self.resolve_namespace(namespace), "logs"), query
+        )
@@ -0,0 +1,276 @@
+"""
+On-disk cache of decorated templates.
+
+With a cache set, by `set_compile_cache(directory)` or the `ARGO_DSL_COMPILE_CACHE`
+environment variable, the template decorators of `argo_dsl.decorator` look a
+function up in the cache before anything else. On a hit the template class is
+rebuilt from the entry: its base, its attributes, the script or manifest the
+function's source made included, and its `Parameters`. The source of the
+function is not read. Instances compile their template like the ones of the
+decorated class do, so subclasses overriding attributes are honoured.
+
+An entry is keyed by:
+
+* the argo_dsl, pydantic and python versions and `Template.__validate__`
+* the digest of the file the function is defined in, its qualified name and line,
+  and the reprs of its defaults and annotations
+* the class and settings of the decorator, and the digest of the files of every
+  class in the decorator's MRO, argo_dsl's own included
+* the type codecs of `argo_dsl.arguments.TYPE_CODECS`
+
+The entries of the functions of a source file are appended to one file of the
+cache, named after the digest of the source file, which is read once per process.
+Templates whose source comes from calling the function for its return value
+depend on more than that and are not cached, nor are the ones which don't pickle.
+The cache is trusted like `__pycache__`: entries are unpickled as they are.
+"""
+import functools
+import hashlib
+import io
+import os
+import pickle
+import sys
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+import pydantic
+
+from . import __version__
+from .arguments import TYPE_CODECS
+from .template import Template
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .decorator import TemplateDecorator
+
+COMPILE_CACHE_ENV = "ARGO_DSL_COMPILE_CACHE"
+
+# bump whenever the layout of the entries changes
+_CACHE_VERSION = 4
+_UNSET: Any = object()
+
+# the name of the cache file of a source file, and the key of the entry in it
+Key = Tuple[str, str]
+
+_compile_cache: Any = _UNSET
+# digests of source files by path, with the (mtime, size) they were computed for
+_file_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _file_digest(path: Optional[str]) -> Optional[str]:
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_digests.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _file_digests[path] = (version, digest)
+    return digest
+
+
+def _module_file(cls: type) -> Optional[str]:
+    return getattr(sys.modules.get(cls.__module__), "__file__", None)
+
+
+@functools.lru_cache(maxsize=None)
+def _decorator_class_parts(cls: type) -> str:
+    """
+    The versions and the classes of the MRO of a decorator class with the digests of
+    their files, once per process
+    """
+    parts: List[Any] = [_CACHE_VERSION, __version__, pydantic.VERSION, sys.version_info[:2]]
+    for base in cls.__mro__:
+        if base.__module__ not in ("builtins", "typing", "abc") and not base.__module__.startswith("pydantic"):
+            parts.extend([base.__module__, base.__qualname__, _file_digest(_module_file(base))])
+    return repr(parts)
+
+
+def _read_entries(path: str) -> Dict[str, bytes]:
+    """
+    The pickled entries of a file by key, the last one of a key winning. A broken
+    file is removed so entries are appended to a new one.
+    """
+    entries: Dict[str, bytes] = {}
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return entries
+
+    stream = io.BytesIO(data)
+    try:
+        while stream.tell() < len(data):
+            key, entry = pickle.load(stream)
+            entries[key] = entry
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover
+            pass
+    return entries
+
+
+class CompileCache:
+    """
+    Entries of decorated templates in `directory`, one file per source file
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # the entries of the files read so far, by path
+        self._files: Dict[str, Dict[str, bytes]] = {}
+
+    def key(self, decorator: "TemplateDecorator", func: Callable[..., Any]) -> Optional[Key]:
+        """
+        Key of the template `decorator` makes of `func`, None when it can not be cached
+        """
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        if code is None:
+            return None
+        digest = _file_digest(code.co_filename)
+        if digest is None:
+            return None
+
+        parts = [
+            _decorator_class_parts(type(decorator)),
+            Template.__validate__,
+            digest,
+            func.__module__,
+            func.__qualname__,
+            code.co_firstlineno,
+            getattr(func, "__defaults__", None),
+            getattr(func, "__kwdefaults__", None),
+            getattr(func, "__annotations__", None),
+            sorted(decorator.dict().items()),
+            # the script of python templates decodes the arguments of these codecs
+            [
+                (str(cls), type(codec).__module__, type(codec).__qualname__, codec.header)
+                for cls, codec in TYPE_CODECS.items()
+            ],
+        ]
+        file_key = hashlib.sha256(repr([_CACHE_VERSION, code.co_filename, digest]).encode()).hexdigest()
+        return file_key, hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def path(self, key: Key) -> str:
+        """
+        The file of the entry `key`
+        """
+        return os.path.join(self.directory, key[0] + ".pickle")
+
+    def entries(self, key: Key) -> Dict[str, bytes]:
+        """
+        The pickled entries of the file of `key`, read once
+        """
+        path = self.path(key)
+        entries = self._files.get(path)
+        if entries is None:
+            entries = self._files[path] = _read_entries(path)
+        return entries
+
+    def load(self, key: Key, decorator: "TemplateDecorator") -> Optional[Type[Template]]:
+        """
+        The template class of the entry `key`, None on a miss
+        """
+        data = self.entries(key).get(key[1])
+        if data is None:
+            return None
+        try:
+            entry = pickle.loads(data)
+        except Exception:
+            # replaced once the template is decorated again
+            return None
+        return _rebuild(entry, decorator)
+
+    def store(self, key: Key, template: Type[Template]):
+        """
+        Append the entry of the template class `template` under `key` to its file
+        """
+        try:
+            data = pickle.dumps(_entry(template), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # templates which don't pickle are left out
+            return
+
+        self.entries(key)[key[1]] = data
+        record = pickle.dumps((key[1], data), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # a single append, so the records of other processes don't interleave
+            fd = os.open(self.path(key), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, record)
+            finally:
+                os.close(fd)
+        except OSError:  # pragma: no cover
+            pass
+
+    def clear(self):
+        self._files.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(self.directory, name))
+
+
+def _entry(template: Type[Template]) -> Dict[str, Any]:
+    attributes = {
+        name: value
+        for name, value in vars(template).items()
+        if not name.startswith("_") and name != "Parameters" and not callable(value)
+    }
+    parameters = template.Parameters
+    return {
+        "name": template.__name__,
+        "module": template.__module__,
+        "qualname": template.__qualname__,
+        "base": template.__bases__[0],
+        "attributes": attributes,
+        "parameters": None
+        if parameters is None
+        else {
+            name: value
+            for name, value in vars(parameters).items()
+            if name == "__annotations__" or not name.startswith("__")
+        },
+    }
+
+
+def _rebuild(entry: Dict[str, Any], decorator: "TemplateDecorator") -> Type[Template]:
+    namespace = dict(entry["attributes"])
+    namespace.update(__module__=entry["module"], __qualname__=entry["qualname"])
+    if entry["parameters"] is not None:
+        namespace["Parameters"] = type("Parameters", (), entry["parameters"])
+    serialize_argument = getattr(decorator, "serialize_argument", None)
+    if serialize_argument is not None:
+        namespace["serialize_argument"] = lambda self, argument: serialize_argument(argument)
+    return type(entry["name"], (entry["base"],), namespace)
+
+
+def set_compile_cache(cache: Union[str, CompileCache, None]):
+    """
+    Cache decorated templates in `cache`, a directory or a `CompileCache`, None
+    turns the cache off
+    """
+    global _compile_cache
+    _compile_cache = CompileCache(cache) if isinstance(cache, str) else cache
+
+
+def get_compile_cache() -> Optional[CompileCache]:
+    if _compile_cache is _UNSET:
+        set_compile_cache(os.environ.get(COMPILE_CACHE_ENV) or None)
+    return _compile_cache
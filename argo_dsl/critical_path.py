@@ -0,0 +1,308 @@
+"""
+Critical path analysis of workflow node graphs.
+
+`analyze` schedules a graph of activities as early as its dependencies allow
+(the critical path method): every activity gets its earliest and latest start,
+the makespan is the finish of the last one and the slack of an activity is how
+much it can be delayed without delaying the makespan. Activities without slack
+form the critical path, the steps worth optimizing first.
+
+`analyze_status` builds the graph from the `children` of the nodes of a finished
+workflow with their measured durations, `analyze_template` from the steps or
+the DAG tasks of a compiled template with durations by template name, see
+`estimated_durations`. Both run in linear time over the graph.
+"""
+import re
+
+from datetime import datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from .api.io.argoproj.workflow import v1alpha1
+from .nodes import status_nodes
+
+
+# nodes which only group other nodes, they take no time of their own
+VIRTUAL_NODE_TYPES = frozenset(["Steps", "StepGroup", "DAG", "TaskGroup", "Retry", "Skipped", "Omitted"])
+
+# the task names of a `depends` expression, e.g. `a && (b.Succeeded || c.Failed)`
+_DEPENDS_TASK = re.compile(r"(?<![\w.-])([A-Za-z0-9][\w-]*)(?:\.\w+)?")
+_DEPENDS_OPERATORS = frozenset(["true", "false"])
+
+Durations = Union[Mapping[str, float], Callable[[Any], Optional[float]]]
+
+
+class Activity:
+    """
+    An activity of an analyzed graph. `ref` is the model it stands for, a
+    `v1alpha1.NodeStatus` (or compact node), `v1alpha1.WorkflowStep` or
+    `v1alpha1.DAGTask`, or None for the barriers between step groups.
+    """
+
+    __slots__ = ("id", "ref", "duration", "earliest_start", "latest_start")
+
+    def __init__(self, id: str, ref: Any, duration: float):
+        self.id = id
+        self.ref = ref
+        self.duration = duration
+        self.earliest_start = 0.0
+        self.latest_start = 0.0
+
+    @property
+    def earliest_finish(self) -> float:
+        return self.earliest_start + self.duration
+
+    @property
+    def latest_finish(self) -> float:
+        return self.latest_start + self.duration
+
+    @property
+    def slack(self) -> float:
+        return self.latest_start - self.earliest_start
+
+    @property
+    def critical(self) -> bool:
+        return self.slack <= 0
+
+    def __repr__(self) -> str:
+        return f"Activity(id={self.id!r}, duration={self.duration}, start={self.earliest_start}, slack={self.slack})"
+
+
+class Analysis:
+    """
+    Result of `analyze`
+    """
+
+    def __init__(self, activities: Dict[str, Activity], critical_path: List[Activity], makespan: float):
+        self.activities = activities
+        self.critical_path = critical_path
+        self.makespan = makespan
+
+    @property
+    def total_work(self) -> float:
+        return sum(activity.duration for activity in self.activities.values())
+
+    @property
+    def parallelism(self) -> float:
+        """
+        Average number of activities running at once when every activity starts as
+        early as possible
+        """
+        return self.total_work / self.makespan if self.makespan else 0.0
+
+    @property
+    def peak_parallelism(self) -> int:
+        """
+        Most activities running at once when every activity starts as early as possible
+        """
+        events: List[Tuple[float, int]] = []
+        for activity in self.activities.values():
+            if activity.duration > 0:
+                events.append((activity.earliest_start, 1))
+                events.append((activity.earliest_finish, -1))
+        # finishes sort before starts at the same time
+        events.sort()
+
+        running = peak = 0
+        for _, change in events:
+            running += change
+            peak = max(peak, running)
+        return peak
+
+    def bottlenecks(self, limit: Optional[int] = None) -> List[Activity]:
+        """
+        Activities of the critical path, longest first
+        """
+        return sorted(self.critical_path, key=lambda activity: activity.duration, reverse=True)[:limit]
+
+
+def analyze(activities: Iterable[Activity], edges: Iterable[Tuple[str, str]]) -> Analysis:
+    """
+    Schedule `activities`, `edges` are `(before, after)` pairs of activity ids. Edges
+    to unknown activities are ignored, a cycle raises ValueError.
+    """
+    nodes = list(activities)
+    index = {activity.id: i for i, activity in enumerate(nodes)}
+    successors: List[List[int]] = [[] for _ in nodes]
+    predecessors: List[List[int]] = [[] for _ in nodes]
+    for before, after in edges:
+        i = index.get(before)
+        j = index.get(after)
+        if i is not None and j is not None:
+            successors[i].append(j)
+            predecessors[j].append(i)
+
+    # Kahn's algorithm, the earliest starts are final once all predecessors are
+    pending = [len(p) for p in predecessors]
+    order = [i for i, count in enumerate(pending) if count == 0]
+    via: List[int] = [-1] * len(nodes)
+    for i in order:
+        finish = nodes[i].earliest_finish
+        for j in successors[i]:
+            if via[j] < 0 or finish > nodes[j].earliest_start:
+                nodes[j].earliest_start = finish
+                via[j] = i
+            pending[j] -= 1
+            if pending[j] == 0:
+                order.append(j)
+
+    if len(order) != len(nodes):
+        raise ValueError("the node graph has a cycle")
+
+    makespan = max((activity.earliest_finish for activity in nodes), default=0.0)
+    for i in reversed(order):
+        activity = nodes[i]
+        latest_finish = min((nodes[j].latest_start for j in successors[i]), default=makespan)
+        activity.latest_start = latest_finish - activity.duration
+
+    critical_path: List[Activity] = []
+    if nodes:
+        last = max(range(len(nodes)), key=lambda i: nodes[i].earliest_finish)
+        while last >= 0:
+            critical_path.append(nodes[last])
+            last = via[last]
+        critical_path.reverse()
+
+    return Analysis({activity.id: activity for activity in nodes}, critical_path, makespan)
+
+
+def _seconds_between(started: Any, finished: Any) -> float:
+    started = getattr(started, "__root__", started)
+    finished = getattr(finished, "__root__", finished)
+    if not isinstance(started, datetime) or not isinstance(finished, datetime):
+        return 0.0
+    return max((finished - started).total_seconds(), 0.0)
+
+
+def _started(node: Any) -> float:
+    started = getattr(node.startedAt, "__root__", node.startedAt)
+    return started.timestamp() if isinstance(started, datetime) else float("inf")
+
+
+def analyze_status(status: Any) -> Analysis:
+    """
+    Critical path of a finished workflow, from a workflow status or its node map.
+
+    Nodes take the time between their `startedAt` and `finishedAt`, except for the
+    `VIRTUAL_NODE_TYPES` which only group other nodes. The attempts of a retry
+    node run one after the other.
+    """
+    nodes: Mapping[str, Any] = status if isinstance(status, Mapping) else status_nodes(status)
+
+    activities: List[Activity] = []
+    edges: List[Tuple[str, str]] = []
+    for node_id, node in nodes.items():
+        duration = 0.0 if node.type in VIRTUAL_NODE_TYPES else _seconds_between(node.startedAt, node.finishedAt)
+        activities.append(Activity(node_id, node, duration))
+
+        children = node.children or ()
+        edges.extend((node_id, child) for child in children)
+        if node.type == "Retry":
+            attempts = sorted((child for child in children if child in nodes), key=lambda child: _started(nodes[child]))
+            edges.extend(zip(attempts, attempts[1:]))
+
+    return analyze(activities, edges)
+
+
+def _template_name(step: Union[v1alpha1.WorkflowStep, v1alpha1.DAGTask]) -> Optional[str]:
+    if step.template is not None:
+        return step.template
+    elif step.templateRef is not None:
+        return step.templateRef.template
+    return None
+
+
+def _duration(durations: Durations, step: Union[v1alpha1.WorkflowStep, v1alpha1.DAGTask]) -> float:
+    if callable(durations):
+        duration = durations(step)
+    else:
+        name = _template_name(step)
+        duration = None if name is None else durations.get(name)
+    return float(duration or 0)
+
+
+def _depends_tasks(depends: str) -> List[str]:
+    return [name for name in _DEPENDS_TASK.findall(depends) if name not in _DEPENDS_OPERATORS]
+
+
+def _analyze_steps(steps: Sequence[Any], durations: Durations) -> Analysis:
+    activities: List[Activity] = []
+    edges: List[Tuple[str, str]] = []
+    previous: Optional[str] = None
+    for i, group in enumerate(steps):
+        group = getattr(group, "__root__", group)
+        # a barrier between groups keeps the graph linear in the number of steps
+        barrier = f"[{i}]"
+        activities.append(Activity(barrier, None, 0.0))
+        if previous is not None:
+            edges.append((previous, barrier))
+
+        previous = f"[{i}].end"
+        activities.append(Activity(previous, None, 0.0))
+        for step in group:
+            step_id = f"[{i}].{step.name}"
+            activities.append(Activity(step_id, step, _duration(durations, step)))
+            edges.append((barrier, step_id))
+            edges.append((step_id, previous))
+
+    analysis = analyze(activities, edges)
+    analysis.activities = {key: activity for key, activity in analysis.activities.items() if activity.ref is not None}
+    analysis.critical_path = [activity for activity in analysis.critical_path if activity.ref is not None]
+    return analysis
+
+
+def _analyze_dag(dag: v1alpha1.DAGTemplate, durations: Durations) -> Analysis:
+    activities: List[Activity] = []
+    edges: List[Tuple[str, str]] = []
+    for task in dag.tasks:
+        activities.append(Activity(task.name, task, _duration(durations, task)))
+        dependencies = list(task.dependencies or ())
+        if task.depends:
+            dependencies.extend(_depends_tasks(task.depends))
+        edges.extend((dependency, task.name) for dependency in dict.fromkeys(dependencies))
+
+    return analyze(activities, edges)
+
+
+def analyze_template(template: Any, durations: Durations) -> Analysis:
+    """
+    Critical path of a compiled steps or DAG template, a `v1alpha1.Template` or an
+    `argo_dsl.template.Template`.
+
+    `durations` maps the template names the steps or tasks call to seconds, or is
+    called with every `v1alpha1.WorkflowStep` or `v1alpha1.DAGTask`. Steps get the
+    ids `[group].name`, tasks their names.
+    """
+    template = getattr(template, "template", template)
+    if template.steps is not None:
+        return _analyze_steps(template.steps, durations)
+    elif template.dag is not None:
+        return _analyze_dag(template.dag, durations)
+    raise ValueError(f"template {template.name!r} has neither steps nor a dag")
+
+
+def estimated_durations(status: Any) -> Dict[str, float]:
+    """
+    Seconds by template name from the `estimatedDuration` of the nodes of a workflow,
+    or from their measured durations, for `analyze_template`
+    """
+    nodes: Mapping[str, Any] = status if isinstance(status, Mapping) else status_nodes(status)
+
+    durations: Dict[str, float] = {}
+    for node in nodes.values():
+        if node.templateName is None or node.type in VIRTUAL_NODE_TYPES:
+            continue
+        if node.estimatedDuration is not None:
+            duration = float(node.estimatedDuration)
+        else:
+            duration = _seconds_between(node.startedAt, node.finishedAt)
+        durations[node.templateName] = max(duration, durations.get(node.templateName, 0.0))
+    return durations
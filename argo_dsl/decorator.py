@@ -1,4 +1,4 @@
-import pickle
+from __future__ import annotations
 
 from typing import Any
 from typing import Callable
@@ -7,15 +7,22 @@ from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Type
 from typing import TypeVar
 
 from pydantic import BaseModel
 from pydantic import PrivateAttr
+from pydantic import validator
 from pydantic.generics import GenericModel
 from typing_extensions import Literal
 
 from .api.io.argoproj.workflow import v1alpha1
+from .arguments import ARGUMENT_CODECS
+from .arguments import DEFAULT_COMPRESS_OVER
+from .arguments import ArgumentCodec
+from .arguments import type_codec_headers
+from .compile_cache import get_compile_cache
 from .template import ResourceTemplate
 from .template import ScriptTemplate
 from .template import Template
@@ -36,16 +43,43 @@ class TemplateDecorator(BaseModel, Generic[_T]):
         self,
         func: Callable[..., Optional[str]],
     ) -> Type[_T]:
+        cache = get_compile_cache()
+        key = None
+        if cache is not None:
+            key = cache.key(self, func)
+            cached = cache.load(key, self) if key is not None else None
+            if cached is not None:
+                self.restore(cached)  # type: ignore[arg-type]
+                return cached  # type: ignore[return-value]
+
         self._func = Function(func)
-        return self.generate_template()
+        template = self.generate_template()
+        if cache is not None and key is not None and not self.func.called:
+            cache.store(key, template)
+        return template
 
     def generate_template(self) -> Type[_T]:
         raise NotImplementedError
 
+    def restore(self, template: Type[_T]):
+        """
+        Called with the template of the compile cache instead of `generate_template`
+        """
+
     def generate_parameter_class(self) -> type:
         return self.func.parameter_class
 
 
+class DecoratedScript(ScriptTemplate):
+    """
+    Base of the templates of `ScriptDecorator`, `source` is the bash script which
+    writes and runs the function
+    """
+
+    def specify_manifest(self) -> v1alpha1.ScriptTemplate:
+        return v1alpha1.ScriptTemplate(image=self.image, source=self.source, command=["bash"])
+
+
 class ScriptDecorator(TemplateDecorator[ScriptTemplate]):
     image: str
     command: str = ""
@@ -66,15 +100,14 @@ set -e
 {self.post_run}
 """.strip()
         decorator = self
+        script = source
 
-        class Script(ScriptTemplate):
+        class Script(DecoratedScript):
             image = decorator.image
             name: ClassVar[str] = decorator.func.name
+            source = script
             Parameters = decorator.generate_parameter_class()
 
-            def specify_manifest(self) -> v1alpha1.ScriptTemplate:
-                return v1alpha1.ScriptTemplate(image=self.image, source=source, command=["bash"])
-
             def serialize_argument(self, argument: Any) -> str:
                 return decorator.serialize_argument(argument)
 
@@ -107,6 +140,21 @@ bash_template = BashDecorator
 class PythonDecorator(ScriptDecorator):
     command: str = "python"
     pickle_protocol: Optional[int] = None
+    # name of the `argo_dsl.arguments.ArgumentCodec` of pickled arguments
+    argument_codec: str = "base85"
+    compress_over: Optional[int] = DEFAULT_COMPRESS_OVER
+    # headers of the type codecs the script decodes, all of them before it is generated
+    _headers: Optional[Set[str]] = PrivateAttr(None)
+
+    @validator("argument_codec")
+    def check_argument_codec(cls, value: str) -> str:
+        if value not in ARGUMENT_CODECS:
+            raise ValueError(f"unknown argument codec {value!r}, expected one of {sorted(ARGUMENT_CODECS)}")
+        return value
+
+    @property
+    def codec(self) -> ArgumentCodec:
+        return ARGUMENT_CODECS[self.argument_codec](compress_over=self.compress_over)
 
     def generate_source(self) -> str:
         source = self.func.body.strip()
@@ -117,18 +165,19 @@ class PythonDecorator(ScriptDecorator):
         )
 
         codes = []
+        decoded = []
         for param_name, param_annotation in parameter_class.__annotations__.items():
             if is_value_from_param(param_name, param_annotation) or param_annotation == str:
                 codes.append('%s = "{{inputs.parameters.%s}}"' % (param_name, param_name))
             elif param_annotation in [int, float, bool, complex]:
                 codes.append("%s = {{inputs.parameters.%s}}" % (param_name, param_name))
             else:
-                if codes[0] != "import pickle":
-                    codes = ["import pickle"] + codes
-                codes.append(
-                    '%s = pickle.loads(bytearray.fromhex("{{inputs.parameters.%s}}"), protocol=%s)'
-                    % (param_name, param_name, self.pickle_protocol)
-                )
+                decoded.append(param_annotation)
+                codes.append('%s = _decode_argument("{{inputs.parameters.%s}}")' % (param_name, param_name))
+
+        self._headers = type_codec_headers(decoded)
+        if decoded:
+            codes.insert(0, self.codec.decoder_source(self._headers))
 
         if self.func.parameters:
             source = "\n".join(codes) + f"\n\n{source}"
@@ -157,7 +206,15 @@ class PythonDecorator(ScriptDecorator):
         if isinstance(argument, (str, int, float, bool, complex)):
             return str(argument)
         else:
-            return str(pickle.dumps(argument, protocol=self.pickle_protocol).hex())
+            return self.codec.encode(argument, self.pickle_protocol, self._headers)
+
+    def restore(self, template: Type[ScriptTemplate]):
+        annotations = getattr(template.Parameters, "__annotations__", {})
+        self._headers = type_codec_headers(
+            annotation
+            for name, annotation in annotations.items()
+            if not isinstance(getattr(template.Parameters, name, None), v1alpha1.ValueFrom)
+        )
 
 
 python_template = PythonDecorator
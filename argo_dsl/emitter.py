@@ -0,0 +1,230 @@
+"""
+YAML emitter for manifests.
+
+`dump_yaml(data)` returns the same text as `yaml.dump(data, Dumper=BlockDumper)`
+for the plain data `to_manifest` builds, without going through the representer,
+serializer and emitter stacks of PyYAML. It only emits what manifests are made of:
+block mappings with sorted string keys, block sequences, None, bools, ints, floats
+and strings. Strings are written plain or single quoted on one line, folded at the
+width PyYAML folds them, and multi-line strings as `|-` literal blocks like
+`BlockDumper` writes them. The style of every distinct string is worked out once.
+
+Anything else, e.g. strings which PyYAML would double quote, non-ASCII text, other
+scalar types or objects referenced twice, makes `dump_yaml` fall back to
+`yaml.dump` for the whole document, so the output is the same in every case.
+"""
+import functools
+import re
+
+from typing import Any
+from typing import List
+from typing import Set
+from typing import Tuple
+
+import yaml
+
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+from .utils import _TRAILING_SPACES
+from .utils import BlockDumper
+
+
+# the defaults of `yaml.dump`
+BEST_WIDTH = 80
+INDENT = 2
+# longer keys are written as complex keys
+MAX_SIMPLE_KEY_LENGTH = 127
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolve = Resolver().resolve
+
+_PRINTABLE = re.compile(r"[\x20-\x7e]*")
+_PRINTABLE_LINES = re.compile(r"[\x20-\x7e\n]*")
+# a space which PyYAML may break a line at
+_SINGLE_SPACE = re.compile("(?<! ) (?! )")
+_INDICATORS = frozenset("#,[]{}&*!|>'\"%@`")
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _block_plain_allowed(value: str) -> bool:
+    """
+    `allow_block_plain` of `yaml.emitter.Emitter.analyze_scalar`, for a line of
+    printable ASCII
+    """
+    first = value[0]
+    followed_by_space = len(value) == 1 or value[1] == " "
+    return not (
+        first in _INDICATORS
+        or (first in "?:-" and followed_by_space)
+        or value.startswith(("---", "..."))
+        or ": " in value
+        or value.endswith(":")
+        or " #" in value
+        or first == " "
+        or value[-1] == " "
+    )
+
+
+@functools.lru_cache(maxsize=65536)
+def _string(value: str) -> Tuple[str, str]:
+    """
+    Style and text of a string: "" plain, "'" single quoted or "|" literal block
+    """
+    if "\n" in value:
+        # as `BlockDumper.represent_scalar` prepares it
+        value = _TRAILING_SPACES.sub("\n", value).strip()
+        if not value or not _PRINTABLE_LINES.fullmatch(value):
+            raise _Unsupported
+        return "|", value
+
+    if not _PRINTABLE.fullmatch(value):
+        raise _Unsupported
+    if value and _block_plain_allowed(value) and _resolve(ScalarNode, value, (True, False)) == _STR_TAG:
+        return "", value
+    return "'", "'%s'" % value.replace("'", "''")
+
+
+def _fold(text: str, column: int, indent: int, quoted: bool) -> str:
+    """
+    Break `text`, written from `column` on, at the single spaces where PyYAML breaks
+    plain and single quoted scalars, which are those past `BEST_WIDTH`
+    """
+    if column + len(text) <= BEST_WIDTH or " " not in text:
+        return text
+
+    lines = []
+    start = 0
+    # `column` at `start`
+    for match in _SINGLE_SPACE.finditer(text):
+        space = match.start()
+        if quoted and (space == 1 or space == len(text) - 2):
+            # the first and last character of the string are never broken at
+            continue
+        if column + space - start > BEST_WIDTH:
+            lines.append(text[start:space])
+            start = space + 1
+            column = indent
+    lines.append(text[start:])
+    return ("\n" + " " * indent).join(lines)
+
+
+def _float(value: float) -> str:
+    # `yaml.representer.SafeRepresenter.represent_float`
+    if value != value:
+        return ".nan"
+    elif value == float("inf"):
+        return ".inf"
+    elif value == -float("inf"):
+        return "-.inf"
+    text = repr(value).lower()
+    if "." not in text and "e" in text:
+        text = text.replace("e", ".0e", 1)
+    return text
+
+
+@functools.lru_cache(maxsize=65536)
+def _key(key: str) -> str:
+    style, text = _string(key)
+    if style == "|" or len(key) > MAX_SIMPLE_KEY_LENGTH:
+        raise _Unsupported
+    return text
+
+
+def _scalar(value: Any, column: int, indent: int) -> str:
+    """
+    The text of a value written from `column` on, in a mapping or sequence at `indent`
+    """
+    cls = value.__class__
+    if cls is str:
+        style, text = _string(value)
+        if style == "|":
+            content = " " * (indent + INDENT)
+            return "|-" + "".join("\n" + content + line if line else "\n" for line in text.split("\n"))
+        return _fold(text, column, indent + INDENT, bool(style))
+    elif value is None:
+        return "null"
+    elif cls is bool:
+        return "true" if value else "false"
+    elif cls is int:
+        return str(value)
+    elif cls is float:
+        return _float(value)
+    elif cls is dict and not value:
+        return "{}"
+    elif cls is list and not value:
+        return "[]"
+    raise _Unsupported
+
+
+class _Emitter:
+    def __init__(self):
+        self.lines: List[str] = []
+        # ids of the mappings and sequences so far, PyYAML writes aliases for repeated ones
+        self.seen: Set[int] = set()
+
+    def container(self, value: Any) -> bool:
+        cls = value.__class__
+        if (cls is dict or cls is list) and value:
+            if id(value) in self.seen:
+                raise _Unsupported
+            self.seen.add(id(value))
+            return True
+        return False
+
+    def mapping(self, data: dict, indent: int, prefix: str):
+        lines = self.lines
+        container = self.container
+        pad = " " * indent
+        try:
+            keys = sorted(data)
+        except TypeError:
+            raise _Unsupported from None
+        for key in keys:
+            if key.__class__ is not str:
+                raise _Unsupported
+            key_text = _key(key)
+            value = data[key]
+            if container(value):
+                lines.append(f"{prefix}{key_text}:\n")
+                if value.__class__ is dict:
+                    self.mapping(value, indent + INDENT, pad + "  ")
+                else:
+                    self.sequence(value, indent, pad)
+            else:
+                lines.append(f"{prefix}{key_text}: {_scalar(value, indent + len(key_text) + 2, indent)}\n")
+            prefix = pad
+
+    def sequence(self, data: list, indent: int, prefix: str):
+        pad = " " * indent
+        for item in data:
+            item_prefix = prefix + "- "
+            if self.container(item):
+                if item.__class__ is dict:
+                    self.mapping(item, indent + INDENT, item_prefix)
+                else:
+                    self.sequence(item, indent + INDENT, item_prefix)
+            else:
+                self.lines.append(f"{item_prefix}{_scalar(item, indent + 2, indent)}\n")
+            prefix = pad
+
+
+def dump_yaml(data: Any) -> str:
+    """
+    `yaml.dump(data, Dumper=BlockDumper)`, see the module docstring
+    """
+    emitter = _Emitter()
+    try:
+        if not emitter.container(data):
+            # `{}`, `[]` and top level scalars
+            raise _Unsupported
+        if data.__class__ is dict:
+            emitter.mapping(data, 0, "")
+        else:
+            emitter.sequence(data, 0, "")
+    except _Unsupported:
+        return yaml.dump(data, Dumper=BlockDumper)
+    return "".join(emitter.lines)
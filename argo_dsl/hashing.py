@@ -0,0 +1,169 @@
+"""
+Content hashes of workflows and templates.
+
+`content_hash(model)` is the SHA-256 of the canonical JSON of a model: keys
+sorted, no whitespace, None fields skipped as in `to_manifest`. The templates of
+a workflow are hashed on their own, and the workflow refers to them by name and
+hash. So a `ContentHasher` which hashes many workflows sharing templates hashes
+each template once. The hash of a template leaves out its name, so identical
+templates under different names have the same hash.
+
+`dedupe_templates` collapses the identical templates of a workflow into one,
+renaming the steps, tasks and handlers which call them:
+
+    workflow = dedupe_templates(workflow)
+
+The stdlib JSON encoder writes the canonical JSON whatever the JSON backend of
+`argo_dsl.manifest` is, so hashes don't depend on what is installed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from .api.io.argoproj.workflow import v1alpha1
+from .manifest import _json_default
+
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+class ContentHasher:
+    """
+    Content hashes of models, each template hashed once.
+
+    The hasher remembers the templates it has hashed by identity and keeps them
+    alive, templates are expected not to change once hashed.
+    """
+
+    def __init__(self):
+        self._templates: Dict[int, Tuple[v1alpha1.Template, str]] = {}
+        self._encoder = json.JSONEncoder(
+            separators=(",", ":"), ensure_ascii=False, sort_keys=True, default=self._default
+        )
+
+    def _digest(self, data: Any) -> str:
+        return hashlib.sha256(self._encoder.encode(data).encode()).hexdigest()
+
+    def template_hash(self, template: v1alpha1.Template) -> str:
+        """
+        Hash of a template without its name
+        """
+        try:
+            return self._templates[id(template)][1]
+        except KeyError:
+            pass
+
+        fields = _json_default(template)
+        fields.pop("name", None)
+        digest = self._digest(fields)
+        self._templates[id(template)] = (template, digest)
+        return digest
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, v1alpha1.Template):
+            return {"name": value.name, "sha256": self.template_hash(value)}
+        return _json_default(value)
+
+    def content_hash(self, model: BaseModel) -> str:
+        """
+        Hash of any model, the templates in it are hashed through `template_hash`
+        """
+        if isinstance(model, v1alpha1.Template):
+            return self.template_hash(model)
+        return self._digest(model)
+
+
+def content_hash(model: BaseModel, hasher: Optional[ContentHasher] = None) -> str:
+    """
+    SHA-256 hex digest of the content of a model, see the module docstring
+    """
+    return (hasher or ContentHasher()).content_hash(model)
+
+
+def _rename(model: _M, field: str, renames: Dict[str, str]) -> _M:
+    name = getattr(model, field)
+    if name in renames:
+        return model.copy(update={field: renames[name]})
+    return model
+
+
+def _rename_calls(calls: List[_M], renames: Dict[str, str]) -> Optional[List[_M]]:
+    """
+    Steps or tasks with the renamed templates they call and handlers, None if none
+    changes. Changed ones are copies, the originals may be shared with other workflows.
+    """
+    renamed = [_rename(_rename(call, "template", renames), "onExit", renames) for call in calls]
+    if all(new is old for new, old in zip(renamed, calls)):
+        return None
+    return renamed
+
+
+def _rename_template_calls(template: v1alpha1.Template, renames: Dict[str, str]) -> v1alpha1.Template:
+    update: Dict[str, Any] = {}
+    if template.steps:
+        groups = [_rename_calls(group.__root__, renames) for group in template.steps]
+        if any(groups):
+            update["steps"] = [
+                group if calls is None else v1alpha1.ParallelSteps.construct(__root__=calls)
+                for group, calls in zip(template.steps, groups)
+            ]
+    if template.dag:
+        tasks = _rename_calls(template.dag.tasks, renames)
+        if tasks is not None:
+            update["dag"] = template.dag.copy(update={"tasks": tasks})
+    return template.copy(update=update) if update else template
+
+
+def _dedupe_spec(spec: _M, hasher: ContentHasher) -> _M:
+    templates: List[v1alpha1.Template] = list(spec.templates or ())  # type: ignore[attr-defined]
+    renames: Dict[str, str] = {}
+    while True:
+        kept: Dict[str, str] = {}
+        round_renames: Dict[str, str] = {}
+        for template in templates:
+            digest = hasher.template_hash(template)
+            if digest in kept:
+                round_renames[template.name] = kept[digest]
+            else:
+                kept[digest] = template.name
+        if not round_renames:
+            break
+
+        # calls to templates dropped earlier follow them to the template kept now
+        renames = {name: round_renames.get(kept_name, kept_name) for name, kept_name in renames.items()}
+        renames.update(round_renames)
+        # callers may become identical once their calls are renamed, the next round finds them
+        templates = [_rename_template_calls(t, round_renames) for t in templates if t.name not in round_renames]
+
+    if not renames:
+        return spec
+    spec = spec.copy(update={"templates": templates})
+    return _rename(_rename(spec, "entrypoint", renames), "onExit", renames)
+
+
+def dedupe_templates(workflow: _M, hasher: Optional[ContentHasher] = None) -> _M:
+    """
+    `workflow`, a `Workflow`, `WorkflowTemplate`, `ClusterWorkflowTemplate` or
+    `CronWorkflow`, with each set of identical templates collapsed into the first
+    of them. `workflow` itself is not changed.
+    """
+    hasher = hasher or ContentHasher()
+    spec = workflow.spec  # type: ignore[attr-defined]
+    if isinstance(spec, v1alpha1.CronWorkflowSpec):
+        workflow_spec = _dedupe_spec(spec.workflowSpec, hasher)
+        if workflow_spec is spec.workflowSpec:
+            return workflow
+        return workflow.copy(update={"spec": spec.copy(update={"workflowSpec": workflow_spec})})
+
+    new_spec = _dedupe_spec(spec, hasher)
+    return workflow if new_spec is spec else workflow.copy(update={"spec": new_spec})
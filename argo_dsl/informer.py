@@ -0,0 +1,556 @@
+"""
+Local cache of workflows, workflow templates and cron workflows.
+
+An `Informer` lists the objects of one kind once, then follows the watch stream of
+the Argo Server from the resource version of the list, so its store stays up to
+date without polling. Dashboards and schedulers query the store instead of the
+server, through indexes by namespace, label, phase and `workflowTemplateRef`,
+which answer in microseconds rather than in the hundreds of milliseconds of a
+list call.
+
+    async with ArgoClient(url, token=token, namespace="argo") as client:
+        informer = Informer(client)
+        informer.start()
+        await informer.wait_synced()
+        running = informer.find(phase="Running", labels={"team": "ml"})
+
+Workflows are indexed with `argo_dsl.view.parse_workflow`, an update only scans
+the nodes which changed since the previous version of the workflow. A dropped
+watch is resumed from the last resource version seen; when that version is too
+old for the server (410 Gone) everything is listed again and the store is
+reconciled with the list.
+
+The Argo Server has no watch endpoint for workflow templates and cron workflows,
+their informers list them again every `resync_period` seconds instead.
+"""
+import asyncio
+import json
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from .api.io.argoproj.workflow import v1alpha1
+from .bulk import Backoff
+from .client import ArgoClient
+from .client import ArgoServerError
+from .client import _path
+from .listing import DEFAULT_PAGE_SIZE
+from .listing import iter_pages
+from .status import CompactNodeStatus
+from .view import Buffer
+from .view import JSONScanError
+from .view import Span
+from .view import WorkflowView
+from .view import decode
+from .view import parse_workflow
+from .view import scan_object
+from .view import skip_value
+from .watch import ADDED
+from .watch import DELETED
+from .watch import MODIFIED
+from .watch import _watch_event
+
+
+ObjectKey = Tuple[str, str]
+
+# errors of a watch stream cut short in the middle of an event
+_CUT_SHORT_ERRORS = (asyncio.IncompleteReadError, JSONScanError, json.JSONDecodeError)
+Indexer = Callable[[Any], Iterable[Hashable]]
+Handler = Callable[[str, Any, Any], None]
+
+DEFAULT_RESYNC_PERIOD = 300.0
+
+NAMESPACE = "namespace"
+LABEL = "label"
+PHASE = "phase"
+TEMPLATE_REF = "workflowTemplateRef"
+
+
+class _Expired(Exception):
+    """
+    The resource version to watch from is gone from the server
+    """
+
+
+class ResourceKind:
+    """
+    How the objects of a kind are listed, watched, parsed and indexed. `parse` turns
+    the span of a listed item into an object, `metadata` returns its decoded
+    metadata. `watch` is the path of the event stream, None if the server has none.
+    """
+
+    def __init__(
+        self,
+        resource: str,
+        parse: Callable[[Buffer, Span, Any], Any],
+        metadata: Callable[[Any], Mapping[str, Any]],
+        indexers: Mapping[str, Indexer],
+        watch: Optional[str] = None,
+    ):
+        self.resource = resource
+        self.parse = parse
+        self.metadata = metadata
+        self.indexers = dict(indexers)
+        self.watch = watch
+
+
+def _namespace_indexer(metadata: Callable[[Any], Mapping[str, Any]]) -> Indexer:
+    return lambda obj: (metadata(obj).get("namespace") or "",)
+
+
+def _label_indexer(metadata: Callable[[Any], Mapping[str, Any]]) -> Indexer:
+    # (key, None) finds the objects with the label whatever its value
+    def labels(obj: Any) -> Iterable[Hashable]:
+        for key, value in (metadata(obj).get("labels") or {}).items():
+            yield key, value
+            yield key, None
+
+    return labels
+
+
+def _workflow_metadata(view: WorkflowView) -> Mapping[str, Any]:
+    return view.field("metadata") or {}
+
+
+def _workflow_phase(view: WorkflowView) -> Iterable[Hashable]:
+    return (None if view.status is None else view.status.phase,)
+
+
+def _workflow_template_ref(view: WorkflowView) -> Iterable[Hashable]:
+    ref = (view.field("spec") or {}).get("workflowTemplateRef")
+    return () if not ref or ref.get("name") is None else (ref["name"],)
+
+
+def _model_metadata(model: Any) -> Mapping[str, Any]:
+    metadata = model.metadata
+    return {
+        "name": metadata.name,
+        "namespace": metadata.namespace,
+        "resourceVersion": metadata.resourceVersion,
+        "labels": metadata.labels,
+    }
+
+
+def _cron_workflow_template_ref(cron_workflow: v1alpha1.CronWorkflow) -> Iterable[Hashable]:
+    ref = cron_workflow.spec.workflowSpec.workflowTemplateRef
+    return () if ref is None or ref.name is None else (ref.name,)
+
+
+def _model_parser(model: Any) -> Callable[[Buffer, Span, Any], Any]:
+    return lambda buf, span, previous: model.parse_raw(bytes(buf[span[0] : span[1]]))
+
+
+def workflow_kind(node_class: Callable[[Any], Any] = CompactNodeStatus.parse_obj) -> ResourceKind:
+    """
+    Workflows as `argo_dsl.view.WorkflowView`, their nodes decoded by `node_class`
+    """
+
+    def parse(buf: Buffer, span: Span, previous: Optional[WorkflowView]) -> WorkflowView:
+        return parse_workflow(buf, node_class, previous=previous, pos=span[0])
+
+    return ResourceKind(
+        "workflows",
+        parse,
+        _workflow_metadata,
+        {
+            NAMESPACE: _namespace_indexer(_workflow_metadata),
+            LABEL: _label_indexer(_workflow_metadata),
+            PHASE: _workflow_phase,
+            TEMPLATE_REF: _workflow_template_ref,
+        },
+        watch="workflow-events",
+    )
+
+
+WORKFLOWS = workflow_kind()
+
+WORKFLOW_TEMPLATES = ResourceKind(
+    "workflow-templates",
+    _model_parser(v1alpha1.WorkflowTemplate),
+    _model_metadata,
+    {NAMESPACE: _namespace_indexer(_model_metadata), LABEL: _label_indexer(_model_metadata)},
+)
+
+CRON_WORKFLOWS = ResourceKind(
+    "cron-workflows",
+    _model_parser(v1alpha1.CronWorkflow),
+    _model_metadata,
+    {
+        NAMESPACE: _namespace_indexer(_model_metadata),
+        LABEL: _label_indexer(_model_metadata),
+        TEMPLATE_REF: _cron_workflow_template_ref,
+    },
+)
+
+
+class Informer:
+    """
+    Keeps the objects of `kind` in `namespace`, all namespaces if it is "", see the
+    module docstring. `indexers` adds indexes to those of the kind, each maps an
+    object to the keys it is found by with `index`.
+
+    Handlers added with `add_handler` are called with the event type, the object
+    and its previous version for every change of the store.
+    """
+
+    def __init__(
+        self,
+        client: ArgoClient,
+        kind: ResourceKind = WORKFLOWS,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        indexers: Optional[Mapping[str, Indexer]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resync_period: float = DEFAULT_RESYNC_PERIOD,
+        backoff: Optional[Backoff] = None,
+    ):
+        self.client = client
+        self.kind = kind
+        self.namespace = client.resolve_namespace(namespace)
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.indexers = {**kind.indexers, **(indexers or {})}
+        self.page_size = page_size
+        self.resync_period = resync_period
+        self.backoff = backoff or Backoff()
+
+        self.objects: Dict[ObjectKey, Any] = {}
+        self.indexes: Dict[str, Dict[Hashable, Set[ObjectKey]]] = {name: {} for name in self.indexers}
+        self.resource_version: Optional[str] = None
+        self.handlers: List[Handler] = []
+        # the error of the last failed list or watch
+        self.last_error: Optional[BaseException] = None
+
+        # the index keys of every object, to remove it from the indexes
+        self._keys: Dict[ObjectKey, Dict[str, Tuple[Hashable, ...]]] = {}
+        self._synced: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._watching = False
+
+    # queries
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.objects
+
+    def get(self, namespace: str, name: str) -> Any:
+        return self.objects.get((namespace, name))
+
+    def list(self) -> List[Any]:
+        return list(self.objects.values())
+
+    def keys(self, index: str, key: Hashable) -> Set[ObjectKey]:
+        """
+        The (namespace, name) keys of the objects found by `key` in `index`, the set
+        belongs to the index and must not be changed
+        """
+        return self.indexes[index].get(key) or set()
+
+    def index(self, index: str, key: Hashable) -> List[Any]:
+        objects = self.objects
+        return [objects[object_key] for object_key in self.keys(index, key)]
+
+    def by_namespace(self, namespace: str) -> List[Any]:
+        return self.index(NAMESPACE, namespace)
+
+    def by_label(self, key: str, value: Optional[str] = None) -> List[Any]:
+        """
+        The objects labelled `key`=`value`, or labelled `key` when `value` is None
+        """
+        return self.index(LABEL, (key, value))
+
+    def by_phase(self, phase: Optional[str]) -> List[Any]:
+        return self.index(PHASE, phase)
+
+    def by_template_ref(self, name: str) -> List[Any]:
+        return self.index(TEMPLATE_REF, name)
+
+    def find(
+        self,
+        namespace: Optional[str] = None,
+        phase: Optional[str] = None,
+        labels: Optional[Mapping[str, Optional[str]]] = None,
+        template_ref: Optional[str] = None,
+        **indexes: Hashable,
+    ) -> List[Any]:
+        """
+        The objects matching all the given conditions, in no particular order. A label
+        whose value is None only needs to be present. `indexes` are other conditions
+        by index name.
+        """
+        conditions = [(index, key) for index, key in indexes.items()]
+        if namespace is not None:
+            conditions.append((NAMESPACE, namespace))
+        if phase is not None:
+            conditions.append((PHASE, phase))
+        if template_ref is not None:
+            conditions.append((TEMPLATE_REF, template_ref))
+        for label in (labels or {}).items():
+            conditions.append((LABEL, label))
+        if not conditions:
+            return self.list()
+
+        # set.intersection iterates over the smallest set
+        first, *others = [self.keys(index, key) for index, key in conditions]
+        objects = self.objects
+        return [objects[key] for key in first.intersection(*others)]
+
+    # events
+
+    def add_handler(self, handler: Handler):
+        self.handlers.append(handler)
+
+    def _notify(self, event_type: str, obj: Any, previous: Any):
+        for handler in self.handlers:
+            handler(event_type, obj, previous)
+
+    # store
+
+    def _key(self, obj: Any) -> ObjectKey:
+        return _object_key(self.kind.metadata(obj))
+
+    def _set(self, key: ObjectKey, obj: Any) -> Any:
+        previous = self.objects.get(key)
+        if previous is not None:
+            self._unindex(key)
+        self.objects[key] = obj
+
+        keys = self._keys[key] = {}
+        for name, indexer in self.indexers.items():
+            index = self.indexes[name]
+            keys[name] = index_keys = tuple(dict.fromkeys(indexer(obj)))
+            for index_key in index_keys:
+                object_keys = index.get(index_key)
+                if object_keys is None:
+                    object_keys = index[index_key] = set()
+                object_keys.add(key)
+        return previous
+
+    def _unindex(self, key: ObjectKey):
+        for name, index_keys in self._keys.pop(key).items():
+            index = self.indexes[name]
+            for index_key in index_keys:
+                object_keys = index[index_key]
+                object_keys.discard(key)
+                if not object_keys:
+                    del index[index_key]
+
+    def _delete(self, key: ObjectKey) -> Any:
+        previous = self.objects.pop(key, None)
+        if previous is not None:
+            self._unindex(key)
+        return previous
+
+    def _resource_version(self, obj: Any) -> Optional[str]:
+        return self.kind.metadata(obj).get("resourceVersion")
+
+    # list and watch
+
+    async def relist(self):
+        """
+        List every object and reconcile the store with the list: objects which are
+        gone are deleted, those whose resource version changed are replaced
+        """
+        seen: Set[ObjectKey] = set()
+        resource_version = None
+        pages = iter_pages(
+            self.client,
+            self.namespace,
+            self.label_selector,
+            self.field_selector,
+            self.page_size,
+            fields=None,
+            resource=self.kind.resource,
+        )
+        async for page in pages:
+            # following the watch from the first page replays what changed meanwhile
+            if resource_version is None:
+                resource_version = page.resource_version
+            buf = page.buf
+            for span in page.spans:
+                self._apply_listed(buf, span, seen)
+
+        for key in [key for key in self.objects if key not in seen]:
+            self._notify(DELETED, None, self._delete(key))
+        self.resource_version = resource_version
+        self._set_synced()
+
+    def _apply_listed(self, buf: Buffer, span: Span, seen: Set[ObjectKey]):
+        metadata = _listed_metadata(buf, span)
+        key = _object_key(metadata)
+        seen.add(key)
+        current = self.objects.get(key)
+        # unchanged objects are not parsed again
+        if current is not None and self._resource_version(current) == metadata.get("resourceVersion"):
+            return
+        obj = self.kind.parse(buf, span, current)
+        self._set(key, obj)
+        self._notify(ADDED if current is None else MODIFIED, obj, current)
+
+    async def watch(self):
+        """
+        Apply the watch events from the current resource version on, until the
+        server ends the stream
+        """
+        if self.kind.watch is None:
+            raise ValueError(f"{self.kind.resource} cannot be watched")
+
+        query = {
+            "listOptions.resourceVersion": self.resource_version,
+            "listOptions.labelSelector": self.label_selector,
+            "listOptions.fieldSelector": self.field_selector,
+        }
+        response = await self.client.stream("GET", _path(self.kind.watch, self.namespace), query)
+        async with response:
+            self._watching = True
+            async for line in response.lines():
+                if line.strip():
+                    self.apply(line)
+
+    def apply(self, event: Buffer):
+        """
+        Apply one raw watch event of a workflow
+        """
+        objects = self.objects
+
+        def previous(fields: Dict[str, Any]) -> Any:
+            return objects.get(_object_key(fields.get("metadata") or {}))
+
+        def parse(pos: int) -> WorkflowView:
+            return self.kind.parse(event, (pos, len(event)), previous)
+
+        event_type, obj, span = _watch_event(event, parse)
+        if obj is not None:
+            key = self._key(obj)
+            if event_type == DELETED:
+                previous_obj = self._delete(key)
+                if previous_obj is not None:
+                    self._notify(DELETED, None, previous_obj)
+            else:
+                previous_obj = self._set(key, obj)
+                self._notify(ADDED if previous_obj is None else MODIFIED, obj, previous_obj)
+            self.resource_version = self._resource_version(obj) or self.resource_version
+        elif event_type == "BOOKMARK" and span is not None:
+            metadata = decode(event, span).get("metadata") or {}
+            self.resource_version = metadata.get("resourceVersion", self.resource_version)
+        elif event_type == "ERROR":
+            status = decode(event, span) if span is not None else {}
+            _raise_status(status.get("code"), status.get("message"))
+        elif event_type is None:
+            # the Argo Server ends a failed stream with an error line
+            error = decode(event, (0, len(event))).get("error") or {}
+            _raise_status(error.get("http_code"), error.get("message"))
+
+    async def run(self):
+        """
+        List and watch until cancelled. Failed requests are retried after the delays
+        of `backoff` for as long as they fail with a retryable error, other errors
+        are raised. Watches cut short in the middle of an event are resumed, up to
+        `backoff.retries` times in a row.
+        """
+        failures = 0
+        malformed = 0
+        relist = True
+        while True:
+            self._watching = False
+            try:
+                if relist:
+                    await self.relist()
+                    relist = False
+                if self.kind.watch is None:
+                    await asyncio.sleep(self.resync_period)
+                    relist = True
+                else:
+                    await self.watch()
+                failures = malformed = 0
+            except _Expired:
+                relist = True
+            except (ArgoServerError, OSError, asyncio.TimeoutError) + _CUT_SHORT_ERRORS as error:
+                if isinstance(error, _CUT_SHORT_ERRORS):
+                    # a watch cut short in the middle of an event is resumed, a server
+                    # which sends malformed events again and again is given up on
+                    malformed += 1
+                    if not self._watching or malformed > self.backoff.retries:
+                        raise
+                elif not self.backoff.retryable(error):
+                    raise
+                self.last_error = error
+                # a watch which was streaming starts the backoff over
+                failures = 1 if self._watching else failures + 1
+                await asyncio.sleep(self.backoff.delay(failures, error))
+
+    def start(self) -> "asyncio.Task[None]":
+        """
+        Run the informer in a task of the running loop
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> "Informer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.stop()
+
+    @property
+    def synced(self) -> bool:
+        return self._synced is not None and self._synced.is_set()
+
+    def _set_synced(self):
+        if self._synced is None:
+            self._synced = asyncio.Event()
+        self._synced.set()
+
+    async def wait_synced(self, timeout: Optional[float] = None):
+        """
+        Wait for the first list to be in the store
+        """
+        if self._synced is None:
+            self._synced = asyncio.Event()
+        await asyncio.wait_for(self._synced.wait(), timeout)
+
+
+def _object_key(metadata: Mapping[str, Any]) -> ObjectKey:
+    return metadata.get("namespace") or "", metadata.get("name") or ""
+
+
+def _listed_metadata(buf: Buffer, span: Span) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {}
+
+    def member(key: str, start: int) -> int:
+        nonlocal metadata
+        end = skip_value(buf, start)
+        if key == "metadata":
+            metadata = decode(buf, (start, end)) or {}
+        return end
+
+    scan_object(buf, span[0], member)
+    return metadata
+
+
+def _raise_status(code: Optional[int], message: Optional[str]):
+    if code == 410:
+        raise _Expired(message)
+    raise ArgoServerError(code or 500, "watch failed", json.dumps({"message": message}).encode())
@@ -0,0 +1,628 @@
+"""
+Offline linting of workflows.
+
+`lint` checks a `v1alpha1.Workflow`, `WorkflowTemplate`, `ClusterWorkflowTemplate`
+or `CronWorkflow`, or the manifest of one, for the mistakes the lint endpoint of
+the Argo Server rejects, without the round trip:
+
+* the entrypoint, the `onExit` handlers and the templates which steps and tasks
+  call exist, template, step and task names are valid and unique
+* the arguments of every call supply the inputs of the called template
+* `{{...}}` references name declared inputs, workflow parameters and outputs, and
+  steps and tasks which have run by then: earlier step groups, the dependencies
+  of a DAG task. `{{item}}` is only used in loops.
+* DAG dependencies exist and have no cycle
+
+`templateRef` and `workflowTemplateRef` are resolved against the workflow
+templates the `Linter` was given. They are only reported missing when templates
+of their scope were given at all, otherwise calls through them are not checked.
+
+Every problem is a `Diagnostic` whose `path` locates it in the manifest, e.g.
+`spec.templates[1].dag.tasks[0].arguments`. `Linter.lint_all` spreads many
+workflows over a pool of processes.
+
+    linter = Linter(workflow_templates=templates)
+    for diagnostic in linter.lint(workflow):
+        print(diagnostic)
+"""
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from pydantic import BaseModel
+
+from .critical_path import _depends_tasks
+from .manifest import to_manifest
+
+
+ERROR = "error"
+WARNING = "warning"
+
+TEMPLATE_KINDS = frozenset(["WorkflowTemplate", "ClusterWorkflowTemplate"])
+TEMPLATE_TYPES = ("container", "script", "resource", "steps", "dag", "suspend")
+LOOP_FIELDS = ("withItems", "withParam", "withSequence")
+# where an input artifact comes from when no argument supplies it
+ARTIFACT_SOURCES = frozenset(["from", "raw", "s3", "git", "http", "artifactory", "hdfs", "oss", "gcs"])
+
+WORKFLOW_VARIABLES = frozenset(
+    [
+        "name",
+        "namespace",
+        "uid",
+        "serviceAccountName",
+        "mainEntrypoint",
+        "labels",
+        "annotations",
+        "creationTimestamp",
+        "duration",
+        "priority",
+        "status",
+        "failures",
+        "outputs",
+        "parameters",
+        "scheduledTime",
+    ]
+)
+NODE_VARIABLES = frozenset(["id", "ip", "status", "exitCode", "startedAt", "finishedAt", "outputs", "hostNodeName"])
+
+MAX_TEMPLATE_NAME_LENGTH = 128
+DEFAULT_CHUNK_SIZE = 32
+
+_REFERENCE = re.compile(r"{{\s*([^{}]*?)\s*}}")
+_NAME = re.compile(r"[a-zA-Z0-9][-a-zA-Z0-9]*\Z")
+
+Manifest = Dict[str, Any]
+# a workflow template spec and its templates by name
+_Registered = Tuple[Manifest, Dict[str, Manifest]]
+
+
+class Diagnostic:
+    """
+    A problem found by the linter, `code` names its kind, e.g. `unknown-template`
+    """
+
+    __slots__ = ("severity", "code", "message", "path")
+
+    def __init__(self, severity: str, code: str, message: str, path: str):
+        self.severity = severity
+        self.code = code
+        self.message = message
+        self.path = path
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+        return (self.severity, self.code, self.message, self.path) == (
+            other.severity,
+            other.code,
+            other.message,
+            other.path,
+        )
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.severity}: {self.message} [{self.code}]"
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.severity!r}, {self.code!r}, {self.message!r}, {self.path!r})"
+
+
+def _manifest(obj: Any) -> Manifest:
+    if isinstance(obj, BaseModel):
+        return to_manifest(obj)
+    return obj
+
+
+def _kind(obj: Any, manifest: Mapping[str, Any]) -> Optional[str]:
+    return obj.__class__.__name__ if isinstance(obj, BaseModel) else manifest.get("kind")
+
+
+def _submitted(obj: Any, manifest: Mapping[str, Any]) -> bool:
+    # the arguments of workflow templates are completed on submission
+    return _kind(obj, manifest) not in TEMPLATE_KINDS
+
+
+def _workflow_spec(manifest: Mapping[str, Any]) -> Tuple[Manifest, str]:
+    spec = manifest.get("spec") or {}
+    if manifest.get("kind") == "CronWorkflow" or "workflowSpec" in spec:
+        return spec.get("workflowSpec") or {}, "spec.workflowSpec"
+    return spec, "spec"
+
+
+def _names(items: Optional[Iterable[Mapping[str, Any]]]) -> List[Any]:
+    return [item.get("name") for item in items or ()]
+
+
+def _register(templates: Optional[Iterable[Any]]) -> Optional[Dict[str, _Registered]]:
+    if templates is None:
+        return None
+
+    registered: Dict[str, _Registered] = {}
+    for template in templates:
+        manifest = _manifest(template)
+        spec = manifest.get("spec") or {}
+        by_name = {template.get("name"): template for template in spec.get("templates") or ()}
+        name: Any = (manifest.get("metadata") or {}).get("name")
+        registered[name] = (spec, by_name)
+    return registered
+
+
+class _Scope:
+    """
+    What the `{{...}}` references of a part of a template resolve to. `nodes` are the
+    steps or tasks of the template with the templates they call, `available` those
+    which have run by then.
+    """
+
+    __slots__ = ("parameters", "artifacts", "kind", "nodes", "available", "loop")
+
+    def __init__(
+        self,
+        parameters: AbstractSet[str],
+        artifacts: AbstractSet[str],
+        kind: Optional[str] = None,
+        nodes: Optional[Mapping[str, Optional[Manifest]]] = None,
+        available: AbstractSet[str] = frozenset(),
+        loop: bool = False,
+    ):
+        self.parameters = parameters
+        self.artifacts = artifacts
+        self.kind = kind
+        self.nodes = nodes
+        self.available = available
+        self.loop = loop
+
+    def nested(self, kind: str, nodes: Mapping[str, Optional[Manifest]], available: AbstractSet[str]) -> "_Scope":
+        return _Scope(self.parameters, self.artifacts, kind, nodes, available)
+
+    def looping(self) -> "_Scope":
+        return _Scope(self.parameters, self.artifacts, self.kind, self.nodes, self.available, True)
+
+
+class _Run:
+    """
+    The lint of one workflow spec
+    """
+
+    def __init__(self, linter: "Linter"):
+        self.linter = linter
+        self.diagnostics: List[Diagnostic] = []
+        self.templates: Dict[str, Manifest] = {}
+        self.parameters: Set[str] = set()
+
+    def error(self, code: str, path: str, message: str):
+        self.diagnostics.append(Diagnostic(ERROR, code, message, path))
+
+    def warning(self, code: str, path: str, message: str):
+        self.diagnostics.append(Diagnostic(WARNING, code, message, path))
+
+    def spec(self, spec: Manifest, path: str, submitted: bool = True):
+        templates = spec.get("templates") or []
+        entrypoint = spec.get("entrypoint")
+        arguments = spec.get("arguments") or {}
+        self.parameters.update(_names(arguments.get("parameters")))
+
+        ref = spec.get("workflowTemplateRef")
+        resolved = True
+        if ref is not None:
+            referenced = self.workflow_template(ref, f"{path}.workflowTemplateRef")
+            resolved = referenced is not None
+            if referenced is not None:
+                referenced_spec, by_name = referenced
+                self.templates.update(by_name)
+                entrypoint = entrypoint or referenced_spec.get("entrypoint")
+                self.parameters.update(_names((referenced_spec.get("arguments") or {}).get("parameters")))
+
+        self.declared(templates, f"{path}.templates", "template")
+        # the templates of the workflow take precedence over those of its workflow
+        # template, the first of duplicates over the others
+        self.templates.update((template.get("name"), template) for template in reversed(templates))
+
+        if entrypoint is None:
+            if ref is None:
+                self.error("missing-entrypoint", f"{path}.entrypoint", "entrypoint is required")
+        elif resolved:
+            entry = self.template(entrypoint, f"{path}.entrypoint")
+            if entry is not None and submitted:
+                self.arguments(arguments, entry, f"{path}.arguments", unknown=False)
+
+        on_exit = spec.get("onExit")
+        if on_exit is not None and resolved:
+            self.template(on_exit, f"{path}.onExit")
+
+        for i, template in enumerate(templates):
+            self.lint_template(template, f"{path}.templates[{i}]")
+
+    # resolution
+
+    def template(self, name: str, path: str) -> Optional[Manifest]:
+        template = self.templates.get(name)
+        if template is None:
+            self.error("unknown-template", path, f"template {name!r} not found")
+        return template
+
+    def workflow_template(self, ref: Mapping[str, Any], path: str) -> Optional[_Registered]:
+        linter = self.linter
+        registered = linter.cluster_workflow_templates if ref.get("clusterScope") else linter.workflow_templates
+        if registered is None:
+            return None
+
+        name: Any = ref.get("name")
+        found = registered.get(name)
+        if found is None:
+            kind = "cluster workflow template" if ref.get("clusterScope") else "workflow template"
+            self.error("unknown-workflow-template", f"{path}.name", f"{kind} {name!r} not found")
+        return found
+
+    def callee(self, step: Mapping[str, Any], path: str) -> Optional[Manifest]:
+        template = step.get("template")
+        ref: Any = step.get("templateRef")
+        if (template is None) == (ref is None):
+            self.error("step-target", path, "exactly one of template and templateRef must be set")
+            return None
+        if template is not None:
+            return self.template(template, f"{path}.template")
+
+        referenced = self.workflow_template(ref, f"{path}.templateRef")
+        if referenced is None:
+            return None
+        callee = referenced[1].get(ref.get("template"))
+        if callee is None:
+            self.error(
+                "unknown-template",
+                f"{path}.templateRef.template",
+                f"template {ref.get('template')!r} not found in {ref.get('name')!r}",
+            )
+        return callee
+
+    # templates
+
+    def name(self, name: Any, path: str, what: str):
+        if not isinstance(name, str) or not _NAME.match(name) or len(name) > MAX_TEMPLATE_NAME_LENGTH:
+            self.error(
+                "invalid-name",
+                path,
+                f"{what} name {name!r} must be at most {MAX_TEMPLATE_NAME_LENGTH} alphanumeric characters or '-', "
+                "starting with an alphanumeric character",
+            )
+
+    def declared(self, items: Optional[List[Mapping[str, Any]]], path: str, what: str) -> Set[str]:
+        names: Set[str] = set()
+        for i, name in enumerate(_names(items)):
+            if name in names:
+                self.error(f"duplicate-{what.replace(' ', '-')}", f"{path}[{i}].name", f"{what} {name!r} is not unique")
+            names.add(name)
+        return names
+
+    def lint_template(self, template: Manifest, path: str):
+        self.name(template.get("name"), f"{path}.name", "template")
+
+        types = [key for key in TEMPLATE_TYPES if template.get(key) is not None]
+        if len(types) != 1:
+            message = "has no type" if not types else f"has more than one type: {', '.join(types)}"
+            self.error("template-type", path, f"template {template.get('name')!r} {message}")
+
+        inputs = template.get("inputs") or {}
+        scope = _Scope(
+            self.declared(inputs.get("parameters"), f"{path}.inputs.parameters", "input parameter"),
+            self.declared(inputs.get("artifacts"), f"{path}.inputs.artifacts", "input artifact"),
+        )
+        for key, value in template.items():
+            if key not in ("steps", "dag", "outputs"):
+                self.references(value, f"{path}.{key}", scope)
+
+        if template.get("steps") is not None:
+            scope = self.steps(template["steps"], f"{path}.steps", scope)
+        elif template.get("dag") is not None:
+            scope = self.dag(template["dag"], f"{path}.dag", scope)
+
+        outputs = template.get("outputs")
+        if outputs is not None:
+            self.declared(outputs.get("parameters"), f"{path}.outputs.parameters", "output parameter")
+            self.declared(outputs.get("artifacts"), f"{path}.outputs.artifacts", "output artifact")
+            self.references(outputs, f"{path}.outputs", scope)
+
+    def steps(self, groups: List[List[Manifest]], path: str, scope: _Scope) -> _Scope:
+        """
+        Lint the step groups of a template, returns the scope of its outputs
+        """
+        nodes: Dict[str, Optional[Manifest]] = {}
+        callees: List[List[Optional[Manifest]]] = []
+        for i, group in enumerate(groups):
+            callees.append([])
+            for j, step in enumerate(group or ()):
+                step_path = f"{path}[{i}][{j}]"
+                name: Any = step.get("name")
+                self.name(name, f"{step_path}.name", "step")
+                callee = self.callee(step, step_path)
+                if name in nodes:
+                    self.error("duplicate-step", f"{step_path}.name", f"step {name!r} is not unique")
+                else:
+                    nodes[name] = callee
+                callees[-1].append(callee)
+
+        available: Set[str] = set()
+        for i, group in enumerate(groups):
+            group_scope = scope.nested("steps", nodes, frozenset(available))
+            for j, step in enumerate(group or ()):
+                self.step(step, f"{path}[{i}][{j}]", group_scope, callees[i][j])
+            available.update(_names(group))
+        return scope.nested("steps", nodes, available)
+
+    def dag(self, dag: Manifest, path: str, scope: _Scope) -> _Scope:
+        """
+        Lint the tasks of a DAG template, returns the scope of its outputs
+        """
+        tasks = dag.get("tasks") or []
+        nodes: Dict[str, Optional[Manifest]] = {}
+        callees: List[Optional[Manifest]] = []
+        for i, task in enumerate(tasks):
+            name = task.get("name")
+            self.name(name, f"{path}.tasks[{i}].name", "task")
+            callee = self.callee(task, f"{path}.tasks[{i}]")
+            if name in nodes:
+                self.error("duplicate-task", f"{path}.tasks[{i}].name", f"task {name!r} is not unique")
+            else:
+                nodes[name] = callee
+            callees.append(callee)
+
+        dependencies: Dict[str, List[str]] = {}
+        for i, task in enumerate(tasks):
+            task_dependencies = list(task.get("dependencies") or ())
+            if task.get("depends"):
+                task_dependencies.extend(_depends_tasks(task["depends"]))
+            for dependency in task_dependencies:
+                if dependency not in nodes:
+                    self.error(
+                        "unknown-dependency",
+                        f"{path}.tasks[{i}]",
+                        f"task {task.get('name')!r} depends on unknown task {dependency!r}",
+                    )
+            known = [dependency for dependency in task_dependencies if dependency in nodes]
+            dependencies.setdefault(task.get("name"), known)
+
+        for target in (dag.get("target") or "").split():
+            if target not in nodes:
+                self.error("unknown-dependency", f"{path}.target", f"target task {target!r} not found")
+
+        ancestors = self.ancestors(dependencies, path)
+        for i, task in enumerate(tasks):
+            # the tasks on a cycle are already reported, their references are not
+            task_scope = scope.nested("tasks", nodes, ancestors.get(task.get("name"), frozenset(nodes)))
+            self.step(task, f"{path}.tasks[{i}]", task_scope, callees[i])
+        return scope.nested("tasks", nodes, frozenset(nodes))
+
+    def ancestors(self, dependencies: Mapping[str, List[str]], path: str) -> Dict[str, FrozenSet[str]]:
+        """
+        The tasks every task transitively depends on, in topological order. Tasks on
+        a cycle are reported and left out.
+        """
+        waiting = {name: len(set(task_dependencies)) for name, task_dependencies in dependencies.items()}
+        dependents: Dict[str, List[str]] = {}
+        for name, task_dependencies in dependencies.items():
+            for dependency in set(task_dependencies):
+                dependents.setdefault(dependency, []).append(name)
+
+        ready = [name for name, count in waiting.items() if count == 0]
+        ancestors: Dict[str, FrozenSet[str]] = {}
+        while ready:
+            name = ready.pop()
+            found: Set[str] = set()
+            for dependency in dependencies[name]:
+                found.add(dependency)
+                found.update(ancestors[dependency])
+            ancestors[name] = frozenset(found)
+            for dependent in dependents.get(name, ()):
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    ready.append(dependent)
+
+        cycle = [name for name in dependencies if name not in ancestors]
+        if cycle:
+            self.error("dependency-cycle", f"{path}.tasks", f"tasks {', '.join(map(repr, cycle))} depend on each other")
+        return ancestors
+
+    def step(self, step: Manifest, path: str, scope: _Scope, callee: Optional[Manifest]):
+        if any(step.get(key) is not None for key in LOOP_FIELDS):
+            scope = scope.looping()
+        for key, value in step.items():
+            if key not in ("name", "template", "templateRef"):
+                self.references(value, f"{path}.{key}", scope)
+
+        if callee is not None:
+            self.arguments(step.get("arguments") or {}, callee, f"{path}.arguments")
+        on_exit = step.get("onExit")
+        if on_exit is not None:
+            self.template(on_exit, f"{path}.onExit")
+
+    def arguments(self, arguments: Mapping[str, Any], callee: Manifest, path: str, unknown: bool = True):
+        """
+        Check that `arguments` supply the inputs of `callee` which have no default,
+        arguments `callee` does not take are reported if `unknown` is set
+        """
+        inputs = callee.get("inputs") or {}
+        name = callee.get("name")
+
+        parameters = inputs.get("parameters") or ()
+        supplied = set(_names(arguments.get("parameters")))
+        for parameter in parameters:
+            if parameter.get("name") not in supplied and all(
+                parameter.get(key) is None for key in ("value", "default", "valueFrom")
+            ):
+                self.error(
+                    "missing-argument",
+                    path,
+                    f"input parameter {parameter.get('name')!r} of template {name!r} is not supplied",
+                )
+
+        artifacts = inputs.get("artifacts") or ()
+        supplied = set(_names(arguments.get("artifacts")))
+        for artifact in artifacts:
+            if (
+                artifact.get("name") not in supplied
+                and not artifact.get("optional")
+                and ARTIFACT_SOURCES.isdisjoint(artifact)
+            ):
+                self.error(
+                    "missing-argument",
+                    path,
+                    f"input artifact {artifact.get('name')!r} of template {name!r} is not supplied",
+                )
+
+        if unknown:
+            for kind, declared in (("parameters", parameters), ("artifacts", artifacts)):
+                names = set(_names(declared))
+                for i, argument in enumerate(arguments.get(kind) or ()):
+                    if argument.get("name") not in names:
+                        self.warning(
+                            "unknown-argument",
+                            f"{path}.{kind}[{i}]",
+                            f"template {name!r} has no input {kind[:-1]} {argument.get('name')!r}",
+                        )
+
+    # references
+
+    def references(self, value: Any, path: str, scope: _Scope):
+        if isinstance(value, str):
+            if "{{" in value:
+                for match in _REFERENCE.finditer(value):
+                    self.reference(match.group(1), path, scope)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                self.references(item, f"{path}.{key}", scope)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                self.references(item, f"{path}[{i}]", scope)
+
+    def reference(self, expression: str, path: str, scope: _Scope):
+        # `{{=...}}` expressions are not checked
+        if expression.startswith("="):
+            return
+
+        parts = expression.split(".")
+        head = parts[0]
+        problem: Optional[str] = None
+        if head == "inputs":
+            if parts[1:] != ["parameters"]:
+                declared = {"parameters": scope.parameters, "artifacts": scope.artifacts}.get(
+                    parts[1] if len(parts) > 1 else ""
+                )
+                if declared is None or len(parts) < 3 or parts[2] not in declared:
+                    problem = "is not a declared input"
+        elif head == "workflow":
+            if len(parts) < 2 or parts[1] not in WORKFLOW_VARIABLES:
+                problem = "is not a workflow variable"
+            elif parts[1] == "parameters" and len(parts) > 2 and parts[2] not in self.parameters:
+                problem = "is not a workflow parameter"
+        elif head in ("steps", "tasks"):
+            # the name of the current step or task
+            if parts[1:] == ["name"]:
+                return
+            problem = self.node_reference(parts, scope)
+        elif head == "item" and not scope.loop:
+            problem = "is only set in loops"
+
+        if problem is not None:
+            self.error("unresolved-reference", path, f"{{{{{expression}}}}} {problem}")
+
+    def node_reference(self, parts: List[str], scope: _Scope) -> Optional[str]:
+        kind = parts[0][:-1]
+        if scope.kind != parts[0] or scope.nodes is None or len(parts) < 2 or parts[1] not in scope.nodes:
+            return f"is not a {kind} of this template"
+        if parts[1] not in scope.available:
+            return (
+                f"refers to a {kind} which has not run yet"
+                if kind == "step"
+                else "refers to a task which is not a dependency"
+            )
+        if len(parts) < 3 or parts[2] not in NODE_VARIABLES:
+            return f"is not a {kind} variable"
+
+        callee = scope.nodes[parts[1]]
+        if parts[2] == "outputs" and len(parts) > 4 and parts[3] in ("parameters", "artifacts") and callee is not None:
+            if parts[4] not in _names((callee.get("outputs") or {}).get(parts[3])):
+                return f"is not an output of template {callee.get('name')!r}"
+        return None
+
+
+class Linter:
+    """
+    Lints workflows against the given workflow templates and cluster workflow
+    templates, models or manifests, see the module docstring
+    """
+
+    def __init__(
+        self,
+        workflow_templates: Optional[Iterable[Any]] = None,
+        cluster_workflow_templates: Optional[Iterable[Any]] = None,
+    ):
+        self.workflow_templates = _register(workflow_templates)
+        self.cluster_workflow_templates = _register(cluster_workflow_templates)
+
+    def lint(self, workflow: Any) -> List[Diagnostic]:
+        """
+        Diagnostics of a workflow, workflow template or cron workflow model or manifest
+        """
+        manifest = _manifest(workflow)
+        return self._lint(manifest, _submitted(workflow, manifest))
+
+    def _lint(self, manifest: Manifest, submitted: bool) -> List[Diagnostic]:
+        spec, path = _workflow_spec(manifest)
+        run = _Run(self)
+        run.spec(spec, path, submitted)
+        return run.diagnostics
+
+    def lint_all(
+        self,
+        workflows: Iterable[Any],
+        processes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[List[Diagnostic]]:
+        """
+        Diagnostics of every workflow, linted by `processes` processes, as many as
+        there are cores by default. Fewer than `chunk_size` workflows, or a single
+        process, are linted in this process.
+        """
+        # the kind of a model comes from its class, which its manifest may not name
+        jobs = []
+        for workflow in workflows:
+            manifest = _manifest(workflow)
+            jobs.append((manifest, _submitted(workflow, manifest)))
+        if processes == 1 or len(jobs) <= chunk_size:
+            return [self._lint(manifest, submitted) for manifest, submitted in jobs]
+
+        with ProcessPoolExecutor(processes, initializer=_set_worker_linter, initargs=(self,)) as executor:
+            return list(executor.map(_worker_lint, jobs, chunksize=chunk_size))
+
+
+_worker_linter: Optional[Linter] = None
+
+
+def _set_worker_linter(linter: Linter):
+    global _worker_linter
+    _worker_linter = linter
+
+
+def _worker_lint(job: Tuple[Manifest, bool]) -> List[Diagnostic]:
+    assert _worker_linter is not None
+    return _worker_linter._lint(*job)
+
+
+def lint(
+    workflow: Any,
+    workflow_templates: Optional[Iterable[Any]] = None,
+    cluster_workflow_templates: Optional[Iterable[Any]] = None,
+) -> List[Diagnostic]:
+    """
+    Diagnostics of a workflow, see `Linter`
+    """
+    return Linter(workflow_templates, cluster_workflow_templates).lint(workflow)
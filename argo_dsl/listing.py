@@ -0,0 +1,240 @@
+"""
+Paginated listing of workflows.
+
+`iter_workflows` pages through the live or archived workflows of the Argo Server
+with `listOptions.limit` and `listOptions.continue`. The request of the next page
+is sent as soon as a page arrives, so it downloads while the items of the current
+page are processed, and at most these two pages are held in memory however many
+workflows there are.
+
+Pages are not parsed into `v1alpha1.WorkflowList` models: the items are indexed
+with `argo_dsl.view` and only their metadata and status phase and times are
+decoded, into `WorkflowSummary` objects. By default the server is asked for just
+these `SUMMARY_FIELDS` too, so whole workflows with their node statuses are
+neither sent nor scanned.
+
+    async with ArgoClient(url, token=token, namespace="argo") as client:
+        async for workflow in iter_workflows(client, label_selector="team=ml"):
+            print(workflow.name, workflow.phase)
+"""
+import asyncio
+
+from datetime import datetime
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+from .client import ArgoClient
+from .client import Response
+from .client import _path
+from .status import _intern_str
+from .status import _time
+from .view import Buffer
+from .view import Span
+from .view import decode
+from .view import scan_array
+from .view import scan_object
+from .view import skip_value
+
+
+_T = TypeVar("_T")
+
+DEFAULT_PAGE_SIZE = 500
+
+SUMMARY_FIELDS = ",".join(
+    [
+        "metadata.continue",
+        "metadata.resourceVersion",
+        "items.metadata.name",
+        "items.metadata.namespace",
+        "items.metadata.uid",
+        "items.metadata.resourceVersion",
+        "items.metadata.creationTimestamp",
+        "items.metadata.labels",
+        "items.status.phase",
+        "items.status.startedAt",
+        "items.status.finishedAt",
+    ]
+)
+
+ItemParser = Callable[[Buffer, Span], _T]
+
+
+class WorkflowSummary:
+    """
+    The metadata and phase of a listed workflow
+    """
+
+    __slots__ = (
+        "name",
+        "namespace",
+        "uid",
+        "resource_version",
+        "creation_timestamp",
+        "labels",
+        "phase",
+        "started_at",
+        "finished_at",
+    )
+
+    def __init__(self, metadata: Dict[str, Any], status: Dict[str, Any]):
+        self.name: Optional[str] = metadata.get("name")
+        self.namespace: Optional[str] = _intern_str(metadata.get("namespace"))
+        self.uid: Optional[str] = metadata.get("uid")
+        self.resource_version: Optional[str] = metadata.get("resourceVersion")
+        self.creation_timestamp = _optional_time(metadata.get("creationTimestamp"))
+        self.labels: Dict[str, str] = metadata.get("labels") or {}
+        self.phase: Optional[str] = _intern_str(status.get("phase"))
+        self.started_at = _optional_time(status.get("startedAt"))
+        self.finished_at = _optional_time(status.get("finishedAt"))
+
+    @classmethod
+    def parse(cls, buf: Buffer, span: Span) -> "WorkflowSummary":
+        """
+        Decode the metadata and the status phase and times of the workflow at `span`,
+        everything else is skipped
+        """
+        metadata: Dict[str, Any] = {}
+        status: Dict[str, Any] = {}
+
+        def status_member(key: str, start: int) -> int:
+            end = skip_value(buf, start)
+            if key in ("phase", "startedAt", "finishedAt"):
+                status[key] = decode(buf, (start, end))
+            return end
+
+        def member(key: str, start: int) -> int:
+            nonlocal metadata
+            if key == "status" and buf[start : start + 1] == b"{":
+                return scan_object(buf, start, status_member)
+            end = skip_value(buf, start)
+            if key == "metadata":
+                metadata = decode(buf, (start, end)) or {}
+            return end
+
+        scan_object(buf, span[0], member)
+        return cls(metadata, status)
+
+    def __repr__(self) -> str:
+        return f"WorkflowSummary(namespace={self.namespace!r}, name={self.name!r}, phase={self.phase!r})"
+
+
+def _optional_time(value: Optional[str]) -> Optional[datetime]:
+    return None if value is None else _time(value)
+
+
+class WorkflowPage:
+    """
+    A page of a workflow list, `spans` locate the items in `buf`. `continue_` is the
+    token of the next page, None on the last one.
+    """
+
+    def __init__(self, buf: Buffer, spans: List[Span], metadata: Dict[str, Any]):
+        self.buf = buf
+        self.spans = spans
+        self.metadata = metadata
+
+    @property
+    def continue_(self) -> Optional[str]:
+        return self.metadata.get("continue") or None
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        return self.metadata.get("resourceVersion")
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    @classmethod
+    def parse(cls, buf: Buffer) -> "WorkflowPage":
+        spans: List[Span] = []
+        metadata: Dict[str, Any] = {}
+
+        def item(start: int) -> int:
+            end = skip_value(buf, start)
+            spans.append((start, end))
+            return end
+
+        def member(key: str, start: int) -> int:
+            nonlocal metadata
+            if key == "items" and buf[start : start + 1] == b"[":
+                return scan_array(buf, start, item)
+            end = skip_value(buf, start)
+            if key == "metadata":
+                metadata = decode(buf, (start, end)) or {}
+            return end
+
+        scan_object(buf, 0, member)
+        return cls(buf, spans, metadata)
+
+
+async def iter_pages(
+    client: ArgoClient,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fields: Optional[str] = SUMMARY_FIELDS,
+    archived: bool = False,
+    resource: str = "workflows",
+) -> AsyncIterator[WorkflowPage]:
+    """
+    Pages of the workflows of `namespace`, or of the archived workflows, the next
+    page is requested before the current one is yielded. `fields` is the field
+    selection of the Argo Server, e.g. `SUMMARY_FIELDS`, None for whole workflows.
+    `resource` lists other namespaced resources instead, e.g. `workflow-templates`
+    or `cron-workflows`.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    namespace = client.resolve_namespace(namespace)
+    path = "archived-workflows" if archived else _path(resource, namespace)
+
+    def request(continue_: Optional[str]) -> "asyncio.Future[Response]":
+        query = {
+            "namespace": namespace if archived else None,
+            "listOptions.labelSelector": label_selector,
+            "listOptions.fieldSelector": field_selector,
+            "listOptions.limit": page_size,
+            "listOptions.continue": continue_,
+            "fields": fields,
+        }
+        return asyncio.ensure_future(client.send("GET", path, query=query))
+
+    pending: Optional["asyncio.Future[Response]"] = request(None)
+    try:
+        while pending is not None:
+            page = WorkflowPage.parse((await pending).body)
+            # prefetch, the server keeps the continue token valid for minutes
+            pending = request(page.continue_) if page.continue_ else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def iter_workflows(
+    client: ArgoClient,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fields: Optional[str] = SUMMARY_FIELDS,
+    archived: bool = False,
+    parse: ItemParser = WorkflowSummary.parse,
+) -> AsyncIterator[Any]:
+    """
+    Every listed workflow parsed by `parse`, `WorkflowSummary` by default, see
+    `iter_pages` for the other arguments. `parse` is called with the page buffer
+    and the span of an item, e.g. `lambda buf, span: v1alpha1.Workflow.parse_raw(buf[slice(*span)])`
+    parses whole workflows when `fields` is None.
+    """
+    async for page in iter_pages(client, namespace, label_selector, field_selector, page_size, fields, archived):
+        buf = page.buf
+        for span in page.spans:
+            yield parse(buf, span)
@@ -0,0 +1,332 @@
+"""
+Lazy import layer for the generated `argo_dsl.api` packages.
+
+The generated model modules define hundreds of pydantic classes and importing
+them eagerly builds every class (and resolves every forward reference) before
+any user code runs. `LazyModelLoader` splits such a module into its import
+prelude and one code object per class, runs only the prelude at import time and
+builds each class the first time it is looked up, together with the classes its
+annotations depend on.
+
+`SlimModelLoader` additionally drops the `description` and `title` of every
+`Field`, they are only used for json schemas and otherwise stay resident in the
+field metadata of every process. The same transformation can be applied to the
+generated sources with `slim_sources`, see `make generate-api-slim`.
+"""
+import __future__
+
+import ast
+import importlib.machinery
+import importlib.util
+import itertools
+import marshal
+import os
+import re
+import sys
+import threading
+
+from types import CodeType
+from types import ModuleType
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+
+API_PACKAGE = "argo_dsl.api"
+LAZY_API_ENV = "ARGO_DSL_LAZY_API"
+SLIM_API_ENV = "ARGO_DSL_SLIM_API"
+SLIM_FIELD_ARGUMENTS = ("description", "title")
+
+# bump whenever the layout of the cached index changes
+_CACHE_VERSION = 1
+_CACHE_TAG = "lazy"
+_NAME_PATTERN = re.compile(r"(?<![.\w])[A-Za-z_]\w*")
+
+# python 3.7 parses string literals to `ast.Str`
+_STRING_NODE, _STRING_FIELD = (ast.Constant, "value") if sys.version_info >= (3, 8) else (ast.Str, "s")
+
+_ClassEntry = Tuple[str, Tuple[str, ...], CodeType]
+_ModuleIndex = Tuple[CodeType, List[_ClassEntry]]
+
+
+def _referenced_names(node: ast.ClassDef) -> Set[str]:
+    names: Set[str] = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, _STRING_NODE):
+            # string annotations and forward references
+            value = getattr(child, _STRING_FIELD)
+            if isinstance(value, str):
+                names.update(_NAME_PATTERN.findall(value))
+
+    return names
+
+
+class _SlimFields(ast.NodeTransformer):
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+
+        func = node.func
+        func_name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if func_name != "Field":
+            return node
+
+        node.keywords = [keyword for keyword in node.keywords if keyword.arg not in SLIM_FIELD_ARGUMENTS]
+        if not node.keywords and len(node.args) == 1:
+            # `Field(None)` and `Field(...)` mean the same as their default
+            return node.args[0]
+
+        return node
+
+
+def slim(tree: ast.Module) -> ast.Module:
+    """
+    Drop the description and title of every `Field` in a generated module
+    """
+    tree = _SlimFields().visit(tree)
+
+    field_used = any(isinstance(node, ast.Name) and node.id == "Field" for node in ast.walk(tree))
+    if not field_used:
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module == "pydantic":
+                stmt.names = [alias for alias in stmt.names if alias.name != "Field"]
+        tree.body = [stmt for stmt in tree.body if not isinstance(stmt, ast.ImportFrom) or stmt.names]
+
+    return ast.fix_missing_locations(tree)
+
+
+def build_index(source: bytes, filename: str, slim_fields: bool = False) -> Optional[_ModuleIndex]:
+    """
+    Split module source into a prelude code object and per-class code objects.
+
+    Returns None when there is nothing to load lazily, or when the module can not
+    be loaded lazily, that is when any statement comes after a class definition.
+    """
+    tree = ast.parse(source, filename)
+    if slim_fields:
+        tree = slim(tree)
+
+    flags = 0
+    prelude: List[ast.stmt] = []
+    classes: List[ast.ClassDef] = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ClassDef):
+            classes.append(stmt)
+        elif classes:
+            return None
+        else:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__":
+                for alias in stmt.names:
+                    flags |= getattr(__future__, alias.name).compiler_flag
+            prelude.append(stmt)
+
+    if not classes:
+        return None
+
+    class_names = {node.name for node in classes}
+    entries: List[_ClassEntry] = []
+    for node in classes:
+        dependencies = tuple(sorted((_referenced_names(node) & class_names) - {node.name}))
+        code = compile(ast.Module(body=[node], type_ignores=[]), filename, "exec", flags=flags, dont_inherit=True)
+        entries.append((node.name, dependencies, code))
+
+    prelude_code = compile(ast.Module(body=prelude, type_ignores=[]), filename, "exec", dont_inherit=True)
+    return prelude_code, entries
+
+
+class LazyModule:
+    """
+    State kept in the namespace of a lazily loaded module as `__lazy__`
+    """
+
+    def __init__(self, module: ModuleType, entries: Iterable[_ClassEntry]):
+        self.module = module
+        self.pending: Dict[str, Tuple[Tuple[str, ...], CodeType]] = {
+            name: (dependencies, code) for name, dependencies, code in entries
+        }
+        self.names = list(self.pending)
+        self._building: Set[str] = set()
+        self._unresolved: List[str] = []
+        self._lock = threading.RLock()
+
+    def materialize(self, name: str) -> object:
+        with self._lock:
+            if name in self.pending:
+                self._build(name)
+                if not self._building:
+                    self._resolve_cycles()
+            return self.module.__dict__[name]
+
+    def materialize_all(self):
+        for name in list(self.pending):
+            self.materialize(name)
+
+    def _build(self, name: str):
+        dependencies, code = self.pending[name]
+        self._building.add(name)
+        try:
+            cyclic = False
+            for dependency in dependencies:
+                if dependency in self._building:
+                    cyclic = True
+                elif dependency in self.pending:
+                    self._build(dependency)
+
+            exec(code, self.module.__dict__)
+            del self.pending[name]
+        finally:
+            self._building.discard(name)
+
+        if cyclic:
+            self._unresolved.append(name)
+
+    def _resolve_cycles(self):
+        while self._unresolved:
+            self.module.__dict__[self._unresolved.pop()].update_forward_refs()
+
+
+class LazyModelLoader(importlib.machinery.SourceFileLoader):
+    cache_tag = _CACHE_TAG
+    slim = False
+    lazy = True
+
+    def exec_module(self, module: ModuleType):
+        index = self._load_index()
+        if index is None:
+            super().exec_module(module)
+            return
+
+        prelude, entries = index
+        namespace = module.__dict__
+        exec(prelude, namespace)
+
+        lazy = LazyModule(module, entries)
+        namespace["__lazy__"] = lazy
+        namespace["__all__"] = list(lazy.names)
+
+        def __getattr__(name: str) -> object:
+            if name in lazy.pending:
+                return lazy.materialize(name)
+            raise AttributeError(f"module {module.__name__!r} has no attribute {name!r}")
+
+        def __dir__() -> List[str]:
+            return sorted(set(namespace) | set(lazy.pending))
+
+        namespace["__getattr__"] = __getattr__
+        namespace["__dir__"] = __dir__
+
+        if not self.lazy:
+            lazy.materialize_all()
+
+    def _load_index(self) -> Optional[_ModuleIndex]:
+        source_path = self.get_filename(self.name)
+        stat = self.path_stats(source_path)
+        key = (_CACHE_VERSION, self.cache_tag, int(stat["mtime"]), stat["size"])
+        cache_path = importlib.util.cache_from_source(source_path, optimization=self.cache_tag)
+
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, index = marshal.load(f)
+            if tuple(cached_key) == key:
+                return index
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        index = self.build_index(self.get_data(source_path), source_path)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "wb") as f:
+                marshal.dump((key, index), f)
+        except OSError:  # pragma: no cover
+            pass
+
+        return index
+
+    def build_index(self, source: bytes, filename: str) -> Optional[_ModuleIndex]:
+        return build_index(source, filename, slim_fields=self.slim)
+
+
+class SlimModelLoader(LazyModelLoader):
+    cache_tag = "slim"
+    slim = True
+
+
+class LazyModelFinder:
+    """
+    Meta path finder which hands modules under `argo_dsl.api` to `loader_class`
+    """
+
+    def __init__(self, loader_class: Type[LazyModelLoader] = LazyModelLoader, lazy: bool = True):
+        self.loader_class = loader_class
+        self.lazy = lazy
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if not fullname.startswith(API_PACKAGE + "."):
+            return None
+
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or spec.origin is None or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            return spec
+
+        loader = self.loader_class(fullname, spec.origin)
+        loader.lazy = self.lazy
+        return importlib.util.spec_from_file_location(
+            fullname,
+            spec.origin,
+            loader=loader,
+            submodule_search_locations=spec.submodule_search_locations,
+        )
+
+
+def install(lazy: bool = True, slim: bool = False):
+    """
+    Load generated models lazily and/or without field descriptions, must be
+    called before `argo_dsl.api` is imported
+    """
+    uninstall()
+    if lazy or slim:
+        sys.meta_path.insert(0, LazyModelFinder(SlimModelLoader if slim else LazyModelLoader, lazy))
+
+
+def install_from_env():
+    install(
+        lazy=os.environ.get(LAZY_API_ENV, "1") != "0",
+        slim=os.environ.get(SLIM_API_ENV, "0") == "1",
+    )
+
+
+def uninstall():
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, LazyModelFinder)]
+
+
+def is_lazy(module: ModuleType) -> bool:
+    return "__lazy__" in module.__dict__
+
+
+def slim_sources(paths: List[str]):  # pragma: no cover
+    """
+    Rewrite generated sources in place in the slim profile, the output needs a pass of isort and black.
+    Needs `ast.unparse`, python 3.9 or later, `SlimModelLoader` works on every version.
+    """
+    if sys.version_info < (3, 9):
+        raise RuntimeError("slim_sources needs python 3.9 or later, use ARGO_DSL_SLIM_API=1 to slim models on import")
+
+    for root in paths:
+        filenames = [root]
+        if os.path.isdir(root):
+            filenames = [
+                os.path.join(d, name) for d, _, names in os.walk(root) for name in names if name.endswith(".py")
+            ]
+
+        for filename in sorted(filenames):
+            with open(filename) as f:
+                source = f.read()
+
+            header = "".join(itertools.takewhile(lambda line: line.startswith("#"), source.splitlines(True)))
+            with open(filename, "w") as f:
+                f.write(header + "\n" + ast.unparse(slim(ast.parse(source, filename))) + "\n")
@@ -0,0 +1,238 @@
+"""
+Streaming reader of workflow, sensor and event source logs.
+
+The Argo Server streams logs as newline delimited json, one `LogEntry` per line,
+wrapped in `{"result": ...}`. `LogReader` splits the chunks of such a stream into
+lines in place, only the line a chunk ends in the middle of is carried over to the
+next chunk, so memory stays bounded by the chunk size however long the stream is.
+
+Entries are filtered on their fields, e.g. `podName`, `level` or `triggerName`,
+before they are decoded: a regular expression for the wanted values is searched
+in the raw bytes and only the lines it matches are decoded, then checked exactly.
+Entries are kept as `CompactModel` records rather than pydantic models.
+
+    async with await client.workflow_logs("hello-xyz") as response:
+        async for entry in aiter_log_entries(response.chunks(), podName="hello-xyz-1"):
+            print(entry.content)
+
+    for entry in read_log_file("sensor.log", CompactSensorLogEntry, level="error"):
+        print(entry.time, entry.msg)
+"""
+import json
+import os
+import re
+
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Collection
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from .api import eventsource
+from .api import sensor
+from .api.io.argoproj.workflow import v1alpha1
+from .client import ArgoServerError
+from .status import CompactModel
+
+
+CHUNK_SIZE = 1 << 20
+
+# values which are written as they are in json, so the raw bytes can be searched for them
+_PLAIN = re.compile(r"[\w .:@+=-]*", re.ASCII)
+# the Argo Server ends a failed stream with an error line
+_ERROR_LINE = re.compile(rb'(?m)^[ \t\r]*\{\s*"error"\s*:')
+_scan = json.JSONDecoder().scan_once  # type: ignore[attr-defined]
+
+
+class CompactLogEntry(CompactModel, model=v1alpha1.LogEntry):
+    """
+    Compact `v1alpha1.LogEntry` of workflow logs
+    """
+
+
+class CompactSensorLogEntry(CompactModel, model=sensor.LogEntry):
+    """
+    Compact `sensor.LogEntry`, `time` is a `datetime`
+    """
+
+
+class CompactEventSourceLogEntry(CompactModel, model=eventsource.LogEntry):
+    """
+    Compact `eventsource.LogEntry`, `time` is a `datetime`
+    """
+
+
+Filter = Union[str, Collection[str]]
+Chunk = Union[bytes, bytearray]
+
+
+class LogReader:
+    """
+    Incremental parser of a log stream into `entry_class` records, see the module
+    docstring. `filters` map field aliases of the entries to the value, or the
+    collection of values, to keep.
+
+    Chunks are passed to `feed`, which returns the entries of the lines they complete,
+    and `close` returns the entry of a last line without a line break.
+    """
+
+    def __init__(self, entry_class: Type[CompactModel] = CompactLogEntry, **filters: Filter):
+        aliases = {field.alias for field in entry_class.__compact_fields__}
+        unknown = sorted(set(filters) - aliases)
+        if unknown:
+            raise ValueError(f"{entry_class.__name__} has no fields {', '.join(map(repr, unknown))}")
+
+        self.entry_class = entry_class
+        self.filters: List[Tuple[str, Collection[str]]] = []
+        self._patterns: List[Pattern[bytes]] = []
+        for alias, values in filters.items():
+            values = frozenset([values] if isinstance(values, str) else values)
+            self.filters.append((alias, values))
+            if all(_PLAIN.fullmatch(value) for value in values):
+                alternatives = b"|".join(re.escape(value.encode()) for value in sorted(values))
+                self._patterns.append(re.compile(b'"%s"\\s*:\\s*"(?:%s)"' % (alias.encode(), alternatives)))
+        # the start of a line the last chunk ended in
+        self._pending = bytearray()
+
+    def feed(self, chunk: Chunk) -> List[Any]:
+        entries: List[Any] = []
+        start = 0
+        if self._pending:
+            end = chunk.find(b"\n")
+            if end < 0:
+                self._pending += chunk
+                return entries
+            self._pending += memoryview(chunk)[:end]
+            entries.extend(self._parse(self._pending, 0, len(self._pending)))
+            self._pending = bytearray()
+            start = end + 1
+
+        stop = chunk.rfind(b"\n", start)
+        if stop < 0:
+            self._pending += memoryview(chunk)[start:]
+            return entries
+        entries.extend(self._parse(chunk, start, stop))
+        self._pending += memoryview(chunk)[stop + 1 :]
+        return entries
+
+    def close(self) -> List[Any]:
+        pending, self._pending = self._pending, bytearray()
+        return list(self._parse(pending, 0, len(pending)))
+
+    def _parse(self, buf: Chunk, start: int, stop: int) -> Iterator[Any]:
+        """
+        The entries of the lines of `buf` from `start` to `stop`, the end of the last line
+        """
+        if not self._patterns:
+            yield from self._decode(buf, start, stop)
+            return
+
+        # only the lines the first pattern matches are looked at, the others are skipped in C
+        first, *others = self._patterns
+        end = start
+        for match in first.finditer(buf, start, stop):
+            if match.start() < end:
+                # another match on the line of the previous one
+                continue
+            line_start = buf.rfind(b"\n", start, match.start()) + 1 or start
+            end = buf.find(b"\n", match.end(), stop)
+            if end < 0:
+                end = stop
+            if all(pattern.search(buf, line_start, end) for pattern in others):
+                yield from self._decode(buf, line_start, end)
+
+        error = _ERROR_LINE.search(buf, start, stop)
+        if error is not None:
+            end = buf.find(b"\n", error.end(), stop)
+            list(self._decode(buf, error.start(), stop if end < 0 else end))
+
+    def _decode(self, buf: Chunk, start: int, stop: int) -> Iterator[Any]:
+        # decoding all lines at once and scanning them in place is twice as fast as `json.loads` per line
+        text = str(memoryview(buf)[start:stop], "utf-8")
+        scan = _scan
+        pos = 0
+        stop = len(text)
+        while pos < stop:
+            end = text.find("\n", pos)
+            if end < 0:
+                end = stop
+            try:
+                data, data_end = scan(text, pos)
+            except (StopIteration, ValueError):
+                data_end = -1
+            if data_end != end and not (pos < data_end < end and text[data_end:end].isspace()):
+                # leading white space, a blank line or invalid json, which raises
+                line = text[pos:end]
+                data = json.loads(line) if line and not line.isspace() else None
+            pos = end + 1
+            if data is not None:
+                entry = self._entry(data)
+                if entry is not None:
+                    yield entry
+
+    def _entry(self, data: Any) -> Optional[Any]:
+        if "error" in data:
+            error = data["error"] or {}
+            raise ArgoServerError(error.get("http_code") or 500, "log stream failed", json.dumps(error).encode())
+        entry = data.get("result", data)
+        for alias, values in self.filters:
+            if entry.get(alias) not in values:
+                return None
+        return self.entry_class(entry)
+
+
+def iter_log_entries(
+    chunks: Iterable[Chunk], entry_class: Type[CompactModel] = CompactLogEntry, **filters: Filter
+) -> Iterator[Any]:
+    """
+    The `entry_class` records of the log stream read in `chunks` which pass `filters`,
+    see `LogReader`
+    """
+    reader = LogReader(entry_class, **filters)
+    for chunk in chunks:
+        yield from reader.feed(chunk)
+    yield from reader.close()
+
+
+async def aiter_log_entries(
+    chunks: AsyncIterable[Chunk], entry_class: Type[CompactModel] = CompactLogEntry, **filters: Filter
+) -> AsyncIterator[Any]:
+    """
+    `iter_log_entries` of an async stream, e.g. `StreamResponse.chunks()` of
+    `ArgoClient.workflow_logs`
+    """
+    reader = LogReader(entry_class, **filters)
+    async for chunk in chunks:
+        for entry in reader.feed(chunk):
+            yield entry
+    for entry in reader.close():
+        yield entry
+
+
+def read_log_file(
+    path: Union[str, "os.PathLike[str]"],
+    entry_class: Type[CompactModel] = CompactLogEntry,
+    chunk_size: int = CHUNK_SIZE,
+    **filters: Filter,
+) -> Iterator[Any]:
+    """
+    The `entry_class` records of a downloaded log stream which pass `filters`, read
+    in chunks of `chunk_size` bytes
+    """
+
+    def chunks() -> Iterator[bytes]:
+        with open(path, "rb") as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    return iter_log_entries(chunks(), entry_class, **filters)
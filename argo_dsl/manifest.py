@@ -0,0 +1,332 @@
+"""
+Manifest serialization for the generated models.
+
+`to_manifest` turns a model into plain python data, equal to
+`model.dict(exclude_none=True, by_alias=True)`, but through one flat function per
+model class which reads the fields directly and skips unset ones. The functions
+for the generated `argo_dsl.api` models are emitted into `argo_dsl/api/serializers.py`
+by `make generate-api` (`python -m argo_dsl.manifest`), functions for any other
+model are generated the first time it is serialized.
+
+`to_json_bytes` writes the JSON of a model without building its manifest first:
+the JSON backend walks the model and asks for the fields of each nested model as
+it gets to it, through one flat function per model class which returns just that
+model's fields. The backend is the stdlib `json` module, or `orjson` if it is
+installed, see `set_json_backend`.
+"""
+import json
+import os
+import re
+import sys
+
+from abc import ABC
+from abc import abstractmethod
+from datetime import date
+from datetime import datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_DICT
+from pydantic.fields import SHAPE_LIST
+from pydantic.fields import SHAPE_MAPPING
+from pydantic.fields import SHAPE_SINGLETON
+from pydantic.fields import ModelField
+from pydantic.utils import ROOT_KEY
+from pydantic.utils import lenient_issubclass
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+Serializer = Callable[[Any], Any]
+
+API_PACKAGE = "argo_dsl.api"
+SERIALIZERS_MODULE = "argo_dsl.api.serializers"
+SCALAR_TYPES = (str, int, float, bool, datetime, date)
+
+_serializers: Dict[type, Serializer] = {}
+
+
+def to_manifest(model: BaseModel) -> Any:
+    """
+    Serialize a model to the data of its manifest, None fields are skipped and
+    fields are keyed by their alias. Custom root models are unwrapped.
+    """
+    return dump_model(model)
+
+
+def dump_model(model: Any) -> Any:
+    try:
+        serializer = _serializers[model.__class__]
+    except KeyError:
+        serializer = _serializers[model.__class__] = _find_serializer(model.__class__)
+
+    return serializer(model)
+
+
+def dump_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return dump_model(value)
+    elif isinstance(value, dict):
+        return {k: dump_value(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return value.__class__(dump_value(v) for v in value)
+    else:
+        return value
+
+
+def _find_serializer(cls: type) -> Serializer:
+    if not lenient_issubclass(cls, BaseModel):
+        return dump_value
+
+    try:
+        from .api.serializers import SERIALIZERS
+    except ImportError:  # pragma: no cover
+        SERIALIZERS = {}
+
+    serializer = SERIALIZERS.get(model_path(cls))
+    if serializer is None:
+        namespace: Dict[str, Any] = {"_model": dump_model, "_value": dump_value}
+        exec(generate_serializer(cls), namespace)
+        serializer = namespace[serializer_name(cls)]
+
+    return serializer
+
+
+def model_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def serializer_name(cls: type) -> str:
+    module = cls.__module__
+    if module.startswith(API_PACKAGE + "."):
+        module = module[len(API_PACKAGE) + 1 :]
+
+    return re.sub(r"\W", "_", f"dump_{module}_{cls.__qualname__}")
+
+
+def _field_expression(field: ModelField) -> str:
+    type_ = field.type_
+    is_model = lenient_issubclass(type_, BaseModel)
+    is_scalar = type_ in SCALAR_TYPES
+
+    if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+        if is_model:
+            return "_model(v)"
+        elif is_scalar:
+            return "v"
+    elif field.shape == SHAPE_LIST:
+        if is_model:
+            return "[_model(x) for x in v]"
+        elif is_scalar:
+            return "list(v)"
+    elif field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+        if is_model:
+            return "{k: _model(x) for k, x in v.items()}"
+        elif is_scalar:
+            return "dict(v)"
+
+    return "_value(v)"
+
+
+def generate_serializer(cls: Type[BaseModel]) -> str:
+    """
+    Source of a flat serializer function for `cls`
+    """
+    lines = [f"def {serializer_name(cls)}(m):"]
+    if not cls.__fields__:
+        lines.append("    return {}")
+        return "\n".join(lines) + "\n"
+
+    lines.append("    get = m.__dict__.get")
+    if ROOT_KEY in cls.__fields__:
+        lines.append(f'    v = get("{ROOT_KEY}")')
+        lines.append(f"    return {_field_expression(cls.__fields__[ROOT_KEY])}")
+        return "\n".join(lines) + "\n"
+
+    lines.append("    d: Dict[str, Any] = {}")
+    for name, field in cls.__fields__.items():
+        lines.append(f'    v = get("{name}")')
+        lines.append("    if v is not None:")
+        lines.append(f'        d["{field.alias}"] = {_field_expression(field)}')
+    lines.append("    return d")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_serializers_module(classes: Iterable[Type[BaseModel]]) -> str:
+    """
+    Source of `argo_dsl.api.serializers`
+    """
+    classes = list(classes)
+    chunks = [
+        "# generated by argo_dsl.manifest, do not edit\n\n"
+        "from typing import Any\n"
+        "from typing import Dict\n\n"
+        "from argo_dsl.manifest import dump_model as _model\n"
+        "from argo_dsl.manifest import dump_value as _value\n"
+    ]
+    chunks.extend(generate_serializer(cls) for cls in classes)
+
+    table = "".join(f'    "{model_path(cls)}": {serializer_name(cls)},\n' for cls in classes)
+    chunks.append("SERIALIZERS = {\n%s}\n" % table)
+
+    return "\n\n".join(chunks)
+
+
+def api_models() -> List[Type[BaseModel]]:
+    """
+    All generated models, in a stable order
+    """
+    from importlib import import_module
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    models: List[Type[BaseModel]] = []
+    for dirpath, dirnames, filenames in os.walk(os.path.join(root, "api")):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+
+            relpath = os.path.relpath(os.path.join(dirpath, filename[:-3]), os.path.dirname(root))
+            module_name = relpath.replace(os.sep, ".")
+            if module_name.endswith(".__init__"):
+                module_name = module_name[: -len(".__init__")]
+            if module_name == SERIALIZERS_MODULE:
+                continue
+
+            module = import_module(module_name)
+            names = getattr(module, "__all__", None) or list(vars(module))
+            for name in names:
+                obj = getattr(module, name)
+                if lenient_issubclass(obj, BaseModel) and obj.__module__ == module_name:
+                    models.append(obj)
+
+    return models
+
+
+class JsonBackend(ABC):
+    """
+    Encoder of manifest data to JSON. `default` is called for the objects the
+    backend can not encode itself, models included, and returns encodable data.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def dumps(self, data: Any, default: Serializer) -> bytes:
+        ...
+
+
+class StdlibJsonBackend(JsonBackend):
+    name = "json"
+
+    def dumps(self, data: Any, default: Serializer) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=default).encode()
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    `orjson` encodes datetimes itself and strings, dicts and lists in one pass over
+    the data, several times faster than the stdlib
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("the orjson JSON backend needs orjson, install argo-dsl[orjson]")
+
+    def dumps(self, data: Any, default: Serializer) -> bytes:
+        return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+JSON_BACKENDS: Dict[str, Type[JsonBackend]] = {"json": StdlibJsonBackend, "orjson": OrjsonBackend}
+
+_json_backend: Optional[JsonBackend] = None
+_field_getters: Dict[type, Serializer] = {}
+
+
+def set_json_backend(backend: Union[str, JsonBackend]):
+    """
+    Encode JSON with `backend`, one of `JSON_BACKENDS` or a `JsonBackend`
+    """
+    global _json_backend
+    _json_backend = JSON_BACKENDS[backend]() if isinstance(backend, str) else backend
+
+
+def get_json_backend() -> JsonBackend:
+    if _json_backend is None:
+        set_json_backend("json" if orjson is None else "orjson")
+    return _json_backend  # type: ignore[return-value]
+
+
+def field_getter_name(cls: type) -> str:
+    return "fields" + serializer_name(cls)[len("dump") :]
+
+
+def generate_field_getter(cls: Type[BaseModel]) -> str:
+    """
+    Source of a function which returns the fields of a `cls` model keyed by their
+    alias, None fields skipped. Unlike the serializer of `cls`, nested models are
+    returned as they are.
+    """
+    lines = [f"def {field_getter_name(cls)}(m):", "    get = m.__dict__.get"]
+    if ROOT_KEY in cls.__fields__:
+        lines.append(f'    return get("{ROOT_KEY}")')
+        return "\n".join(lines) + "\n"
+
+    lines.append("    d = {}")
+    for field_name, field in cls.__fields__.items():
+        lines.append(f'    v = get("{field_name}")')
+        lines.append("    if v is not None:")
+        lines.append(f'        d["{field.alias}"] = v')
+    lines.append("    return d")
+    return "\n".join(lines) + "\n"
+
+
+def _json_default(value: Any) -> Any:
+    try:
+        return _field_getters[value.__class__](value)
+    except KeyError:
+        pass
+
+    cls = value.__class__
+    if isinstance(value, BaseModel):
+        namespace: Dict[str, Any] = {}
+        exec(generate_field_getter(cls), namespace)
+        getter = _field_getters[cls] = namespace[field_getter_name(cls)]
+        return getter(value)
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"{cls.__name__} is not JSON serializable")
+
+
+def to_json_bytes(data: Any) -> bytes:
+    """
+    JSON of a model, or of data with models in it, equal to the JSON of its
+    `to_manifest` data. Keys are not sorted and non-ASCII text is not escaped.
+    """
+    return get_json_backend().dumps(data, _json_default)
+
+
+def to_json(data: Any) -> str:
+    """
+    `to_json_bytes` as a string
+    """
+    return to_json_bytes(data).decode()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.stdout.write(generate_serializers_module(api_models()))
@@ -0,0 +1,355 @@
+"""
+Node maps of workflow statuses.
+
+Big workflows do not keep their nodes in `status.nodes`: the controller either
+stores them gzipped and base64 encoded in `status.compressedNodes`, or offloads
+them to its database and only records `status.offloadNodeStatusVersion`.
+`decode_compressed_nodes` inflates `compressedNodes` in chunks and decodes every
+node as soon as its json is complete, so neither the decompressed document nor
+a full `v1alpha1.NodeStatus` map is ever built.
+
+`NodeIndex` answers the usual questions about a node map, nodes of a phase, a
+template, a type or a boundary and the subtree below a node, from lookup tables
+built in one pass.
+"""
+import base64
+import gzip
+import json
+import operator
+import zlib
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .status import CompactNodeStatus
+from .view import _STRING
+from .view import JSONScanError
+from .view import decode_key
+from .view import skip_value
+from .view import skip_whitespace
+
+
+# base64 characters read at a time, a multiple of 4 so every chunk decodes on its own
+CHUNK_SIZE = 64 * 1024
+
+# accept both gzip, as written by the controller, and zlib streams
+_WBITS = 32 + zlib.MAX_WBITS
+
+
+class OffloadedNodesError(LookupError):
+    """
+    The nodes of the workflow are kept in the database of the workflow controller
+    """
+
+    def __init__(self, version: str):
+        super().__init__(f"nodes are offloaded, offloadNodeStatusVersion is {version!r}")
+        self.version = version
+
+
+def inflate(data: Union[str, bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Decompressed chunks of a base64 encoded gzip stream, none bigger than `chunk_size`
+    """
+    if chunk_size < 4:
+        raise ValueError("chunk_size must be at least 4")
+    chunk_size -= chunk_size % 4
+    decompressor = zlib.decompressobj(_WBITS)
+    for start in range(0, len(data), chunk_size):
+        compressed = base64.b64decode(data[start : start + chunk_size])
+        while compressed:
+            chunk = decompressor.decompress(compressed, chunk_size)
+            if chunk:
+                yield chunk
+            compressed = decompressor.unconsumed_tail
+
+    chunk = decompressor.flush()
+    if chunk:
+        yield chunk
+    if not decompressor.eof:
+        raise zlib.error("truncated compressed stream")
+
+
+def iter_members(chunks: Iterable[bytes]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Key and raw value of every member of a json object split into `chunks`,
+    each member is yielded as soon as its value is complete
+    """
+    buf = bytearray()
+    offset = 0  # offset of buf in the whole document, for errors
+    started = False
+    after_value = False
+    first = True
+
+    for chunk in chunks:
+        buf += chunk
+        pos = skip_whitespace(buf, 0)
+
+        if not started:
+            if pos == len(buf):
+                continue
+            if buf[pos : pos + 1] != b"{":
+                raise JSONScanError("expected an object", offset + pos)
+            pos = skip_whitespace(buf, pos + 1)
+            started = True
+
+        while pos < len(buf):
+            char = buf[pos : pos + 1]
+            if char == b"}" and (after_value or first):
+                return
+            elif after_value:
+                if char != b",":
+                    raise JSONScanError("expected ',' or '}'", offset + pos)
+                pos = skip_whitespace(buf, pos + 1)
+                after_value = False
+                continue
+
+            match = _STRING.match(buf, pos)
+            if match is None:
+                if char != b'"':
+                    raise JSONScanError("expected a key", offset + pos)
+                break
+
+            colon = skip_whitespace(buf, match.end())
+            if colon == len(buf):
+                break
+            if buf[colon : colon + 1] != b":":
+                raise JSONScanError("expected ':'", offset + colon)
+
+            start = skip_whitespace(buf, colon + 1)
+            if start == len(buf):
+                break
+            if buf[start : start + 1] == b'"':
+                value = _STRING.match(buf, start)
+                if value is None:
+                    break
+                end = value.end()
+            else:
+                try:
+                    end = skip_value(buf, start)
+                except JSONScanError:
+                    # the value continues in the next chunk
+                    break
+                if end == len(buf) and buf[start] not in b"{[":
+                    # so may a number or literal
+                    break
+
+            yield decode_key(match.group()), bytes(buf[start:end])
+            pos = skip_whitespace(buf, end)
+            after_value = True
+            first = False
+
+        del buf[:pos]
+        offset += pos
+
+    raise JSONScanError("unterminated object", offset + len(buf))
+
+
+def iter_compressed_nodes(data: Union[str, bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, bytes]]:
+    """
+    Node ids and raw node json of `status.compressedNodes`
+    """
+    return iter_members(inflate(data, chunk_size))
+
+
+def decode_compressed_nodes(
+    data: Union[str, bytes],
+    node_class: Callable[[Any], Any] = CompactNodeStatus.parse_obj,
+    chunk_size: int = CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Decode `status.compressedNodes` into a map of node ids to `node_class` objects,
+    `argo_dsl.status.CompactNodeStatus` by default
+    """
+    return {node_id: node_class(json.loads(raw)) for node_id, raw in iter_compressed_nodes(data, chunk_size)}
+
+
+def compress_nodes(nodes: Mapping[str, Any]) -> str:
+    """
+    Encode a map of node ids to node json the way the controller does for `status.compressedNodes`
+    """
+    return base64.b64encode(gzip.compress(json.dumps(nodes, separators=(",", ":")).encode())).decode()
+
+
+def status_nodes(status: Any, node_class: Callable[[Any], Any] = CompactNodeStatus.parse_obj) -> Mapping[str, Any]:
+    """
+    Nodes of a workflow status, whether they are kept in `nodes` or in `compressedNodes`.
+
+    Works with `v1alpha1.WorkflowStatus` and `argo_dsl.status.CompactWorkflowStatus` as
+    well as `argo_dsl.view` statuses. Raises `OffloadedNodesError` when the nodes are
+    not part of the status at all.
+    """
+    if status.nodes is not None:
+        return status.nodes
+    elif status.compressedNodes is not None:
+        return decode_compressed_nodes(status.compressedNodes, node_class)
+    elif status.offloadNodeStatusVersion is not None:
+        raise OffloadedNodesError(status.offloadNodeStatusVersion)
+    return {}
+
+
+def _freeze(table: Dict[str, List[Any]]) -> Dict[str, Tuple[Any, ...]]:
+    return {key: tuple(values) for key, values in table.items()}
+
+
+class NodeIndex:
+    """
+    Lookup tables over the nodes of a workflow status, nodes are any objects with the
+    `v1alpha1.NodeStatus` attributes. Lookups return tuples of nodes in the order of
+    the node map and do not copy them, the index does not follow changes of the map.
+    """
+
+    def __init__(self, nodes: Mapping[str, Any]):
+        self.nodes = nodes
+
+        by_phase: Dict[str, List[Any]] = {}
+        by_template: Dict[str, List[Any]] = {}
+        by_type: Dict[str, List[Any]] = {}
+        by_boundary: Dict[str, List[Any]] = {}
+        children: Dict[str, Tuple[str, ...]] = {}
+        parents: Dict[str, List[str]] = {}
+
+        for node_id, node in nodes.items():
+            if node.phase is not None:
+                by_phase.setdefault(node.phase, []).append(node)
+            if node.templateName is not None:
+                by_template.setdefault(node.templateName, []).append(node)
+            if node.type is not None:
+                by_type.setdefault(node.type, []).append(node)
+            if node.boundaryID is not None:
+                by_boundary.setdefault(node.boundaryID, []).append(node)
+
+            if node.children:
+                children[node_id] = tuple(child for child in node.children if child in nodes)
+                for child in children[node_id]:
+                    parents.setdefault(child, []).append(node_id)
+
+        self._by_phase = _freeze(by_phase)
+        self._by_template = _freeze(by_template)
+        self._by_type = _freeze(by_type)
+        self._by_boundary = _freeze(by_boundary)
+        self._children = children
+        self._parents = _freeze(parents)
+        self.roots: Tuple[str, ...] = tuple(node_id for node_id in nodes if node_id not in parents)
+        self.leaves: Tuple[str, ...] = tuple(node_id for node_id in nodes if not children.get(node_id))
+        self._found: Dict[Tuple[Optional[Any], ...], Tuple[Any, ...]] = {}
+
+    @classmethod
+    def from_status(cls, status: Any, node_class: Callable[[Any], Any] = CompactNodeStatus.parse_obj) -> "NodeIndex":
+        """
+        Index the nodes of a workflow status, see `status_nodes`
+        """
+        return cls(status_nodes(status, node_class))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, node_id: str) -> Any:
+        return self.nodes[node_id]
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.nodes
+
+    def by_phase(self, phase: str) -> Tuple[Any, ...]:
+        return self._by_phase.get(phase, ())
+
+    def by_template(self, template_name: str) -> Tuple[Any, ...]:
+        return self._by_template.get(template_name, ())
+
+    def by_type(self, type_: str) -> Tuple[Any, ...]:
+        return self._by_type.get(type_, ())
+
+    def by_boundary(self, boundary_id: str) -> Tuple[Any, ...]:
+        return self._by_boundary.get(boundary_id, ())
+
+    def children(self, node_id: str) -> Tuple[str, ...]:
+        return self._children.get(node_id, ())
+
+    def parents(self, node_id: str) -> Tuple[str, ...]:
+        return self._parents.get(node_id, ())
+
+    def is_leaf(self, node_id: str) -> bool:
+        return not self._children.get(node_id)
+
+    def subtree(self, node_id: str, include_self: bool = True) -> Iterator[str]:
+        """
+        Ids of the nodes reachable from `node_id` through `children`, depth first and
+        each once even where the graph joins again
+        """
+        seen: Set[str] = {node_id}
+        stack = [node_id] if include_self else list(reversed(self.children(node_id)))
+        seen.update(stack)
+        while stack:
+            current = stack.pop()
+            yield current
+            for child in reversed(self._children.get(current, ())):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+
+    def ancestors(self, node_id: str) -> Iterator[str]:
+        """
+        Ids of the nodes `node_id` is reachable from, nearest first
+        """
+        seen: Set[str] = {node_id}
+        queue = list(self.parents(node_id))
+        seen.update(queue)
+        for current in queue:
+            yield current
+            for parent in self._parents.get(current, ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    queue.append(parent)
+
+    def find(
+        self,
+        phase: Optional[str] = None,
+        template_name: Optional[str] = None,
+        type_: Optional[str] = None,
+        boundary_id: Optional[str] = None,
+        leaf: Optional[bool] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        Nodes matching all of the given criteria, e.g. `find(phase="Failed", leaf=True)`.
+        The smallest matching table is filtered by the other criteria, results are
+        kept for repeated queries.
+        """
+        key = (phase, template_name, type_, boundary_id, leaf)
+        try:
+            return self._found[key]
+        except KeyError:
+            pass
+
+        criteria = [
+            (table.get(value, ()), attribute, value)
+            for attribute, value, table in (
+                ("phase", phase, self._by_phase),
+                ("templateName", template_name, self._by_template),
+                ("type", type_, self._by_type),
+                ("boundaryID", boundary_id, self._by_boundary),
+            )
+            if value is not None
+        ]
+        if not criteria:
+            candidates: Tuple[Any, ...] = tuple(self.nodes.values())
+        else:
+            criteria.sort(key=lambda criterion: len(criterion[0]))
+            candidates = criteria[0][0]
+            for table, attribute, value in criteria[1:]:
+                if len(table) < len(self.nodes):
+                    get = operator.attrgetter(attribute)
+                    candidates = tuple(node for node in candidates if get(node) == value)
+
+        if leaf is not None:
+            candidates = tuple(node for node in candidates if self.is_leaf(node.id) == leaf)
+
+        self._found[key] = candidates
+        return candidates
@@ -0,0 +1,257 @@
+"""
+Compact read-only representations of workflow status models.
+
+A `v1alpha1.WorkflowStatus` of a big fan-out workflow holds one pydantic
+`NodeStatus` per node, each with its nested `Inputs`, `Outputs` and `Time`
+objects. `CompactWorkflowStatus` and `CompactNodeStatus` keep the same attribute
+names in `__slots__` instead:
+
+* strings and string lists (node ids, phases, types, template names) are interned
+  and lists are stored as tuples,
+* times are stored as `datetime` rather than `meta.v1.Time` wrappers,
+* nested models are kept as the raw parsed json and only validated into their
+  pydantic model the first time they are accessed.
+
+The compact objects are not validated beyond these conversions.
+"""
+import functools
+import json
+import sys
+
+from datetime import datetime
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+from pydantic import BaseModel
+from pydantic import ValidationError
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_DICT
+from pydantic.fields import SHAPE_LIST
+from pydantic.fields import SHAPE_MAPPING
+from pydantic.fields import SHAPE_SINGLETON
+from pydantic.fields import ModelField
+
+from .api.io.argoproj.workflow import v1alpha1
+from .api.io.k8s.apimachinery.pkg.apis.meta import v1 as meta_v1
+
+
+_C = TypeVar("_C", bound="CompactModel")
+
+_intern = sys.intern
+
+
+def _intern_str(value: Any) -> Any:
+    return _intern(value) if type(value) is str else value
+
+
+def _intern_strs(value: Any) -> Tuple[Any, ...]:
+    return tuple(_intern(v) if type(v) is str else v for v in value)
+
+
+def _intern_keys(value: Any) -> Dict[Any, Any]:
+    return {_intern_str(k): v for k, v in value.items()}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_time(value: str) -> datetime:
+    return parse_datetime(value)
+
+
+def _time(value: Any) -> Any:
+    # nodes of one workflow share most of their timestamps, so do the parsed datetimes
+    return value if isinstance(value, datetime) else _parse_time(value)
+
+
+class _CompactField:
+    __slots__ = ("name", "alias", "convert", "field", "lazy_bit", "slot")
+
+    def __init__(self, name: str, alias: str, convert: Callable[[Any], Any], field: ModelField, lazy_bit: int = 0):
+        self.name = name
+        self.alias = alias
+        self.convert = convert
+        self.field = field
+        self.lazy_bit = lazy_bit
+        # lazy fields keep their raw value in a private slot behind a property
+        self.slot = "_" + name if lazy_bit else name
+
+
+def _compact_field(name: str, field: ModelField, nested: Optional[type], lazy_bit: int) -> _CompactField:
+    type_ = field.type_
+
+    if nested is not None:
+        if field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+            return _CompactField(name, field.alias, lambda v: {_intern_str(k): nested(x) for k, x in v.items()}, field)
+        elif field.shape == SHAPE_LIST:
+            return _CompactField(name, field.alias, lambda v: tuple(nested(x) for x in v), field)
+        return _CompactField(name, field.alias, nested, field)
+
+    if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+        if type_ is str:
+            return _CompactField(name, field.alias, _intern_str, field)
+        elif type_ in (int, float, bool):
+            return _CompactField(name, field.alias, _identity, field)
+        elif type_ in (meta_v1.Time, meta_v1.MicroTime):
+            return _CompactField(name, field.alias, _time, field)
+    elif field.shape == SHAPE_LIST and type_ is str:
+        return _CompactField(name, field.alias, _intern_strs, field)
+    elif field.shape in (SHAPE_DICT, SHAPE_MAPPING) and type_ in (str, int, float, bool):
+        return _CompactField(name, field.alias, _intern_keys, field)
+
+    return _CompactField(name, field.alias, _identity, field, lazy_bit)
+
+
+def _lazy_property(compact_field: _CompactField, model: Type[BaseModel]) -> property:
+    slot = compact_field.slot
+    bit = compact_field.lazy_bit
+    field = compact_field.field
+
+    def get(self: "CompactModel") -> Any:
+        value = getattr(self, slot)
+        if value is None or self._parsed & bit:
+            return value
+
+        value, errors = field.validate(value, {}, loc=field.alias, cls=model)
+        if errors:
+            raise ValidationError([errors], model)
+
+        object.__setattr__(self, slot, value)
+        object.__setattr__(self, "_parsed", self._parsed | bit)
+        return value
+
+    return property(get, doc=f"`{model.__name__}.{compact_field.name}`, validated on first access")
+
+
+class CompactModelMeta(type):
+    def __new__(
+        mcs,
+        name: str,
+        bases: Tuple[type, ...],
+        namespace: Dict[str, Any],
+        model: Optional[Type[BaseModel]] = None,
+        nested: Optional[Dict[str, type]] = None,
+    ):
+        if model is None:
+            return super().__new__(mcs, name, bases, namespace)
+
+        nested = nested or {}
+        fields: List[_CompactField] = []
+        lazy_bit = 1
+        for field_name, field in model.__fields__.items():
+            compact_field = _compact_field(field_name, field, nested.get(field_name), lazy_bit)
+            if compact_field.lazy_bit:
+                lazy_bit <<= 1
+                namespace[field_name] = _lazy_property(compact_field, model)
+            fields.append(compact_field)
+
+        namespace["__slots__"] = tuple(field.slot for field in fields)
+        namespace["__model__"] = model
+        namespace["__compact_fields__"] = tuple(fields)
+        namespace["__init__"] = _generate_init(fields)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+def _generate_init(fields: List[_CompactField]) -> Callable[..., None]:
+    """
+    Unrolled `__init__`, a generic loop over the fields costs more than parsing the json
+    """
+    namespace: Dict[str, Any] = {"intern": _intern, "set_attribute": object.__setattr__}
+    lines = ["def __init__(self, data):", "    get = data.get"]
+    for i, field in enumerate(fields):
+        if field.convert is _identity:
+            expression = "v"
+        elif field.convert is _intern_str:
+            expression = "intern(v) if v.__class__ is str else v"
+        else:
+            namespace[f"convert_{i}"] = field.convert
+            expression = f"convert_{i}(v)"
+
+        lines.append(f"    v = get({field.alias!r})")
+        lines.append(f"    set_attribute(self, {field.slot!r}, None if v is None else {expression})")
+    lines.append("    set_attribute(self, '_parsed', 0)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["__init__"]
+
+
+class CompactModel(metaclass=CompactModelMeta):
+    """
+    Read-only `__slots__` view of a pydantic model, see the module docstring
+    """
+
+    __slots__ = ("_parsed",)
+    _parsed: int
+    __model__: ClassVar[Type[BaseModel]]
+    __compact_fields__: ClassVar[Tuple[_CompactField, ...]]
+
+    def __init__(self, data: Mapping[str, Any]):
+        # replaced by an unrolled version in every concrete subclass
+        raise TypeError(f"{self.__class__.__name__} is not bound to a model")
+
+    @classmethod
+    def parse_obj(cls: Type[_C], data: Mapping[str, Any]) -> _C:
+        return cls(data)
+
+    @classmethod
+    def parse_raw(cls: Type[_C], data: Union[str, bytes]) -> _C:
+        return cls(json.loads(data))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{field.name}={getattr(self, field.slot)!r}"
+            for field in self.__compact_fields__
+            if not field.lazy_bit and getattr(self, field.slot) is not None
+        )
+        return f"{self.__class__.__name__}({fields})"
+
+    def to_model(self) -> BaseModel:
+        """
+        Build the full pydantic model
+        """
+        return self.__model__.parse_obj(
+            {
+                field.alias: _to_model_value(getattr(self, field.name))
+                for field in self.__compact_fields__
+                if getattr(self, field.slot) is not None
+            }
+        )
+
+
+def _to_model_value(value: Any) -> Any:
+    if isinstance(value, CompactModel):
+        return value.to_model()
+    elif isinstance(value, dict):
+        return {k: _to_model_value(v) for k, v in value.items()}
+    elif isinstance(value, tuple):
+        return [_to_model_value(v) for v in value]
+    return value
+
+
+class CompactNodeStatus(CompactModel, model=v1alpha1.NodeStatus):
+    """
+    Compact `v1alpha1.NodeStatus`
+    """
+
+
+class CompactWorkflowStatus(CompactModel, model=v1alpha1.WorkflowStatus, nested={"nodes": CompactNodeStatus}):
+    """
+    Compact `v1alpha1.WorkflowStatus`, `nodes` maps node ids to `CompactNodeStatus`
+    """
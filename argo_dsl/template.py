@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
@@ -13,17 +15,22 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
-import yaml
-
+from pydantic import BaseModel
 from pydantic.typing import resolve_annotations
 from typing_extensions import Literal
 
-from . import utils
 from .api.io.argoproj.workflow import v1alpha1
 from .api.io.k8s.api.core import v1
+from .emitter import dump_yaml
+from .hashing import content_hash
+from .manifest import to_json_bytes
+from .manifest import to_manifest
 
 
 _T = TypeVar("_T")
+_M = TypeVar("_M", bound=BaseModel)
+
+VALIDATE_TEMPLATES_ENV = "ARGO_DSL_VALIDATE_TEMPLATES"
 
 
 class Template(ABC):
@@ -31,6 +38,8 @@ class Template(ABC):
     Parameters: ClassVar[Optional[Type]] = None
     template: v1alpha1.Template
     __hooks__: ClassVar[List[Callable[[v1alpha1.Template], v1alpha1.Template]]] = []
+    __validate__: ClassVar[bool] = os.environ.get(VALIDATE_TEMPLATES_ENV, "0") == "1"
+    _content_hash: Optional[str] = None
 
     def __init__(self):
         self.construct()
@@ -48,13 +57,46 @@ class Template(ABC):
         ...
 
     def __repr__(self) -> str:
-        return yaml.dump(self.template.dict(exclude_none=True), Dumper=utils.BlockDumper)
+        return dump_yaml(self.to_manifest())
+
+    def to_manifest(self) -> Dict[str, Any]:
+        return to_manifest(self.template)
+
+    def to_json(self) -> str:
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        """
+        JSON of the template, written by `argo_dsl.manifest.to_json_bytes`
+        """
+        return to_json_bytes(self.template)
+
+    def content_hash(self) -> str:
+        """
+        `argo_dsl.hashing.content_hash` of the template, which leaves out its name,
+        computed once
+        """
+        if self._content_hash is None:
+            self._content_hash = content_hash(self.template)
+        return self._content_hash
 
     def serialize_argument(self, argument: Any) -> str:
         return str(argument)
 
 
-def new_parameters(cls: Optional[Type]) -> Optional[List[v1alpha1.Parameter]]:
+def new_model(model: Type[_M], validate: bool = False, **fields: Any) -> _M:
+    """
+    Assemble a model from values argo_dsl has already built itself.
+
+    Pydantic validation is skipped unless `validate` is set, None values are left unset.
+    """
+    if validate:
+        return model(**fields)
+
+    return model.construct(**{field: value for field, value in fields.items() if value is not None})
+
+
+def new_parameters(cls: Optional[Type], validate: bool = False) -> Optional[List[v1alpha1.Parameter]]:
     if cls is None:
         return None
 
@@ -69,23 +111,23 @@ def new_parameters(cls: Optional[Type]) -> Optional[List[v1alpha1.Parameter]]:
 
     parameters: List[v1alpha1.Parameter] = []
     for parameter_name, parameter_type in annos.items():
-        parameter = v1alpha1.Parameter(name=parameter_name)
+        fields: Dict[str, Any] = {"name": parameter_name}
 
         if parameter_name in default_values:
             default_value = default_values[parameter_name]
 
             if isinstance(default_value, v1alpha1.ValueFrom):
-                parameter.valueFrom = default_value
-                parameters.append(parameter)
+                fields["valueFrom"] = default_value
+                parameters.append(new_model(v1alpha1.Parameter, validate, **fields))
                 continue
 
-            parameter.default = default_value
+            fields["default"] = default_value
 
         origin_type = getattr(parameter_type, "__origin__", parameter_type)
         if origin_type == Literal:
-            parameter.enum = list(parameter_type.__args__)
+            fields["enum"] = list(parameter_type.__args__)
 
-        parameters.append(parameter)
+        parameters.append(new_model(v1alpha1.Parameter, validate, **fields))
 
     return parameters
 
@@ -112,11 +154,14 @@ class ExecutorTemplate(Template, Generic[_T]):
             )
 
     def compile(self) -> v1alpha1.Template:
-        parameters = new_parameters(self.Parameters)
+        parameters = new_parameters(self.Parameters, self.__validate__)
         name = self.name or self.__class__.__name__
+        inputs = new_model(v1alpha1.Inputs, self.__validate__, parameters=parameters)
 
-        return v1alpha1.Template.validate(
-            {"name": name, "inputs": v1alpha1.Inputs(parameters=parameters), self._manifest_type: self.manifest}
+        return new_model(
+            v1alpha1.Template,
+            self.__validate__,
+            **{"name": name, "inputs": inputs, self._manifest_type: self.manifest},
         )
 
     def specify_manifest(self) -> _T:
@@ -127,14 +172,14 @@ class ExecutorTemplate(Template, Generic[_T]):
         raise RuntimeError("Need implement method `specify_manifest`")
 
 
-class ContainerTemplate(ExecutorTemplate[v1.Container]):
+class ContainerTemplate(ExecutorTemplate["v1.Container"]):
     image: str
 
     def specify_manifest(self) -> v1.Container:
         return v1.Container(image=self.image)
 
 
-class ScriptTemplate(ExecutorTemplate[v1alpha1.ScriptTemplate]):
+class ScriptTemplate(ExecutorTemplate["v1alpha1.ScriptTemplate"]):
     image: str
     source: str
 
@@ -142,7 +187,7 @@ class ScriptTemplate(ExecutorTemplate[v1alpha1.ScriptTemplate]):
         return v1alpha1.ScriptTemplate(image=self.image, source=self.source)
 
 
-class ResourceTemplate(ExecutorTemplate[v1alpha1.ResourceTemplate]):
+class ResourceTemplate(ExecutorTemplate["v1alpha1.ResourceTemplate"]):
     action: Literal["get", "create", "apply", "delete", "replace", "patch"]
     resource_manifest: Optional[str] = None
     failureCondition: Optional[str] = None
@@ -0,0 +1,637 @@
+"""
+An in-memory stand-in for the Argo Server REST API, for tests and benchmarks.
+
+`StubArgoServer` serves the workflow, workflow template, cluster workflow template
+and cron workflow endpoints `argo_dsl.client.ArgoClient` uses over persistent
+HTTP/1.1 connections on a local port. Resources are kept as their json in dicts,
+nothing is validated or run beyond what the endpoints need: names are generated,
+metadata is filled in and the actions only set the fields they stand for.
+
+    async with StubArgoServer() as server:
+        async with ArgoClient(server.url, namespace="argo") as client:
+            ...
+"""
+import asyncio
+import collections
+import copy
+import itertools
+import json
+import random
+import re
+
+from datetime import datetime
+from datetime import timezone
+from http import HTTPStatus
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+
+Resource = Dict[str, Any]
+ResourceKey = Tuple[Optional[str], str]
+
+# gRPC status codes of the errors the server answers with
+INVALID_ARGUMENT = 3
+NOT_FOUND = 5
+ALREADY_EXISTS = 6
+RESOURCE_EXHAUSTED = 8
+INTERNAL = 13
+UNAVAILABLE = 14
+
+_HTTP_STATUS = {INVALID_ARGUMENT: 400, NOT_FOUND: 404, ALREADY_EXISTS: 409}
+_GRPC_CODE = {400: INVALID_ARGUMENT, 404: NOT_FOUND, 409: ALREADY_EXISTS, 429: RESOURCE_EXHAUSTED, 500: INTERNAL}
+
+
+class StubError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _matches_labels(resource: Resource, selector: Optional[str]) -> bool:
+    """
+    Whether `resource` matches a label selector of `key=value`, `key!=value`, `key`
+    and `!key` requirements
+    """
+    if not selector:
+        return True
+    labels = resource.get("metadata", {}).get("labels") or {}
+    for requirement in selector.split(","):
+        requirement = requirement.strip()
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.split("=", 1)
+            if labels.get(key.strip().rstrip("=")) != value.strip().lstrip("="):
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:] in labels:
+                return False
+        elif requirement and requirement not in labels:
+            return False
+    return True
+
+
+def _field_tree(paths: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _keep(data: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(data, list):
+        return [_keep(item, tree) for item in data]
+    elif isinstance(data, dict):
+        return {key: _keep(value, tree[key]) if tree[key] else value for key, value in data.items() if key in tree}
+    return data
+
+
+def _drop(data: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(data, list):
+        return [_drop(item, tree) for item in data]
+    elif isinstance(data, dict):
+        return {
+            key: _drop(value, tree[key]) if key in tree else value
+            for key, value in data.items()
+            if key not in tree or tree[key]
+        }
+    return data
+
+
+def select_fields(data: Any, fields: Optional[str]) -> Any:
+    """
+    The fields of `data` selected like the `fields` query parameter of the Argo
+    Server does: a comma separated list of dotted paths to keep, or to drop if the
+    list starts with `-`. Paths go through lists, e.g. `items.metadata.name`.
+    """
+    if not fields:
+        return data
+    if fields.startswith("-"):
+        return _drop(data, _field_tree(fields[1:].split(",")))
+    return _keep(data, _field_tree(fields.split(",")))
+
+
+_LOG_PATH = re.compile(r"/api/v1/workflows/([^/]+)/([^/]+)/log$")
+
+
+class _Route:
+    __slots__ = ("method", "pattern", "handler")
+
+    def __init__(self, method: str, pattern: str, handler: Callable[..., Any]):
+        self.method = method
+        self.pattern: Pattern[str] = re.compile("/api/v1/" + pattern + "$")
+        self.handler = handler
+
+
+class StubArgoServer:
+    """
+    See the module docstring. `latency` seconds are waited before every response.
+    `workflows`, `workflow_templates`, `cron_workflows` and `archived_workflows`
+    map (namespace, name) to the stored json, `cluster_workflow_templates`
+    (None, name).
+
+    Requests fail with the statuses queued by `fail`, and at random with
+    `error_status` at `error_rate`, before they reach their endpoint.
+
+    Changes of workflows are kept as watch events, `workflow-events` streams them
+    from the requested resource version on. `compact` forgets them like the
+    Kubernetes API does, watches from older versions then fail with 410 Gone.
+    `disconnect` drops the open connections, watches included.
+
+    `logs` maps (namespace, name) of workflows to their log entries, the `log`
+    endpoint streams them in slices of `log_chunk_size` bytes, so that lines are
+    split across chunks.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.faults: Deque[Tuple[int, Optional[float]]] = collections.deque()
+        self._random = random.Random(seed)
+        self.workflows: Dict[ResourceKey, Resource] = {}
+        self.workflow_templates: Dict[ResourceKey, Resource] = {}
+        self.cluster_workflow_templates: Dict[ResourceKey, Resource] = {}
+        self.cron_workflows: Dict[ResourceKey, Resource] = {}
+        self.archived_workflows: Dict[ResourceKey, Resource] = {}
+        self.logs: Dict[ResourceKey, List[Resource]] = {}
+        self.log_chunk_size = 100
+        # served requests and accepted connections
+        self.requests = 0
+        self.connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._counter = itertools.count(1)
+        # watch events by resource version: (resource version, namespace, workflow, line)
+        self._events: List[Tuple[int, str, Resource, bytes]] = []
+        self._compacted = 0
+        # None ends a watch
+        self._watchers: Set["asyncio.Queue[Optional[Tuple[int, str, Resource, bytes]]]"] = set()
+        self._routes = [
+            _Route("POST", r"workflows/([^/]+)", self.create_workflow),
+            _Route("GET", r"workflows/([^/]+)", self.list_workflows),
+            _Route("POST", r"workflows/([^/]+)/lint", self.lint_workflow),
+            _Route("POST", r"workflows/([^/]+)/submit", self.submit_workflow),
+            _Route("GET", r"workflows/([^/]+)/([^/]+)", self.get_workflow),
+            _Route("DELETE", r"workflows/([^/]+)/([^/]+)", self.delete_workflow),
+            _Route("PUT", r"workflows/([^/]+)/([^/]+)/([a-z]+)", self.workflow_action),
+            _Route("GET", r"workflows/([^/]+)/([^/]+)/log", self.workflow_logs),
+            _Route("POST", r"workflow-templates/([^/]+)", self.create_workflow_template),
+            _Route("GET", r"workflow-templates/([^/]+)", self.list_workflow_templates),
+            _Route("POST", r"workflow-templates/([^/]+)/lint", self.lint_workflow_template),
+            _Route("GET", r"workflow-templates/([^/]+)/([^/]+)", self.get_workflow_template),
+            _Route("DELETE", r"workflow-templates/([^/]+)/([^/]+)", self.delete_workflow_template),
+            _Route("POST", r"cluster-workflow-templates", self.create_cluster_workflow_template),
+            _Route("POST", r"cron-workflows/([^/]+)", self.create_cron_workflow),
+            _Route("GET", r"cron-workflows/([^/]+)", self.list_cron_workflows),
+            _Route("GET", r"archived-workflows", self.list_archived_workflows),
+        ]
+
+    def fail(self, status: int, times: int = 1, retry_after: Optional[float] = None):
+        """
+        Answer the next `times` requests with `status`, and a `Retry-After` header
+        of `retry_after` seconds if given
+        """
+        self.faults.extend([(status, retry_after)] * times)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "StubArgoServer":
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        """
+        Stop listening and drop the open connections
+        """
+        if self._server is not None:
+            self._server.close()
+            self.disconnect()
+            await self._server.wait_closed()
+            self._server = None
+
+    def disconnect(self):
+        """
+        Drop the open connections, the server keeps listening
+        """
+        for writer in list(self._writers):
+            writer.close()
+        for queue in self._watchers:
+            queue.put_nowait(None)
+
+    def compact(self):
+        """
+        Forget the watch events so far
+        """
+        if self._events:
+            self._compacted = self._events[-1][0]
+            self._events.clear()
+
+    def update_workflow(self, namespace: str, name: str, patch: Mapping[str, Any]) -> Resource:
+        """
+        Merge `patch` into a stored workflow, as the controller would update it
+        """
+
+        def merge(target: Dict[str, Any], patch: Mapping[str, Any]):
+            for key, value in patch.items():
+                if isinstance(value, Mapping) and isinstance(target.get(key), dict):
+                    merge(target[key], value)
+                elif value is None:
+                    target.pop(key, None)
+                else:
+                    target[key] = copy.deepcopy(value)
+
+        workflow = self._get(self.workflows, "workflow", namespace, name)
+        merge(workflow, patch)
+        return self._modified(workflow)
+
+    async def __aenter__(self) -> "StubArgoServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+
+    # http
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+
+                headers: Dict[str, str] = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self.requests += 1
+                if method == "GET" and target.startswith("/api/v1/workflow-events/"):
+                    # the connection is given over to the stream
+                    await self._watch(writer, target)
+                    break
+                log = _LOG_PATH.match(urlsplit(target).path) if method == "GET" else None
+                entries = self.logs.get((unquote(log[1]), unquote(log[2]))) if log is not None else None
+                if entries is not None:
+                    await self._stream_logs(writer, target, entries)
+                    break
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                extra_headers: Dict[str, str] = {}
+                if self.faults:
+                    status, retry_after = self.faults.popleft()
+                    data: Any = {"code": _GRPC_CODE.get(status, UNAVAILABLE), "message": HTTPStatus(status).phrase}
+                    if retry_after is not None:
+                        extra_headers["Retry-After"] = f"{retry_after:g}"
+                elif self.error_rate and self._random.random() < self.error_rate:
+                    status, data = self.error_status, {"code": UNAVAILABLE, "message": "injected error"}
+                else:
+                    status, data = self.handle(method, target, body)
+                close = headers.get("connection", "").lower() == "close"
+                writer.write(self.response(status, data, close, extra_headers))
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _watch(self, writer: asyncio.StreamWriter, target: str):
+        parts = urlsplit(target)
+        namespace = unquote(parts.path.rsplit("/", 1)[-1])
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        selector = query.get("listOptions.labelSelector")
+        resource_version = int(query.get("listOptions.resourceVersion") or 0)
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n")
+
+        def write(line: bytes):
+            writer.write(b"%x\r\n%s\n\r\n" % (len(line) + 1, line))
+
+        if resource_version and resource_version < self._compacted:
+            error = {"grpc_code": 9, "http_code": 410, "message": "too old resource version", "http_status": "Gone"}
+            write(json.dumps({"error": error}).encode())
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+            return
+
+        queue: "asyncio.Queue[Optional[Tuple[int, str, Resource, bytes]]]" = asyncio.Queue()
+        backlog = [event for event in self._events if event[0] > resource_version]
+        self._watchers.add(queue)
+        try:
+            for event in backlog:
+                queue.put_nowait(event)
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                _, event_namespace, workflow, line = event
+                if namespace in ("", event_namespace) and _matches_labels(workflow, selector):
+                    write(line)
+                    await writer.drain()
+        finally:
+            self._watchers.discard(queue)
+
+    async def _stream_logs(self, writer: asyncio.StreamWriter, target: str, entries: List[Resource]):
+        query = {name: values[-1] for name, values in parse_qs(urlsplit(target).query).items()}
+        pod_name = query.get("podName")
+        grep = query.get("grep")
+        body = b"".join(
+            json.dumps({"result": entry}).encode() + b"\n"
+            for entry in entries
+            if pod_name in (None, entry.get("podName")) and (grep is None or grep in entry.get("content", ""))
+        )
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n")
+        for start in range(0, len(body), self.log_chunk_size):
+            chunk = body[start : start + self.log_chunk_size]
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _event(self, type: str, workflow: Resource):
+        metadata = workflow["metadata"]
+        line = json.dumps({"result": {"type": type, "object": workflow}}, separators=(",", ":")).encode()
+        event = (int(metadata["resourceVersion"]), metadata.get("namespace") or "", copy.deepcopy(workflow), line)
+        self._events.append(event)
+        for queue in self._watchers:
+            queue.put_nowait(event)
+
+    def response(
+        self,
+        status: int,
+        data: Any,
+        close: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> bytes:
+        body = json.dumps(data, separators=(",", ":")).encode()
+        head = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        if headers:
+            head.extend(f"{name}: {value}" for name, value in headers.items())
+        if close:
+            head.append("Connection: close")
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+    def handle(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        """
+        Status and json of the response to a request
+        """
+        parts = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        path_matched = False
+        for route in self._routes:
+            match = route.pattern.match(parts.path)
+            if match is None:
+                continue
+            path_matched = True
+            if route.method != method:
+                continue
+
+            try:
+                data = json.loads(body) if body else {}
+                return 200, route.handler(data, query, *map(unquote, match.groups()))
+            except ValueError as e:
+                return 400, {"code": INVALID_ARGUMENT, "message": str(e)}
+            except StubError as e:
+                return _HTTP_STATUS.get(e.code, 500), {"code": e.code, "message": e.message}
+
+        if path_matched:
+            return 405, {"code": 12, "message": f"method {method} not allowed"}
+        return 404, {"code": NOT_FOUND, "message": "Not Found"}
+
+    # resources
+
+    def _store(
+        self,
+        resources: Dict[ResourceKey, Resource],
+        kind: str,
+        resource: Any,
+        namespace: Optional[str],
+        dry_run: bool = False,
+    ) -> Resource:
+        if not isinstance(resource, dict):
+            raise StubError(INVALID_ARGUMENT, f"{kind} is required")
+        metadata = resource.setdefault("metadata", {})
+        n = next(self._counter)
+        if not metadata.get("name"):
+            if not metadata.get("generateName"):
+                raise StubError(INVALID_ARGUMENT, "name or generateName is required")
+            metadata["name"] = f"{metadata['generateName']}{n:05d}"
+
+        key = (namespace, metadata["name"])
+        if key in resources:
+            raise StubError(ALREADY_EXISTS, f"{kind} {metadata['name']!r} already exists")
+        if namespace is not None:
+            metadata["namespace"] = namespace
+        metadata["uid"] = f"00000000-0000-0000-0000-{n:012d}"
+        metadata["resourceVersion"] = str(n)
+        metadata["creationTimestamp"] = _now()
+        if not dry_run:
+            resources[key] = resource
+            if resources is self.workflows:
+                self._event("ADDED", resource)
+        return resource
+
+    def _get(self, resources: Dict[ResourceKey, Resource], kind: str, namespace: Optional[str], name: str) -> Resource:
+        try:
+            return resources[(namespace, name)]
+        except KeyError:
+            raise StubError(NOT_FOUND, f"{kind} {name!r} not found") from None
+
+    def _modified(self, workflow: Resource) -> Resource:
+        workflow["metadata"]["resourceVersion"] = str(next(self._counter))
+        self._event("MODIFIED", workflow)
+        return workflow
+
+    def create_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._store(self.workflows, "workflow", data.get("workflow"), namespace, bool(data.get("serverDryRun")))
+
+    def lint_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        workflow = data.get("workflow")
+        if not isinstance(workflow, dict):
+            raise StubError(INVALID_ARGUMENT, "workflow is required")
+        return workflow
+
+    def _list(self, resources: Dict[ResourceKey, Resource], query: Mapping[str, str], namespace: Optional[str]) -> Any:
+        selector = query.get("listOptions.labelSelector")
+        items = [
+            resource
+            for (resource_namespace, _), resource in resources.items()
+            if (not namespace or resource_namespace == namespace) and _matches_labels(resource, selector)
+        ]
+
+        start = int(query.get("listOptions.continue") or 0)
+        limit = int(query.get("listOptions.limit") or 0)
+        end = start + limit if limit else len(items)
+        metadata = {"resourceVersion": str(next(self._counter))}
+        if end < len(items):
+            metadata["continue"] = str(end)
+        return select_fields({"metadata": metadata, "items": items[start:end]}, query.get("fields"))
+
+    def list_workflows(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._list(self.workflows, query, namespace)
+
+    def list_workflow_templates(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._list(self.workflow_templates, query, namespace)
+
+    def list_cron_workflows(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._list(self.cron_workflows, query, namespace)
+
+    def list_archived_workflows(self, data: Mapping[str, Any], query: Mapping[str, str]) -> Resource:
+        return self._list(self.archived_workflows, query, query.get("namespace"))
+
+    def get_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str, name: str) -> Resource:
+        return select_fields(self._get(self.workflows, "workflow", namespace, name), query.get("fields"))
+
+    def workflow_logs(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str, name: str) -> Resource:
+        # the logs in `logs` are streamed before the request gets here
+        raise StubError(NOT_FOUND, f"logs of workflow {name!r} not found")
+
+    def delete_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str, name: str) -> Resource:
+        workflow = self._get(self.workflows, "workflow", namespace, name)
+        del self.workflows[(namespace, name)]
+        workflow["metadata"]["resourceVersion"] = str(next(self._counter))
+        self._event("DELETED", workflow)
+        return {}
+
+    def submit_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        kind = data.get("resourceKind")
+        name = data.get("resourceName") or ""
+        if kind == "WorkflowTemplate":
+            self._get(self.workflow_templates, "workflow template", namespace, name)
+            spec: Dict[str, Any] = {"workflowTemplateRef": {"name": name}}
+        elif kind == "ClusterWorkflowTemplate":
+            self._get(self.cluster_workflow_templates, "cluster workflow template", None, name)
+            spec = {"workflowTemplateRef": {"name": name, "clusterScope": True}}
+        elif kind == "CronWorkflow":
+            cron_workflow = self._get(self.cron_workflows, "cron workflow", namespace, name)
+            spec = copy.deepcopy(cron_workflow.get("spec", {}).get("workflowSpec", {}))
+        else:
+            raise StubError(INVALID_ARGUMENT, f"resource kind {kind!r} is not supported")
+
+        options = data.get("submitOptions") or {}
+        parameters = options.get("parameters")
+        if parameters:
+            spec["arguments"] = {
+                "parameters": [dict(zip(("name", "value"), parameter.split("=", 1))) for parameter in parameters]
+            }
+
+        metadata: Dict[str, Any] = {
+            "generateName": options.get("generateName") or f"{name}-",
+            "labels": dict(re.findall(r"([^,=]+)=([^,]*)", options.get("labels") or "")),
+        }
+        if options.get("name"):
+            metadata["name"] = options["name"]
+        metadata["labels"][f"workflows.argoproj.io/{re.sub('(?<!^)(?=[A-Z])', '-', kind).lower()}"] = name
+        return self._store(self.workflows, "workflow", {"metadata": metadata, "spec": spec}, namespace)
+
+    def workflow_action(
+        self,
+        data: Mapping[str, Any],
+        query: Mapping[str, str],
+        namespace: str,
+        name: str,
+        action: str,
+    ) -> Resource:
+        workflow = self._get(self.workflows, "workflow", namespace, name)
+        spec = workflow.setdefault("spec", {})
+        if action == "terminate":
+            spec["shutdown"] = "Terminate"
+        elif action == "stop":
+            spec["shutdown"] = "Stop"
+        elif action == "suspend":
+            spec["suspend"] = True
+        elif action == "resume":
+            spec.pop("suspend", None)
+        elif action == "retry":
+            workflow.setdefault("status", {})["phase"] = "Running"
+        elif action == "resubmit":
+            labels = dict(workflow["metadata"].get("labels") or {})
+            labels["workflows.argoproj.io/resubmitted-from-workflow"] = name
+            metadata = {"generateName": f"{name}-", "labels": labels}
+            return self._store(
+                self.workflows, "workflow", {"metadata": metadata, "spec": copy.deepcopy(spec)}, namespace
+            )
+        else:
+            raise StubError(NOT_FOUND, f"unknown workflow action {action!r}")
+        return self._modified(workflow)
+
+    def create_workflow_template(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._store(self.workflow_templates, "workflow template", data.get("template"), namespace)
+
+    def lint_workflow_template(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        template = data.get("template")
+        if not isinstance(template, dict):
+            raise StubError(INVALID_ARGUMENT, "template is required")
+        return template
+
+    def get_workflow_template(
+        self,
+        data: Mapping[str, Any],
+        query: Mapping[str, str],
+        namespace: str,
+        name: str,
+    ) -> Resource:
+        return self._get(self.workflow_templates, "workflow template", namespace, name)
+
+    def delete_workflow_template(
+        self,
+        data: Mapping[str, Any],
+        query: Mapping[str, str],
+        namespace: str,
+        name: str,
+    ) -> Resource:
+        self._get(self.workflow_templates, "workflow template", namespace, name)
+        del self.workflow_templates[(namespace, name)]
+        return {}
+
+    def create_cluster_workflow_template(self, data: Mapping[str, Any], query: Mapping[str, str]) -> Resource:
+        return self._store(self.cluster_workflow_templates, "cluster workflow template", data.get("template"), None)
+
+    def create_cron_workflow(self, data: Mapping[str, Any], query: Mapping[str, str], namespace: str) -> Resource:
+        return self._store(self.cron_workflows, "cron workflow", data.get("cronWorkflow"), namespace)
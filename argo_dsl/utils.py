@@ -1,11 +1,16 @@
+import ast
 import inspect
+import linecache
 import re
 import textwrap
+import tokenize
 
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -16,53 +21,174 @@ except ImportError:
     from yaml import Dumper  # type: ignore
 
 
-def get_function_body(func: Callable[..., Any]) -> str:
-    body_lines = []
-    left_bracket_num = 0
-    right_bracket_num = 0
-    def_found = False
-    end_of_signature = False
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+# the lines of a source file and its function definitions by their first line, decorators included
+_sources: Dict[str, Tuple[List[str], Dict[int, FunctionNode]]] = {}
+_UNSET: Any = object()
+# the fields of statements which hold statements, `handlers` and `cases` hold nodes with a body
+_STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _parse_source(
+    filename: str, module_globals: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], Dict[int, FunctionNode]]:
+    """
+    Lines and function definitions of a source file, parsed once for as long as
+    `linecache` holds the same lines
+    """
+    lines = linecache.getlines(filename, module_globals)
+    cached = _sources.get(filename)
+    if cached is not None and cached[0] is lines:
+        return cached
+
+    definitions: Dict[int, FunctionNode] = {}
+    try:
+        _collect_definitions(ast.parse("".join(lines), filename).body, definitions)
+    except (SyntaxError, ValueError):
+        pass
+
+    cached = _sources[filename] = (lines, definitions)
+    return cached
+
+
+def _collect_definitions(statements: List[ast.stmt], definitions: Dict[int, FunctionNode]):
+    # functions are only defined by statements, the expressions are not walked
+    for node in statements:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            first = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+            definitions[first] = node
+        for field in _STATEMENT_FIELDS:
+            children = getattr(node, field, None)
+            if children:
+                _collect_definitions(children, definitions)
+
+
+def _function_source(func: Callable[..., Any]) -> Tuple[List[str], FunctionNode]:
+    """
+    Source lines which `func` is defined in and the node of its definition
+    """
+    code = inspect.unwrap(getattr(func, "__func__", func)).__code__
+    lines, definitions = _parse_source(code.co_filename, getattr(func, "__globals__", None))
+    node = definitions.get(code.co_firstlineno)
+    if node is not None and node.name == code.co_name:
+        return lines, node
+
+    # not in the file linecache knows, e.g. defined by `exec`, through the lookup of inspect
+    lines = textwrap.dedent("".join(inspect.getsourcelines(func)[0])).splitlines(True)
+    node = ast.parse("".join(lines)).body[0]
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        raise TypeError(f"{func!r} is not defined by a def statement")
+    return lines, node
+
+
+def _signature_end(lines: List[str], node: FunctionNode) -> int:
+    """
+    Index of the line after the colon which ends the signature of `node`, the first
+    colon out of comments after its last parameter, default and annotation
+    """
+    if not hasattr(node, "end_lineno"):  # pragma: no cover
+        # python 3.7
+        return _signature_end_by_tokens(lines, node)
+
+    args = node.args
+    parts: List[Optional[ast.AST]] = [*args.posonlyargs, *args.args, args.vararg, *args.kwonlyargs, args.kwarg]
+    parts += [*args.defaults, *args.kw_defaults, node.returns]
+    row, col = max(
+        [(node.lineno, node.col_offset)]
+        + [(part.end_lineno or 0, part.end_col_offset or 0) for part in parts if part is not None]  # type: ignore[attr-defined]
+    )
+
+    # offsets count utf-8 bytes
+    col = len(lines[row - 1].encode()[:col].decode(errors="ignore"))
+    for index in range(row - 1, len(lines)):
+        for char in lines[index][col:]:
+            if char == ":":
+                return index + 1
+            elif char == "#":
+                break
+        col = 0
+    raise ValueError(f"no end of the signature of {node.name}")  # pragma: no cover
+
+
+def _signature_end_by_tokens(lines: List[str], node: FunctionNode) -> int:  # pragma: no cover
+    depth = 0
+    readline = iter(lines[node.lineno - 1 : node.body[0].lineno]).__next__
+    for token in tokenize.generate_tokens(readline):
+        if token.type != tokenize.OP:
+            continue
+        if token.string in "([{":
+            depth += 1
+        elif token.string in ")]}":
+            depth -= 1
+        elif token.string == ":" and depth == 0:
+            return node.lineno + token.start[0] - 1
+    raise ValueError(f"no end of the signature of {node.name}")
 
-    for line in inspect.getsourcelines(func)[0]:
 
-        if end_of_signature:
-            body_lines.append(line)
+def _end_line(lines: List[str], node: FunctionNode) -> int:
+    end = getattr(node, "end_lineno", None)
+    if end is None:  # pragma: no cover
+        # python 3.7
+        end = node.lineno - 1 + len(inspect.getblock(lines[node.lineno - 1 :]))
+    return end
 
-        if re.match(r"\s*def", line):
-            def_found = True
 
-        if not def_found and "def" not in line:
-            continue
+def _body(lines: List[str], node: FunctionNode) -> str:
+    return textwrap.dedent("".join(lines[_signature_end(lines, node) : _end_line(lines, node)]))
 
-        for char in line:
-            if char == "(":
-                left_bracket_num += 1
-            elif char == ")":
-                right_bracket_num += 1
 
-        if (left_bracket_num - right_bracket_num == 0) and ":" in line:
-            end_of_signature = True
+def _returns_value(node: FunctionNode) -> bool:
+    last = node.body[-1]
+    return isinstance(last, ast.Return) and last.value is not None
 
-    return textwrap.dedent("".join(body_lines))
+
+def get_function_body(func: Callable[..., Any]) -> str:
+    """
+    Source of the body of `func`, the lines after its signature, dedented
+    """
+    return _body(*_function_source(func))
 
 
 def check_function_has_return_value(func: Callable[..., Any]) -> bool:
-    return inspect.getsourcelines(func)[0][-1].lstrip().startswith("return ")
+    """
+    Whether `func` ends with returning a value
+    """
+    return _returns_value(_function_source(func)[1])
 
 
 class Function:
     def __init__(self, func: Callable[..., Union[Optional[str], None]]):
         self.name = func.__name__
         self.func = func
-        self.body = get_function_body(func)
+        lines, node = _function_source(func)
+        self.body = _body(lines, node)
         self.docstring = textwrap.dedent(func.__doc__ or "").strip()
         self.parameters: Dict[str, inspect.Parameter] = dict(inspect.signature(func).parameters)
         self.parameters.pop("self", None)
         self.parameter_class = self._new_parameters_class(self.parameters)
-        self.return_value = None
 
-        if check_function_has_return_value(func):
-            self.return_value = str(func(*([None] * len(self.parameters))))
+        # whether the function has been called for its return value
+        self.called = False
+        self._return_value: Optional[str] = None
+        if _returns_value(node):
+            try:
+                self._return_value = str(ast.literal_eval(node.body[-1].value))  # type: ignore[attr-defined]
+            except (ValueError, TypeError, SyntaxError):
+                # not a literal, or one which can't be built like a dict with a list key
+                self._return_value = _UNSET
+
+    @property
+    def return_value(self) -> Optional[str]:
+        """
+        What the function returns as a string, None if it doesn't end with returning
+        a value. A literal is read from the source, otherwise the function is called
+        with None arguments, once and only when the value is asked for.
+        """
+        if self._return_value is _UNSET:
+            self.called = True
+            self._return_value = str(self.func(*([None] * len(self.parameters))))
+        return self._return_value
 
     @staticmethod
     def _new_parameters_class(parameters: Dict[str, inspect.Parameter]) -> Type:
@@ -92,11 +218,14 @@ def shorten_repr(obj: Any, max_length: int) -> str:
     return repr_obj
 
 
+_TRAILING_SPACES = re.compile(" +\n")
+
+
 class BlockDumper(Dumper):
     def represent_scalar(self, tag, value, style=None):
-        if re.search("\n", value):
+        if "\n" in value:
             style = "|"
             # remove trailing spaces and newlines which are not allowed in YAML blocks
-            value = re.sub(" +\n", "\n", value).strip()
+            value = _TRAILING_SPACES.sub("\n", value).strip()
 
         return super().represent_scalar(tag, value, style)
@@ -0,0 +1,468 @@
+"""
+Lazy views over workflow json documents.
+
+`parse_workflow` walks a `v1alpha1.Workflow` document once without building its
+object tree. The top level fields are decoded right away, while the entries of
+`status.nodes` and `status.storedTemplates` are only indexed by their byte offsets
+and decoded into models when they are looked up. The document itself is the only
+big object kept around, and `load_workflow` maps it from a file instead of
+reading it into memory.
+"""
+import json
+import mmap
+import re
+
+from typing import AbstractSet
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from .api.io.argoproj.workflow import v1alpha1
+from .api.io.k8s.apimachinery.pkg.apis.meta import v1 as meta_v1
+from .status import CompactWorkflowStatus
+
+
+_V = TypeVar("_V")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+Span = Tuple[int, int]
+
+LAZY_STATUS_FIELDS = ("nodes", "storedTemplates")
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# everything but brackets, strings are skipped as a whole so brackets inside them are ignored
+_SKIP = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SCALAR = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[^,:{}\[\]\s]+')
+
+
+def _nested_pattern(depth: int) -> "re.Pattern[bytes]":
+    """
+    Objects and arrays nested up to `depth` levels matched in one go, deeper ones need `skip_value`'s loop
+    """
+    # a run of plain characters must reach the next special one, otherwise a failed
+    # match (a truncated value) backtracks through every way of splitting the run
+    run = rb'[^"{}\[\]]+(?=["{}\[\]])'
+    pattern = rb"[{\[](?:%s|%s)*[}\]]" % (run, _STRING.pattern)
+    for _ in range(depth - 1):
+        pattern = rb"[{\[](?:%s|%s|%s)*[}\]]" % (run, _STRING.pattern, pattern)
+    return re.compile(pattern)
+
+
+_NESTED = _nested_pattern(12)
+
+# bytes compared at once when looking for the first difference to an earlier version
+_COMMON_BLOCK = 4096
+_COMMON_BLOCK_MAX = 1 << 20
+_SELF_DELIMITED = b'{["'
+
+
+class JSONScanError(ValueError):
+    def __init__(self, message: str, pos: int):
+        super().__init__(f"{message} at offset {pos}")
+        self.pos = pos
+
+
+def skip_whitespace(buf: Buffer, pos: int) -> int:
+    return _WHITESPACE.match(buf, pos).end()  # type: ignore
+
+
+def skip_value(buf: Buffer, pos: int) -> int:
+    """
+    Offset right after the json value starting at `pos`, without decoding it
+    """
+    char = buf[pos : pos + 1]
+    if char != b"{" and char != b"[":
+        match = _SCALAR.match(buf, pos)
+        if match is None:
+            raise JSONScanError("expected a value", pos)
+        return match.end()
+
+    match = _NESTED.match(buf, pos)
+    if match is not None:
+        return match.end()
+
+    depth = 0
+    while True:
+        if char == b"{" or char == b"[":
+            depth += 1
+        elif char == b"}" or char == b"]":
+            depth -= 1
+        else:
+            raise JSONScanError("unterminated value", pos)
+
+        pos += 1
+        if depth == 0:
+            return pos
+
+        pos = _SKIP.match(buf, pos).end()  # type: ignore
+        char = buf[pos : pos + 1]
+
+
+def decode_key(raw: Union[bytes, bytearray]) -> str:
+    """
+    Decode a json string token, keys rarely need unescaping
+    """
+    return json.loads(raw) if b"\\" in raw else bytes(raw[1:-1]).decode()
+
+
+def scan_value(buf: Buffer, pos: int) -> Span:
+    start = skip_whitespace(buf, pos)
+    return start, skip_value(buf, start)
+
+
+def scan_object(buf: Buffer, pos: int, member: Callable[[str, int], int]) -> int:
+    """
+    Walk the json object starting at `pos`. `member` is called with the key and
+    the offset of the value of every member and returns the offset right after
+    that value. Returns the offset right after the object.
+    """
+    pos = skip_whitespace(buf, pos)
+    if buf[pos : pos + 1] != b"{":
+        raise JSONScanError("expected an object", pos)
+
+    pos = skip_whitespace(buf, pos + 1)
+    if buf[pos : pos + 1] == b"}":
+        return pos + 1
+
+    while True:
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise JSONScanError("expected a key", pos)
+        key = decode_key(match.group())
+
+        pos = skip_whitespace(buf, match.end())
+        if buf[pos : pos + 1] != b":":
+            raise JSONScanError("expected ':'", pos)
+
+        pos = skip_whitespace(buf, member(key, skip_whitespace(buf, pos + 1)))
+        char = buf[pos : pos + 1]
+        if char == b"}":
+            return pos + 1
+        elif char != b",":
+            raise JSONScanError("expected ',' or '}'", pos)
+        pos = skip_whitespace(buf, pos + 1)
+
+
+def scan_array(buf: Buffer, pos: int, element: Callable[[int], int]) -> int:
+    """
+    Walk the json array starting at `pos`. `element` is called with the offset of
+    every element and returns the offset right after it. Returns the offset right
+    after the array.
+    """
+    pos = skip_whitespace(buf, pos)
+    if buf[pos : pos + 1] != b"[":
+        raise JSONScanError("expected an array", pos)
+
+    pos = skip_whitespace(buf, pos + 1)
+    if buf[pos : pos + 1] == b"]":
+        return pos + 1
+
+    while True:
+        pos = skip_whitespace(buf, element(pos))
+        char = buf[pos : pos + 1]
+        if char == b"]":
+            return pos + 1
+        elif char != b",":
+            raise JSONScanError("expected ',' or ']'", pos)
+        pos = skip_whitespace(buf, pos + 1)
+
+
+def _block(buf: Buffer, start: int, end: int) -> Union[bytes, bytearray]:
+    block = buf[start:end]
+    # memoryviews compare item by item, bytes with memcmp
+    return block.tobytes() if isinstance(block, memoryview) else block
+
+
+def common_length(a: Buffer, a_pos: int, b: Buffer, b_pos: int, limit: int) -> int:
+    """
+    Length of the common prefix of `a[a_pos:]` and `b[b_pos:]`, at most `limit`
+    """
+
+    def same(offset: int, size: int) -> bool:
+        return _block(a, a_pos + offset, a_pos + offset + size) == _block(b, b_pos + offset, b_pos + offset + size)
+
+    length = 0
+    size = _COMMON_BLOCK
+    while length < limit:
+        size = min(size, limit - length)
+        if not same(length, size):
+            # the first difference is in this block, `low` bytes of it are the same
+            # and it is in the `high - low` bytes after them
+            low, high = 0, size
+            while high - low > 1:
+                middle = (low + high) // 2
+                if same(length + low, middle - low):
+                    low = middle
+                else:
+                    high = middle
+            return length + low
+        length += size
+        size = min(size * 2, _COMMON_BLOCK_MAX)
+    return length
+
+
+def index_object(
+    buf: Buffer,
+    pos: int,
+    spans: Dict[str, Span],
+    previous: Optional[Tuple[Buffer, Dict[str, Span]]] = None,
+    reused: Optional[Set[str]] = None,
+) -> int:
+    """
+    Collect the spans of the member values of the json object starting at `pos`
+    into `spans`. Returns the offset right after the object.
+
+    `previous` is the buffer and the spans of an earlier version of the object with
+    its members in the same order. Where the bytes from a member on are the same as
+    before, the members up to the first difference are taken over without scanning
+    them again, and their keys are added to `reused`.
+    """
+    if previous is None:
+
+        def member(key: str, start: int) -> int:
+            end = skip_value(buf, start)
+            spans[key] = (start, end)
+            return end
+
+        return scan_object(buf, pos, member)
+
+    previous_buf, previous_spans = previous
+    previous_keys = list(previous_spans)
+    positions = {key: i for i, key in enumerate(previous_keys)}
+    reused = set() if reused is None else reused
+
+    def reuse_member(key: str, start: int) -> int:
+        span = previous_spans.get(key)
+        if span is not None:
+            limit = min(len(previous_buf) - span[0], len(buf) - start)
+            common_end = span[0] + common_length(previous_buf, span[0], buf, start, limit)
+            shift = start - span[0]
+
+            end = None
+            for previous_key in previous_keys[positions[key] :]:
+                previous_start, previous_end = previous_spans[previous_key]
+                # objects, arrays and strings end by themselves, other values need the byte after them
+                if previous_end > common_end or (
+                    previous_end == common_end and previous_buf[previous_start] not in _SELF_DELIMITED
+                ):
+                    break
+                end = previous_end + shift
+                spans[previous_key] = (previous_start + shift, end)
+                reused.add(previous_key)
+            if end is not None:
+                return end
+
+        end = skip_value(buf, start)
+        spans[key] = (start, end)
+        return end
+
+    return scan_object(buf, pos, reuse_member)
+
+
+def decode(buf: Buffer, span: Span) -> Any:
+    return json.loads(bytes(buf[span[0] : span[1]]))
+
+
+class LazyMapping(Mapping[str, _V]):
+    """
+    Mapping of json object members which are decoded by `parse` on first access.
+
+    `reused` are the members which are the same as in the `previous` mapping of an
+    earlier version of the object, their decoded values are taken over.
+    `compared_with` are the spans of `previous`, None without one.
+    """
+
+    def __init__(
+        self,
+        buf: Buffer,
+        spans: Dict[str, Span],
+        parse: Callable[[Any], _V],
+        previous: "Optional[LazyMapping[_V]]" = None,
+        reused: AbstractSet[str] = frozenset(),
+    ):
+        self.buf = buf
+        self.spans = spans
+        self.parse = parse
+        self.reused = reused
+        self.compared_with = None if previous is None else previous.spans
+        self._values: Dict[str, _V] = {}
+        if previous is not None and previous.parse == parse:
+            self._values = {key: value for key, value in previous._values.items() if key in reused}
+
+    def __getitem__(self, key: str) -> _V:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = self.parse(decode(self.buf, self.spans[key]))
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.spans
+
+    def raw(self, key: str) -> bytes:
+        start, end = self.spans[key]
+        return bytes(self.buf[start:end])
+
+
+class WorkflowStatusView:
+    """
+    `v1alpha1.WorkflowStatus` whose nodes and stored templates are decoded on access,
+    the other fields are read from a `CompactWorkflowStatus`
+    """
+
+    def __init__(
+        self,
+        status: CompactWorkflowStatus,
+        nodes: Optional[LazyMapping[Any]],
+        stored_templates: Optional[LazyMapping[v1alpha1.Template]],
+    ):
+        self._status = status
+        self.nodes = nodes
+        self.storedTemplates = stored_templates
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._status, item)
+
+
+class WorkflowView:
+    """
+    `v1alpha1.Workflow` read from a json document, see `parse_workflow`
+    """
+
+    def __init__(
+        self,
+        buf: Buffer,
+        fields: Dict[str, Any],
+        status: Optional[WorkflowStatusView],
+        span: Optional[Span] = None,
+    ):
+        self.buf = buf
+        # where the document is in `buf`
+        self.span = (0, len(buf)) if span is None else span
+        self._fields = fields
+        self.apiVersion: Optional[str] = fields.get("apiVersion")
+        self.kind: Optional[str] = fields.get("kind")
+        self.status = status
+        self._metadata: Optional[meta_v1.ObjectMeta] = None
+        self._spec: Optional[v1alpha1.WorkflowSpec] = None
+
+    def field(self, name: str) -> Any:
+        """
+        Decoded json of a top level field, without validating it
+        """
+        return self._fields.get(name)
+
+    @property
+    def metadata(self) -> meta_v1.ObjectMeta:
+        if self._metadata is None:
+            self._metadata = meta_v1.ObjectMeta.parse_obj(self._fields["metadata"])
+        return self._metadata
+
+    @property
+    def spec(self) -> v1alpha1.WorkflowSpec:
+        if self._spec is None:
+            self._spec = v1alpha1.WorkflowSpec.parse_obj(self._fields["spec"])
+        return self._spec
+
+    def to_model(self) -> v1alpha1.Workflow:
+        """
+        Decode the whole document into a `v1alpha1.Workflow`
+        """
+        return v1alpha1.Workflow.parse_raw(bytes(self.buf[self.span[0] : self.span[1]]))
+
+
+def parse_workflow(
+    buf: Union[Buffer, str],
+    node_class: Callable[[Any], Any] = v1alpha1.NodeStatus.parse_obj,
+    previous: Union[WorkflowView, Callable[[Dict[str, Any]], Optional[WorkflowView]], None] = None,
+    pos: int = 0,
+) -> WorkflowView:
+    """
+    Index a workflow json document, `node_class` turns the decoded nodes into
+    objects, e.g. `argo_dsl.status.CompactNodeStatus`.
+
+    `previous` is the view of an earlier version of the same workflow, nodes and
+    stored templates which did not change since are not scanned again. It can also
+    be looked up by a function of the fields decoded before `status`, such as
+    `metadata`. `pos` is where the document starts in `buf`, the view's `span`
+    tells where it ends.
+    """
+    if isinstance(buf, str):
+        buf = buf.encode()
+
+    fields: Dict[str, Any] = {}
+    status_fields: Optional[Dict[str, Any]] = None
+    lazy_fields: Dict[str, Dict[str, Span]] = {}
+
+    previous_mappings: Dict[str, LazyMapping[Any]] = {}
+    reused: Dict[str, Set[str]] = {key: set() for key in LAZY_STATUS_FIELDS}
+
+    def find_previous():
+        view = previous(fields) if callable(previous) else previous
+        if view is not None and view.status is not None:
+            for key in LAZY_STATUS_FIELDS:
+                mapping = getattr(view.status, key)
+                if mapping is not None:
+                    previous_mappings[key] = mapping
+
+    def eager_member(fields: Dict[str, Any], key: str, start: int) -> int:
+        end = skip_value(buf, start)
+        fields[key] = decode(buf, (start, end))
+        return end
+
+    def status_member(key: str, start: int) -> int:
+        assert status_fields is not None
+        if key in LAZY_STATUS_FIELDS and buf[start : start + 1] == b"{":
+            lazy_fields[key] = {}
+            mapping = previous_mappings.get(key)
+            hint = None if mapping is None else (mapping.buf, mapping.spans)
+            return index_object(buf, start, lazy_fields[key], hint, reused[key])
+        return eager_member(status_fields, key, start)
+
+    def member(key: str, start: int) -> int:
+        nonlocal status_fields
+        if key == "status" and buf[start : start + 1] == b"{":
+            status_fields = {}
+            find_previous()
+            return scan_object(buf, start, status_member)
+        return eager_member(fields, key, start)
+
+    end = scan_object(buf, pos, member)
+
+    status: Optional[WorkflowStatusView] = None
+    if status_fields is not None:
+        mappings: Dict[str, Optional[LazyMapping[Any]]] = {}
+        for key, parse in (("nodes", node_class), ("storedTemplates", v1alpha1.Template.parse_obj)):
+            spans = lazy_fields.get(key)
+            mappings[key] = (
+                None if spans is None else LazyMapping(buf, spans, parse, previous_mappings.get(key), reused[key])
+            )
+        status = WorkflowStatusView(
+            CompactWorkflowStatus(status_fields), mappings["nodes"], mappings["storedTemplates"]
+        )
+
+    return WorkflowView(buf, fields, status, (pos, end))
+
+
+def load_workflow(path: str, **kwargs: Any) -> WorkflowView:
+    """
+    Index a workflow json file, the file is memory mapped rather than read
+    """
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return parse_workflow(buf, **kwargs)
@@ -0,0 +1,240 @@
+"""
+Incremental consumer of workflow watch streams.
+
+Every MODIFIED event of a workflow watch carries the whole workflow. `WatchConsumer`
+keeps the last document of every workflow and indexes each new one with
+`argo_dsl.view.parse_workflow`, which only records the byte spans of the nodes.
+Nodes whose bytes are the same as in the previous document keep their decoded
+object, only added and modified nodes are decoded again. Every event yields a
+`NodeChange` per added, modified or deleted node.
+"""
+from typing import AbstractSet
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .nodes import iter_compressed_nodes
+from .status import CompactNodeStatus
+from .view import Buffer
+from .view import Span
+from .view import WorkflowView
+from .view import decode
+from .view import parse_workflow
+from .view import scan_object
+from .view import skip_value
+
+
+ADDED = "ADDED"
+MODIFIED = "MODIFIED"
+DELETED = "DELETED"
+
+WorkflowKey = Tuple[Optional[str], Optional[str]]
+
+
+class NodeChange:
+    """
+    A node of workflow `key` (namespace, name) was added, modified or deleted. `node` is
+    None for deleted nodes and `previous` for added ones.
+    """
+
+    __slots__ = ("type", "key", "node_id", "node", "previous")
+
+    def __init__(self, type: str, key: WorkflowKey, node_id: str, node: Any, previous: Any):
+        self.type = type
+        self.key = key
+        self.node_id = node_id
+        self.node = node
+        self.previous = previous
+
+    def __repr__(self) -> str:
+        return f"NodeChange(type={self.type!r}, key={self.key!r}, node_id={self.node_id!r})"
+
+
+class WorkflowState:
+    """
+    The last known document of a workflow and its decoded nodes
+    """
+
+    def __init__(self, key: WorkflowKey):
+        self.key = key
+        self.workflow: Optional[WorkflowView] = None
+        self.nodes: Dict[str, Any] = {}
+        self.resource_version: Optional[str] = None
+        # the bytes the spans of the nodes point into
+        self._buf: Buffer = b""
+        self._spans: Dict[str, Span] = {}
+
+
+def _unchanged(state: WorkflowState, buf: Buffer, spans: Dict[str, Span]) -> AbstractSet[str]:
+    previous_buf, previous_spans = state._buf, state._spans
+    unchanged = set()
+    for node_id, (start, end) in spans.items():
+        span = previous_spans.get(node_id)
+        if (
+            span is not None
+            and span[1] - span[0] == end - start
+            and memoryview(previous_buf)[span[0] : span[1]] == memoryview(buf)[start:end]
+        ):
+            unchanged.add(node_id)
+    return unchanged
+
+
+def _node_spans(state: WorkflowState, workflow: WorkflowView) -> Tuple[Buffer, Dict[str, Span], AbstractSet[str]]:
+    """
+    The nodes of `workflow` and the ids of those which did not change since `state`
+    """
+    status = workflow.status
+    if status is None:
+        return b"", {}, frozenset()
+    elif status.nodes is not None:
+        nodes = status.nodes
+        if nodes.compared_with is not None and nodes.compared_with is state._spans:
+            # parse_workflow already compared the nodes with those of the previous view,
+            # it only finds it when the metadata comes before the status
+            return nodes.buf, nodes.spans, nodes.reused
+        return nodes.buf, nodes.spans, _unchanged(state, nodes.buf, nodes.spans)
+    elif status.compressedNodes is not None:
+        # lay the inflated nodes out one after the other to compare them like the others
+        buf = bytearray()
+        spans: Dict[str, Span] = {}
+        for node_id, raw in iter_compressed_nodes(status.compressedNodes):
+            spans[node_id] = (len(buf), len(buf) + len(raw))
+            buf += raw
+        return buf, spans, _unchanged(state, buf, spans)
+    return b"", {}, frozenset()
+
+
+def _metadata_key(metadata: Any) -> WorkflowKey:
+    metadata = metadata or {}
+    return metadata.get("namespace"), metadata.get("name")
+
+
+def _watch_event(
+    buf: Buffer,
+    parse: Callable[[int], WorkflowView],
+) -> Tuple[Optional[str], Optional[WorkflowView], Optional[Span]]:
+    """
+    Type, workflow and the span of the object of a watch event, either a Kubernetes
+    watch event or an Argo Server event stream line wrapping one in `result`. The
+    object of ADDED, MODIFIED and DELETED events is indexed by `parse` right where
+    it is, which needs the type to come first as both servers write it.
+    """
+    event_type: Optional[str] = None
+    workflow: Optional[WorkflowView] = None
+    span: Optional[Span] = None
+
+    def member(key: str, start: int) -> int:
+        nonlocal event_type, workflow, span
+        if key == "result" and buf[start : start + 1] == b"{":
+            return scan_object(buf, start, member)
+        elif key == "object" and event_type in (ADDED, MODIFIED, DELETED):
+            workflow = parse(start)
+            span = workflow.span
+            return span[1]
+
+        end = skip_value(buf, start)
+        if key == "type":
+            event_type = decode(buf, (start, end))
+        elif key == "object":
+            span = (start, end)
+        return end
+
+    scan_object(buf, 0, member)
+    return event_type, workflow, span
+
+
+class WatchConsumer:
+    """
+    Keeps the state of every watched workflow, see the module docstring. Nodes are
+    decoded by `node_class`, `argo_dsl.status.CompactNodeStatus` by default.
+    """
+
+    def __init__(self, node_class: Callable[[Any], Any] = CompactNodeStatus.parse_obj):
+        self.node_class = node_class
+        self.workflows: Dict[WorkflowKey, WorkflowState] = {}
+        self.resource_version: Optional[str] = None
+
+    def apply(self, event: Union[Buffer, str]) -> List[NodeChange]:
+        """
+        Apply one raw watch event, returns the node changes it made
+        """
+        buf = event.encode() if isinstance(event, str) else event
+
+        def previous(fields: Dict[str, Any]) -> Optional[WorkflowView]:
+            state = self.workflows.get(_metadata_key(fields.get("metadata")))
+            return None if state is None else state.workflow
+
+        def parse(pos: int) -> WorkflowView:
+            return parse_workflow(buf, self.node_class, previous=previous, pos=pos)
+
+        event_type, workflow, span = _watch_event(buf, parse)
+        if workflow is not None:
+            return self.delete(workflow) if event_type == DELETED else self.update(workflow)
+
+        # BOOKMARK and ERROR events change no workflow
+        if span is not None:
+            metadata = decode(buf, span).get("metadata") or {}
+            self.resource_version = metadata.get("resourceVersion", self.resource_version)
+        return []
+
+    def consume(self, events: Iterable[Union[bytes, str]]) -> Iterator[NodeChange]:
+        """
+        Apply a stream of raw watch events, e.g. the lines of a watch response
+        """
+        for event in events:
+            if event.strip():
+                yield from self.apply(event)
+
+    def update(self, workflow: WorkflowView) -> List[NodeChange]:
+        key = self._key(workflow)
+        state = self.workflows.get(key)
+        if state is None:
+            state = self.workflows[key] = WorkflowState(key)
+
+        buf, spans, unchanged = _node_spans(state, workflow)
+        previous_spans = state._spans
+        nodes = state.nodes
+        changes: List[NodeChange] = []
+
+        for node_id, span in spans.items():
+            if node_id in unchanged:
+                continue
+
+            node = self.node_class(decode(buf, span))
+            previous = nodes.get(node_id)
+            nodes[node_id] = node
+            changes.append(NodeChange(MODIFIED if node_id in previous_spans else ADDED, key, node_id, node, previous))
+
+        if len(previous_spans) + sum(change.type == ADDED for change in changes) != len(spans):
+            for node_id in [node_id for node_id in previous_spans if node_id not in spans]:
+                changes.append(NodeChange(DELETED, key, node_id, None, nodes.pop(node_id)))
+
+        state.workflow = workflow
+        state._buf, state._spans = buf, spans
+        self._set_resource_version(state, workflow)
+        return changes
+
+    def delete(self, workflow: WorkflowView) -> List[NodeChange]:
+        key = self._key(workflow)
+        state = self.workflows.pop(key, None)
+        self._set_resource_version(state, workflow)
+        if state is None:
+            return []
+        return [NodeChange(DELETED, key, node_id, None, node) for node_id, node in state.nodes.items()]
+
+    def _key(self, workflow: WorkflowView) -> WorkflowKey:
+        return _metadata_key(workflow.field("metadata"))
+
+    def _set_resource_version(self, state: Optional[WorkflowState], workflow: WorkflowView):
+        metadata = workflow.field("metadata") or {}
+        resource_version = metadata.get("resourceVersion")
+        if resource_version is not None:
+            self.resource_version = resource_version
+            if state is not None:
+                state.resource_version = resource_version
@@ -0,0 +1,66 @@
+"""
+Per-template and per-host rollups of a 1M node corpus, python loops over the nodes
+against argo_dsl.analytics.NodeTable. Needs numpy.
+
+    python benchmarks/analytics.py
+"""
+import time
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from status import new_status  # type: ignore
+
+from argo_dsl.analytics import NodeTableBuilder
+from argo_dsl.status import CompactWorkflowStatus
+
+
+WORKFLOWS = 50
+NODES = 20000
+
+
+def python_rollup(statuses: List[Any]) -> Dict[str, Any]:
+    durations: Dict[str, List[float]] = {}
+    cpu: Dict[str, float] = {}
+    for status in statuses:
+        for node in status.nodes.values():
+            if node.startedAt is not None and node.finishedAt is not None:
+                seconds = (node.finishedAt - node.startedAt).total_seconds()
+                durations.setdefault(node.templateName, []).append(seconds)
+            if node.resourcesDuration:
+                cpu[node.hostNodeName] = cpu.get(node.hostNodeName, 0) + node.resourcesDuration.get("cpu", 0)
+
+    return {
+        "durations": {
+            name: (len(values), sum(values) / len(values), min(values), max(values))
+            for name, values in durations.items()
+        },
+        "cpu": cpu,
+    }
+
+
+def main():
+    statuses = [CompactWorkflowStatus(new_status(NODES)) for _ in range(WORKFLOWS)]
+    print(f"{WORKFLOWS * (NODES + 1)} nodes")
+
+    start = time.perf_counter()
+    python_rollup(statuses)
+    print(f"{'python loops':<24}{(time.perf_counter() - start) * 1000:>10.1f}ms")
+
+    start = time.perf_counter()
+    builder = NodeTableBuilder()
+    for i, status in enumerate(statuses):
+        builder.add_status(status, f"fanout-{i}")
+    table = builder.build()
+    print(f"{'NodeTable load':<24}{(time.perf_counter() - start) * 1000:>10.1f}ms")
+
+    start = time.perf_counter()
+    table.durations_by("template")
+    table.resources_by("host", "cpu")
+    table.queue_delays_by("phase")
+    print(f"{'NodeTable rollups':<24}{(time.perf_counter() - start) * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
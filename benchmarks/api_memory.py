@@ -0,0 +1,46 @@
+"""
+Resident memory after importing every model of `argo_dsl.api`, with and without slim loading.
+
+    python benchmarks/api_memory.py
+"""
+import os
+import subprocess
+import sys
+
+
+CODE = """
+import gc
+import resource
+import sys
+
+import pydantic
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+from argo_dsl.manifest import api_models
+
+api_models()
+gc.collect()
+
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+print((after - before) / (1024 * 1024 if sys.platform == "darwin" else 1024))
+"""
+
+
+def api_rss(slim: bool) -> float:
+    env = {**os.environ, "ARGO_DSL_SLIM_API": "1" if slim else "0"}
+    return float(subprocess.check_output([sys.executable, "-c", CODE], env=env))
+
+
+def main():
+    full = api_rss(slim=False)
+    slim = api_rss(slim=True)
+
+    print(f"full {full:>8.1f}MB")
+    print(f"slim {slim:>8.1f}MB")
+    print(f"diff {full - slim:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
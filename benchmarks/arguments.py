@@ -0,0 +1,85 @@
+"""
+Parameter sizes of typical python_template arguments, pickled as hex as
+python_template used to, with each argo_dsl.arguments codec with and without
+compression, and pickled against the shorter of pickled and encoded by the type
+codecs. Then the time the script takes to decode them.
+
+    python benchmarks/arguments.py
+"""
+import pickle
+import random
+import time
+
+import numpy as np
+
+from argo_dsl import arguments as arguments_module
+from argo_dsl.arguments import ARGUMENT_CODECS
+from argo_dsl.arguments import Base85Codec
+
+
+def arguments():
+    rng = random.Random(0)
+    return {
+        "config dict": {
+            "model": "resnet50",
+            "learning_rate": 0.001,
+            "layers": [64, 128, 256, 512],
+            "augment": {"flip": True, "crop": 224, "mean": [0.485, 0.456, 0.406]},
+        },
+        "1000 records": [
+            {"id": i, "name": f"user-{i}", "score": rng.random(), "tags": ["a", "b"]} for i in range(1000)
+        ],
+        "10000 ints": [rng.randrange(1000) for _ in range(10000)],
+        "64KB bytes": bytes(rng.randrange(16) for _ in range(65536)),
+        "float64[10000]": np.random.default_rng(0).normal(size=10000),
+        "int32[100, 100]": np.arange(10000, dtype=np.int32).reshape(100, 100),
+    }
+
+
+def pickled(function, *args):
+    codecs = arguments_module.TYPE_CODECS
+    arguments_module.TYPE_CODECS = {}
+    try:
+        return function(*args)
+    finally:
+        arguments_module.TYPE_CODECS = codecs
+
+
+def decode_time(decode, text: str) -> float:
+    runs = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 0.2:
+        decode(text)
+        runs += 1
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    codecs = [("hex", None), ("base64", None), ("base85", None), ("base64", 256), ("base85", 256)]
+    header = f"{'pickled argument':<20}{'pickle':>10}{'old hex':>10}"
+    for name, compress_over in codecs:
+        header += f"{name + (' zlib' if compress_over else ''):>14}"
+    print(header)
+    for label, argument in arguments().items():
+        size = len(pickle.dumps(argument))
+        row = f"{label:<20}{size:>10}{size * 2:>10}"
+        for name, compress_over in codecs:
+            text = pickled(ARGUMENT_CODECS[name](compress_over=compress_over).encode, argument)
+            row += f"{len(text):>9}{len(text) / (size * 2):>5.0%}"
+        print(row)
+
+    codec = Base85Codec()
+    namespace: dict = {}
+    exec(codec.decoder_source(), namespace)
+    decode = namespace["_decode_argument"]
+    print(f"\n{'base85 zlib':<20}{'pickled':>10}{'shorter':>14}{'decode pickled':>18}{'decode shorter':>16}")
+    for label, argument in arguments().items():
+        old = pickled(codec.encode, argument)
+        new = codec.encode(argument)
+        row = f"{label:<20}{len(old):>10}{len(new):>9}{len(new) / len(old):>5.0%}"
+        row += f"{decode_time(decode, old) * 1e6:>16.0f}us{decode_time(decode, new) * 1e6:>14.0f}us"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+argo_dsl.bulk.bulk_submit of parameterized submissions against
+argo_dsl.testing.StubArgoServer answering after LATENCY seconds and failing
+ERROR_RATE of the requests with 503, at several limits of in-flight requests.
+
+    python benchmarks/bulk.py
+"""
+import asyncio
+import threading
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.bulk import Backoff
+from argo_dsl.bulk import bulk_submit
+from argo_dsl.client import ArgoClient
+from argo_dsl.testing import StubArgoServer
+
+
+LATENCY = 0.005
+ERROR_RATE = 0.02
+SUBMISSIONS = 5000
+
+TEMPLATE = v1alpha1.Workflow.parse_obj(
+    {"metadata": {"generateName": "sweep-"}, "spec": {"workflowTemplateRef": {"name": "sweep"}}}
+)
+
+
+def arguments(i: int) -> v1alpha1.Arguments:
+    return v1alpha1.Arguments(
+        parameters=[
+            v1alpha1.Parameter(name="learning-rate", value=str(i / SUBMISSIONS)),
+            v1alpha1.Parameter(name="seed", value=str(i)),
+        ]
+    )
+
+
+def serve_in_thread() -> StubArgoServer:
+    server = StubArgoServer(latency=LATENCY, error_rate=ERROR_RATE, seed=0)
+    started = threading.Event()
+
+    async def serve():
+        await server.start()
+        started.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    started.wait()
+    return server
+
+
+async def submit(server: StubArgoServer, max_in_flight: int):
+    async with ArgoClient(server.url, namespace="argo", concurrency=max_in_flight) as client:
+        items = (arguments(i) for i in range(SUBMISSIONS))
+        backoff = Backoff(base=0.01, seed=0)
+        return await bulk_submit(client, items, workflow=TEMPLATE, max_in_flight=max_in_flight, backoff=backoff)
+
+
+def main():
+    server = serve_in_thread()
+    print(f"{SUBMISSIONS} submissions, {LATENCY * 1000:.0f}ms server latency, {ERROR_RATE:.0%} errors")
+    print(f"{'in flight':<12}{'rate':>10}{'retries':>10}{'failed':>8}{'p50':>10}{'p99':>10}")
+    for max_in_flight in (1, 16, 64):
+        report = asyncio.run(submit(server, max_in_flight))
+        latency = report.submit_latency
+        print(
+            f"{max_in_flight:<12}{report.rate:>8.0f}/s{report.retries:>10}{len(report.failed):>8}"
+            f"{latency.quantile(0.5) * 1000:>8.1f}ms{latency.quantile(0.99) * 1000:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Workflow submissions per second against argo_dsl.testing.StubArgoServer, which
+answers after LATENCY seconds like an Argo Server busy with the Kubernetes API.
+A blocking http.client loop with a new connection per request and one with a
+persistent connection against argo_dsl.client.ArgoClient at several concurrencies.
+
+    python benchmarks/client.py
+"""
+import asyncio
+import http.client
+import threading
+import time
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import dump_body
+from argo_dsl.testing import StubArgoServer
+
+
+LATENCY = 0.005
+SUBMISSIONS = 2000
+
+WORKFLOW = v1alpha1.Workflow.parse_obj(
+    {
+        "metadata": {"generateName": "hello-"},
+        "spec": {
+            "entrypoint": "main",
+            "arguments": {"parameters": [{"name": "message", "value": "hello"}]},
+            "templates": [{"name": "main", "container": {"image": "alpine", "command": ["echo", "hello"]}}],
+        },
+    }
+)
+
+
+def serve_in_thread() -> StubArgoServer:
+    server = StubArgoServer(latency=LATENCY)
+    started = threading.Event()
+
+    async def serve():
+        await server.start()
+        started.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    started.wait()
+    return server
+
+
+def blocking(server: StubArgoServer, submissions: int, keep_alive: bool) -> float:
+    headers = {"Content-Type": "application/json"}
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection(server.host, server.port)
+    for _ in range(submissions):
+        body = dump_body(v1alpha1.WorkflowCreateRequest(namespace="argo", workflow=WORKFLOW))
+        if not keep_alive:
+            connection = http.client.HTTPConnection(server.host, server.port)
+        connection.request("POST", "/api/v1/workflows/argo", body, headers)
+        response = connection.getresponse()
+        v1alpha1.Workflow.parse_raw(response.read())
+        if not keep_alive:
+            connection.close()
+    connection.close()
+    return submissions / (time.perf_counter() - start)
+
+
+async def concurrent(server: StubArgoServer, submissions: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    async with ArgoClient(server.url, namespace="argo", concurrency=concurrency) as client:
+        await asyncio.gather(*(client.create_workflow(WORKFLOW) for _ in range(submissions)))
+    return submissions / (time.perf_counter() - start)
+
+
+def main():
+    server = serve_in_thread()
+    print(f"{SUBMISSIONS} submissions, {LATENCY * 1000:.0f}ms server latency")
+    print(f"{'blocking, connection per request':<36}{blocking(server, SUBMISSIONS // 4, False):>10.0f}/s")
+    print(f"{'blocking, keep-alive':<36}{blocking(server, SUBMISSIONS // 4, True):>10.0f}/s")
+    for concurrency in (1, 8, 32, 128):
+        rate = asyncio.run(concurrent(server, SUBMISSIONS, concurrency))
+        print(f"{f'ArgoClient, concurrency {concurrency}':<36}{rate:>10.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Compiling every template of a library module of FUNCTIONS decorated functions
+with argo_dsl.build.compile_all, in this process and across every core.
+
+    python benchmarks/compile_all.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+from function_source import write_module  # type: ignore
+
+from argo_dsl.build import compile_all
+
+
+FUNCTIONS = 3000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        write_module(directory, "library", FUNCTIONS)
+        sys.path.insert(0, directory)
+        import library  # type: ignore
+
+        # the first compile of each kind of template pays for lazy imports and caches
+        compile_all([library], processes=1)
+        print(f"{FUNCTIONS} functions")
+        for name, processes in [("in process", 1), (f"{os.cpu_count()} cores", None)]:
+            start = time.perf_counter()
+            manifests = compile_all([library], processes=processes, chunk_size=64)
+            elapsed = time.perf_counter() - start
+            assert len(manifests) == FUNCTIONS
+            print(f"{name:<16}{FUNCTIONS / elapsed:>10.0f} templates/s")
+
+
+if __name__ == "__main__":
+    main()
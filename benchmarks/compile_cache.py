@@ -0,0 +1,55 @@
+"""
+A fresh process importing a template library module of FUNCTIONS decorated
+functions and compiling every template, without the compile cache, with an empty
+cache and with a warm one. The generated models are built and the library is
+byte-compiled before.
+
+    python benchmarks/compile_cache.py
+"""
+import os
+import py_compile
+import subprocess
+import sys
+import tempfile
+
+from function_source import write_module  # type: ignore
+
+
+FUNCTIONS = 800
+
+PROGRAM = """
+import time
+
+import argo_dsl.decorator
+from argo_dsl.api.io.argoproj.workflow.v1alpha1 import Template as _
+from argo_dsl.template import Template
+
+start = time.perf_counter()
+import library
+
+for value in list(vars(library).values()):
+    if isinstance(value, type) and issubclass(value, Template):
+        value()
+print(time.perf_counter() - start)
+"""
+
+
+def run(directory: str, cache: str) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory] + sys.path), ARGO_DSL_COMPILE_CACHE=cache)
+    output = subprocess.run([sys.executable, "-c", PROGRAM], env=env, check=True, capture_output=True, text=True)
+    return float(output.stdout)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        write_module(directory, "library", FUNCTIONS)
+        py_compile.compile(os.path.join(directory, "library.py"))
+        cache = os.path.join(directory, "cache")
+        print(f"{FUNCTIONS} functions")
+        for name, cache_dir in [("no cache", ""), ("cold cache", cache), ("warm cache", cache)]:
+            elapsed = run(directory, cache_dir)
+            print(f"{name:<16}{elapsed * 1e3:>10.1f}ms{elapsed / FUNCTIONS * 1e6:>10.1f}us per function")
+
+
+if __name__ == "__main__":
+    main()
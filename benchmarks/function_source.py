@@ -0,0 +1,74 @@
+"""
+Importing a template library module of FUNCTIONS functions decorated with
+python_template, bash_template and script_template, each decorated function
+reading its own source.
+
+    python benchmarks/function_source.py
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+import argo_dsl.decorator  # noqa: F401, imported before the libraries are timed
+
+
+FUNCTIONS = [100, 200, 400, 800]
+
+HEADER = """\
+from argo_dsl.decorator import bash_template
+from argo_dsl.decorator import python_template
+from argo_dsl.decorator import script_template
+"""
+
+DEFINITIONS = [
+    """
+@python_template(image="python:3.8")
+def step_{i}(
+    a: str,
+    b: int = {i},
+    c: float = 0.5,
+):
+    import json
+
+    rows = [{{"index": index, "a": a}} for index in range(b)]
+    for row in rows:
+        print(json.dumps(row))
+""",
+    '''
+@bash_template(image="alpine")
+def echo_{i}(message: str):
+    """
+    echo "$message" {i}
+    """
+''',
+    """
+@script_template(image="alpine", command="sh")
+def render_{i}(name: str) -> str:
+    return "echo rendering {i} {{{{inputs.parameters.name}}}}"
+""",
+]
+
+
+def write_module(directory: str, name: str, functions: int):
+    with open(os.path.join(directory, f"{name}.py"), "w") as file:
+        file.write(HEADER)
+        for i in range(functions):
+            file.write(DEFINITIONS[i % len(DEFINITIONS)].format(i=i))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for functions in FUNCTIONS:
+            name = f"library_{functions}"
+            write_module(directory, name, functions)
+            start = time.perf_counter()
+            importlib.import_module(name)
+            elapsed = time.perf_counter() - start
+            print(f"{functions:>5} functions{elapsed * 1e3:>10.1f}ms{elapsed / functions * 1e6:>10.1f}us per function")
+
+
+if __name__ == "__main__":
+    main()
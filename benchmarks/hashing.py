@@ -0,0 +1,81 @@
+"""
+Hashing WORKFLOWS workflows of TEMPLATES templates each, drawn from a library of
+LIBRARY compiled templates of which only DISTINCT differ, with a new ContentHasher
+per workflow against one shared hasher, and deduping their templates.
+
+    python benchmarks/hashing.py
+"""
+import random
+import time
+
+from typing import ClassVar
+from typing import List
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.hashing import ContentHasher
+from argo_dsl.hashing import dedupe_templates
+from argo_dsl.manifest import to_json_bytes
+from argo_dsl.template import ScriptTemplate
+from argo_dsl.template import new_model
+
+
+WORKFLOWS = 300
+TEMPLATES = 50
+LIBRARY = 200
+DISTINCT = 40
+
+
+def new_library() -> List[v1alpha1.Template]:
+    templates = []
+    for i in range(LIBRARY):
+
+        class Step(ScriptTemplate):
+            name: ClassVar[str] = f"step-{i}"
+            image = "python:3.8"
+            source = f"import sys\nprint('step', {i % DISTINCT}, sys.argv)\n" * 20
+
+            class Parameters:
+                index: str = str(i % DISTINCT)
+                mode: str = "fast"
+
+        templates.append(Step().template)
+    return templates
+
+
+def new_workflows() -> List[v1alpha1.Workflow]:
+    rng = random.Random(0)
+    library = new_library()
+    workflows = []
+    for i in range(WORKFLOWS):
+        templates = rng.sample(library, TEMPLATES)
+        main = v1alpha1.Template(
+            name="main", steps=[[v1alpha1.WorkflowStep(name=f"s{j}", template=t.name)] for j, t in enumerate(templates)]
+        )
+        spec = new_model(v1alpha1.WorkflowSpec, entrypoint="main", templates=[main] + templates)
+        workflows.append(new_model(v1alpha1.Workflow, metadata={"name": f"pipeline-{i}"}, spec=spec))
+    return workflows
+
+
+def main():
+    workflows = new_workflows()
+    print(f"{WORKFLOWS} workflows, {TEMPLATES} of {LIBRARY} templates each")
+
+    shared = ContentHasher()
+    for name, hasher in [("hasher per workflow", ContentHasher), ("shared hasher", lambda: shared)]:
+        start = time.perf_counter()
+        for workflow in workflows:
+            hasher().content_hash(workflow)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24}{elapsed / WORKFLOWS * 1e3:>10.2f}ms per workflow")
+
+    start = time.perf_counter()
+    deduped = [dedupe_templates(workflow, shared) for workflow in workflows]
+    elapsed = time.perf_counter() - start
+    before = sum(len(to_json_bytes(workflow)) for workflow in workflows)
+    after = sum(len(to_json_bytes(workflow)) for workflow in deduped)
+    print(f"{'dedupe_templates':<24}{elapsed / WORKFLOWS * 1e3:>10.2f}ms per workflow")
+    print(f"{'JSON':<24}{before / 1e6:>10.1f}MB -> {after / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
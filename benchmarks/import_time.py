@@ -0,0 +1,44 @@
+"""
+Cold import time of argo_dsl modules with and without the lazy api loader.
+
+    python benchmarks/import_time.py
+"""
+import os
+import subprocess
+import sys
+
+
+MODULES = ["argo_dsl.template", "argo_dsl.decorator", "argo_dsl.api.io.argoproj.workflow.v1alpha1"]
+REPEAT = 5
+
+CODE = """
+import time
+
+import pydantic
+import yaml
+
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def cold_import(module: str, lazy: bool) -> float:
+    env = {**os.environ, "ARGO_DSL_LAZY_API": "1" if lazy else "0"}
+    timings = [
+        float(subprocess.check_output([sys.executable, "-c", CODE.format(module=module)], env=env))
+        for _ in range(REPEAT)
+    ]
+    return min(timings)
+
+
+def main():
+    print(f"{'module':<50}{'eager':>10}{'lazy':>10}")
+    for module in MODULES:
+        eager = cold_import(module, lazy=False)
+        lazy = cold_import(module, lazy=True)
+        print(f"{module:<50}{eager * 1000:>8.1f}ms{lazy * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
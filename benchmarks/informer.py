@@ -0,0 +1,102 @@
+"""
+Finding the running workflows of a team among WORKFLOWS workflows of NODES nodes:
+with a label selected list call to argo_dsl.testing.StubArgoServer, running in
+another process, against querying the store of an argo_dsl.informer.Informer.
+
+    python benchmarks/informer.py
+"""
+import asyncio
+import multiprocessing
+import time
+
+from typing import Any
+
+from status import new_status  # type: ignore
+
+from argo_dsl.client import ArgoClient
+from argo_dsl.informer import Informer
+from argo_dsl.listing import iter_workflows
+from argo_dsl.testing import StubArgoServer
+
+
+WORKFLOWS = 2000
+NODES = 20
+TEAMS = 10
+PHASES = ("Running", "Succeeded", "Failed")
+
+LIST_CALLS = 20
+QUERIES = 100_000
+
+
+def serve(connection: Any):
+    async def main():
+        server = StubArgoServer()
+        status = new_status(NODES)
+        for i in range(WORKFLOWS):
+            metadata = {
+                "name": f"wf-{i}",
+                "namespace": "argo",
+                "resourceVersion": str(i + 1),
+                "labels": {"team": str(i % TEAMS)},
+            }
+            workflow_status = {**status, "phase": PHASES[i % len(PHASES)]}
+            server.workflows[("argo", f"wf-{i}")] = {"metadata": metadata, "spec": {}, "status": workflow_status}
+        await server.start()
+        connection.send(server.url)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def list_running(client: ArgoClient) -> int:
+    return sum(
+        [
+            workflow.phase == "Running"
+            async for workflow in iter_workflows(client, label_selector="team=3", page_size=WORKFLOWS)
+        ]
+    )
+
+
+async def measure(url: str):
+    async with ArgoClient(url, namespace="argo") as client:
+        expected = await list_running(client)
+        start = time.perf_counter()
+        for _ in range(LIST_CALLS):
+            await list_running(client)
+        per_call = (time.perf_counter() - start) / LIST_CALLS
+        print(f"{'list call':<24}{per_call * 1e6:>12.1f}us")
+
+        informer = Informer(client)
+        start = time.perf_counter()
+        informer.start()
+        await informer.wait_synced()
+        print(f"{'informer sync':<24}{(time.perf_counter() - start) * 1e3:>12.1f}ms")
+
+        assert len(informer.find(phase="Running", labels={"team": "3"})) == expected
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            informer.find(phase="Running", labels={"team": "3"})
+        per_query = (time.perf_counter() - start) / QUERIES
+        print(f"{'informer find':<24}{per_query * 1e6:>12.1f}us")
+
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            informer.get("argo", "wf-3")
+        per_get = (time.perf_counter() - start) / QUERIES
+        print(f"{'informer get':<24}{per_get * 1e6:>12.3f}us")
+        await informer.stop()
+
+
+def main():
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(target=serve, args=(sender,), daemon=True)
+    server.start()
+    url = receiver.recv()
+
+    print(f"{WORKFLOWS} workflows of {NODES} nodes, the running ones of 1 of {TEAMS} teams")
+    asyncio.run(measure(url))
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+JSON of a workflow with a status of NODES nodes and of a workflow of TASKS DAG
+tasks: json.dumps of its to_manifest data against argo_dsl.manifest.to_json_bytes
+with the json and orjson backends.
+
+    python benchmarks/json_export.py
+"""
+import json
+import timeit
+
+from typing import Any
+from typing import Dict
+
+from status import new_status  # type: ignore
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.manifest import JSON_BACKENDS
+from argo_dsl.manifest import set_json_backend
+from argo_dsl.manifest import to_json_bytes
+from argo_dsl.manifest import to_manifest
+
+
+NODES = 5000
+TASKS = 2000
+NUMBER = 5
+
+
+def new_dag() -> Dict[str, Any]:
+    tasks = [
+        {
+            "name": f"t{i}",
+            "template": "work",
+            "dependencies": [f"t{i - 1}"] if i else None,
+            "arguments": {"parameters": [{"name": "index", "value": str(i)}]},
+        }
+        for i in range(TASKS)
+    ]
+    work = {
+        "name": "work",
+        "inputs": {"parameters": [{"name": "index"}]},
+        "container": {"image": "alpine", "command": ["echo", "{{inputs.parameters.index}}"]},
+    }
+    return {
+        "metadata": {"name": "dag"},
+        "spec": {"entrypoint": "main", "templates": [{"name": "main", "dag": {"tasks": tasks}}, work]},
+    }
+
+
+def to_manifest_json(workflow: v1alpha1.Workflow) -> bytes:
+    return json.dumps(to_manifest(workflow), separators=(",", ":"), default=str).encode()
+
+
+def main():
+    workflows = {
+        f"{NODES} node status": v1alpha1.Workflow.parse_obj(
+            {"metadata": {"name": "fanout"}, "spec": {"entrypoint": "main"}, "status": new_status(NODES)}
+        ),
+        f"{TASKS} task dag": v1alpha1.Workflow.parse_obj(new_dag()),
+    }
+    for name, workflow in workflows.items():
+        print(f"{name}, {len(to_json_bytes(workflow)) / 1e6:.1f}MB")
+        elapsed = timeit.timeit(lambda: to_manifest_json(workflow), number=NUMBER) / NUMBER
+        print(f"{'to_manifest+json':<24}{elapsed * 1e3:>10.1f}ms")
+        for backend in JSON_BACKENDS:
+            try:
+                set_json_backend(backend)
+            except ImportError:
+                continue
+            elapsed = timeit.timeit(lambda: to_json_bytes(workflow), number=NUMBER) / NUMBER
+            print(f"{'to_json_bytes ' + backend:<24}{elapsed * 1e3:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Linting WORKFLOWS workflows of a DAG of TASKS tasks with argo_dsl.lint, in this
+process and across every core.
+
+    python benchmarks/lint.py
+"""
+import os
+import time
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from argo_dsl.lint import Linter
+
+
+WORKFLOWS = 5000
+TASKS = 20
+
+
+def new_workflow(i: int) -> Dict[str, Any]:
+    tasks: List[Dict[str, Any]] = []
+    for j in range(TASKS):
+        task: Dict[str, Any] = {
+            "name": f"t{j}",
+            "template": "work",
+            "arguments": {"parameters": [{"name": "index", "value": str(j)}]},
+        }
+        if j:
+            task["dependencies"] = [f"t{j - 1}"]
+            task["arguments"]["parameters"].append(
+                {"name": "previous", "value": f"{{{{tasks.t{j - 1}.outputs.parameters.result}}}}"}
+            )
+        tasks.append(task)
+
+    work = {
+        "name": "work",
+        "inputs": {"parameters": [{"name": "index"}, {"name": "previous", "default": ""}]},
+        "container": {
+            "image": "alpine",
+            "args": ["{{inputs.parameters.index}}", "{{inputs.parameters.previous}}", "{{workflow.parameters.run}}"],
+        },
+        "outputs": {"parameters": [{"name": "result", "valueFrom": {"path": "/tmp/result"}}]},
+    }
+    return {
+        "metadata": {"name": f"wf-{i}"},
+        "spec": {
+            "entrypoint": "main",
+            "arguments": {"parameters": [{"name": "run", "value": str(i)}]},
+            "templates": [{"name": "main", "dag": {"tasks": tasks}}, work],
+        },
+    }
+
+
+def main():
+    workflows = [new_workflow(i) for i in range(WORKFLOWS)]
+    linter = Linter()
+
+    print(f"{WORKFLOWS} workflows of {TASKS} tasks")
+    for name, processes in [("in process", 1), (f"{os.cpu_count()} cores", None)]:
+        start = time.perf_counter()
+        results = linter.lint_all(workflows, processes=processes, chunk_size=64)
+        elapsed = time.perf_counter() - start
+        assert not any(results)
+        print(f"{name:<16}{WORKFLOWS / elapsed:>10.0f} workflows/s")
+
+
+if __name__ == "__main__":
+    main()
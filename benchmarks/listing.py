@@ -0,0 +1,86 @@
+"""
+Listing WORKFLOWS workflows of NODES nodes each from argo_dsl.testing.StubArgoServer,
+running in another process, as one v1alpha1.WorkflowList against paging through
+them with argo_dsl.listing.iter_workflows, with and without the field selection.
+Peak memory is that of the client process.
+
+    python benchmarks/listing.py
+"""
+import asyncio
+import multiprocessing
+import time
+import tracemalloc
+
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+from status import new_status  # type: ignore
+
+from argo_dsl.client import ArgoClient
+from argo_dsl.listing import iter_workflows
+from argo_dsl.testing import StubArgoServer
+
+
+WORKFLOWS = 2000
+NODES = 20
+
+
+def serve(connection: Any):
+    async def main():
+        server = StubArgoServer()
+        status = new_status(NODES)
+        for i in range(WORKFLOWS):
+            metadata = {"name": f"wf-{i}", "namespace": "argo", "labels": {"team": str(i % 10)}}
+            server.workflows[("argo", f"wf-{i}")] = {"metadata": metadata, "spec": {}, "status": status}
+        await server.start()
+        connection.send(server.url)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def whole_list(client: ArgoClient) -> int:
+    return len((await client.list_workflows()).items)
+
+
+async def paged(client: ArgoClient, **kwargs: Any) -> int:
+    count = 0
+    async for _ in iter_workflows(client, page_size=500, **kwargs):
+        count += 1
+    return count
+
+
+def measure(name: str, url: str, list_workflows: Callable[[ArgoClient], Awaitable[int]]):
+    async def main():
+        async with ArgoClient(url, namespace="argo") as client:
+            assert await list_workflows(client) == WORKFLOWS
+
+    # tracemalloc slows allocation down, time the listing separately
+    start = time.perf_counter()
+    asyncio.run(main())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    asyncio.run(main())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<28}{elapsed:>8.2f}s{peak / 1024 / 1024:>10.1f}MB peak")
+
+
+def main():
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(target=serve, args=(sender,), daemon=True)
+    server.start()
+    url = receiver.recv()
+
+    print(f"{WORKFLOWS} workflows of {NODES} nodes")
+    measure("WorkflowList", url, whole_list)
+    measure("iter_workflows, all fields", url, lambda client: paged(client, fields=None))
+    measure("iter_workflows", url, paged)
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
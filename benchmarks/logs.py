@@ -0,0 +1,67 @@
+"""
+Reading a LINES line workflow log of PODS pods with argo_dsl.logs: decoding every
+line into a pydantic v1alpha1.LogEntry against the compact reader, with and without
+a podName filter.
+
+    python benchmarks/logs.py
+"""
+import json
+import os
+import resource
+import tempfile
+import time
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.logs import read_log_file
+
+
+LINES = 1_000_000
+PODS = 20
+
+
+def write_log(path: str):
+    with open(path, "wb") as file:
+        for i in range(0, LINES, 1000):
+            file.write(
+                b"".join(
+                    json.dumps(
+                        {"result": {"podName": f"pipeline-{j % PODS}", "content": f"step {j}: processed batch {j * 7}"}}
+                    ).encode()
+                    + b"\n"
+                    for j in range(i, i + 1000)
+                )
+            )
+
+
+def pydantic_entries(path: str):
+    with open(path, "rb") as file:
+        for line in file:
+            yield v1alpha1.LogEntry.parse_obj(json.loads(line)["result"])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "workflow.log")
+        write_log(path)
+        size = os.path.getsize(path) / 1e6
+        print(f"{LINES} lines, {size:.0f}MB")
+
+        cases = [
+            ("pydantic", lambda: pydantic_entries(path), LINES),
+            ("compact", lambda: read_log_file(path), LINES),
+            ("compact, 1 pod", lambda: read_log_file(path, podName="pipeline-3"), LINES // PODS),
+            ("compact, 5 pods", lambda: read_log_file(path, podName=[f"pipeline-{i}" for i in range(5)]), LINES // 4),
+        ]
+        for name, read, expected in cases:
+            start = time.perf_counter()
+            count = sum(1 for _ in read())
+            elapsed = time.perf_counter() - start
+            assert count == expected
+            print(f"{name:<16}{size / elapsed:>10.1f}MB/s")
+
+    # entries are not kept, the peak is the one of writing the file
+    print(f"{'max rss':<16}{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
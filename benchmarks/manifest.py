@@ -0,0 +1,56 @@
+"""
+to_manifest against `.dict(exclude_none=True)` on a WorkflowTemplate with 5,000 templates.
+
+    python benchmarks/manifest.py
+"""
+import timeit
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.manifest import to_manifest
+
+
+TEMPLATES = 5000
+NUMBER = 5
+
+
+def new_workflow_template() -> v1alpha1.WorkflowTemplate:
+    templates = [
+        {
+            "name": f"step-{i}",
+            "inputs": {"parameters": [{"name": "a"}, {"name": "b", "default": str(i)}]},
+            "script": {
+                "image": "python:3.8",
+                "command": ["python"],
+                "source": f"print({i})",
+                "env": [{"name": "STEP", "value": str(i)}],
+                "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+            },
+            "retryStrategy": {"limit": 3},
+        }
+        for i in range(TEMPLATES)
+    ]
+    templates.append(
+        {
+            "name": "main",
+            "dag": {"tasks": [{"name": f"task-{i}", "template": f"step-{i}"} for i in range(TEMPLATES)]},
+        }
+    )
+
+    return v1alpha1.WorkflowTemplate.parse_obj(
+        {"metadata": {"name": "benchmark"}, "spec": {"entrypoint": "main", "templates": templates}}
+    )
+
+
+def main():
+    workflow_template = new_workflow_template()
+    assert to_manifest(workflow_template) == workflow_template.dict(exclude_none=True, by_alias=True)
+
+    exclude_none = min(timeit.repeat(lambda: workflow_template.dict(exclude_none=True), number=1, repeat=NUMBER))
+    manifest = min(timeit.repeat(lambda: to_manifest(workflow_template), number=1, repeat=NUMBER))
+
+    print(f"dict(exclude_none=True) {exclude_none * 1000:>8.1f}ms")
+    print(f"to_manifest             {manifest * 1000:>8.1f}ms ({exclude_none / manifest:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Linear scans over status.nodes against argo_dsl.nodes.NodeIndex lookups.
+
+    python benchmarks/node_index.py
+"""
+import time
+
+from typing import Any
+from typing import Callable
+
+from status import new_status  # type: ignore
+
+from argo_dsl.nodes import NodeIndex
+from argo_dsl.status import CompactWorkflowStatus
+
+
+NODES = 20000
+QUERIES = 1000
+
+
+def failed_leaves_scan(nodes: Any) -> Any:
+    return [node for node in nodes.values() if node.phase == "Failed" and not node.children]
+
+
+def step_nodes_scan(nodes: Any) -> Any:
+    return [node for node in nodes.values() if node.templateName == "step" and node.boundaryID == "fanout"]
+
+
+def measure(name: str, query: Callable[[], Any]):
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        query()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32}{elapsed / QUERIES * 1e6:>10.1f}us/query")
+
+
+def main():
+    nodes = CompactWorkflowStatus(new_status(NODES)).nodes
+
+    start = time.perf_counter()
+    index = NodeIndex(nodes)
+    print(f"index built in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    measure("failed leaves, scan", lambda: failed_leaves_scan(nodes))
+    measure("failed leaves, index (cached)", lambda: index.find(phase="Failed", leaf=True))
+    measure("step nodes, scan", lambda: step_nodes_scan(nodes))
+    measure("step nodes, index (cached)", lambda: index.find(template_name="step", boundary_id="fanout"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Parse time and retained memory of CompactWorkflowStatus against v1alpha1.WorkflowStatus.
+
+    python benchmarks/status.py
+"""
+import gc
+import json
+import time
+import tracemalloc
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.status import CompactWorkflowStatus
+
+
+NODES = 20000
+
+
+def new_status(nodes: int = NODES) -> Dict[str, Any]:
+    children = [f"fanout-{i}" for i in range(nodes)]
+    status: Dict[str, Any] = {
+        "phase": "Running",
+        "startedAt": "2021-01-01T00:00:00Z",
+        "nodes": {
+            "fanout": {
+                "id": "fanout",
+                "name": "fanout",
+                "displayName": "fanout",
+                "type": "Steps",
+                "templateName": "main",
+                "phase": "Running",
+                "startedAt": "2021-01-01T00:00:00Z",
+                "children": children,
+            }
+        },
+    }
+    for i, node_id in enumerate(children):
+        status["nodes"][node_id] = {
+            "id": node_id,
+            "name": f"fanout[0].step({i}:{i})",
+            "displayName": f"step({i}:{i})",
+            "type": "Pod",
+            "templateName": "step",
+            "templateScope": "local/fanout",
+            "phase": "Succeeded",
+            "boundaryID": "fanout",
+            "hostNodeName": f"node-{i % 50}",
+            "startedAt": "2021-01-01T00:00:00Z",
+            "finishedAt": "2021-01-01T00:01:00Z",
+            "resourcesDuration": {"cpu": 60, "memory": 60},
+            "inputs": {"parameters": [{"name": "item", "value": str(i)}]},
+            "outputs": {"parameters": [{"name": "result", "value": str(i * 2)}], "exitCode": "0"},
+        }
+
+    return status
+
+
+def measure(parse: Callable[[str], Any], raw: str):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    status = parse(raw)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del status
+    return elapsed, retained
+
+
+def main():
+    raw = json.dumps(new_status())
+
+    # tracemalloc slows allocation down, time the parse separately
+    for name, parse in [("pydantic", v1alpha1.WorkflowStatus.parse_raw), ("compact", CompactWorkflowStatus.parse_raw)]:
+        start = time.perf_counter()
+        parse(raw)
+        elapsed = time.perf_counter() - start
+        _, retained = measure(parse, raw)
+        print(f"{name:<10}{elapsed * 1000:>10.1f}ms{retained / 1024 / 1024:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Reading the phase of a large workflow with parse_workflow against v1alpha1.Workflow.parse_raw.
+
+    python benchmarks/view.py
+"""
+import json
+import time
+import tracemalloc
+
+from typing import Any
+from typing import Callable
+
+from status import new_status  # type: ignore
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.view import parse_workflow
+
+
+NODES = 50000
+
+
+def measure(name: str, read_phase: Callable[[bytes], Any], document: bytes):
+    # tracemalloc slows allocation down, time the read separately
+    start = time.perf_counter()
+    phase = read_phase(document)
+    elapsed = time.perf_counter() - start
+    assert phase == "Running"
+
+    tracemalloc.start()
+    read_phase(document)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<16}{elapsed * 1000:>10.1f}ms{peak / 1024 / 1024:>10.1f}MB peak")
+
+
+def main():
+    workflow = {"metadata": {"name": "fanout"}, "spec": {"entrypoint": "main"}, "status": new_status(NODES)}
+    document = json.dumps(workflow).encode()
+    print(f"document {len(document) / 1024 / 1024:.1f}MB")
+
+    measure("parse_raw", lambda d: v1alpha1.Workflow.parse_raw(d).status.phase, document)
+    measure("parse_workflow", lambda d: parse_workflow(d).status.phase, document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+MODIFIED events of a 20k node workflow which change two nodes each, re-validating the
+whole workflow against argo_dsl.watch.WatchConsumer.
+
+    python benchmarks/watch.py
+"""
+import json
+import time
+
+from typing import List
+
+from status import new_status  # type: ignore
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.watch import WatchConsumer
+
+
+NODES = 20000
+EVENTS = 20
+
+
+def new_events() -> List[bytes]:
+    workflow = {"metadata": {"name": "fanout", "namespace": "argo"}, "spec": {}, "status": new_status(NODES)}
+    events = [json.dumps({"type": "ADDED", "object": workflow}).encode()]
+    nodes = workflow["status"]["nodes"]
+    for i in range(EVENTS):
+        nodes[f"fanout-{2 * i}"]["phase"] = "Failed"
+        nodes[f"fanout-{2 * i + 1}"]["message"] = "retrying"
+        events.append(json.dumps({"type": "MODIFIED", "object": workflow}).encode())
+    return events
+
+
+def main():
+    events = new_events()
+    print(f"{len(events[0]) / 1024 / 1024:.1f}MB per event")
+
+    start = time.perf_counter()
+    for event in events[1:]:
+        v1alpha1.Workflow.parse_obj(json.loads(event)["object"])
+    print(f"{'full parse':<16}{(time.perf_counter() - start) / EVENTS * 1000:>10.1f}ms/event")
+
+    consumer = WatchConsumer()
+    consumer.apply(events[0])
+    start = time.perf_counter()
+    for event in events[1:]:
+        assert len(consumer.apply(event)) == 2
+    print(f"{'WatchConsumer':<16}{(time.perf_counter() - start) / EVENTS * 1000:>10.1f}ms/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Writing the YAML of a library of TEMPLATES script and container templates with
+yaml.dump and BlockDumper against argo_dsl.emitter.dump_yaml.
+
+    python benchmarks/yaml_dump.py
+"""
+import time
+
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import List
+
+import yaml
+
+from argo_dsl.emitter import dump_yaml
+from argo_dsl.template import ContainerTemplate
+from argo_dsl.template import ScriptTemplate
+from argo_dsl.utils import BlockDumper
+
+
+TEMPLATES = 3000
+
+SOURCE = """\
+import json
+import sys
+
+def step(index, data):
+    with open(data) as file:
+        rows = [json.loads(line) for line in file]
+    print(json.dumps({"index": index, "rows": len(rows)}))
+
+step(INDEX, "{{inputs.artifacts.data.path}}")
+"""
+
+
+def new_library() -> List[Dict[str, Any]]:
+    manifests = []
+    for i in range(TEMPLATES):
+        if i % 2:
+
+            class Step(ScriptTemplate):
+                name: ClassVar[str] = f"step-{i}"
+                image = "python:3.8"
+                source = SOURCE.replace("INDEX", str(i))
+
+                class Parameters:
+                    index: str = str(i)
+                    mode: str = "fast"
+
+        else:
+
+            class Step(ContainerTemplate):  # type: ignore[no-redef]
+                name: ClassVar[str] = f"step-{i}"
+                image = "alpine:3.13"
+                command = ["sh", "-c"]
+                args = [f"echo running step {i} of the library with {{{{inputs.parameters.mode}}}} && sleep 1", "true"]
+
+                class Parameters:
+                    mode: str = "fast"
+
+        manifests.append(Step().to_manifest())
+    return manifests
+
+
+def main():
+    manifests = new_library()
+    print(f"{TEMPLATES} templates")
+
+    results = []
+    for name, dump in [("BlockDumper", lambda data: yaml.dump(data, Dumper=BlockDumper)), ("dump_yaml", dump_yaml)]:
+        start = time.perf_counter()
+        results.append([dump(manifest) for manifest in manifests])
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16}{elapsed * 1e3:>10.1f}ms{elapsed / TEMPLATES * 1e6:>10.1f}us per template")
+
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
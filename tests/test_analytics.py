@@ -0,0 +1,109 @@
+import math
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.nodes import compress_nodes
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.status import CompactWorkflowStatus
+
+
+np = pytest.importorskip("numpy")
+
+from argo_dsl.analytics import NO_TIME  # noqa: E402
+from argo_dsl.analytics import NodeTable  # noqa: E402
+
+
+def node(node_id, type_, phase, started=None, finished=None, **fields):
+    data = {"id": node_id, "name": node_id, "type": type_, "phase": phase, **fields}
+    if started is not None:
+        data["startedAt"] = f"2021-01-01T00:{started:02d}:00Z"
+    if finished is not None:
+        data["finishedAt"] = f"2021-01-01T00:{finished:02d}:00Z"
+    return data
+
+
+NODES = {
+    "wf": node("wf", "DAG", "Failed", 0, 9, templateName="main", children=["wf-a", "wf-b"]),
+    "wf-a": node(
+        "wf-a",
+        "Pod",
+        "Succeeded",
+        1,
+        3,
+        templateName="step",
+        hostNodeName="host-1",
+        resourcesDuration={"cpu": 120, "memory": 60},
+        children=["wf-c"],
+    ),
+    "wf-b": node(
+        "wf-b",
+        "Pod",
+        "Succeeded",
+        2,
+        6,
+        templateName="step",
+        hostNodeName="host-2",
+        resourcesDuration={"cpu": 240},
+        children=["wf-c"],
+    ),
+    "wf-c": node("wf-c", "Pod", "Failed", 8, 9, templateName="last", hostNodeName="host-1"),
+    "wf-d": node("wf-d", "Pod", "Pending"),
+}
+
+
+@pytest.mark.parametrize("node_class", [CompactNodeStatus.parse_obj, v1alpha1.NodeStatus.parse_obj])
+def test_node_table(node_class):
+    table = NodeTable.from_nodes({node_id: node_class(data) for node_id, data in NODES.items()}, workflow="wf")
+
+    assert len(table) == 5
+    assert table.ids == list(NODES)
+    assert table.template.labels == ("main", "step", "last", None)
+    assert table.template.codes.tolist() == [0, 1, 1, 2, 3]
+    assert table.workflow.labels == ("wf",)
+    assert table.host.mask("host-1").tolist() == [False, True, False, True, False]
+    assert not table.host.mask("host-3").any()
+
+    assert table.started[0] == 1609459200
+    assert table.finished[-1] == NO_TIME
+    assert table.duration()[:4].tolist() == [540, 120, 240, 60]
+    assert math.isnan(table.duration()[4])
+
+    # wf-a and wf-b wait for their DAG to start, wf-c for both of its dependencies to finish
+    delays = table.queue_delay()
+    assert delays[1:4].tolist() == [60, 120, 120]
+    assert math.isnan(delays[0]) and math.isnan(delays[4])
+
+    assert table.resource("cpu")[1:3].tolist() == [120, 240]
+    assert math.isnan(table.resource("memory")[2])
+    assert np.isnan(table.resource("gpu")).all()
+
+
+def test_aggregate():
+    table = NodeTable.from_statuses(
+        [
+            ("wf-1", CompactWorkflowStatus({"nodes": NODES})),
+            ("wf-2", CompactWorkflowStatus({"compressedNodes": compress_nodes(NODES)})),
+        ]
+    )
+    assert len(table) == 10
+    assert table.workflow.labels == ("wf-1", "wf-2")
+    assert table.queue_delay()[6:9].tolist() == [60, 120, 120]
+
+    durations = table.durations_by("template")
+    assert durations["step"] == {"count": 4, "total": 720.0, "mean": 180.0, "min": 120.0, "max": 240.0}
+    assert durations[None]["count"] == 0
+    assert math.isnan(durations[None]["mean"])
+    assert list(durations.to_dict()) == ["main", "step", "last"]
+
+    assert table.durations_by("phase").to_dict()["Failed"]["total"] == 1200
+    assert table.resources_by("host", "cpu").to_dict() == {
+        "host-1": {"count": 2, "total": 240.0, "mean": 120.0, "min": 120.0, "max": 120.0},
+        "host-2": {"count": 2, "total": 480.0, "mean": 240.0, "min": 240.0, "max": 240.0},
+    }
+
+    where = table.workflow.mask("wf-2")
+    assert table.queue_delays_by("type", where=where).to_dict()["Pod"]["total"] == 300
+
+    with pytest.raises(ValueError):
+        table.aggregate("name", table.duration())
@@ -0,0 +1,228 @@
+import re
+import subprocess
+import sys
+
+from collections import OrderedDict
+from fractions import Fraction
+from typing import List
+
+import pytest
+
+from argo_dsl import arguments
+from argo_dsl.arguments import ARGUMENT_CODECS
+from argo_dsl.arguments import Base85Codec
+from argo_dsl.arguments import HexCodec
+from argo_dsl.arguments import TypeCodec
+from argo_dsl.arguments import register_type_codec
+from argo_dsl.decorator import python_template
+
+
+ARGUMENTS = [
+    {"a": [1, 2.5, None], "b": "x" * 1000},
+    list(range(300)),
+    re.compile("abc"),
+    b"\x00$`{{}}\xff" * 100,
+    bytes(range(256)),
+    # not JSON values, pickled
+    {1: "a"},
+    [(1, 2)],
+    OrderedDict(a=1),
+]
+
+
+def equal(a, b):
+    return type(a) is type(b) and a == b
+
+
+def array_equal(a, b):
+    np = pytest.importorskip("numpy")
+    return type(b) is np.ndarray and a.dtype == b.dtype and np.array_equal(a, b)
+
+
+def check_round_trip(name, argument, equal):
+    codec = ARGUMENT_CODECS[name]()
+    text = codec.encode(argument)
+    assert equal(codec.decode(text), argument)
+    assert not set("$`\"'\\") & set(text)
+    assert "{" not in text and "}" not in text
+
+    namespace = {}
+    exec(codec.decoder_source(), namespace)
+    assert equal(namespace["_decode_argument"](text), argument)
+
+
+def run_script(template, arguments, tmp_path):
+    source = template.manifest.source.replace("/tmp/script", str(tmp_path / "script"))
+    for name, value in arguments.items():
+        source = source.replace("{{inputs.parameters.%s}}" % name, value)
+    source = source.replace("python ", f"{sys.executable} ")
+    return subprocess.run(["bash", "-c", source], check=True, capture_output=True, text=True).stdout
+
+
+class FractionCodec(TypeCodec):
+    header = "f"
+    imports = ("fractions",)
+
+    def dumps(self, argument):
+        return str(argument).encode()
+
+    def loads(self, data):
+        return Fraction(data.decode())
+
+    def loads_source(self):
+        return "fractions.Fraction(data.decode())"
+
+
+@pytest.fixture
+def fraction_codec(monkeypatch):
+    monkeypatch.setattr(arguments, "TYPE_CODECS", dict(arguments.TYPE_CODECS))
+    register_type_codec(Fraction, FractionCodec())
+
+
+@pytest.mark.parametrize("name", sorted(ARGUMENT_CODECS))
+@pytest.mark.parametrize("argument", ARGUMENTS)
+def test_round_trip(name, argument):
+    check_round_trip(name, argument, equal)
+
+
+@pytest.mark.parametrize("name", sorted(ARGUMENT_CODECS))
+def test_round_trip_numpy(name):
+    np = pytest.importorskip("numpy")
+    for argument in [np.arange(1000, dtype=np.int32).reshape(10, 100), np.array(["a", "b"]), np.array([None, 1])]:
+        check_round_trip(name, argument, array_equal)
+
+
+def test_headers():
+    codec = Base85Codec()
+    assert codec.encode({"a": 1})[0] == "j"
+    assert codec.encode({"b": "x" * 1000})[0] == "J"
+    assert codec.encode(b"abc")[0] == "b"
+    assert codec.encode(re.compile("a"))[0] == "p"
+    assert codec.encode({1: "a"})[0] == "p"
+
+
+def test_numpy_headers():
+    np = pytest.importorskip("numpy")
+    codec = Base85Codec()
+    assert codec.encode(np.zeros(3))[0] == "n"
+    assert codec.encode(np.array([None] * 1000))[0] == "P"
+    # only the codecs of the headers given
+    assert codec.encode(np.zeros(3), headers={"j"})[0] == "p"
+
+
+def test_compression():
+    compressible = {"b": "x" * 1000}
+    assert Base85Codec(compress_over=None).encode(compressible)[0] == "j"
+    # too short to compress, or not shorter compressed
+    assert Base85Codec().encode([1, 2])[0] == "j"
+    assert Base85Codec(compress_over=0).encode(bytes(range(256)))[0] == "b"
+
+    assert len(Base85Codec().encode(compressible)) < len(HexCodec(compress_over=None).encode(compressible)) / 20
+
+
+def test_shorter_encoding():
+    records = [{"id": i, "name": f"user-{i}", "score": i / 7, "tags": ["a", "b"]} for i in range(1000)]
+    codec = Base85Codec()
+    text = codec.encode(records)
+    assert text[0] == "P"
+    assert codec.decode(text) == records
+    assert codec.encode({"a": 1})[0] == "j"
+    # only the codecs of the headers given
+    assert codec.encode([1, 2], headers=set())[0] == "p"
+
+
+def test_unpicklable_argument(fraction_codec):
+    class Unpicklable(Fraction):
+        def __reduce__(self):
+            raise TypeError("not picklable")
+
+    register_type_codec(Unpicklable, FractionCodec())
+    codec = Base85Codec()
+    assert codec.decode(codec.encode(Unpicklable(1, 3))) == Fraction(1, 3)
+    with pytest.raises(TypeError, match="not picklable"):
+        codec.encode(Unpicklable(1, 3), headers=set())
+
+
+def test_decoder_source_headers():
+    source = Base85Codec().decoder_source({"j"})
+    assert 'header == "j"' in source
+    assert "numpy" not in source and 'header == "b"' not in source
+    assert "pickle.loads" in source
+
+
+def test_script_decodes_its_annotations():
+    @python_template(image="python")
+    def count(rows: list, names: List[str], data: bytes, pattern: re.Pattern):
+        print(len(rows))
+
+    template = count()
+    source = template.manifest.source
+    assert 'header == "j"' in source and 'header == "b"' in source
+    assert "numpy" not in source
+    assert template.serialize_argument([1, 2])[0] == "j"
+    assert template.serialize_argument({1: "a"})[0] == "p"
+
+
+def test_script_pickles_unannotated_arrays():
+    np = pytest.importorskip("numpy")
+
+    @python_template(image="python")
+    def count(rows: list):
+        print(len(rows))
+
+    assert count().serialize_argument(np.arange(3))[0] == "p"
+
+
+def test_register_type_codec(fraction_codec):
+    codec = Base85Codec()
+    text = codec.encode(Fraction(1, 3))
+    assert text[0] == "f"
+    assert codec.decode(text) == Fraction(1, 3)
+    namespace = {}
+    exec(codec.decoder_source(), namespace)
+    assert namespace["_decode_argument"](text) == Fraction(1, 3)
+
+    register_type_codec("decimal.Decimal", FractionCodec())
+    for header in ["", "p", "F", "fr"]:
+
+        class Invalid(FractionCodec):
+            pass
+
+        Invalid.header = header
+        with pytest.raises(ValueError, match="lower case letter"):
+            register_type_codec(Fraction, Invalid())
+    with pytest.raises(ValueError, match="already used by JsonCodec"):
+        register_type_codec(Fraction, type("Other", (FractionCodec,), {"header": "j"})())
+
+
+def test_script(tmp_path, fraction_codec):
+    @python_template(image="python")
+    def report(rows: list, pattern: re.Pattern, ratio: Fraction, name: str = "rows"):
+        print(name, len(rows), pattern.pattern, ratio)
+
+    template = report()
+    arguments = {
+        "rows": template.serialize_argument([{"value": "$HOME `id` {{x}}"}] * 100),
+        "pattern": template.serialize_argument(re.compile("a+")),
+        "ratio": template.serialize_argument(Fraction(1, 3)),
+        "name": "rows",
+    }
+    assert run_script(template, arguments, tmp_path) == "rows 100 a+ 1/3\n"
+
+
+def test_script_numpy(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    @python_template(image="python")
+    def total(matrix: np.ndarray):
+        print(matrix.sum())
+
+    template = total()
+    assert "numpy" in template.manifest.source
+    arguments = {"matrix": template.serialize_argument(np.ones((10, 10)))}
+    assert run_script(template, arguments, tmp_path) == "100.0\n"
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="unknown argument codec"):
+        python_template(image="python", argument_codec="base32")
@@ -0,0 +1,83 @@
+import sys
+
+from typing import ClassVar
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.build import compile_all
+from argo_dsl.decorator import bash_template
+from argo_dsl.template import ContainerTemplate
+from argo_dsl.template import ScriptTemplate
+from argo_dsl.template import Template
+
+
+class Train(ContainerTemplate):
+    name: ClassVar[str] = "train"
+    image = "python:3.8"
+    command = ["python", "train.py"]
+
+    class Parameters:
+        epochs: str = "3"
+
+
+class Evaluate(ScriptTemplate):
+    name: ClassVar[str] = "evaluate"
+    image = "python:3.8"
+    source = "print('evaluate')"
+
+
+@bash_template(image="alpine")
+def echo(message: str):
+    """
+    echo $message
+    """
+
+
+class Nested:
+    class Suspend(Template):
+        name: ClassVar[str] = "suspend"
+
+        def compile(self) -> v1alpha1.Template:
+            return v1alpha1.Template(name="suspend", suspend={})
+
+
+def steps(i):
+    class Step(ScriptTemplate):
+        name: ClassVar[str] = f"step-{i}"
+        image = "alpine"
+        source = f"echo {i}"
+
+    return Step
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_compile_all(processes):
+    local = [steps(i) for i in range(10)]
+    items = [sys.modules[__name__], Nested.Suspend, *local, __name__, Train]
+
+    manifests = compile_all(items, processes=processes, chunk_size=2)
+    names = [manifest["name"] for manifest in manifests]
+    assert names == ["train", "evaluate", "echo", "suspend"] + [f"step-{i}" for i in range(10)]
+    assert manifests[0] == Train().to_manifest()
+    assert manifests[2] == echo().to_manifest()
+    assert manifests == compile_all(items, processes=1)
+
+
+def test_compile_all_star_imports(tmp_path, monkeypatch):
+    (tmp_path / "star_templates.py").write_text(
+        "from argo_dsl.decorator import *\n"
+        "from argo_dsl.template import *\n"
+        "\n"
+        "@bash_template(image='alpine')\n"
+        "def hello():\n"
+        "    'echo hello'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    manifests = compile_all(["star_templates"], processes=1)
+    assert [manifest["name"] for manifest in manifests] == ["hello"]
+
+
+def test_compile_all_type_error():
+    with pytest.raises(TypeError, match="expected a module"):
+        compile_all([Train, 1])
@@ -0,0 +1,280 @@
+import asyncio
+import json
+import math
+import time
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.bulk import Backoff
+from argo_dsl.bulk import BulkSubmitter
+from argo_dsl.bulk import LatencyHistogram
+from argo_dsl.bulk import TokenBucket
+from argo_dsl.bulk import bulk_submit
+from argo_dsl.bulk import serialize_submission
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import ArgoServerError
+from argo_dsl.client import ConnectError
+from argo_dsl.testing import StubArgoServer
+
+
+TEMPLATE = v1alpha1.Workflow.parse_obj(
+    {"metadata": {"generateName": "hello-"}, "spec": {"workflowTemplateRef": {"name": "hello"}}}
+)
+
+FAST_BACKOFF = Backoff(retries=3, base=0.001, seed=0)
+
+
+def arguments(value):
+    return v1alpha1.Arguments(parameters=[v1alpha1.Parameter(name="message", value=value)])
+
+
+def run(test, **server_options):
+    async def main():
+        async with StubArgoServer(**server_options) as server:
+            async with ArgoClient(server.url, namespace="argo") as client:
+                return await test(server, client)
+
+    return asyncio.run(main())
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    assert math.isnan(histogram.quantile(0.5))
+
+    for i in range(1, 101):
+        histogram.record(i / 1000)
+    assert histogram.count == 100
+    assert histogram.min == 0.001
+    assert histogram.max == 0.1
+    assert histogram.mean == pytest.approx(0.0505)
+    assert 0.05 <= histogram.quantile(0.5) <= 0.05 * 1.19
+    assert 0.099 <= histogram.quantile(0.99) <= 0.1
+    assert 0.001 <= histogram.quantile(0) <= 0.001 * 1.19
+    assert sum(count for _, count in histogram.buckets()) == 100
+
+    other = LatencyHistogram()
+    other.record(2.0)
+    histogram.merge(other)
+    assert histogram.count == 101
+    assert histogram.quantile(1.0) == 2.0
+
+
+def test_token_bucket():
+    async def main():
+        bucket = TokenBucket(rate=200, burst=5)
+        start = time.perf_counter()
+        for _ in range(25):
+            await bucket.acquire()
+        return time.perf_counter() - start
+
+    # 5 at once, the other 20 at 200/s
+    assert 0.09 <= asyncio.run(main()) < 0.5
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_backoff():
+    backoff = Backoff(retries=2, base=1.0, cap=3.0, seed=1)
+    assert backoff.retryable(ArgoServerError(503, "Service Unavailable", b""))
+    assert backoff.retryable(ArgoServerError(429, "Too Many Requests", b""))
+    assert backoff.retryable(ConnectionResetError())
+    assert not backoff.retryable(ArgoServerError(400, "Bad Request", b""))
+    assert not backoff.retryable(ValueError())
+
+    error = ArgoServerError(503, "Service Unavailable", b"")
+    assert all(0 <= backoff.delay(attempt, error) <= min(3.0, 2**attempt) for attempt in range(1, 6))
+    assert backoff.delay(1, ArgoServerError(429, "Too Many Requests", b"", {"retry-after": "2"})) == 2.0
+    assert backoff.delay(1, ArgoServerError(429, "Too Many Requests", b"", {"retry-after": "60"})) == 3.0
+
+
+def test_serialize_submission():
+    template = TEMPLATE.dict(exclude_none=True)
+    namespace, body = serialize_submission(template, "argo", arguments("hi"))
+    request = json.loads(body)
+    assert namespace == request["namespace"] == "argo"
+    assert request["workflow"]["spec"] == {
+        "workflowTemplateRef": {"name": "hello"},
+        "arguments": {"parameters": [{"name": "message", "value": "hi"}]},
+    }
+    # the template is left as it was
+    assert "arguments" not in template["spec"]
+
+    workflow = v1alpha1.Workflow.parse_obj({"metadata": {"name": "wf", "namespace": "other"}, "spec": {}})
+    namespace, body = serialize_submission(None, "argo", workflow)
+    assert namespace == "other"
+    assert json.loads(body)["workflow"]["metadata"]["name"] == "wf"
+
+    with pytest.raises(ValueError):
+        serialize_submission(None, "argo", arguments("hi"))
+
+
+def test_bulk_submit_arguments():
+    async def test(server, client):
+        results = []
+        report = await bulk_submit(
+            client,
+            (arguments(str(i)) for i in range(50)),
+            workflow=TEMPLATE,
+            max_in_flight=8,
+            on_result=results.append,
+        )
+        assert report.submitted == 50
+        assert report.failed == []
+        assert report.retries == 0
+        assert report.submit_latency.count == report.request_latency.count == 50
+        assert report.rate > 0
+
+        assert sorted(result.index for result in results) == list(range(50))
+        assert all(result.ok and result.name.startswith("hello-") for result in results)
+        values = sorted(w["spec"]["arguments"]["parameters"][0]["value"] for w in server.workflows.values())
+        assert values == sorted(str(i) for i in range(50))
+        assert server.connections <= 8
+
+    run(test)
+
+
+def test_bulk_submit_retries():
+    async def test(server, client):
+        server.fail(429, retry_after=0)
+        server.fail(429, times=2)
+        submitter = BulkSubmitter(client, TEMPLATE, max_in_flight=1, backoff=FAST_BACKOFF)
+        report = await submitter.submit([arguments("a"), arguments("b")])
+        assert report.submitted == 2
+        assert report.retries == 3
+        assert report.request_latency.count == 5
+        assert len(server.workflows) == 2
+
+        # retries run out
+        server.fail(429, times=4)
+        report = await submitter.submit([arguments("c")])
+        assert report.submitted == 0
+        [failed] = report.failed
+        assert failed.attempts == 4
+        assert failed.error.status == 429
+
+        # the workflow may have been created
+        server.fail(503)
+        report = await submitter.submit([arguments("c")])
+        assert report.failed[0].attempts == 1
+        assert report.failed[0].error.status == 503
+
+        # client errors are not retried
+        server.fail(400)
+        report = await submitter.submit([arguments("d"), arguments("e")])
+        assert report.submitted == 1
+        assert report.failed[0].index == 0
+        assert report.failed[0].attempts == 1
+
+    run(test)
+
+
+def test_bulk_submit_retries_named_workflows():
+    def workflow(name):
+        return v1alpha1.Workflow.parse_obj({"metadata": {"name": name}, "spec": {}})
+
+    async def test(server, client):
+        submitter = BulkSubmitter(client, max_in_flight=1, backoff=FAST_BACKOFF)
+        server.fail(503)
+        report = await submitter.submit([workflow("a")])
+        assert report.submitted == 1
+        assert report.retries == 1
+        assert list(server.workflows) == [("argo", "a")]
+
+        # created before the 503, the 409 of the retry means it was submitted
+        server.fail(503)
+        report = await submitter.submit([workflow("a")])
+        assert report.submitted == 1
+        assert report.retries == 1
+        assert len(server.workflows) == 1
+
+        # without a 5xx the workflow existed before
+        report = await submitter.submit([workflow("a")])
+        assert report.failed[0].error.status == 409
+
+        # opting in to retry workflows with a generateName
+        submitter = BulkSubmitter(client, TEMPLATE, backoff=FAST_BACKOFF, retry_generate_name=True)
+        server.fail(503, times=2)
+        report = await submitter.submit([arguments("b")])
+        assert report.submitted == 1
+        assert report.retries == 2
+
+    run(test)
+
+
+def test_bulk_submit_random_errors():
+    async def test(server, client):
+        backoff = Backoff(retries=10, base=0.001, seed=0)
+        report = await bulk_submit(client, [arguments(str(i)) for i in range(100)], workflow=TEMPLATE, backoff=backoff)
+        assert report.submitted == 100
+        assert report.retries > 0
+        assert len(server.workflows) == 100
+
+    run(test, error_rate=0.2, error_status=429, seed=0)
+
+    async def test_5xx(server, client):
+        backoff = Backoff(retries=10, base=0.001, seed=0)
+        report = await bulk_submit(
+            client,
+            [arguments(str(i)) for i in range(100)],
+            workflow=TEMPLATE,
+            backoff=backoff,
+            retry_generate_name=True,
+        )
+        assert report.submitted == 100
+        assert report.retries > 0
+
+    run(test_5xx, error_rate=0.2, error_status=503, seed=0)
+
+
+def test_bulk_submit_connect_error():
+    async def test():
+        server = StubArgoServer()
+        async with server:
+            url = server.url
+        async with ArgoClient(url, namespace="argo") as client:
+            report = await BulkSubmitter(client, TEMPLATE, backoff=FAST_BACKOFF).submit([arguments("a")])
+        [failed] = report.failed
+        assert isinstance(failed.error, ConnectError)
+        assert failed.attempts == 4
+
+    asyncio.run(test())
+
+
+def test_bulk_submit_quotes_namespace():
+    async def test(server, client):
+        workflow = v1alpha1.Workflow.parse_obj({"metadata": {"name": "wf", "namespace": "a/b"}, "spec": {}})
+        report = await bulk_submit(client, [workflow])
+        assert report.submitted == 1
+        assert list(server.workflows) == [("a/b", "wf")]
+
+    run(test)
+
+
+def test_bulk_submit_async_iterable_and_rate():
+    async def items():
+        for i in range(10):
+            await asyncio.sleep(0)
+            yield v1alpha1.Workflow.parse_obj({"metadata": {"name": f"wf-{i}"}, "spec": {}})
+
+    async def test(server, client):
+        report = await bulk_submit(client, items(), rate=100, burst=1)
+        assert report.submitted == 10
+        # the first request goes at once, the others at 100/s
+        assert report.elapsed >= 0.09
+        assert sorted(name for _, name in server.workflows) == sorted(f"wf-{i}" for i in range(10))
+
+    run(test)
+
+
+def test_bulk_submit_invalid_items():
+    async def test(server, client):
+        report = await bulk_submit(client, [arguments("a")])
+        assert report.submitted == 0
+        assert isinstance(report.failed[0].error, ValueError)
+
+    run(test)
+
+    with pytest.raises(ValueError):
+        BulkSubmitter(ArgoClient(), v1alpha1.Workflow.parse_obj({"metadata": {"name": "fixed"}, "spec": {}}))
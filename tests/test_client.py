@@ -0,0 +1,315 @@
+import asyncio
+import json
+
+from datetime import datetime
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import ArgoServerError
+from argo_dsl.client import ConnectionPool
+from argo_dsl.client import dump_body
+from argo_dsl.manifest import get_json_backend
+from argo_dsl.manifest import set_json_backend
+from argo_dsl.testing import StubArgoServer
+
+
+def run(test):
+    async def main():
+        async with StubArgoServer() as server:
+            async with ArgoClient(server.url, namespace="argo", concurrency=4) as client:
+                return await test(server, client)
+
+    return asyncio.run(main())
+
+
+def new_workflow(name=None, generate_name="hello-", labels=None):
+    return v1alpha1.Workflow.parse_obj(
+        {
+            "metadata": {"name": name, "generateName": None if name else generate_name, "labels": labels},
+            "spec": {"entrypoint": "main", "templates": [{"name": "main", "container": {"image": "alpine"}}]},
+        }
+    )
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_dump_body(backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    previous = get_json_backend()
+    set_json_backend(backend)
+    try:
+        assert dump_body(None) == b""
+        assert dump_body(b"{}") == b"{}"
+        assert dump_body({"a": [1]}) == b'{"a":[1]}'
+        assert dump_body(v1alpha1.WorkflowStopRequest(name="wf", message=None)) == b'{"name":"wf"}'
+        assert dump_body({"at": datetime(2021, 1, 1)}) == b'{"at":"2021-01-01T00:00:00"}'
+    finally:
+        set_json_backend(previous)
+
+
+def test_create_and_get_workflow():
+    async def test(server, client):
+        created = await client.create_workflow(new_workflow())
+        assert isinstance(created, v1alpha1.Workflow)
+        assert created.metadata.name.startswith("hello-")
+        assert created.metadata.namespace == "argo"
+        assert created.spec.entrypoint == "main"
+
+        fetched = await client.get_workflow(created.metadata.name)
+        assert fetched == created
+
+        in_other = await client.create_workflow(new_workflow(), namespace="other")
+        assert in_other.metadata.namespace == "other"
+        assert ("other", in_other.metadata.name) in server.workflows
+
+        dry_run = await client.create_workflow(new_workflow(), server_dry_run=True)
+        assert ("argo", dry_run.metadata.name) not in server.workflows
+
+        request = v1alpha1.WorkflowCreateRequest(namespace="third", workflow=new_workflow())
+        assert (await client.create_workflow(request)).metadata.namespace == "third"
+
+    run(test)
+
+
+def test_errors():
+    async def test(server, client):
+        with pytest.raises(ArgoServerError) as e:
+            await client.get_workflow("missing")
+        assert e.value.status == 404
+        assert e.value.code == 5
+        assert "missing" in e.value.message
+
+        await client.create_workflow(new_workflow(name="fixed"))
+        with pytest.raises(ArgoServerError) as e:
+            await client.create_workflow(new_workflow(name="fixed"))
+        assert e.value.status == 409
+
+        # the connection stays usable after error responses
+        assert (await client.get_workflow("fixed")).metadata.name == "fixed"
+
+    run(test)
+
+
+def test_list_and_delete_workflows():
+    async def test(server, client):
+        for i in range(5):
+            await client.create_workflow(new_workflow(labels={"team": "a" if i % 2 else "b"}))
+
+        workflows = await client.list_workflows()
+        assert isinstance(workflows, v1alpha1.WorkflowList)
+        assert len(workflows.items) == 5
+
+        page = await client.list_workflows(limit=2)
+        assert len(page.items) == 2
+        rest = await client.list_workflows(continue_=page.metadata.continue_)
+        assert [w.metadata.name for w in page.items + rest.items] == [w.metadata.name for w in workflows.items]
+
+        assert len((await client.list_workflows(label_selector="team=a")).items) == 2
+        assert len((await client.list_workflows(label_selector="team!=a")).items) == 3
+
+        await client.delete_workflow(workflows.items[0].metadata.name)
+        assert len(server.workflows) == 4
+
+    run(test)
+
+
+def test_workflow_actions():
+    async def test(server, client):
+        name = (await client.create_workflow(new_workflow())).metadata.name
+        assert (await client.suspend_workflow(name)).spec.suspend is True
+        assert (await client.resume_workflow(name)).spec.suspend is None
+        assert (await client.stop_workflow(name, message="bye")).spec.shutdown == "Stop"
+        assert (await client.terminate_workflow(name)).spec.shutdown == "Terminate"
+        assert (await client.retry_workflow(name)).status.phase == "Running"
+
+        resubmitted = await client.resubmit_workflow(name)
+        assert resubmitted.metadata.name != name
+        assert resubmitted.metadata.labels["workflows.argoproj.io/resubmitted-from-workflow"] == name
+
+        linted = await client.lint_workflow(new_workflow())
+        assert linted.spec.entrypoint == "main"
+
+    run(test)
+
+
+def test_templates():
+    async def test(server, client):
+        template = v1alpha1.WorkflowTemplate.parse_obj(
+            {"metadata": {"name": "hello"}, "spec": {"entrypoint": "main", "templates": [{"name": "main"}]}}
+        )
+        created = await client.create_workflow_template(template)
+        assert created.metadata.namespace == "argo"
+        assert (await client.get_workflow_template("hello")).spec.entrypoint == "main"
+        assert (await client.lint_workflow_template(template)).metadata.name == "hello"
+
+        options = v1alpha1.SubmitOpts(parameters=["message=hi"], labels="run=1")
+        workflow = await client.submit_workflow("WorkflowTemplate", "hello", options)
+        assert workflow.spec.workflowTemplateRef.name == "hello"
+        assert workflow.spec.arguments.parameters[0].value == "hi"
+        assert workflow.metadata.labels == {"run": "1", "workflows.argoproj.io/workflow-template": "hello"}
+
+        cluster = await client.create_cluster_workflow_template(
+            v1alpha1.ClusterWorkflowTemplate.parse_obj({"metadata": {"name": "shared"}, "spec": {}})
+        )
+        assert cluster.metadata.namespace is None
+        workflow = await client.submit_workflow("ClusterWorkflowTemplate", "shared")
+        assert workflow.spec.workflowTemplateRef.clusterScope is True
+
+        cron = await client.create_cron_workflow(
+            v1alpha1.CronWorkflow.parse_obj(
+                {
+                    "metadata": {"name": "nightly"},
+                    "spec": {"schedule": "0 0 * * *", "workflowSpec": {"entrypoint": "x"}},
+                }
+            )
+        )
+        assert cron.spec.schedule == "0 0 * * *"
+        assert (await client.submit_workflow("CronWorkflow", "nightly")).spec.entrypoint == "x"
+
+        await client.delete_workflow_template("hello")
+        with pytest.raises(ArgoServerError):
+            await client.submit_workflow("WorkflowTemplate", "hello")
+
+    run(test)
+
+
+def test_connections_are_reused():
+    async def test(server, client):
+        await asyncio.gather(*(client.create_workflow(new_workflow()) for _ in range(40)))
+        assert server.requests == 40
+        # at most `concurrency` requests are in flight
+        assert server.connections == client.pool.connections_opened <= 4
+
+        for _ in range(10):
+            await client.list_workflows(limit=1)
+        assert client.pool.connections_opened <= 4
+
+    run(test)
+
+
+def test_stale_connections_are_replaced():
+    async def main():
+        async with StubArgoServer() as server:
+            pool = ConnectionPool(server.host, server.port, concurrency=1)
+            assert (await pool.request("GET", "/api/v1/workflows/argo")).status == 200
+
+            # the server drops the idle connection
+            await server.close()
+            await server.start()
+            response = await pool.request("GET", "/api/v1/workflows/argo")
+            assert response.status == 200
+            assert response.json()["items"] == []
+            assert pool.connections_opened == 2
+            await pool.close()
+
+    asyncio.run(main())
+
+
+def test_connection_close_and_chunked_responses():
+    async def handler(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line.strip():
+                break
+            while (await reader.readline()).strip():
+                pass
+            if line.startswith(b"GET /chunked"):
+                writer.write(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3\r\n{"a\r\n4\r\n":1}\r\n0\r\n\r\n')
+            else:
+                writer.write(b'HTTP/1.0 200 OK\r\n\r\n{"b":2}')
+                await writer.drain()
+                break
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        pool = ConnectionPool("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            assert (await pool.request("GET", "/chunked")).json() == {"a": 1}
+            assert (await pool.request("GET", "/chunked")).json() == {"a": 1}
+            assert pool.connections_opened == 1
+            assert (await pool.request("GET", "/close")).json() == {"b": 2}
+            assert (await pool.request("GET", "/chunked")).json() == {"a": 1}
+            assert pool.connections_opened == 2
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("body", [b'3\r\n{"a\r\n', b'3\r\n{"a\r\n4'])
+def test_chunked_response_cut_short(body):
+    async def handler(reader, writer):
+        while (await reader.readline()).strip():
+            pass
+        writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + body)
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        pool = ConnectionPool("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            with pytest.raises(ConnectionResetError, match="response body"):
+                await pool.request("GET", "/chunked")
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_watch_workflows():
+    async def test(server, client):
+        created = await client.create_workflow(new_workflow(labels={"team": "a"}))
+        await client.create_workflow(new_workflow(labels={"team": "b"}))
+        name = created.metadata.name
+
+        async with await client.watch_workflows(label_selector="team=a") as stream:
+            lines = stream.lines()
+            assert json.loads(await lines.__anext__())["result"]["type"] == "ADDED"
+            server.update_workflow("argo", name, {"status": {"phase": "Running"}})
+            event = json.loads(await lines.__anext__())["result"]
+            assert event["type"] == "MODIFIED"
+            assert event["object"]["status"]["phase"] == "Running"
+
+            server.disconnect()
+            with pytest.raises(ConnectionResetError):
+                await lines.__anext__()
+
+        # later events only
+        async with await client.watch_workflows(
+            resource_version=event["object"]["metadata"]["resourceVersion"]
+        ) as stream:
+            lines = stream.lines()
+            await client.delete_workflow(name)
+            assert json.loads(await lines.__anext__())["result"]["type"] == "DELETED"
+
+        server.compact()
+        async with await client.watch_workflows(resource_version="1") as stream:
+            assert json.loads(await stream.read())["error"]["http_code"] == 410
+
+        with pytest.raises(ArgoServerError):
+            server.fail(403)
+            await client.stream("GET", "workflows/argo")
+
+    run(test)
+
+
+def test_invalid_client_arguments():
+    with pytest.raises(ValueError):
+        ArgoClient("localhost:2746")
+    with pytest.raises(ValueError):
+        ConnectionPool("localhost", 2746, concurrency=0)
+
+    client = ArgoClient("https://argo.example.com/argo/", token="abc")
+    assert client.pool.port == 443
+    assert client.pool.ssl is True
+    assert client.base_path == "/argo"
+    assert client.headers["Authorization"] == "Bearer abc"
+    assert ArgoClient(token="Bearer abc").headers["Authorization"] == "Bearer abc"
@@ -0,0 +1,193 @@
+import os
+import re
+
+import pytest
+
+from argo_dsl import compile_cache
+from argo_dsl import decorator as decorator_module
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.compile_cache import get_compile_cache
+from argo_dsl.compile_cache import set_compile_cache
+from argo_dsl.decorator import Hook
+from argo_dsl.decorator import python_template
+from argo_dsl.decorator import resource_template
+from argo_dsl.decorator import script_template
+from argo_dsl.template import Template
+from argo_dsl.template import new_parameters
+
+
+@pytest.fixture
+def cache(tmp_path):
+    set_compile_cache(str(tmp_path))
+    yield get_compile_cache()
+    set_compile_cache(None)
+
+
+def files(cache):
+    return sorted(name for name in os.listdir(cache.directory) if name.endswith(".pickle"))
+
+
+def entries(cache):
+    return [key for name in files(cache) for key in compile_cache._read_entries(os.path.join(cache.directory, name))]
+
+
+def no_source(monkeypatch):
+    def fail(func):
+        raise AssertionError("the source is read")
+
+    monkeypatch.setattr(decorator_module, "Function", fail)
+
+
+def train(epochs: int = 3, pattern: re.Pattern = re.compile("a+"), source: v1alpha1.ValueFrom = None):
+    print(epochs, pattern, source)
+
+
+def get_pod(name):
+    """
+    apiVersion: v1
+    kind: Pod
+    metadata:
+      name: {{inputs.parameters.name}}
+    """
+
+
+def test_python_template(cache, monkeypatch):
+    cold = python_template(image="python:3.8")(train)
+    assert len(entries(cache)) == 1
+
+    no_source(monkeypatch)
+    warm = python_template(image="python:3.8")(train)
+
+    assert warm is not cold
+    assert (warm.__name__, warm.__qualname__, warm.__module__) == (cold.__name__, cold.__qualname__, cold.__module__)
+    assert warm.name == cold.name == "train"
+    assert warm.image == "python:3.8"
+    assert new_parameters(warm.Parameters) == new_parameters(cold.Parameters)
+    assert warm.Parameters.__annotations__ == cold.Parameters.__annotations__
+    assert warm().template == cold().template
+    assert warm().manifest == cold().manifest
+    assert warm().serialize_argument(re.compile("b")) == cold().serialize_argument(re.compile("b"))
+    # the script of train decodes only pickles
+    assert warm().serialize_argument([1, 2]) == cold().serialize_argument([1, 2])
+    assert warm().serialize_argument([1, 2])[0] == "p"
+    # every instance has its own template
+    assert warm().template is not warm().template
+
+    class image(Hook):
+        def hook(self):
+            def set_image(template):
+                template.script.image = "hooked"
+                return template
+
+            return set_image
+
+    assert image()(warm)().template.script.image == "hooked"
+    assert warm().template.script.image == "python:3.8"
+
+
+def test_subclass(cache, monkeypatch):
+    python_template(image="python:3.8")(train)
+    no_source(monkeypatch)
+    warm = python_template(image="python:3.8")(train)
+
+    class Renamed(warm):
+        name = "renamed"
+        image = "python:3.11"
+
+    assert Renamed().template.name == "renamed"
+    assert Renamed().template.script.image == "python:3.11"
+    assert warm().template.script.image == "python:3.8"
+
+
+def test_decoration_does_not_compile(cache, monkeypatch):
+    def fail(self):
+        raise AssertionError("the template is compiled")
+
+    monkeypatch.setattr(Template, "__init__", fail)
+    python_template(image="python:3.8")(train)
+    resource_template(action="get")(get_pod)
+    assert len(entries(cache)) == 2
+
+
+def test_resource_template(cache, monkeypatch):
+    cold = resource_template(action="get", flags=["--v=1"])(get_pod)
+    no_source(monkeypatch)
+    warm = resource_template(action="get", flags=["--v=1"])(get_pod)
+
+    assert warm().resource_manifest == cold().resource_manifest
+    assert warm.flags == ["--v=1"]
+    assert warm().template == cold().template
+
+
+def test_keys(cache):
+    python_template(image="python:3.8")(train)
+    python_template(image="python:3.9")(train)
+    python_template(image="python:3.8", pickle_protocol=2)(train)
+    resource_template(action="get")(get_pod)
+    python_template(image="python:3.8")(train)
+    assert len(entries(cache)) == 4
+    assert len(files(cache)) == 1
+
+    def local():
+        print(1)
+
+    keys = {cache.key(python_template(image="python:3.8"), f) for f in [train, local]}
+    local.__defaults__ = (1,)
+    keys.add(cache.key(python_template(image="python:3.8"), local))
+    assert len(keys) == 3
+
+    assert cache.key(python_template(image="python:3.8"), eval("lambda: 1")) is None
+
+
+def test_called_for_return_value_is_not_cached(cache):
+    suffix = "!"
+
+    @script_template(image="alpine", command="sh")
+    def computed():
+        return "echo hello" + suffix
+
+    @script_template(image="alpine", command="sh")
+    def literal():
+        return "echo hello"
+
+    assert "echo hello!" in computed().manifest.source
+    assert "echo hello" in literal().manifest.source
+    assert len(entries(cache)) == 1
+
+
+def test_file_is_read_once(cache, monkeypatch):
+    python_template(image="python:3.8")(train)
+    resource_template(action="get")(get_pod)
+
+    reads = []
+    read_entries = compile_cache._read_entries
+    monkeypatch.setattr(compile_cache, "_read_entries", lambda path: reads.append(path) or read_entries(path))
+    set_compile_cache(cache.directory)
+    no_source(monkeypatch)
+    assert python_template(image="python:3.8")(train)().template.name == "train"
+    assert resource_template(action="get")(get_pod)().template.name == "get_pod"
+    assert len(reads) == 1
+
+
+def test_broken_entry(cache):
+    template = python_template(image="python:3.8")
+    key = cache.key(template, train)
+    with open(cache.path(key), "wb") as f:
+        f.write(b"not a pickle")
+
+    assert template(train)().template.name == "train"
+    assert cache.load(key, template) is not None
+    assert compile_cache.CompileCache(cache.directory).load(key, template) is not None
+
+    cache.entries(key)[key[1]] = b"not a pickle"
+    assert cache.load(key, template) is None
+
+
+def test_from_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(compile_cache, "_compile_cache", compile_cache._UNSET)
+    monkeypatch.setenv("ARGO_DSL_COMPILE_CACHE", str(tmp_path))
+    assert get_compile_cache().directory == str(tmp_path)
+
+    monkeypatch.setattr(compile_cache, "_compile_cache", compile_cache._UNSET)
+    monkeypatch.delenv("ARGO_DSL_COMPILE_CACHE")
+    assert get_compile_cache() is None
@@ -0,0 +1,109 @@
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.critical_path import Activity
+from argo_dsl.critical_path import analyze
+from argo_dsl.critical_path import analyze_status
+from argo_dsl.critical_path import analyze_template
+from argo_dsl.critical_path import estimated_durations
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.status import CompactWorkflowStatus
+
+
+def test_analyze():
+    analysis = analyze(
+        [Activity("a", None, 2), Activity("b", None, 5), Activity("c", None, 1), Activity("d", None, 3)],
+        [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "unknown")],
+    )
+
+    assert analysis.makespan == 10
+    assert [activity.id for activity in analysis.critical_path] == ["a", "b", "d"]
+    assert analysis.activities["c"].earliest_start == 2
+    assert analysis.activities["c"].latest_start == 6
+    assert analysis.activities["c"].slack == 4
+    assert not analysis.activities["c"].critical
+    assert analysis.activities["d"].critical
+    assert analysis.total_work == 11
+    assert analysis.parallelism == 1.1
+    assert analysis.peak_parallelism == 2
+    assert [activity.id for activity in analysis.bottlenecks(2)] == ["b", "d"]
+
+    with pytest.raises(ValueError):
+        analyze([Activity("a", None, 1), Activity("b", None, 1)], [("a", "b"), ("b", "a")])
+
+    assert analyze([], []).makespan == 0
+
+
+def node(node_id, type_, started=None, finished=None, **fields):
+    data = {"id": node_id, "name": node_id, "type": type_, **fields}
+    if started is not None:
+        data["startedAt"] = f"2021-01-01T00:00:{started:02d}Z"
+    if finished is not None:
+        data["finishedAt"] = f"2021-01-01T00:00:{finished:02d}Z"
+    return data
+
+
+# steps `[[a, b], [c]]` where c failed once
+NODES = {
+    "wf": node("wf", "Steps", 0, 30, templateName="main", children=["g0"]),
+    "g0": node("g0", "StepGroup", 0, 10, children=["a", "b"]),
+    "a": node("a", "Pod", 1, 10, templateName="slow", children=["g1"]),
+    "b": node("b", "Pod", 1, 4, templateName="fast", children=["g1"]),
+    "g1": node("g1", "StepGroup", 10, 30, children=["c"]),
+    "c": node("c", "Retry", 10, 30, templateName="last", children=["c-2", "c-1"]),
+    "c-1": node("c-1", "Pod", 10, 15, templateName="last"),
+    "c-2": node("c-2", "Pod", 16, 30, templateName="last", estimatedDuration=12),
+}
+
+
+@pytest.mark.parametrize("node_class", [CompactNodeStatus.parse_obj, v1alpha1.NodeStatus.parse_obj])
+def test_analyze_status(node_class):
+    nodes = {node_id: node_class(data) for node_id, data in NODES.items()}
+    analysis = analyze_status(nodes)
+
+    assert analysis.makespan == 9 + 5 + 14
+    assert [activity.id for activity in analysis.critical_path] == ["wf", "g0", "a", "g1", "c", "c-1", "c-2"]
+    assert analysis.critical_path[2].ref is nodes["a"]
+    assert analysis.activities["b"].slack == 6
+    assert analysis.activities["wf"].duration == 0
+    assert analysis.peak_parallelism == 2
+
+    assert analyze_status(CompactWorkflowStatus({"nodes": NODES})).makespan == analysis.makespan
+    assert estimated_durations(nodes) == {"slow": 9, "fast": 3, "last": 12}
+
+
+def test_analyze_steps_template():
+    steps = [
+        [v1alpha1.WorkflowStep(name="a", template="slow"), v1alpha1.WorkflowStep(name="b", template="fast")],
+        [v1alpha1.WorkflowStep(name="c", templateRef=v1alpha1.TemplateRef(name="lib", template="last"))],
+    ]
+    template = v1alpha1.Template(name="main", steps=steps)
+    analysis = analyze_template(template, {"slow": 9, "fast": 3, "last": 12})
+
+    assert analysis.makespan == 21
+    assert [activity.id for activity in analysis.critical_path] == ["[0].a", "[1].c"]
+    assert analysis.critical_path[0].ref is template.steps[0].__root__[0]
+    assert list(analysis.activities) == ["[0].a", "[0].b", "[1].c"]
+    assert analysis.activities["[0].b"].slack == 6
+
+    analysis = analyze_template(template, lambda step: 1)
+    assert analysis.makespan == 2
+
+
+def test_analyze_dag_template():
+    tasks = [
+        v1alpha1.DAGTask(name="a", template="slow"),
+        v1alpha1.DAGTask(name="b", template="fast"),
+        v1alpha1.DAGTask(name="c-1", template="fast", dependencies=["b"]),
+        v1alpha1.DAGTask(name="d", template="last", depends="(a.Succeeded || a.Skipped) && c-1"),
+    ]
+    template = v1alpha1.Template(name="main", dag=v1alpha1.DAGTemplate(tasks=tasks))
+    analysis = analyze_template(template, {"slow": 9, "fast": 3, "last": 12})
+
+    assert analysis.makespan == 21
+    assert [activity.id for activity in analysis.critical_path] == ["a", "d"]
+    assert analysis.activities["c-1"].earliest_start == 3
+    assert analysis.activities["c-1"].slack == 3
+
+    with pytest.raises(ValueError):
+        analyze_template(v1alpha1.Template(name="leaf"), {})
@@ -1,5 +1,6 @@
 import re
 
+from argo_dsl.arguments import Base85Codec
 from argo_dsl.decorator import *
 from argo_dsl.template import new_parameters
 
@@ -76,13 +77,28 @@ def test_python_decorator_with_parameters():
         print_result().manifest.source
         == """\
 cat > /tmp/script << EOL
-import pickle
+import base64
+
+
+def _decode_argument(text):
+    header, text = text[:1], text[1:]
+    data = base64.b85decode(text.translate({46: 36, 44: 96, 91: 123, 93: 125}))
+    if header.isupper():
+        import zlib
+
+        header = header.lower()
+        data = zlib.decompress(data)
+    import pickle
+
+    return pickle.loads(data)
+
+
 a = "{{inputs.parameters.a}}"
 b = {{inputs.parameters.b}}
 c = {{inputs.parameters.c}}
 d = {{inputs.parameters.d}}
 e = {{inputs.parameters.e}}
-f = pickle.loads(bytearray.fromhex("{{inputs.parameters.f}}"), protocol=None)
+f = _decode_argument("{{inputs.parameters.f}}")
 g = "{{inputs.parameters.g}}"
 
 print(a * b)
@@ -99,7 +115,7 @@ python /tmp/script"""
     assert print_result().serialize_argument(1.1) == "1.1"
     assert print_result().serialize_argument(2j) == "2j"
     assert print_result().serialize_argument(True) == "True"
-    assert print_result().serialize_argument(re.compile("abc")) == str(pickle.dumps(re.compile("abc")).hex())
+    assert print_result().serialize_argument(re.compile("abc")) == Base85Codec().encode(re.compile("abc"))
 
     assert new_parameters(print_result.Parameters) == [
         v1alpha1.Parameter(name="a"),
@@ -107,7 +123,7 @@ python /tmp/script"""
         v1alpha1.Parameter(name="c", default="3.3"),
         v1alpha1.Parameter(name="d", default="False"),
         v1alpha1.Parameter(name="e", default="2j"),
-        v1alpha1.Parameter(name="f", default=str(pickle.dumps(re.compile("abc")).hex())),
+        v1alpha1.Parameter(name="f", default=Base85Codec().encode(re.compile("abc"))),
         v1alpha1.Parameter(name="g", valueFrom=v1alpha1.ValueFrom(default="4")),
     ]
 
@@ -0,0 +1,165 @@
+import random
+
+from datetime import datetime
+from typing import ClassVar
+
+import pytest
+import yaml
+
+from typing_extensions import Literal
+
+from argo_dsl.emitter import _Emitter
+from argo_dsl.emitter import _Unsupported
+from argo_dsl.emitter import dump_yaml
+from argo_dsl.template import ContainerTemplate
+from argo_dsl.template import ResourceTemplate
+from argo_dsl.template import ScriptTemplate
+from argo_dsl.utils import BlockDumper
+
+
+def block_dump(data):
+    return yaml.dump(data, Dumper=BlockDumper)
+
+
+def fast(data):
+    """
+    Whether `dump_yaml` writes `data` itself rather than falling back to PyYAML
+    """
+    emitter = _Emitter()
+    try:
+        if not emitter.container(data):
+            return False
+        emitter.mapping(data, 0, "") if isinstance(data, dict) else emitter.sequence(data, 0, "")
+    except _Unsupported:
+        return False
+    return True
+
+
+class Train(ScriptTemplate):
+    name: ClassVar[str] = "train"
+    image = "python:3.8"
+    source = """\
+import json
+import sys
+
+def main(epochs):
+    for epoch in range(int(epochs)):
+        print(json.dumps({"epoch": epoch, "loss": 1 / (epoch + 1)}))
+
+
+main("{{inputs.parameters.epochs}}")
+"""
+
+    class Parameters:
+        epochs: str = "10"
+        optimizer: Literal["sgd", "adam"] = "adam"
+        dataset: str
+
+
+class Fetch(ContainerTemplate):
+    name: ClassVar[str] = "fetch"
+    image = "curlimages/curl:7.77.0"
+    command = ["sh", "-c"]
+    args = [
+        "curl --fail --retry 5 --output /tmp/data.csv '{{inputs.parameters.url}}' && "
+        "echo 'downloaded {{inputs.parameters.url}} into /tmp/data.csv, checking the size: done' # ok",
+        "true",
+        "",
+        "-v",
+        "3",
+        "key: value",
+    ]
+
+    class Parameters:
+        url: str
+        retries: int = 3
+
+
+class Apply(ResourceTemplate):
+    name: ClassVar[str] = "apply"
+    action = "apply"
+    resource_manifest = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: cm\ndata:\n  a: '1'\n"
+    flags = ["--validate=false"]
+
+
+@pytest.mark.parametrize("template", [Train, Fetch, Apply])
+def test_templates(template):
+    manifest = template().to_manifest()
+    assert fast(manifest)
+    assert dump_yaml(manifest) == block_dump(manifest)
+    assert repr(template()) == block_dump(manifest)
+
+
+def test_styles():
+    data = {
+        "plain": ['a "b" \\', "a b", "-a", "a-", "a:b", "a#b", "http://x/y", "{{inputs.parameters.a}}", "1.5a", "~a"],
+        "quoted": ["", " a", "a ", "- a", "a: b", "a #b", "#a", "true", "No", "null", "~", "1", "1.5", "0x1f", "'a'"],
+        "scalars": [None, True, False, 0, -1, 10**30, 1.5, 1e20, 1e-7, float("inf"), -float("inf"), float("nan")],
+        "empty": {"mapping": {}, "sequence": []},
+        "nested": [[1, [2, 3]], [{"a": 1, "b": [{"c": "d"}]}]],
+        "literal": ["a\n\n  b  \nc\n", "one line\n"],
+        "'quoted key'": 1,
+        "": "empty key",
+        "long": "word " * 60 + "'quoted' " * 10,
+        "quoted long": "true " + "word  " * 30,
+    }
+    assert fast(data)
+    assert dump_yaml(data) == block_dump(data)
+    assert "literal:\n- |-\n  a\n\n    b\n  c\n- |-\n  one line\n" in dump_yaml(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": "caf\xe9"},
+        {"a": "tab\there"},
+        {"a": "   \n  \n"},
+        {"a": datetime(2021, 1, 1)},
+        {"a": (1, 2)},
+        {1: "a", "b": "c"},
+        {"multi\nline key": 1},
+        {"k" * 200: 1},
+        {},
+        [],
+        "scalar",
+    ],
+)
+def test_fallback(data):
+    assert not fast(data)
+    assert dump_yaml(data) == block_dump(data)
+
+
+def test_aliases():
+    shared = {"a": 1}
+    data = {"x": shared, "y": [shared]}
+    assert not fast(data)
+    assert dump_yaml(data) == block_dump(data)
+    assert "&id001" in dump_yaml(data)
+
+
+def test_random_documents():
+    rng = random.Random(0)
+    alphabet = "ab c-:#'?{}[],.!&*|>%@`019eE+_/~=<    \n\n"
+    words = ["true", "null", "yes", "on", "1.5", "0x1F", "12:30", "2001-01-01", "<<", "=", ".inf", "-", "---", "? x"]
+
+    def string():
+        if rng.random() < 0.3:
+            return rng.choice(words)
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200 if rng.random() < 0.4 else 12)))
+
+    def value(depth=0):
+        if depth > 4 or rng.random() < 0.5:
+            if rng.random() < 0.8:
+                return string()
+            return rng.choice([None, True, 0, -3, 10**20, 1.5, 1e-7, float("nan"), {}, []])
+        if rng.random() < 0.7:
+            return {string().replace("\n", "")[:30]: value(depth + 1) for _ in range(rng.randint(1, 5))}
+        return [value(depth + 1) for _ in range(rng.randint(1, 5))]
+
+    written = 0
+    for _ in range(300):
+        data = {string().replace("\n", "")[:30]: value() for _ in range(rng.randint(1, 4))}
+        written += fast(data)
+        assert dump_yaml(data) == block_dump(data)
+    # most documents are written by the emitter itself
+    assert written > 250
@@ -0,0 +1,129 @@
+import hashlib
+import json
+
+from typing import ClassVar
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.hashing import ContentHasher
+from argo_dsl.hashing import content_hash
+from argo_dsl.hashing import dedupe_templates
+from argo_dsl.manifest import to_manifest
+from argo_dsl.template import ScriptTemplate
+
+
+class Echo(ScriptTemplate):
+    name: ClassVar[str] = "echo"
+    image = "alpine"
+    source = "echo {{inputs.parameters.message}}"
+
+    class Parameters:
+        message: str = "hello"
+
+
+class Say(Echo):
+    name: ClassVar[str] = "say"
+
+
+class Shout(Echo):
+    name: ClassVar[str] = "shout"
+    source = "echo {{inputs.parameters.message}}!"
+
+
+def steps_template(name, *calls):
+    return v1alpha1.Template(
+        name=name, steps=[[v1alpha1.WorkflowStep(name=f"step-{i}", template=call)] for i, call in enumerate(calls)]
+    )
+
+
+def new_workflow(*templates, entrypoint="main"):
+    return v1alpha1.Workflow(
+        metadata={"generateName": "hello-"},
+        spec=v1alpha1.WorkflowSpec(entrypoint=entrypoint, templates=list(templates)),
+    )
+
+
+def test_template_hash():
+    manifest = to_manifest(Echo().template)
+    del manifest["name"]
+    expected = hashlib.sha256(json.dumps(manifest, separators=(",", ":"), sort_keys=True).encode()).hexdigest()
+
+    assert content_hash(Echo().template) == expected
+    assert content_hash(Say().template) == expected
+    assert content_hash(v1alpha1.Template.parse_obj(to_manifest(Say().template))) == expected
+    assert content_hash(Shout().template) != expected
+
+    template = Echo()
+    assert template.content_hash() == expected
+    assert template._content_hash == expected
+
+
+def test_workflow_hash():
+    echo, say = Echo().template, Say().template
+    workflow = new_workflow(steps_template("main", "echo", "say"), echo, say)
+    hasher = ContentHasher()
+    digest = hasher.content_hash(workflow)
+
+    assert digest == content_hash(new_workflow(steps_template("main", "echo", "say"), Echo().template, Say().template))
+    assert digest != content_hash(new_workflow(steps_template("main", "echo", "say"), echo, Shout().template))
+    assert digest != content_hash(new_workflow(steps_template("main", "echo", "say"), say, echo))
+
+    # templates are hashed once per hasher
+    assert len(hasher._templates) == 3
+    assert hasher.content_hash(workflow.copy(update={"metadata": {"name": "hello"}})) != digest
+    assert len(hasher._templates) == 3
+
+
+def test_dedupe_templates():
+    main = steps_template("main", "echo", "say", "shout")
+    workflow = new_workflow(main, Echo().template, Say().template, Shout().template)
+    manifest = to_manifest(workflow)
+
+    deduped = dedupe_templates(workflow)
+
+    assert [t.name for t in deduped.spec.templates] == ["main", "echo", "shout"]
+    assert [group.__root__[0].template for group in deduped.spec.templates[0].steps] == ["echo", "echo", "shout"]
+    assert to_manifest(workflow) == manifest
+    assert content_hash(deduped) != content_hash(workflow)
+    assert dedupe_templates(deduped) is deduped
+
+
+def test_dedupe_templates_callers():
+    # the callers only become identical once the templates they call are collapsed
+    workflow = new_workflow(
+        v1alpha1.Template(
+            name="main",
+            dag=v1alpha1.DAGTemplate(
+                tasks=[v1alpha1.DAGTask(name="a", template="run-echo"), v1alpha1.DAGTask(name="b", template="run-say")]
+            ),
+        ),
+        steps_template("run-echo", "echo"),
+        steps_template("run-say", "say"),
+        Echo().template,
+        Say().template,
+        entrypoint="run-say",
+    )
+    workflow.spec.onExit = "say"
+
+    deduped = dedupe_templates(workflow)
+
+    assert [t.name for t in deduped.spec.templates] == ["main", "run-echo", "echo"]
+    assert [task.template for task in deduped.spec.templates[0].dag.tasks] == ["run-echo", "run-echo"]
+    assert deduped.spec.entrypoint == "run-echo"
+    assert deduped.spec.onExit == "echo"
+    assert workflow.spec.templates[2].steps[0].__root__[0].template == "say"
+
+
+def test_dedupe_cron_workflow():
+    cron = v1alpha1.CronWorkflow(
+        metadata={"name": "cron"},
+        spec=v1alpha1.CronWorkflowSpec(
+            schedule="* * * * *",
+            workflowSpec=new_workflow(steps_template("main", "say"), Echo().template, Say().template).spec,
+        ),
+    )
+
+    deduped = dedupe_templates(cron)
+
+    assert [t.name for t in deduped.spec.workflowSpec.templates] == ["main", "echo"]
+    assert deduped.spec.schedule == "* * * * *"
+    assert dedupe_templates(deduped) is deduped
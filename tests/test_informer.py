@@ -0,0 +1,260 @@
+import asyncio
+import json
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.bulk import Backoff
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import ArgoServerError
+from argo_dsl.informer import CRON_WORKFLOWS
+from argo_dsl.informer import WORKFLOW_TEMPLATES
+from argo_dsl.informer import Informer
+from argo_dsl.informer import _Expired
+from argo_dsl.testing import StubArgoServer
+from argo_dsl.view import JSONScanError
+
+
+FAST_BACKOFF = Backoff(base=0.001, seed=0)
+
+
+def new_workflow(name, team="a", phase="Running", template="hello", namespace="argo"):
+    return v1alpha1.Workflow.parse_obj(
+        {
+            "metadata": {"name": name, "namespace": namespace, "labels": {"team": team}},
+            "spec": {"workflowTemplateRef": {"name": template}},
+            "status": {"phase": phase, "nodes": {name: {"id": name, "name": name, "type": "Pod", "phase": phase}}},
+        }
+    )
+
+
+def names(objects):
+    return sorted(obj.field("metadata")["name"] for obj in objects)
+
+
+def run(test, **informer_options):
+    async def main():
+        async with StubArgoServer() as server:
+            async with ArgoClient(server.url, namespace="argo") as client:
+                informer_options.setdefault("backoff", FAST_BACKOFF)
+                informer = Informer(client, **informer_options)
+                try:
+                    return await test(server, client, informer)
+                finally:
+                    await informer.stop()
+
+    return asyncio.run(main())
+
+
+async def eventually(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def event(type, name, resource_version, **fields):
+    workflow = {"metadata": {"name": name, "namespace": "argo", "resourceVersion": resource_version}, **fields}
+    return json.dumps({"result": {"type": type, "object": workflow}}).encode()
+
+
+def test_apply_events_and_indexes():
+    async def test(server, client, informer):
+        informer.apply(event("ADDED", "a", "1", status={"phase": "Running"}))
+        informer.apply(event("ADDED", "b", "2", status={"phase": "Running"}))
+        assert names(informer.by_phase("Running")) == ["a", "b"]
+        assert informer.resource_version == "2"
+
+        informer.apply(event("MODIFIED", "a", "3", status={"phase": "Succeeded"}))
+        assert names(informer.by_phase("Running")) == ["b"]
+        assert names(informer.by_phase("Succeeded")) == ["a"]
+        assert informer.get("argo", "a").status.phase == "Succeeded"
+
+        informer.apply(event("DELETED", "b", "4"))
+        assert informer.by_phase("Running") == []
+        assert "Running" not in informer.indexes["phase"]
+        assert len(informer) == 1
+
+        informer.apply(b'{"result": {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "9"}}}}')
+        assert informer.resource_version == "9"
+
+        with pytest.raises(_Expired):
+            informer.apply(b'{"error": {"http_code": 410, "message": "too old resource version"}}')
+        with pytest.raises(_Expired):
+            informer.apply(b'{"result": {"type": "ERROR", "object": {"code": 410}}}')
+        with pytest.raises(ArgoServerError) as error:
+            informer.apply(b'{"error": {"http_code": 403, "message": "forbidden"}}')
+        assert error.value.status == 403
+
+    run(test)
+
+
+def test_list_and_watch():
+    async def test(server, client, informer):
+        for i in range(5):
+            await client.create_workflow(new_workflow(f"wf-{i}", team="a" if i % 2 else "b"))
+
+        changes = []
+        informer.add_handler(lambda type, obj, previous: changes.append(type))
+        informer.page_size = 2
+        informer.start()
+        await informer.wait_synced(timeout=2)
+        assert len(informer) == 5
+        assert changes == ["ADDED"] * 5
+
+        assert names(informer.by_label("team", "a")) == ["wf-1", "wf-3"]
+        assert names(informer.by_label("team")) == [f"wf-{i}" for i in range(5)]
+        assert names(informer.by_namespace("argo")) == [f"wf-{i}" for i in range(5)]
+        assert names(informer.by_template_ref("hello")) == [f"wf-{i}" for i in range(5)]
+
+        server.update_workflow("argo", "wf-1", {"status": {"phase": "Succeeded"}})
+        await client.create_workflow(new_workflow("wf-5", template="other"))
+        await client.delete_workflow("wf-0")
+        await eventually(lambda: len(changes) == 8)
+        assert changes[5:] == ["MODIFIED", "ADDED", "DELETED"]
+
+        assert names(informer.find(phase="Running", labels={"team": "b"})) == ["wf-2", "wf-4"]
+        assert names(informer.find(phase="Succeeded", labels={"team": None})) == ["wf-1"]
+        assert names(informer.find(template_ref="other", namespace="argo")) == ["wf-5"]
+        assert informer.find(phase="Failed", labels={"team": "a"}) == []
+        assert len(informer.find()) == 5
+
+        # the unchanged nodes of an updated workflow are reused
+        workflow = informer.get("argo", "wf-1")
+        assert workflow.status.nodes["wf-1"].phase == "Running"
+
+    run(test)
+
+
+def test_resumes_dropped_watch():
+    async def test(server, client, informer):
+        await client.create_workflow(new_workflow("wf-0"))
+        informer.start()
+        await informer.wait_synced(timeout=2)
+        requests = server.requests
+
+        server.disconnect()
+        server.update_workflow("argo", "wf-0", {"status": {"phase": "Failed"}})
+        await eventually(lambda: informer.by_phase("Failed"))
+        # resumed from the last resource version, without listing again
+        assert server.requests == requests + 1
+
+    run(test)
+
+
+def test_relists_when_expired():
+    async def test(server, client, informer):
+        for i in range(3):
+            await client.create_workflow(new_workflow(f"wf-{i}"))
+        informer.start()
+        await informer.wait_synced(timeout=2)
+
+        deleted = []
+        informer.add_handler(lambda type, obj, previous: type == "DELETED" and deleted.append(previous))
+
+        # the informer misses these events, they are forgotten before it watches again
+        server.disconnect()
+        del server.workflows[("argo", "wf-0")]
+        server.update_workflow("argo", "wf-1", {"status": {"phase": "Succeeded"}})
+        server.compact()
+        await eventually(lambda: names(informer.list()) == ["wf-1", "wf-2"] and informer.by_phase("Succeeded"))
+        assert names(deleted) == ["wf-0"]
+
+    run(test)
+
+
+def test_failing_server():
+    async def test(server, client, informer):
+        server.fail(503, times=2)
+        informer.start()
+        await informer.wait_synced(timeout=2)
+        assert isinstance(informer.last_error, ArgoServerError)
+
+        failing = Informer(client, namespace="other", backoff=FAST_BACKOFF)
+        server.fail(403)
+        with pytest.raises(ArgoServerError):
+            await failing.run()
+
+    run(test)
+
+
+def test_unexpected_errors_are_raised():
+    async def test(server, client, informer):
+        await client.create_workflow(new_workflow("wf-0"))
+
+        def handler(event_type, obj, previous):
+            raise ValueError("bug in the handler")
+
+        informer.add_handler(handler)
+        with pytest.raises(ValueError, match="bug in the handler"):
+            await asyncio.wait_for(informer.run(), 2)
+
+    run(test)
+
+
+def test_gives_up_on_malformed_events():
+    async def test(server, client, informer):
+        watches = []
+
+        async def cut_short():
+            informer._watching = True
+            watches.append(informer.resource_version)
+            raise JSONScanError("unterminated value", 0)
+
+        informer.watch = cut_short
+        with pytest.raises(JSONScanError):
+            await asyncio.wait_for(informer.run(), 2)
+        assert len(watches) == FAST_BACKOFF.retries + 1
+        assert isinstance(informer.last_error, JSONScanError)
+
+    run(test)
+
+
+def test_custom_indexer():
+    async def test(server, client, informer):
+        await client.create_workflow(new_workflow("wf-0"))
+        await client.create_workflow(new_workflow("wf-1"))
+        informer.start()
+        await informer.wait_synced(timeout=2)
+        assert names(informer.index("first", "w")) == ["wf-0", "wf-1"]
+        assert names(informer.find(first="w", phase="Running")) == ["wf-0", "wf-1"]
+
+    run(test, indexers={"first": lambda workflow: workflow.field("metadata")["name"][:1]})
+
+
+def test_templates_and_cron_workflows_resync():
+    async def test(server, client, informer):
+        template = v1alpha1.WorkflowTemplate.parse_obj(
+            {"metadata": {"name": "hello", "labels": {"team": "a"}}, "spec": {"entrypoint": "main"}}
+        )
+        await client.create_workflow_template(template)
+        cron_workflow = v1alpha1.CronWorkflow.parse_obj(
+            {
+                "metadata": {"name": "nightly"},
+                "spec": {"schedule": "0 0 * * *", "workflowSpec": {"workflowTemplateRef": {"name": "hello"}}},
+            }
+        )
+        await client.create_cron_workflow(cron_workflow)
+
+        templates = Informer(client, WORKFLOW_TEMPLATES, resync_period=0.01)
+        cron_workflows = Informer(client, CRON_WORKFLOWS)
+        try:
+            templates.start()
+            cron_workflows.start()
+            await templates.wait_synced(timeout=2)
+            await cron_workflows.wait_synced(timeout=2)
+
+            assert [t.metadata.name for t in templates.by_label("team", "a")] == ["hello"]
+            assert [c.metadata.name for c in cron_workflows.by_template_ref("hello")] == ["nightly"]
+
+            await client.delete_workflow_template("hello")
+            await eventually(lambda: len(templates) == 0)
+        finally:
+            await templates.stop()
+            await cron_workflows.stop()
+
+        with pytest.raises(ValueError):
+            await templates.watch()
+
+    run(test)
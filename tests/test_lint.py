@@ -0,0 +1,323 @@
+import copy
+
+from typing import ClassVar
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.lint import ERROR
+from argo_dsl.lint import WARNING
+from argo_dsl.lint import Diagnostic
+from argo_dsl.lint import Linter
+from argo_dsl.lint import lint
+from argo_dsl.template import ScriptTemplate
+
+
+WORKFLOW = {
+    "apiVersion": "argoproj.io/v1alpha1",
+    "kind": "Workflow",
+    "metadata": {"generateName": "pipeline-"},
+    "spec": {
+        "entrypoint": "main",
+        "onExit": "notify",
+        "arguments": {"parameters": [{"name": "dataset", "value": "s3://data"}]},
+        "templates": [
+            {
+                "name": "main",
+                "steps": [
+                    [
+                        {
+                            "name": "prepare",
+                            "template": "echo",
+                            "arguments": {
+                                "parameters": [{"name": "message", "value": "{{workflow.parameters.dataset}}"}]
+                            },
+                        }
+                    ],
+                    [
+                        {
+                            "name": "train",
+                            "template": "train",
+                            "arguments": {
+                                "parameters": [{"name": "shard", "value": "{{item}}"}],
+                                "artifacts": [{"name": "data", "from": "{{steps.prepare.outputs.artifacts.out}}"}],
+                            },
+                            "withItems": [1, 2],
+                        },
+                        {"name": "report", "template": "fan", "when": "{{steps.prepare.outputs.parameters.size}} > 0"},
+                    ],
+                ],
+                "outputs": {
+                    "parameters": [
+                        {"name": "size", "valueFrom": {"parameter": "{{steps.prepare.outputs.parameters.size}}"}}
+                    ]
+                },
+            },
+            {
+                "name": "echo",
+                "inputs": {"parameters": [{"name": "message"}]},
+                "container": {"image": "alpine", "args": ["echo", "{{inputs.parameters.message}}", "{{pod.name}}"]},
+                "outputs": {
+                    "parameters": [{"name": "size", "valueFrom": {"path": "/tmp/size"}}],
+                    "artifacts": [{"name": "out", "path": "/tmp/out"}],
+                },
+            },
+            {
+                "name": "train",
+                "inputs": {
+                    "parameters": [{"name": "shard"}, {"name": "epochs", "default": "3"}],
+                    "artifacts": [
+                        {"name": "data", "path": "/data"},
+                        {"name": "code", "path": "/src", "git": {"repo": "r"}},
+                    ],
+                },
+                "script": {
+                    "image": "python",
+                    "source": "print('{{inputs.parameters.shard}}', '{{inputs.artifacts.data.path}}')",
+                },
+            },
+            {
+                "name": "fan",
+                "dag": {
+                    "tasks": [
+                        {
+                            "name": "a",
+                            "template": "echo",
+                            "arguments": {"parameters": [{"name": "message", "value": "a"}]},
+                        },
+                        {
+                            "name": "b",
+                            "template": "echo",
+                            "dependencies": ["a"],
+                            "arguments": {
+                                "parameters": [{"name": "message", "value": "{{tasks.a.outputs.parameters.size}}"}]
+                            },
+                        },
+                        {
+                            "name": "c",
+                            "template": "echo",
+                            "depends": "b.Succeeded || a",
+                            "arguments": {"parameters": [{"name": "message", "value": "{{tasks.a.status}}"}]},
+                        },
+                    ]
+                },
+            },
+            {"name": "notify", "suspend": {}},
+        ],
+    },
+}
+
+TEMPLATE = {
+    "kind": "WorkflowTemplate",
+    "metadata": {"name": "shared"},
+    "spec": {
+        "entrypoint": "say",
+        "arguments": {"parameters": [{"name": "who", "value": "world"}]},
+        "templates": [
+            {
+                "name": "say",
+                "inputs": {"parameters": [{"name": "text"}]},
+                "container": {"image": "alpine", "args": ["{{inputs.parameters.text}}", "{{workflow.parameters.who}}"]},
+            }
+        ],
+    },
+}
+
+
+def workflow():
+    return copy.deepcopy(WORKFLOW)
+
+
+def templates(manifest):
+    return {template["name"]: template for template in manifest["spec"]["templates"]}
+
+
+def codes(diagnostics):
+    return sorted(diagnostic.code for diagnostic in diagnostics)
+
+
+def test_valid_workflow():
+    assert lint(WORKFLOW) == []
+    assert lint(v1alpha1.Workflow.parse_obj(WORKFLOW)) == []
+    assert lint(TEMPLATE) == []
+
+
+def test_entrypoint_and_template_names():
+    manifest = workflow()
+    manifest["spec"]["entrypoint"] = "missing"
+    manifest["spec"]["onExit"] = "gone"
+    manifest["spec"]["templates"].append({"name": "echo", "suspend": {}})
+    manifest["spec"]["templates"].append({"name": "-bad_name", "suspend": {}, "container": {"image": "alpine"}})
+    diagnostics = lint(manifest)
+    assert codes(diagnostics) == [
+        "duplicate-template",
+        "invalid-name",
+        "template-type",
+        "unknown-template",
+        "unknown-template",
+    ]
+    assert Diagnostic(ERROR, "unknown-template", "template 'missing' not found", "spec.entrypoint") in diagnostics
+    assert (
+        Diagnostic(ERROR, "duplicate-template", "template 'echo' is not unique", "spec.templates[5].name")
+        in diagnostics
+    )
+
+    del manifest["spec"]["entrypoint"]
+    assert "missing-entrypoint" in codes(lint(manifest))
+
+
+def test_arguments():
+    manifest = workflow()
+    steps = templates(manifest)["main"]["steps"]
+    steps[0][0]["arguments"]["parameters"] = [{"name": "mesage", "value": "x"}]
+    del steps[1][0]["arguments"]["artifacts"]
+    diagnostics = lint(manifest)
+    assert [str(diagnostic) for diagnostic in diagnostics] == [
+        "spec.templates[0].steps[0][0].arguments: error: "
+        "input parameter 'message' of template 'echo' is not supplied [missing-argument]",
+        "spec.templates[0].steps[0][0].arguments.parameters[0]: warning: "
+        "template 'echo' has no input parameter 'mesage' [unknown-argument]",
+        "spec.templates[0].steps[1][0].arguments: error: "
+        "input artifact 'data' of template 'train' is not supplied [missing-argument]",
+    ]
+    assert diagnostics[1].severity == WARNING
+
+    # the workflow arguments supply the inputs of the entrypoint
+    manifest = workflow()
+    manifest["spec"]["entrypoint"] = "echo"
+    assert codes(lint(manifest)) == ["missing-argument"]
+    manifest["spec"]["arguments"]["parameters"].append({"name": "message", "value": "hi"})
+    assert lint(manifest) == []
+
+
+def test_references():
+    manifest = workflow()
+    by_name = templates(manifest)
+    by_name["echo"]["container"]["args"] += ["{{inputs.parameters.messages}}", "{{workflow.parameters.other}}"]
+    by_name["echo"]["container"]["command"] = ["{{item}}", "{{workflow.nam}}", "{{ =inputs.parameters.anything }}"]
+    steps = by_name["main"]["steps"]
+    # the same group has not run yet
+    steps[1][1]["when"] = "{{steps.train.status}} == Succeeded"
+    steps[1][0]["arguments"]["parameters"][0]["value"] = "{{steps.prepare.outputs.parameters.length}}"
+    tasks = by_name["fan"]["dag"]["tasks"]
+    # a is not a dependency of itself, c is not one of b
+    tasks[0]["arguments"]["parameters"][0]["value"] = "{{tasks.c.outputs.result}}"
+    tasks[1]["when"] = "{{tasks.a.phase}} and {{steps.prepare.status}}"
+
+    messages = {(d.path, d.message) for d in lint(manifest)}
+    assert messages == {
+        ("spec.templates[1].container.args[3]", "{{inputs.parameters.messages}} is not a declared input"),
+        ("spec.templates[1].container.args[4]", "{{workflow.parameters.other}} is not a workflow parameter"),
+        ("spec.templates[1].container.command[0]", "{{item}} is only set in loops"),
+        ("spec.templates[1].container.command[1]", "{{workflow.nam}} is not a workflow variable"),
+        ("spec.templates[0].steps[1][1].when", "{{steps.train.status}} refers to a step which has not run yet"),
+        (
+            "spec.templates[0].steps[1][0].arguments.parameters[0].value",
+            "{{steps.prepare.outputs.parameters.length}} is not an output of template 'echo'",
+        ),
+        (
+            "spec.templates[3].dag.tasks[0].arguments.parameters[0].value",
+            "{{tasks.c.outputs.result}} refers to a task which is not a dependency",
+        ),
+        ("spec.templates[3].dag.tasks[1].when", "{{tasks.a.phase}} is not a task variable"),
+        ("spec.templates[3].dag.tasks[1].when", "{{steps.prepare.status}} is not a step of this template"),
+    }
+
+
+def test_dag_dependencies():
+    manifest = workflow()
+    tasks = templates(manifest)["fan"]["dag"]["tasks"]
+    tasks[0]["dependencies"] = ["c"]
+    tasks[2]["depends"] = "b && missing.Failed"
+    tasks.append({"name": "b", "template": "notify"})
+    diagnostics = lint(manifest)
+    assert codes(diagnostics) == ["dependency-cycle", "duplicate-task", "unknown-dependency"]
+    cycle = next(d for d in diagnostics if d.code == "dependency-cycle")
+    assert cycle.message == "tasks 'a', 'b', 'c' depend on each other"
+
+
+def test_template_refs():
+    manifest = workflow()
+    steps = templates(manifest)["main"]["steps"]
+    steps[0].append({"name": "say", "templateRef": {"name": "shared", "template": "say"}})
+    steps[0].append({"name": "gone", "templateRef": {"name": "shared", "template": "gone"}})
+    steps[0].append({"name": "other", "templateRef": {"name": "other", "template": "say"}})
+    steps[0].append({"name": "both", "template": "echo", "templateRef": {"name": "shared", "template": "say"}})
+
+    # unknown workflow templates can not be checked
+    assert codes(lint(manifest)) == ["step-target"]
+
+    linter = Linter(workflow_templates=[TEMPLATE])
+    assert codes(linter.lint(manifest)) == [
+        "missing-argument",
+        "step-target",
+        "unknown-template",
+        "unknown-workflow-template",
+    ]
+
+    steps[0][1]["arguments"] = {"parameters": [{"name": "text", "value": "hi"}]}
+    assert codes(linter.lint(manifest)) == ["step-target", "unknown-template", "unknown-workflow-template"]
+
+    # cluster workflow templates are looked up separately
+    steps[0][3]["templateRef"]["clusterScope"] = True
+    assert "unknown-workflow-template" in codes(Linter(cluster_workflow_templates=[]).lint(manifest))
+
+
+def test_workflow_template_ref():
+    manifest = {"metadata": {"name": "run"}, "spec": {"workflowTemplateRef": {"name": "shared"}}}
+    assert lint(manifest) == []
+    assert codes(lint(manifest, workflow_templates=[])) == ["unknown-workflow-template"]
+
+    linter = Linter(workflow_templates=[v1alpha1.WorkflowTemplate.parse_obj(TEMPLATE)])
+    # the entrypoint of the workflow template needs its text
+    assert codes(linter.lint(manifest)) == ["missing-argument"]
+    manifest["spec"]["arguments"] = {"parameters": [{"name": "text", "value": "hi"}]}
+    assert linter.lint(manifest) == []
+
+    cron = v1alpha1.CronWorkflow.parse_obj(
+        {"metadata": {"name": "nightly"}, "spec": {"schedule": "@daily", "workflowSpec": manifest["spec"]}}
+    )
+    assert linter.lint(cron) == []
+    cron.spec.workflowSpec.entrypoint = "missing"
+    assert [d.path for d in linter.lint(cron)] == ["spec.workflowSpec.entrypoint"]
+
+
+def test_dsl_templates():
+    class Greet(ScriptTemplate):
+        name: ClassVar[str] = "greet"
+        image = "python:3.8"
+        source = "print('{{inputs.parameters.who}}')"
+
+        class Parameters:
+            who: str
+
+    manifest = {"spec": {"entrypoint": "greet", "templates": [Greet().to_manifest()]}}
+    assert codes(lint(manifest)) == ["missing-argument"]
+    manifest["spec"]["arguments"] = {"parameters": [{"name": "who", "value": "world"}]}
+    assert lint(manifest) == []
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_lint_all(processes):
+    broken = workflow()
+    broken["spec"]["entrypoint"] = "missing"
+    workflows = [WORKFLOW, broken] * 20
+
+    results = Linter().lint_all(workflows, processes=processes, chunk_size=4)
+    assert len(results) == 40
+    assert results[0] == []
+    assert codes(results[1]) == ["unknown-template"]
+    assert results == [lint(workflow) for workflow in workflows]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_lint_all_kind_of_models(processes):
+    manifest = copy.deepcopy(TEMPLATE)
+    del manifest["kind"]
+    # supplied on submission
+    manifest["spec"]["arguments"]["parameters"] = [{"name": "who"}]
+    template = v1alpha1.WorkflowTemplate.parse_obj(manifest)
+    assert lint(template) == []
+
+    results = Linter().lint_all([template] * 10, processes=processes, chunk_size=2)
+    assert results == [[]] * 10
@@ -0,0 +1,166 @@
+import asyncio
+import datetime
+import json
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import ArgoServerError
+from argo_dsl.listing import WorkflowPage
+from argo_dsl.listing import WorkflowSummary
+from argo_dsl.listing import iter_pages
+from argo_dsl.listing import iter_workflows
+from argo_dsl.testing import StubArgoServer
+from argo_dsl.testing import select_fields
+
+
+def new_workflow(i, namespace="argo"):
+    return {
+        "metadata": {
+            "name": f"wf-{i}",
+            "namespace": namespace,
+            "uid": f"uid-{i}",
+            "creationTimestamp": "2021-05-01T10:00:00Z",
+            "labels": {"team": "a" if i % 2 else "b"},
+        },
+        "spec": {"entrypoint": "main"},
+        "status": {
+            "phase": "Succeeded",
+            "startedAt": "2021-05-01T10:00:00Z",
+            "finishedAt": "2021-05-01T10:01:00Z",
+            "nodes": {f"wf-{i}": {"id": f"wf-{i}", "name": f"wf-{i}", "type": "Pod"}},
+        },
+    }
+
+
+def run(test, workflows=0, archived=0):
+    async def main():
+        async with StubArgoServer() as server:
+            for i in range(workflows):
+                server.workflows[("argo", f"wf-{i}")] = new_workflow(i)
+            for i in range(archived):
+                server.archived_workflows[("argo", f"wf-{i}")] = new_workflow(i)
+            async with ArgoClient(server.url, namespace="argo") as client:
+                return await test(server, client)
+
+    return asyncio.run(main())
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_workflow_summary():
+    buf = json.dumps({"items": [new_workflow(1)]}).encode()
+    start = buf.index(b"{", 1)
+    summary = WorkflowSummary.parse(buf, (start, len(buf) - 2))
+    assert summary.name == "wf-1"
+    assert summary.namespace == "argo"
+    assert summary.uid == "uid-1"
+    assert summary.labels == {"team": "a"}
+    assert summary.phase == "Succeeded"
+    assert summary.creation_timestamp == datetime.datetime(2021, 5, 1, 10, tzinfo=datetime.timezone.utc)
+    assert summary.finished_at - summary.started_at == datetime.timedelta(minutes=1)
+
+    empty = WorkflowSummary.parse(b"{}", (0, 2))
+    assert empty.name is None
+    assert empty.phase is None
+    assert empty.started_at is None
+
+
+def test_workflow_page():
+    page = WorkflowPage.parse(b'{"metadata": {"continue": "2", "resourceVersion": "7"}, "items": [{"a": 1}, {}]}')
+    assert len(page) == 2
+    assert page.continue_ == "2"
+    assert page.resource_version == "7"
+    assert [json.loads(page.buf[start:end]) for start, end in page.spans] == [{"a": 1}, {}]
+
+    last = WorkflowPage.parse(b'{"metadata": {"continue": ""}, "items": null}')
+    assert len(last) == 0
+    assert last.continue_ is None
+
+
+def test_select_fields():
+    data = {"metadata": {"continue": "1", "x": 1}, "items": [{"metadata": {"name": "a", "uid": "1"}, "spec": {}}]}
+    assert select_fields(data, "metadata.continue,items.metadata.name") == {
+        "metadata": {"continue": "1"},
+        "items": [{"metadata": {"name": "a"}}],
+    }
+    assert select_fields(data, "-items.spec,metadata") == {"items": [{"metadata": {"name": "a", "uid": "1"}}]}
+    assert select_fields(data, None) is data
+
+
+def test_iter_workflows():
+    async def test(server, client):
+        summaries = await collect(iter_workflows(client, page_size=7))
+        assert [summary.name for summary in summaries] == [f"wf-{i}" for i in range(25)]
+        assert all(summary.phase == "Succeeded" for summary in summaries)
+        # 4 pages
+        assert server.requests == 4
+
+        team_a = await collect(iter_workflows(client, label_selector="team=a", page_size=5))
+        assert len(team_a) == 12
+
+        assert await collect(iter_workflows(client, namespace="other")) == []
+
+        # namespaces are quoted
+        server.workflows[("a/b", "wf-25")] = new_workflow(25, namespace="a/b")
+        assert [summary.name for summary in await collect(iter_workflows(client, namespace="a/b"))] == ["wf-25"]
+
+    run(test, workflows=25)
+
+
+def test_iter_pages_selects_fields():
+    async def test(server, client):
+        pages = await collect(iter_pages(client, page_size=2))
+        assert [len(page) for page in pages] == [2, 1]
+        for page in pages:
+            for start, end in page.spans:
+                item = json.loads(page.buf[start:end])
+                assert set(item) == {"metadata", "status"}
+                assert "nodes" not in item["status"]
+
+        pages = await collect(iter_pages(client, page_size=2, fields=None))
+        item = json.loads(pages[0].buf[slice(*pages[0].spans[0])])
+        assert "nodes" in item["status"]
+
+    run(test, workflows=3)
+
+
+def test_iter_workflows_parse_models():
+    async def test(server, client):
+        def parse(buf, span):
+            return v1alpha1.Workflow.parse_raw(buf[span[0] : span[1]])
+
+        workflows = await collect(iter_workflows(client, fields=None, parse=parse))
+        assert [workflow.spec.entrypoint for workflow in workflows] == ["main"] * 3
+
+    run(test, workflows=3)
+
+
+def test_iter_archived_workflows():
+    async def test(server, client):
+        summaries = await collect(iter_workflows(client, archived=True, page_size=2))
+        assert [summary.name for summary in summaries] == ["wf-0", "wf-1", "wf-2"]
+
+    run(test, archived=3)
+
+
+def test_iter_pages_prefetches():
+    async def test(server, client):
+        pages = iter_pages(client, page_size=5)
+        await pages.__anext__()
+        await asyncio.sleep(0.05)
+        # the second page was requested before the first one was consumed
+        assert server.requests == 2
+        await pages.aclose()
+
+        with pytest.raises(ArgoServerError):
+            server.fail(500)
+            await collect(iter_workflows(client))
+
+        with pytest.raises(ValueError):
+            await collect(iter_pages(client, page_size=0))
+
+    run(test, workflows=20)
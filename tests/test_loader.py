@@ -0,0 +1,189 @@
+import ast
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from argo_dsl import loader
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+
+
+# the lazy import of argo_dsl.template may take at most this share of the eager
+# one, third-party imports excluded
+IMPORT_TIME_BUDGET = 0.5
+
+
+def run_python(code: str, **env) -> str:
+    return subprocess.check_output(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        env={**os.environ, **env},
+        universal_newlines=True,
+    ).strip()
+
+
+def test_build_index():
+    source = b"""\
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class A(BaseModel):
+    b: Optional[B] = None
+
+
+class B(BaseModel):
+    value: int
+"""
+    prelude, entries = loader.build_index(source, "<test>")
+
+    assert [(name, dependencies) for name, dependencies, _ in entries] == [("A", ("B",)), ("B", ())]
+    assert loader.build_index(source + b"\nA.update_forward_refs()\n", "<test>") is None
+
+
+def test_slim():
+    source = b"""\
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class A(BaseModel):
+    a: str = Field(..., description="a", title="A")
+    b: int = Field(None, alias="c", description="b")
+"""
+    _, entries = loader.build_index(source, "<test>", slim_fields=True)
+    namespace = {}
+    exec(entries[0][2], {"BaseModel": BaseModel, "Field": Field}, namespace)
+    fields = namespace["A"].__fields__
+
+    assert fields["a"].required
+    assert fields["a"].field_info.description is None
+    assert fields["a"].field_info.title is None
+    assert fields["b"].alias == "c"
+    assert fields["b"].field_info.description is None
+
+    tree = loader.slim(
+        ast.parse("from pydantic import BaseModel, Field\nclass A(BaseModel):\n    a: str = Field(...)\n")
+    )
+    assert "Field" not in ast.dump(tree)
+
+
+def test_slim_sources_needs_unparse(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "version_info", (3, 8, 10))
+    with pytest.raises(RuntimeError, match="python 3.9"):
+        loader.slim_sources([str(tmp_path)])
+
+
+def test_slim_module():
+    assert (
+        run_python(
+            """
+        from argo_dsl.api.io.argoproj.workflow import v1alpha1
+
+        print(v1alpha1.Artifact.__fields__["from_"].alias, v1alpha1.Artifact.__fields__["name"].field_info.description)
+        """,
+            ARGO_DSL_SLIM_API="1",
+        )
+        == "from None"
+    )
+
+
+def test_lazy_module():
+    assert loader.is_lazy(v1alpha1)
+    assert "NodeStatus" in v1alpha1.__all__
+    assert "NodeStatus" in dir(v1alpha1)
+
+    node_status = v1alpha1.NodeStatus
+    assert "NodeStatus" not in v1alpha1.__lazy__.pending
+    assert "Inputs" not in v1alpha1.__lazy__.pending
+    assert node_status.__module__ == v1alpha1.__name__
+    assert v1alpha1.NodeStatus.parse_obj(
+        {"id": "a", "name": "a", "type": "Pod", "inputs": {"parameters": [{"name": "p"}]}}
+    ).inputs == v1alpha1.Inputs(parameters=[v1alpha1.Parameter(name="p")])
+
+
+def test_lazy_module_missing_attribute():
+    try:
+        v1alpha1.NotAModel
+    except AttributeError as e:
+        assert "NotAModel" in str(e)
+    else:  # pragma: no cover
+        raise AssertionError("AttributeError not raised")
+
+
+def test_lazy_module_is_disabled():
+    assert (
+        run_python(
+            """
+            from argo_dsl.api.io.argoproj.workflow import v1alpha1
+            print(hasattr(v1alpha1, "__lazy__"))
+            """,
+            ARGO_DSL_LAZY_API="0",
+        )
+        == "False"
+    )
+    assert (
+        run_python(
+            """
+            from argo_dsl.api.io.argoproj.workflow import v1alpha1
+            print(len(v1alpha1.__lazy__.pending), v1alpha1.Template.__fields__["name"].field_info.description)
+            """,
+            ARGO_DSL_LAZY_API="0",
+            ARGO_DSL_SLIM_API="1",
+        )
+        == "0 None"
+    )
+
+
+def test_import_is_lazy():
+    # argo_dsl.template imports the generated models it needs lazily, building none of them
+    output = run_python(
+        """
+        import sys
+
+        from pydantic import BaseModel
+
+        import argo_dsl.template
+        from argo_dsl import loader
+
+        for name, module in sorted(sys.modules.items()):
+            if not name.startswith("argo_dsl.api.") or hasattr(module, "__path__"):
+                continue
+            built = [
+                value.__name__
+                for value in vars(module).values()
+                if isinstance(value, type) and issubclass(value, BaseModel) and value.__module__ == name
+            ]
+            print(name, loader.is_lazy(module), built)
+        """
+    )
+
+    modules = dict(line.split(" ", 1) for line in output.splitlines())
+    assert modules["argo_dsl.api.io.argoproj.workflow.v1alpha1"] == "True []"
+    assert set(modules.values()) == {"True []"}
+    assert not any(".events." in name or name.endswith(("sensor", "eventsource")) for name in modules)
+
+
+def test_import_time_budget():
+    code = """
+        import time
+
+        import pydantic
+        import yaml
+
+        start = time.perf_counter()
+        import argo_dsl.template
+        print(time.perf_counter() - start)
+        """
+
+    def import_time(lazy: str) -> float:
+        return min(float(run_python(code, **{loader.LAZY_API_ENV: lazy})) for _ in range(3))
+
+    assert import_time("1") < IMPORT_TIME_BUDGET * import_time("0")
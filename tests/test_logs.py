@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.client import ArgoClient
+from argo_dsl.client import ArgoServerError
+from argo_dsl.logs import CompactEventSourceLogEntry
+from argo_dsl.logs import CompactLogEntry
+from argo_dsl.logs import CompactSensorLogEntry
+from argo_dsl.logs import LogReader
+from argo_dsl.logs import aiter_log_entries
+from argo_dsl.logs import iter_log_entries
+from argo_dsl.logs import read_log_file
+from argo_dsl.testing import StubArgoServer
+
+
+ENTRIES = [{"podName": f"hello-{i % 3}", "content": f'line {i} "podName": "hello-1" {{}}\n\\ ü'} for i in range(30)]
+
+
+def stream(entries, wrap=True):
+    return b"".join(json.dumps({"result": entry} if wrap else entry).encode() + b"\n" for entry in entries)
+
+
+def split(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def contents(entries):
+    return [entry.content for entry in entries]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+def test_chunk_boundaries(size):
+    data = stream(ENTRIES)
+    entries = list(iter_log_entries(split(data, size)))
+    assert all(isinstance(entry, CompactLogEntry) for entry in entries)
+    assert contents(entries) == [entry["content"] for entry in ENTRIES]
+    assert entries[4].to_model() == v1alpha1.LogEntry.parse_obj(ENTRIES[4])
+
+    # without a last line break, blank lines and plain entries
+    data = b"\n\r\n" + stream(ENTRIES[:2], wrap=False) + b"  \n" + stream(ENTRIES[2:3])[:-1]
+    assert contents(iter_log_entries(split(data, size))) == [entry["content"] for entry in ENTRIES[:3]]
+
+    # white space around entries
+    data = b" " + stream(ENTRIES[:1]).replace(b"}\n", b"} \r\n") + b'\t{"content": "x"}'
+    assert contents(iter_log_entries(split(data, size))) == [ENTRIES[0]["content"], "x"]
+
+    with pytest.raises(ValueError):
+        list(iter_log_entries(split(stream(ENTRIES[:2]) + b'{"content": "x"} }\n', size)))
+    with pytest.raises(ValueError):
+        list(iter_log_entries(split(b'{"content": "x\n', size)))
+
+
+@pytest.mark.parametrize("size", [1, 13, 1 << 20])
+def test_filters(size):
+    data = stream(ENTRIES)
+
+    def read(**filters):
+        return [entry.content for entry in iter_log_entries(split(data, size), **filters)]
+
+    assert read(podName="hello-1") == [entry["content"] for entry in ENTRIES[1::3]]
+    assert read(podName=["hello-0", "hello-2"]) == [e["content"] for e in ENTRIES if e["podName"] != "hello-1"]
+    assert read(podName="hello-3") == []
+    # the content does not match, however it looks like
+    assert read(content=ENTRIES[5]["content"]) == [ENTRIES[5]["content"]]
+    assert read(podName="hello-2", content=[ENTRIES[5]["content"], ENTRIES[6]["content"]]) == [ENTRIES[5]["content"]]
+
+    with pytest.raises(ValueError, match="level"):
+        LogReader(CompactLogEntry, level="error")
+
+
+def test_escaped_values_are_found():
+    # a value json may escape is checked after decoding only
+    line = b'{"result": {"podName": "a\\u002fb", "content": "x"}}\n'
+    assert contents(iter_log_entries([line], podName="a/b")) == ["x"]
+    assert contents(iter_log_entries([line], podName=["a/b", "c"])) == ["x"]
+
+
+@pytest.mark.parametrize("filters", [{}, {"podName": "hello-1"}])
+def test_error_line(filters):
+    data = stream(ENTRIES[:3]) + b'{"error": {"grpc_code": 5, "http_code": 404, "message": "pod not found"}}\n'
+    entries = []
+    with pytest.raises(ArgoServerError) as error:
+        for entry in iter_log_entries(split(data, 50), **filters):
+            entries.append(entry)
+    assert error.value.status == 404
+    assert error.value.message == "pod not found"
+    assert contents(entries) == [
+        e["content"] for e in ENTRIES[:3] if e["podName"] == filters.get("podName", e["podName"])
+    ]
+
+
+def test_sensor_and_event_source_entries(tmp_path):
+    sensor_entries = [
+        {"namespace": "argo", "sensorName": "s", "triggerName": f"t{i % 2}", "level": "info", "msg": f"m{i}"}
+        for i in range(6)
+    ]
+    sensor_entries[3]["level"] = "error"
+    sensor_entries[3]["time"] = "2021-01-01T00:00:00Z"
+    path = tmp_path / "sensor.log"
+    path.write_bytes(stream(sensor_entries))
+
+    entries = list(read_log_file(path, CompactSensorLogEntry, level="error", triggerName=["t1"]))
+    assert [entry.msg for entry in entries] == ["m3"]
+    assert entries[0].time == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert [entry.msg for entry in read_log_file(path, CompactSensorLogEntry, triggerName="t0")] == ["m0", "m2", "m4"]
+    assert len(list(read_log_file(path, CompactSensorLogEntry))) == 6
+
+    path.write_bytes(b"")
+    assert list(read_log_file(path, CompactSensorLogEntry)) == []
+
+    event = {"eventSourceName": "webhook", "eventSourceType": "webhook", "eventName": "example", "msg": "received"}
+    entries = list(iter_log_entries([stream([event])], CompactEventSourceLogEntry, eventName="example"))
+    assert [entry.msg for entry in entries] == ["received"]
+
+
+def test_async_reader():
+    async def chunks():
+        for chunk in split(stream(ENTRIES), 11):
+            yield chunk
+
+    async def read():
+        return [entry async for entry in aiter_log_entries(chunks(), podName="hello-0")]
+
+    assert contents(asyncio.run(read())) == [entry["content"] for entry in ENTRIES[::3]]
+
+
+def test_workflow_logs():
+    async def main():
+        async with StubArgoServer() as server:
+            server.logs[("argo", "hello")] = ENTRIES
+            async with ArgoClient(server.url, namespace="argo") as client:
+                async with await client.workflow_logs("hello") as response:
+                    entries = [entry async for entry in aiter_log_entries(response.chunks())]
+                assert contents(entries) == [entry["content"] for entry in ENTRIES]
+
+                async with await client.workflow_logs("hello", pod_name="hello-2") as response:
+                    entries = [entry async for entry in aiter_log_entries(response.chunks())]
+                assert [entry.podName for entry in entries] == ["hello-2"] * 10
+
+                with pytest.raises(ArgoServerError) as error:
+                    await client.workflow_logs("missing")
+                assert error.value.status == 404
+
+    asyncio.run(main())
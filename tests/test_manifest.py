@@ -0,0 +1,160 @@
+import json
+
+from datetime import datetime
+from datetime import timezone
+from os import path
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from pydantic import BaseModel
+
+from argo_dsl import manifest
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.manifest import JsonBackend
+from argo_dsl.manifest import get_json_backend
+from argo_dsl.manifest import set_json_backend
+from argo_dsl.manifest import to_json
+from argo_dsl.manifest import to_json_bytes
+from argo_dsl.manifest import to_manifest
+from argo_dsl.template import ScriptTemplate
+
+
+WORKFLOW = {
+    "metadata": {"generateName": "demo-", "labels": {"app": "demo"}},
+    "spec": {
+        "entrypoint": "main",
+        "activeDeadlineSeconds": 60,
+        "templates": [
+            {
+                "name": "main",
+                "steps": [
+                    [
+                        {
+                            "name": "a",
+                            "template": "echo",
+                            "arguments": {"parameters": [{"name": "msg", "value": "hello"}]},
+                        }
+                    ],
+                    [{"name": "b", "template": "echo", "withItems": [1, "two", {"three": 3}]}],
+                ],
+            },
+            {
+                "name": "echo",
+                "inputs": {
+                    "parameters": [{"name": "msg"}],
+                    "artifacts": [{"name": "art", "from": "{{steps.a.outputs.artifacts.art}}"}],
+                },
+                "container": {
+                    "image": "alpine",
+                    "command": ["echo", "{{inputs.parameters.msg}}"],
+                    "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+                    "ports": [{"containerPort": 80}],
+                    "livenessProbe": {"httpGet": {"port": 8080, "path": "/"}},
+                },
+            },
+        ],
+    },
+    "status": {"phase": "Running", "startedAt": datetime(2021, 1, 1)},
+}
+
+
+def test_to_manifest():
+    workflow = v1alpha1.Workflow.parse_obj(WORKFLOW)
+
+    assert to_manifest(workflow) == workflow.dict(exclude_none=True, by_alias=True)
+    assert to_manifest(workflow)["spec"]["templates"][1]["inputs"]["artifacts"][0]["from"] == (
+        "{{steps.a.outputs.artifacts.art}}"
+    )
+    assert to_manifest(v1alpha1.ParallelSteps.parse_obj([{"name": "a"}])) == [{"name": "a"}]
+
+
+def test_to_manifest_of_constructed_model():
+    template = v1alpha1.Template.construct(name="a", inputs={"parameters": [v1alpha1.Parameter(name="p")]})
+
+    assert to_manifest(template) == {"name": "a", "inputs": {"parameters": [{"name": "p"}]}}
+
+
+def test_to_manifest_of_custom_model():
+    class Custom(BaseModel):
+        name: str
+        nested: Optional[List[v1alpha1.Parameter]] = None
+        labels: Dict[str, str] = {}
+        ignored: Optional[int] = None
+
+    custom = Custom(name="a", nested=[{"name": "p", "default": "1"}], labels={"a": "b"})
+
+    assert to_manifest(custom) == custom.dict(exclude_none=True, by_alias=True)
+    assert manifest.serializer_name(Custom) in manifest.generate_serializer(Custom)
+
+
+def test_template_to_manifest():
+    class Echo(ScriptTemplate):
+        image = "alpine"
+        source = "echo hello"
+
+    assert Echo().to_manifest() == {
+        "name": "Echo",
+        "inputs": {},
+        "script": {"image": "alpine", "source": "echo hello"},
+    }
+
+
+def test_generated_serializers_are_up_to_date():
+    with open(path.join(path.dirname(manifest.__file__), "api", "serializers.py")) as f:
+        assert f.read() == manifest.generate_serializers_module(manifest.api_models())
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    previous = get_json_backend()
+    set_json_backend(request.param)
+    yield get_json_backend()
+    set_json_backend(previous)
+
+
+def test_to_json(json_backend):
+    workflow = v1alpha1.Workflow.parse_obj(WORKFLOW)
+    workflow.metadata.annotations = {"note": "caf\xe9"}
+    workflow.status.finishedAt = datetime(2021, 1, 1, 0, 1, tzinfo=timezone.utc)
+
+    expected = json.loads(json.dumps(to_manifest(workflow), default=datetime.isoformat))
+    assert json.loads(to_json_bytes(workflow)) == expected
+    assert json.loads(to_json(workflow)) == expected
+    assert '"note":"caf\xe9"' in to_json(workflow)
+    assert to_json_bytes({"a": [workflow.spec.templates[0].steps[0]], "b": {1}}) == (
+        b'{"a":[[{"arguments":{"parameters":[{"name":"msg","value":"hello"}]},"name":"a","template":"echo"}]],"b":[1]}'
+    )
+    assert to_json_bytes(v1alpha1.ParallelSteps.parse_obj([{"name": "a"}])) == b'[{"name":"a"}]'
+
+    with pytest.raises(TypeError):
+        to_json_bytes({"a": object()})
+
+
+def test_template_to_json(json_backend):
+    class Echo(ScriptTemplate):
+        image = "alpine"
+        source = "echo hello"
+
+    assert Echo().to_json_bytes() == b'{"inputs":{},"name":"Echo","script":{"image":"alpine","source":"echo hello"}}'
+    assert json.loads(Echo().to_json()) == Echo().to_manifest()
+
+
+def test_custom_json_backend():
+    with pytest.raises(TypeError):
+        JsonBackend()
+
+    class Sorted(JsonBackend):
+        def dumps(self, data, default):
+            return json.dumps(data, default=default, sort_keys=True).encode()
+
+    previous = get_json_backend()
+    set_json_backend(Sorted())
+    try:
+        assert to_json(v1alpha1.Parameter(name="p", default="1")) == '{"default": "1", "name": "p"}'
+    finally:
+        set_json_backend(previous)
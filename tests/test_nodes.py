@@ -0,0 +1,176 @@
+import base64
+import json
+import zlib
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.nodes import NodeIndex
+from argo_dsl.nodes import OffloadedNodesError
+from argo_dsl.nodes import compress_nodes
+from argo_dsl.nodes import decode_compressed_nodes
+from argo_dsl.nodes import inflate
+from argo_dsl.nodes import iter_members
+from argo_dsl.nodes import status_nodes
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.status import CompactWorkflowStatus
+from argo_dsl.view import JSONScanError
+
+
+NODES = {
+    "wf": {"id": "wf", "name": "wf", "type": "Steps", "phase": "Running", "children": ["wf-1", "wf-2"]},
+    "wf-1": {"id": "wf-1", "name": "wf[0]", "type": "Pod", "message": 'brackets } ] and "quotes"'},
+    "wf-é": {"id": "wf-é", "name": "wf[1]", "type": "Pod", "startedAt": "2021-01-01T00:00:00Z"},
+}
+
+
+def test_inflate():
+    data = json.dumps(NODES).encode() * 100
+    chunks = list(inflate(base64.b64encode(zlib.compress(data)).decode()))
+    assert b"".join(chunks) == data
+
+    chunks = list(inflate(base64.b64encode(zlib.compress(data)), chunk_size=64))
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) <= 64
+
+    with pytest.raises(zlib.error):
+        list(inflate(base64.b64encode(zlib.compress(data)[:-10])))
+
+    # rounded down to a multiple of 4
+    assert b"".join(inflate(base64.b64encode(zlib.compress(data)), chunk_size=5)) == data
+    with pytest.raises(ValueError, match="at least 4"):
+        list(inflate(base64.b64encode(zlib.compress(data)), chunk_size=3))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_members(chunk_size):
+    raw = json.dumps({"a": {"b": [1, 2]}, 'c"d': 12345, "e": "}", "f": None}, indent=2).encode()
+    chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+
+    assert [(key, json.loads(value)) for key, value in iter_members(chunks)] == [
+        ("a", {"b": [1, 2]}),
+        ('c"d', 12345),
+        ("e", "}"),
+        ("f", None),
+    ]
+    assert list(iter_members([b" {", b" } "])) == []
+
+
+@pytest.mark.parametrize("raw", [b"[]", b'{"a" 1}', b'{"a": 1 "b": 2}', b'{"a": 1,}', b'{"a": {}', b""])
+def test_iter_members_invalid(raw):
+    with pytest.raises(JSONScanError):
+        list(iter_members([raw]))
+
+
+def test_decode_compressed_nodes():
+    nodes = decode_compressed_nodes(compress_nodes(NODES), chunk_size=16)
+
+    assert list(nodes) == list(NODES)
+    assert all(isinstance(node, CompactNodeStatus) for node in nodes.values())
+    assert nodes["wf"].children == ("wf-1", "wf-2")
+    assert nodes["wf-1"].message == NODES["wf-1"]["message"]
+
+    nodes = decode_compressed_nodes(compress_nodes(NODES), node_class=v1alpha1.NodeStatus.parse_obj)
+    assert nodes == {node_id: v1alpha1.NodeStatus.parse_obj(node) for node_id, node in NODES.items()}
+
+
+def test_status_nodes():
+    compressed = {"phase": "Running", "compressedNodes": compress_nodes(NODES)}
+    assert list(status_nodes(v1alpha1.WorkflowStatus.parse_obj(compressed))) == list(NODES)
+    assert list(status_nodes(CompactWorkflowStatus(compressed))) == list(NODES)
+
+    status = CompactWorkflowStatus({"nodes": NODES})
+    assert status_nodes(status) is status.nodes
+    assert status_nodes(CompactWorkflowStatus({})) == {}
+
+    with pytest.raises(OffloadedNodesError) as e:
+        status_nodes(CompactWorkflowStatus({"offloadNodeStatusVersion": "fnv:1"}))
+    assert e.value.version == "fnv:1"
+
+
+DAG = {
+    "wf": {
+        "id": "wf",
+        "name": "wf",
+        "type": "DAG",
+        "phase": "Failed",
+        "templateName": "main",
+        "children": ["wf-a", "wf-b"],
+    },
+    "wf-a": {
+        "id": "wf-a",
+        "name": "wf-a",
+        "type": "Pod",
+        "phase": "Succeeded",
+        "templateName": "step",
+        "boundaryID": "wf",
+    },
+    "wf-b": {
+        "id": "wf-b",
+        "name": "wf-b",
+        "type": "Retry",
+        "phase": "Failed",
+        "templateName": "step",
+        "boundaryID": "wf",
+        "children": ["wf-b-1", "wf-b-2"],
+    },
+    "wf-b-1": {
+        "id": "wf-b-1",
+        "name": "wf-b-1",
+        "type": "Pod",
+        "phase": "Failed",
+        "templateName": "step",
+        "children": ["wf-c"],
+    },
+    "wf-b-2": {
+        "id": "wf-b-2",
+        "name": "wf-b-2",
+        "type": "Pod",
+        "phase": "Failed",
+        "templateName": "step",
+        "children": ["wf-c"],
+    },
+    "wf-c": {
+        "id": "wf-c",
+        "name": "wf-c",
+        "type": "Pod",
+        "phase": "Omitted",
+        "boundaryID": "wf",
+        "children": ["missing"],
+    },
+}
+
+
+@pytest.mark.parametrize("node_class", [CompactNodeStatus.parse_obj, v1alpha1.NodeStatus.parse_obj])
+def test_node_index(node_class):
+    index = NodeIndex({node_id: node_class(node) for node_id, node in DAG.items()})
+
+    assert len(index) == 6
+    assert "wf-a" in index
+    assert index["wf-a"].phase == "Succeeded"
+
+    assert [node.id for node in index.by_phase("Failed")] == ["wf", "wf-b", "wf-b-1", "wf-b-2"]
+    assert [node.id for node in index.by_template("step")] == ["wf-a", "wf-b", "wf-b-1", "wf-b-2"]
+    assert [node.id for node in index.by_type("Retry")] == ["wf-b"]
+    assert [node.id for node in index.by_boundary("wf")] == ["wf-a", "wf-b", "wf-c"]
+    assert index.by_phase("Running") == ()
+
+    assert index.roots == ("wf",)
+    assert index.leaves == ("wf-a", "wf-c")
+    assert index.children("wf-c") == ()
+    assert index.parents("wf-c") == ("wf-b-1", "wf-b-2")
+    assert list(index.subtree("wf")) == ["wf", "wf-a", "wf-b", "wf-b-1", "wf-c", "wf-b-2"]
+    assert list(index.subtree("wf-b", include_self=False)) == ["wf-b-1", "wf-c", "wf-b-2"]
+    assert list(index.ancestors("wf-c")) == ["wf-b-1", "wf-b-2", "wf-b", "wf"]
+
+    assert [node.id for node in index.find(phase="Failed", template_name="step")] == ["wf-b", "wf-b-1", "wf-b-2"]
+    assert [node.id for node in index.find(phase="Failed", leaf=False, type_="Pod")] == ["wf-b-1", "wf-b-2"]
+    assert [node.id for node in index.find(boundary_id="wf", leaf=True)] == ["wf-a", "wf-c"]
+    assert len(index.find()) == 6
+    assert index.find(phase="Failed", template_name="step") is index.find(phase="Failed", template_name="step")
+
+
+def test_node_index_from_status():
+    index = NodeIndex.from_status(CompactWorkflowStatus({"compressedNodes": compress_nodes(DAG)}))
+    assert index.roots == ("wf",)
+    assert isinstance(index["wf"], CompactNodeStatus)
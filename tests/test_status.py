@@ -0,0 +1,88 @@
+import json
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.status import CompactWorkflowStatus
+
+
+STATUS = {
+    "phase": "Succeeded",
+    "startedAt": "2021-01-01T00:00:00Z",
+    "finishedAt": "2021-01-01T00:02:00Z",
+    "nodes": {
+        "wf": {
+            "id": "wf",
+            "name": "wf",
+            "displayName": "wf",
+            "type": "Steps",
+            "templateName": "main",
+            "phase": "Succeeded",
+            "children": ["wf-1"],
+            "startedAt": "2021-01-01T00:00:00Z",
+        },
+        "wf-1": {
+            "id": "wf-1",
+            "name": "wf[0].step",
+            "displayName": "step",
+            "type": "Pod",
+            "templateName": "step",
+            "phase": "Succeeded",
+            "boundaryID": "wf",
+            "startedAt": "2021-01-01T00:00:00Z",
+            "finishedAt": "2021-01-01T00:01:00Z",
+            "resourcesDuration": {"cpu": 60, "memory": 60},
+            "inputs": {"parameters": [{"name": "item", "value": "1"}]},
+            "outputs": {"parameters": [{"name": "result", "value": "2"}], "exitCode": "0"},
+        },
+    },
+}
+
+
+def test_compact_workflow_status():
+    status = CompactWorkflowStatus.parse_raw(json.dumps(STATUS))
+
+    assert status.phase == "Succeeded"
+    assert status.startedAt == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert status.storedTemplates is None
+
+    node = status.nodes["wf-1"]
+    assert isinstance(node, CompactNodeStatus)
+    assert node.type == "Pod"
+    assert node.boundaryID == "wf"
+    assert node.resourcesDuration == {"cpu": 60, "memory": 60}
+    assert status.nodes["wf"].children == ("wf-1",)
+    assert status.nodes["wf"].children[0] is node.id
+
+    assert node.inputs == v1alpha1.Inputs(parameters=[v1alpha1.Parameter(name="item", value="1")])
+    assert node.inputs is node.inputs
+    assert node.outputs.exitCode == "0"
+    assert node.templateRef is None
+
+
+def test_compact_model_is_read_only():
+    node = CompactNodeStatus(STATUS["nodes"]["wf"])
+
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError, match="read-only"):
+        node.phase = "Failed"
+    with pytest.raises(AttributeError, match="read-only"):
+        del node.phase
+
+
+def test_compact_model_to_model():
+    status = CompactWorkflowStatus.parse_obj(STATUS)
+
+    assert status.to_model() == v1alpha1.WorkflowStatus.parse_obj(STATUS)
+    assert repr(status.nodes["wf"]).startswith("CompactNodeStatus(children=('wf-1',), displayName='wf'")
+
+
+def test_compact_model_lazy_field_validation():
+    node = CompactNodeStatus({"id": "a", "name": "a", "type": "Pod", "inputs": {"parameters": [{}]}})
+
+    with pytest.raises(ValueError, match="field required"):
+        node.inputs
@@ -137,3 +137,27 @@ def test_template_hooks():
         ),
         container=container,
     )
+
+
+def test_new_model():
+    parameter = new_model(v1alpha1.Parameter, name="v1", default=None)
+    assert parameter == v1alpha1.Parameter(name="v1")
+    assert parameter.__fields_set__ == {"name"}
+
+    assert new_model(v1alpha1.Parameter, validate=True, name="v1", default=1).default == "1"
+    assert new_model(v1alpha1.Parameter, name="v1", default=1).default == 1
+
+
+def test_executor_template_validate():
+    class TestTemplate(ContainerTemplate):
+        name: ClassVar[str] = "test"
+        image = "ubuntu"
+
+        class Parameters:
+            v1: int = 1
+
+    class ValidatedTemplate(TestTemplate):
+        __validate__ = True
+
+    assert TestTemplate().template.inputs.parameters == [v1alpha1.Parameter.construct(name="v1", default=1)]
+    assert ValidatedTemplate().template.inputs.parameters == [v1alpha1.Parameter(name="v1", default="1")]
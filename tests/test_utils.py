@@ -1,4 +1,7 @@
 from decimal import Decimal
+from typing import Dict
+
+import pytest
 
 from typing_extensions import Literal
 
@@ -86,6 +89,64 @@ def test_function_class_with_func_with_return_value():
     assert func.return_value == "This is a demo"
 
 
+def test_function_class_with_static_return_value():
+    calls = []
+
+    def literal(a, b):
+        raise AssertionError("not called for a literal")
+        return "echo " "{{inputs.parameters.a}}"
+
+    def computed(a: str = "x", b: str = "y"):
+        calls.append((a, b))
+        return "echo %s %s" % (a, b)
+
+    assert Function(literal).return_value == "echo {{inputs.parameters.a}}"
+
+    func = Function(computed)
+    assert calls == []
+    assert func.return_value == "echo None None"
+    assert func.return_value == "echo None None"
+    assert calls == [(None, None)]
+
+    def unhashable_key():
+        return {[1]: "a"}
+
+    # literal_eval raises TypeError, the function is called and raises it too
+    func = Function(unhashable_key)
+    with pytest.raises(TypeError, match="unhashable"):
+        func.return_value
+
+
+def test_function_source_with_tricky_signature():
+    def tricky(
+        a: Dict[str, int] = {"b:": (1)},
+        c=lambda x: x,
+    ) -> "Dict[str, int]":  # ends here: not before
+        # a comment before the first statement
+        return a
+
+    assert check_function_has_return_value(tricky) is True
+    assert get_function_body(tricky) == "# a comment before the first statement\nreturn a\n"
+    assert Function(tricky).return_value == "None"
+
+
+def test_function_source_is_parsed_once_per_file():
+    from argo_dsl.utils import _sources
+
+    def first():
+        print(1)
+
+    def second():
+        print(2)
+
+    Function(first)
+    lines, definitions = _sources[__file__]
+    Function(second)
+    assert _sources[__file__] == (lines, definitions)
+    assert _sources[__file__][1] is definitions
+    assert {node.name for node in definitions.values()} >= {"first", "second", "test_get_function_body"}
+
+
 def test_function_class_with_method():
     class C:
         def hello(
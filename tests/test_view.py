@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.view import JSONScanError
+from argo_dsl.view import common_length
+from argo_dsl.view import index_object
+from argo_dsl.view import load_workflow
+from argo_dsl.view import parse_workflow
+from argo_dsl.view import scan_array
+from argo_dsl.view import skip_value
+
+
+WORKFLOW = {
+    "apiVersion": "argoproj.io/v1alpha1",
+    "kind": "Workflow",
+    "metadata": {"name": "wf", "namespace": "argo"},
+    "spec": {"entrypoint": "main"},
+    "status": {
+        "phase": "Running",
+        "progress": "1/2",
+        "nodes": {
+            "wf": {"id": "wf", "name": "wf", "type": "Steps", "children": ["wf-1"]},
+            "wf-1": {"id": "wf-1", "name": "wf[0]", "type": "Pod", "message": 'brackets } ] and "quotes"'},
+        },
+        "storedTemplates": {"namespaced/tmpl/main": {"name": "main", "container": {"image": "alpine"}}},
+        "estimatedDuration": 10,
+    },
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_parse_workflow(indent):
+    workflow = parse_workflow(json.dumps(WORKFLOW, indent=indent))
+
+    assert workflow.apiVersion == "argoproj.io/v1alpha1"
+    assert workflow.metadata.name == "wf"
+    assert workflow.spec.entrypoint == "main"
+    assert workflow.status.phase == "Running"
+    assert workflow.status.estimatedDuration == 10
+
+    nodes = workflow.status.nodes
+    assert list(nodes) == ["wf", "wf-1"]
+    assert len(nodes) == 2
+    assert "wf-1" in nodes
+    assert nodes._values == {}
+    assert nodes["wf-1"] == v1alpha1.NodeStatus.parse_obj(WORKFLOW["status"]["nodes"]["wf-1"])
+    assert nodes["wf-1"] is nodes["wf-1"]
+    assert list(nodes._values) == ["wf-1"]
+    assert json.loads(nodes.raw("wf")) == WORKFLOW["status"]["nodes"]["wf"]
+
+    assert workflow.status.storedTemplates["namespaced/tmpl/main"].container.image == "alpine"
+    assert workflow.to_model() == v1alpha1.Workflow.parse_obj(WORKFLOW)
+
+
+def test_parse_workflow_with_compact_nodes():
+    workflow = parse_workflow(json.dumps(WORKFLOW).encode(), node_class=CompactNodeStatus)
+
+    assert workflow.status.nodes["wf"].children == ("wf-1",)
+
+
+def test_parse_workflow_without_status():
+    workflow = parse_workflow(json.dumps({"metadata": {"name": "wf"}, "spec": {}}))
+
+    assert workflow.status is None
+    assert workflow.metadata.name == "wf"
+
+
+def test_load_workflow(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+
+    workflow = load_workflow(str(path))
+    assert workflow.status.nodes["wf"].type == "Steps"
+
+
+@pytest.mark.parametrize("document", [b"[]", b'{"a" 1}', b'{"a": 1 "b": 2}', b'{"a": {"b": 1}', b"{1: 2}"])
+def test_index_object_errors(document):
+    with pytest.raises(JSONScanError):
+        index_object(document, 0, {})
+
+
+def test_scan_array():
+    document = b' [1, {"a": [2]} , "x,]" ,[]] '
+    spans = []
+
+    def element(start):
+        end = skip_value(document, start)
+        spans.append((start, end))
+        return end
+
+    assert scan_array(document, 0, element) == len(document) - 1
+    assert [json.loads(document[start:end]) for start, end in spans] == [1, {"a": [2]}, "x,]", []]
+    assert scan_array(b"[ ]", 0, element) == 3
+
+    for invalid in (b"{}", b"[1 2]", b"[1,"):
+        with pytest.raises(JSONScanError):
+            scan_array(invalid, 0, element)
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+@pytest.mark.parametrize("difference", [0, 1, 4095, 4096, 5000, 70000, None])
+def test_common_length(wrap, difference):
+    a = bytes(range(256)) * 400
+    b = bytearray(a)
+    if difference is not None:
+        b[difference + 3] ^= 1
+    expected = len(a) - 3 if difference is None else difference
+    assert common_length(wrap(a), 3, wrap(b), 3, len(a) - 3) == expected
+    assert common_length(wrap(a), 3, wrap(b), 3, 100) == min(expected, 100)
+    # at different offsets, b is a shifted by 256 bytes
+    shifted = 1000 if difference is None or difference + 3 < 256 else min(1000, difference + 3 - 256)
+    assert common_length(wrap(a), 0, wrap(b), 256, 1000) == shifted
+
+
+def test_skip_value_truncated():
+    # a failed match must not backtrack through the run of plain characters
+    with pytest.raises(JSONScanError):
+        skip_value(b'{"a": {"b": ' + b"1" * 10000, 0)
+
+
+@pytest.mark.parametrize(
+    "before, after, reused",
+    [
+        (b'{"a": {"x": 1}, "b": 12, "c": "s"}', b'{"a": {"x": 1}, "b": 123, "c": "s"}', {"a", "c"}),
+        (b'{"a": {"x": 1}, "b": 12}', b'{"a": {"x": 1}}', {"a"}),
+        (b'{"a": 1, "b": 2}', b'{"a": 1, "a2": [], "b": 2}', {"a", "b"}),
+        (b'{"a": 1}', b"{}", set()),
+    ],
+)
+def test_index_object_previous(before, after, reused):
+    previous_spans = {}
+    index_object(before, 0, previous_spans)
+
+    spans = {}
+    found = set()
+    assert index_object(after, 0, spans, (before, previous_spans), found) == len(after)
+    expected = {}
+    index_object(after, 0, expected)
+    assert spans == expected
+    assert found == reused
+
+
+def test_parse_workflow_previous():
+    previous = parse_workflow(json.dumps(WORKFLOW))
+    node = previous.status.nodes["wf"]
+
+    changed = json.loads(json.dumps(WORKFLOW))
+    changed["status"]["nodes"]["wf-1"]["phase"] = "Failed"
+    workflow = parse_workflow(json.dumps(changed), previous=lambda fields: previous)
+
+    assert workflow.status.nodes.reused == {"wf"}
+    assert workflow.status.nodes["wf"] is node
+    assert workflow.status.nodes["wf-1"].phase == "Failed"
+    assert workflow.status.storedTemplates.reused == {"namespaced/tmpl/main"}
+    assert workflow.to_model() == v1alpha1.Workflow.parse_obj(changed)
@@ -0,0 +1,106 @@
+import copy
+import json
+
+from argo_dsl.api.io.argoproj.workflow import v1alpha1
+from argo_dsl.nodes import compress_nodes
+from argo_dsl.status import CompactNodeStatus
+from argo_dsl.watch import ADDED
+from argo_dsl.watch import DELETED
+from argo_dsl.watch import MODIFIED
+from argo_dsl.watch import WatchConsumer
+
+
+WORKFLOW = {
+    "metadata": {"name": "wf", "namespace": "argo", "resourceVersion": "1"},
+    "spec": {"entrypoint": "main"},
+    "status": {
+        "phase": "Running",
+        "nodes": {
+            "wf": {"id": "wf", "name": "wf", "type": "Steps", "phase": "Running", "children": ["wf-1"]},
+            "wf-1": {"id": "wf-1", "name": "wf[0]", "type": "Pod", "phase": "Pending"},
+        },
+    },
+}
+
+
+def event(type_, workflow, result=False):
+    data = {"type": type_, "object": workflow}
+    return json.dumps({"result": data} if result else data)
+
+
+def changes(consumer, raw):
+    return [(change.type, change.key, change.node_id) for change in consumer.apply(raw)]
+
+
+def test_watch_consumer():
+    consumer = WatchConsumer()
+    key = ("argo", "wf")
+
+    assert changes(consumer, event("ADDED", WORKFLOW)) == [(ADDED, key, "wf"), (ADDED, key, "wf-1")]
+    state = consumer.workflows[key]
+    assert isinstance(state.nodes["wf-1"], CompactNodeStatus)
+    assert state.workflow.status.phase == "Running"
+    assert consumer.resource_version == state.resource_version == "1"
+
+    unchanged = state.nodes["wf"]
+    workflow = copy.deepcopy(WORKFLOW)
+    workflow["metadata"]["resourceVersion"] = "2"
+    workflow["status"]["nodes"]["wf-1"]["phase"] = "Running"
+    workflow["status"]["nodes"]["wf-2"] = {"id": "wf-2", "name": "wf[1]", "type": "Pod"}
+    previous = state.nodes["wf-1"]
+
+    applied = consumer.apply(event("MODIFIED", workflow, result=True))
+    assert [(change.type, change.node_id) for change in applied] == [(MODIFIED, "wf-1"), (ADDED, "wf-2")]
+    assert applied[0].previous is previous
+    assert applied[0].node.phase == "Running"
+    assert state.nodes["wf"] is unchanged
+    assert consumer.resource_version == "2"
+
+    # the same document again changes nothing
+    assert changes(consumer, event("MODIFIED", workflow)) == []
+
+    del workflow["status"]["nodes"]["wf-2"]
+    assert changes(consumer, event("MODIFIED", workflow)) == [(DELETED, key, "wf-2")]
+    assert list(state.nodes) == ["wf", "wf-1"]
+
+    assert changes(consumer, event("DELETED", workflow)) == [(DELETED, key, "wf"), (DELETED, key, "wf-1")]
+    assert consumer.workflows == {}
+
+
+def test_watch_consumer_metadata_after_status():
+    consumer = WatchConsumer()
+    workflow = {key: copy.deepcopy(WORKFLOW[key]) for key in ["status", "spec", "metadata"]}
+    assert len(changes(consumer, event("ADDED", workflow))) == 2
+    unchanged = consumer.workflows["argo", "wf"].nodes["wf"]
+
+    workflow["metadata"]["resourceVersion"] = "2"
+    workflow["status"]["nodes"]["wf-1"]["phase"] = "Running"
+    assert changes(consumer, event("MODIFIED", workflow)) == [(MODIFIED, ("argo", "wf"), "wf-1")]
+    assert consumer.workflows["argo", "wf"].nodes["wf"] is unchanged
+    assert changes(consumer, event("MODIFIED", workflow)) == []
+
+
+def test_watch_consumer_compressed_nodes():
+    consumer = WatchConsumer(node_class=v1alpha1.NodeStatus.parse_obj)
+    workflow = copy.deepcopy(WORKFLOW)
+    nodes = workflow["status"].pop("nodes")
+    workflow["status"]["compressedNodes"] = compress_nodes(nodes)
+    assert [change.node_id for change in consumer.apply(event("ADDED", workflow))] == ["wf", "wf-1"]
+
+    nodes["wf-1"]["phase"] = "Failed"
+    workflow["status"]["compressedNodes"] = compress_nodes(nodes)
+    applied = consumer.apply(event("MODIFIED", workflow))
+    assert [(change.type, change.node_id) for change in applied] == [(MODIFIED, "wf-1")]
+    assert applied[0].node == v1alpha1.NodeStatus.parse_obj(nodes["wf-1"])
+
+
+def test_watch_consumer_consume():
+    consumer = WatchConsumer()
+    lines = [
+        event("ADDED", WORKFLOW).encode(),
+        b"\n",
+        event("BOOKMARK", {"metadata": {"resourceVersion": "9"}}).encode(),
+        json.dumps({"type": "ERROR", "object": {"code": 410}}),
+    ]
+    assert [change.node_id for change in consumer.consume(lines)] == ["wf", "wf-1"]
+    assert consumer.resource_version == "9"